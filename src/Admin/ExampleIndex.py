@@ -0,0 +1,278 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import concurrent.futures
+import json
+import os
+import re
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path, PurePosixPath
+
+
+def get_program_parameters():
+    import argparse
+    description = 'Build or update the index of the example files and the VTK classes they use.'
+    epilogue = '''
+The index maps each example file to its language and the VTK classes it uses.
+It also records the .extras files and the test images.
+
+The index is persisted and updated incrementally, only the files whose mtime or size
+   have changed are rescanned. It is used by VTKClassesUsedInExamples.py,
+   FindMissingExamples.py, FindMissingTestImages.py and ScrapeRepo.py.
+'''
+    parser = argparse.ArgumentParser(description=description, epilog=epilogue,
+                                     formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument('vtk_examples', help='The path to the VTK example source files.')
+    parser.add_argument('-i', '--index', default=None,
+                        help='The path to the index, default is vtk-examples/ExampleIndex.json'
+                             ' in the temporary directory.')
+    parser.add_argument('-f', '--full', action='store_true', help='Ignore the existing index and rebuild it.')
+
+    args = parser.parse_args()
+    return args.vtk_examples, args.index, args.full
+
+
+# The regular expressions used to identify example files for each language.
+FILE_PATTERNS = {
+    'CSharp': re.compile(r'^[0-9a-zA-Z_\-]+\.cs$'),
+    'Cxx': re.compile(r'^[0-9a-zA-Z_\-]+\.(hxx|HXX|hpp|HPP|[hH]\+\+|[hH]|cpp|CPP|cxx|CXX|[cC]\+\+|txx|TXX)$'),
+    'Java': re.compile(r'^[0-9a-zA-Z_\-]+\.java$'),
+    'Python': re.compile(r'^[0-9a-zA-Z_\-]+\.py$'),
+}
+
+EXTRAS_PATTERN = re.compile(r'^[0-9a-zA-Z_\-]+\.extras$')
+
+# The regular expressions used to find the VTK classes in a line of an example for each language.
+CLASS_PATTERNS = {
+    'CSharp': re.compile(r'^[A-Za-z0-9=. <>()_\t]+(vtk[A-Za-z0-9]+)'),
+    'Cxx': re.compile(
+        r'^[ \t]*#include[ ]+<(vtk[A-Za-z0-9]+)+.h>$|'  # match: #include <vtkClass.h>
+        r'.*[< ]+(vtk[A-Za-z0-9]+)[> ]|'  # match: <vtkClass>
+        r'.*[= ]+(vtk[A-Za-z0-9]+)[ ]*::New'  # match: vtkClass::New()
+    ),
+    'Java': re.compile(r'^[A-Za-z0-9=. _\t]+new[ ]+(vtk[A-Za-z0-9]+)[ ]*\('),
+    'Python': re.compile(r'^[A-Za-z0-9=. ()_\t]+(vtk[A-Za-z0-9]+)[ ]*\('),
+}
+
+TEST_IMAGE_PREFIX = 'Test'
+
+
+def scan_file(item):
+    """
+    Scan a file, this is run in a worker process.
+    :param item: A tuple of (relative path, full path, kind, language).
+    :return: A tuple of (relative path, the values found).
+    """
+    rel_path, path, kind, eg = item
+    res = set()
+    with open(path) as f:
+        if kind == 'source':
+            class_pattern = CLASS_PATTERNS[eg]
+            for line in f:
+                m = class_pattern.match(line)
+                if m:
+                    res.add(m.group(m.lastindex))
+        else:
+            for line in f:
+                line = line.strip()
+                if line:
+                    res.add(line)
+    return rel_path, sorted(res)
+
+
+class ExampleIndex(object):
+    """
+    A persisted index of the example files, the VTK classes they use, the .extras files
+     and the test images.
+
+    Paths in the index are relative to the base directory and use '/' as the separator.
+    """
+    version = 1
+
+    def __init__(self, base_directory, index_path=None):
+        """
+        :param base_directory: The path to the VTK Examples sources, usually some_path/vtk-examples/src
+        :param index_path: The path to the persisted index.
+        """
+        self.example_types = ['CSharp', 'Cxx', 'Java', 'Python']
+        self.base_directory = Path(base_directory).resolve()
+        if index_path is None:
+            index_path = Path(tempfile.gettempdir(), 'vtk-examples', 'ExampleIndex.json')
+        self.index_path = Path(index_path)
+        # A dictionary consisting of [relative path]{kind, language, mtime, size, values}
+        #  where kind is one of source, extras or image and values are the VTK classes for
+        #  a source file or the file names for an extras file.
+        self.files = dict()
+        self.stats = {'scanned': 0, 'unchanged': 0, 'removed': 0}
+
+    def load(self):
+        """
+        Load the persisted index, it is ignored if it was built for a different base directory.
+        """
+        if not self.index_path.is_file():
+            return
+        with open(self.index_path) as f:
+            try:
+                index = json.load(f)
+            except ValueError:
+                return
+        if index.get('version') == self.version and index.get('base_directory') == str(self.base_directory):
+            self.files = index['files']
+
+    def save(self):
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.index_path.with_name(self.index_path.name + '.tmp')
+        with open(tmp, 'w') as f:
+            json.dump({'version': self.version, 'base_directory': str(self.base_directory), 'files': self.files}, f)
+        os.replace(tmp, self.index_path)
+
+    def walk(self):
+        """
+        Walk the example and test image trees once.
+        :return: A dictionary consisting of [relative path](kind, language, full path, stat).
+        """
+        res = dict()
+        for eg in self.example_types:
+            directory = Path(self.base_directory, eg)
+            # Does the directory exist?
+            if not directory.is_dir():
+                raise RuntimeError(f'Non-existent folder: {str(directory)}')
+            for root, directories, files in os.walk(str(directory)):
+                for filename in files:
+                    if FILE_PATTERNS[eg].match(filename):
+                        kind = 'source'
+                    elif EXTRAS_PATTERN.match(filename):
+                        kind = 'extras'
+                    else:
+                        continue
+                    path = os.path.join(root, filename)
+                    res[Path(path).relative_to(self.base_directory).as_posix()] = (kind, eg, path, os.stat(path))
+            directory = Path(self.base_directory, 'Testing', 'Baseline', eg)
+            for root, directories, files in os.walk(str(directory)):
+                for filename in files:
+                    if filename.startswith(TEST_IMAGE_PREFIX) and filename.endswith('.png'):
+                        path = os.path.join(root, filename)
+                        res[Path(path).relative_to(self.base_directory).as_posix()] = (
+                            'image', eg, path, os.stat(path))
+        return res
+
+    def update(self, full=False):
+        """
+        Bring the index up to date, only new or modified files are scanned.
+        The scanning is done in parallel.
+        :param full: If True, ignore the persisted index.
+        :return: The index.
+        """
+        self.stats = {'scanned': 0, 'unchanged': 0, 'removed': 0}
+        if not full:
+            self.load()
+        found = self.walk()
+        for rel_path in list(self.files.keys()):
+            if rel_path not in found:
+                del self.files[rel_path]
+                self.stats['removed'] += 1
+        to_scan = list()
+        for rel_path, (kind, eg, path, st) in found.items():
+            entry = self.files.get(rel_path)
+            if entry and entry['kind'] == kind and entry['mtime'] == st.st_mtime and entry['size'] == st.st_size:
+                self.stats['unchanged'] += 1
+                continue
+            self.files[rel_path] = {'kind': kind, 'language': eg, 'mtime': st.st_mtime, 'size': st.st_size,
+                                    'values': list()}
+            if kind != 'image':
+                to_scan.append((rel_path, path, kind, eg))
+        if to_scan:
+            with concurrent.futures.ProcessPoolExecutor() as executor:
+                for rel_path, values in executor.map(scan_file, to_scan, chunksize=32):
+                    self.files[rel_path]['values'] = values
+        self.stats['scanned'] = len(to_scan)
+        self.save()
+        return self
+
+    def entries(self, eg, kind):
+        """
+        A generator of the entries of a given language and kind.
+        :param eg: The language.
+        :param kind: One of source, extras or image.
+        :return: The directory key e.g. Cxx/GeometricObjects, the file path relative to the base directory
+                  and the entry.
+        """
+        for rel_path in sorted(self.files):
+            entry = self.files[rel_path]
+            if entry['language'] == eg and entry['kind'] == kind:
+                yield str(PurePosixPath(rel_path).parent), rel_path, entry
+
+    def example_file_paths(self, eg):
+        """
+        The example files of a language.
+        :param eg: The language.
+        :return: A dictionary consisting of [directory key][full file paths of each example ...]
+        """
+        res = defaultdict(list)
+        for key, rel_path, entry in self.entries(eg, 'source'):
+            res[key].append(str(Path(self.base_directory, rel_path)))
+        return res
+
+    def examples(self, eg):
+        """
+        The example names of a language.
+        :param eg: The language.
+        :return: A dictionary consisting of [directory key]{example name ...}
+        """
+        res = defaultdict(set)
+        for key, rel_path, entry in self.entries(eg, 'source'):
+            res[key].add(PurePosixPath(rel_path).stem)
+        return res
+
+    def extras(self, eg):
+        """
+        The files listed in the .extras files of a language.
+        :param eg: The language.
+        :return: A dictionary consisting of [directory key]{file name ...}
+        """
+        res = defaultdict(set)
+        for key, rel_path, entry in self.entries(eg, 'extras'):
+            res[key].update(entry['values'])
+        return res
+
+    def test_images(self, eg):
+        """
+        The test images of a language, the key is relative to Testing/Baseline.
+        :param eg: The language.
+        :return: A dictionary consisting of [directory key]{example name ...}
+        """
+        res = defaultdict(set)
+        for key, rel_path, entry in self.entries(eg, 'image'):
+            key = str(PurePosixPath(key).relative_to('Testing/Baseline'))
+            res[key].add(PurePosixPath(rel_path).stem[len(TEST_IMAGE_PREFIX):])
+        return res
+
+    def classes_used(self, eg, vtk_classes=None):
+        """
+        The VTK classes used in the examples of a language.
+        :param eg: The language.
+        :param vtk_classes: If specified, only these classes are considered.
+        :return: A dictionary consisting of [vtk class][directory key]{example name ...}
+        """
+        res = defaultdict(lambda: defaultdict(set))
+        for key, rel_path, entry in self.entries(eg, 'source'):
+            for c in entry['values']:
+                if vtk_classes is None or c in vtk_classes:
+                    res[c][key].add(PurePosixPath(rel_path).stem)
+        return res
+
+
+def main():
+    example_source, index_path, full = get_program_parameters()
+    start = time.perf_counter()
+    index = ExampleIndex(example_source, index_path).update(full)
+    print(f'Index: {index.index_path}')
+    print(f'Files: {len(index.files)} scanned: {index.stats["scanned"]} unchanged: {index.stats["unchanged"]}'
+          f' removed: {index.stats["removed"]}')
+    print('Time taken: {:0.3f}s'.format(time.perf_counter() - start))
+
+
+if __name__ == '__main__':
+    main()
@@ -7,29 +7,7 @@ import os
 import re
 from collections import defaultdict
 
-
-def path_splitter(path):
-    """
-    Split a path into its constituent parts.
-    Might be better written as a recursive function.
-    :param path: The path to split.
-    :return: A list of the path's constituent parts.
-    """
-    res = []
-    while True:
-        p = os.path.split(path)
-        if p[0] == path:
-            # Were done, this is an absolute path.
-            res.insert(0, p[0])
-            break
-        elif p[1] == path:
-            # Were done, this is a relative path.
-            res.insert(0, p[0])
-            break
-        else:
-            path = p[0]
-            res.insert(0, p[1])
-    return res
+from ExampleIndex import ExampleIndex
 
 
 def get_program_parameters():
@@ -44,9 +22,11 @@ Typical usage:
     parser = argparse.ArgumentParser(description=description, epilog=epilogue,
                                      formatter_class=argparse.RawTextHelpFormatter)
     parser.add_argument('vtk_examples', help='The path to the VTK example source files.')
+    parser.add_argument('-i', '--index', default=None,
+                        help='The path to the example index, see ExampleIndex.py.')
 
     args = parser.parse_args()
-    return args.vtk_examples
+    return args.vtk_examples, args.index
 
 
 class UndocumentedExamples(object):
@@ -54,13 +34,15 @@ class UndocumentedExamples(object):
     Find undocumented examples.
     """
 
-    def __init__(self, base_directory):
+    def __init__(self, base_directory, index_path=None):
         """
         :param base_directory: The path to the VTK Examples sources, usually some_path/VTKExamples/src
+        :param index_path: The path to the persisted example index.
         """
         self.example_types = ['CSharp', 'Cxx', 'Java', 'Python']
         self.excluded_dirs = ['Cxx/CMakeTechniques', 'Cxx/Developers', 'Cxx/Untested', 'Cxx/Untested/Video']
         self.base_directory = base_directory
+        self.example_index = ExampleIndex(base_directory, index_path)
         # A dictionary consisting of [example type][directory name][example name ...]
         self.all_examples = defaultdict(lambda: defaultdict(set))
         self.extras = defaultdict(lambda: defaultdict(set))
@@ -69,66 +51,21 @@ class UndocumentedExamples(object):
 
     def get_all_examples(self):
         """
-        For each example, get the example file paths and the example file names.
+        For each example, get the example file names from the example index.
         """
+        self.example_index.update()
         for eg in self.example_types:
-            # Get the paths to the examples in a particular sub directory e.g Cxx.
-            directory = os.path.join(self.base_directory, eg)
-            # Does the directory exist?
-            if not os.path.isdir(directory):
-                raise RuntimeError('Non-existent folder: {:s}'.format(directory))
-            if eg == 'CSharp':
-                fn_pattern = re.compile(r'^[0-9a-zA-Z_\-]+\.cs$')
-            elif eg == 'Cxx':
-                fn_pattern = re.compile(
-                    r'^[0-9a-zA-Z_\-]+\.(hxx|HXX|hpp|HPP|[hH]\+\+|[hH]|cpp|CPP|cxx|CXX|[cC]\+\+|txx|TXX)$')
-
-            elif eg == 'Java':
-                fn_pattern = re.compile(r'^[0-9a-zA-Z_\-]+\.java$')
-            elif eg == 'Python':
-                fn_pattern = re.compile(r'^[0-9a-zA-Z_\-]+\.py$')
-            else:
-                raise RuntimeError('Unknown example type.')
-
-            # Walk the tree.
-            for root, directories, files in os.walk(directory):
-                sp = path_splitter(root)
-                idx = sp.index(eg)
-                key = '/'.join(sp[idx:])
-                examples = set()
+            for key, examples in self.example_index.examples(eg).items():
                 if key in self.excluded_dirs:
                     continue
-                for filename in files:
-                    m = fn_pattern.match(filename)
-                    if m:
-                        examples.add(os.path.splitext(filename)[0])
                 self.all_examples[eg][key] = examples
 
     def get_extras(self):
         for eg in self.example_types:
-            # Get the paths to the examples in a particular sub directory e.g Cxx.
-            directory = os.path.join(self.base_directory, eg)
-            # Does the directory exist?
-            if not os.path.isdir(directory):
-                raise RuntimeError('Non-existent folder: {:s}'.format(directory))
-            fn_pattern = re.compile(r'^[0-9a-zA-Z_\-]+\.extras$')
-            if eg not in self.example_types:
-                raise RuntimeError('Unknown example type.')
-            # Walk the tree.
-            for root, directories, files in os.walk(directory):
-                sp = path_splitter(root)
-                idx = sp.index(eg)
-                key = '/'.join(sp[idx:])
-                examples = set()
+            for key, file_names in self.example_index.extras(eg).items():
                 if key in self.excluded_dirs:
                     continue
-                for filename in files:
-                    m = fn_pattern.match(filename)
-                    if m:
-                        with open(os.path.join(root, filename), 'r') as f:
-                            for line in f:
-                                examples.add(os.path.splitext(line)[0])
-                self.extras[eg][key] = examples
+                self.extras[eg][key] = {os.path.splitext(file_name)[0] for file_name in file_names}
 
     def parse_markdown_files(self):
         """
@@ -178,8 +115,8 @@ class UndocumentedExamples(object):
 
 
 def main():
-    example_source = get_program_parameters()
-    UndocumentedExamples(example_source).print_tables()
+    example_source, index_path = get_program_parameters()
+    UndocumentedExamples(example_source, index_path).print_tables()
 
 
 if __name__ == '__main__':
@@ -4,9 +4,10 @@
 from __future__ import print_function
 
 import os
-import re
 from collections import defaultdict
 
+from ExampleIndex import ExampleIndex
+
 
 def get_program_parameters():
     import argparse
@@ -26,9 +27,11 @@ Typical usage:
     parser = argparse.ArgumentParser(description=description, epilog=epilogue,
                                      formatter_class=argparse.RawTextHelpFormatter)
     parser.add_argument('vtk_example_src_path', help='The path to the VTK example source files.')
+    parser.add_argument('-i', '--index', default=None,
+                        help='The path to the example index, see ExampleIndex.py.')
 
     args = parser.parse_args()
-    return args.vtk_example_src_path
+    return args.vtk_example_src_path, args.index
 
 
 def excluded_examples():
@@ -128,36 +131,16 @@ def excluded_examples():
     return no_image
 
 
-def path_splitter(path):
-    """
-    Split a path into its constituent parts.
-    Might be better written as a recursive function.
-    :param path: The path to split.
-    :return: A list of the path's constituent parts.
-    """
-    res = []
-    while True:
-        p = os.path.split(path)
-        if p[0] == path:
-            # We are done, this is an absolute path.
-            res.insert(0, p[0])
-            break
-        elif p[1] == path:
-            # We are done, this is a relative path.
-            res.insert(0, p[0])
-            break
-        else:
-            path = p[0]
-            res.insert(0, p[1])
-    return res
-
-
 class ExamplesMissingTestImages:
     """
     Find examples that have missing test images
     """
 
-    def __init__(self, base_directory):
+    def __init__(self, base_directory, index_path=None):
+        """
+        :param base_directory: The path to the VTK Examples sources, usually some_path/VTKExamples/src
+        :param index_path: The path to the persisted example index.
+        """
         self.example_types = ['CSharp', 'Cxx', 'Java', 'Python']
         self.excluded_dirs = ['Cxx/CMakeTechniques', 'Cxx/Developers']
         self.excluded_dirs += ['Cxx/Untested', 'Cxx/Untested/Video', 'Cxx/Untested/HasBugs',
@@ -166,6 +149,7 @@ class ExamplesMissingTestImages:
         self.excluded_dirs += ['Java/Untested', 'Java/Untested/Video']
         self.base_directory = base_directory
         self.test_images_base_directory = os.path.join(self.base_directory, 'Testing/Baseline')
+        self.example_index = ExampleIndex(base_directory, index_path)
         # A dictionary consisting of [example type][directory name][example name ...]
         self.all_examples = defaultdict(lambda: defaultdict(set))
         self.all_test_images = defaultdict(lambda: defaultdict(set))
@@ -173,70 +157,30 @@ class ExamplesMissingTestImages:
 
     def get_all_examples(self):
         """
-        For each example, get the example file paths and the example file names.
+        For each example, get the example file names from the example index.
         """
+        self.example_index.update()
         for eg in self.example_types:
-            # Get the paths to the examples in a particular sub directory e.g Cxx.
-            directory = os.path.join(self.base_directory, eg)
-            # Does the directory exist?
-            if not os.path.isdir(directory):
-                raise RuntimeError('Non-existent folder: {:s}'.format(directory))
-            if eg == 'CSharp':
-                fn_pattern = re.compile(r'^[0-9a-zA-Z_\-]+\.cs$')
-            elif eg == 'Cxx':
-                fn_pattern = re.compile(
-                    r'^[0-9a-zA-Z_\-]+\.(hxx|HXX|hpp|HPP|[hH]\+\+|[hH]|cpp|CPP|cxx|CXX|[cC]\+\+|txx|TXX)$')
-            elif eg == 'Java':
-                fn_pattern = re.compile(r'^[0-9a-zA-Z_\-]+\.java$')
-            elif eg == 'Python':
-                fn_pattern = re.compile(r'^[0-9a-zA-Z_\-]+\.py$')
-            else:
-                raise RuntimeError('Unknown example type.')
-
-            # Walk the tree.
-            for root, directories, files in os.walk(directory):
-                sp = path_splitter(root)
-                idx = sp.index(eg)
-                key = '/'.join(sp[idx:])
-                examples = set()
+            for key, examples in self.example_index.examples(eg).items():
                 if key in self.excluded_dirs:
                     continue
-                for filename in files:
-                    m = fn_pattern.match(filename)
-                    if m:
-                        examples.add(os.path.splitext(filename)[0])
-                idx = key.index(eg)
-                key = key[idx + len(eg) + 1:]
-                self.all_examples[eg][key] = examples
+                self.all_examples[eg][key[len(eg) + 1:]] = examples
 
     def get_all_test_images(self):
         """
-        For each example, get the example file paths and the example file names.
+        For each example, get the test image names from the example index.
         """
+        if not self.example_index.files:
+            self.example_index.update()
         for eg in self.example_types:
-            # Get the paths to the examples in a particular sub directory e.g Cxx.
-            directory = os.path.join(self.test_images_base_directory, eg)
             # Does the directory exist?
+            directory = os.path.join(self.test_images_base_directory, eg)
             if not os.path.isdir(directory):
                 raise RuntimeError('Non-existent folder: {:s}'.format(directory))
-
-            prefix = 'Test'
-            # Walk the tree.
-            for root, directories, files in os.walk(directory):
-                sp = path_splitter(root)
-                idx = sp.index(eg)
-                key = '/'.join(sp[idx:])
-                images = set()
+            for key, images in self.example_index.test_images(eg).items():
                 if key in self.excluded_dirs:
                     continue
-                for filename in files:
-                    s = os.path.splitext(filename)
-                    if s[1] == '.png':
-                        if s[0].startswith(prefix):
-                            images.add(s[0][len(prefix):])
-                idx = key.index(eg)
-                key = key[idx + len(eg) + 1:]
-                self.all_test_images[eg][key] = images
+                self.all_test_images[eg][key[len(eg) + 1:]] = images
 
         # Remove those examples that do not produce an image.
         no_image = excluded_examples()
@@ -279,8 +223,8 @@ class ExamplesMissingTestImages:
 
 
 def main():
-    base_directory = get_program_parameters()
-    emti = ExamplesMissingTestImages(base_directory)
+    base_directory, index_path = get_program_parameters()
+    emti = ExamplesMissingTestImages(base_directory, index_path)
     res = emti.display()
     if res:
         print('Examples with missing test images')
@@ -0,0 +1,327 @@
+#!/usr/bin/env python
+
+import concurrent.futures
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+from pathlib import Path
+from xml.etree import ElementTree
+
+
+def get_program_parameters():
+    import argparse
+    description = 'Run the Python examples offscreen and compare their images with the baseline images.'
+    epilogue = '''
+Each example is run in its own process, several examples are run at the same time.
+The render windows are offscreen and the interactor does not start an event loop,
+ instead the image in the render window is captured when Start() is called
+ and compared with src/Testing/Baseline/Python/TOPIC/TestEXAMPLE.png.
+The examples are run in a scratch folder, OUTPUT/Work/TOPIC/EXAMPLE, so the files
+ that they write are not left in the source tree.
+
+Only the examples with a baseline image are run unless -n is used.
+
+Examples needing arguments are skipped unless they are given in a JSON file (-a)
+ mapping the example, e.g. "Visualization/Blow", to a list of arguments.
+ Only the argparse usage error (exit code 2) counts as needing arguments,
+ any other non-zero exit code is a failure.
+ ${DATA} in an argument is replaced by the path to src/Testing/Data.
+
+Typical usage:
+   To test all the examples:
+      PythonRegressionTests.py some_path/vtk-examples/src
+   To test the examples in some folders, writing a JUnit report:
+      PythonRegressionTests.py some_path/vtk-examples/src -s GeometricObjects Rendering -j report.xml
+'''
+    parser = argparse.ArgumentParser(description=description, epilog=epilogue,
+                                     formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument('vtk_examples', help='The path to the VTK example source files.')
+    parser.add_argument('-s', '--select', nargs='+', default=None,
+                        help='The examples or folders to run, relative to src/Python.')
+    parser.add_argument('-n', '--no_baseline', action='store_true', help='Also run the examples with no baseline.')
+    parser.add_argument('-a', '--arguments', default=None, help='A JSON file of the arguments for the examples.')
+    parser.add_argument('-w', '--workers', type=int, default=os.cpu_count(),
+                        help='The number of examples to run at once.')
+    parser.add_argument('-t', '--timeout', type=float, default=60, help='The time allowed for each example (s).')
+    parser.add_argument('-e', '--error_threshold', type=float, default=10,
+                        help='The largest thresholded image difference allowed.')
+    parser.add_argument('-o', '--output', default=None,
+                        help='The folder for the captured images, default is a temporary folder.')
+    parser.add_argument('-j', '--junit', default=None, help='Write a JUnit XML report to this file.')
+    parser.add_argument('-r', '--report', default=None, help='Write a JSON report to this file.')
+    parser.add_argument('--child', nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    return args
+
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+
+def run_example(path, example_args, image_path, baseline_path, error_threshold, work_dir):
+    """
+    Run an example with the rendering overridden, this is run in the child process.
+
+    The vtkRenderWindow and vtkRenderWindowInteractor in vtkmodules.vtkRenderingCore are
+     replaced before the example is run. The render windows render offscreen and
+     Start() captures the image in the render window instead of starting the event loop.
+
+    :param path: The path to the example.
+    :param example_args: The arguments for the example.
+    :param image_path: The path to write the captured image to.
+    :param baseline_path: The path to the baseline image.
+    :param error_threshold: The largest thresholded image difference allowed.
+    :param work_dir: The folder the example is run in.
+    :return: A dictionary of the result.
+    """
+    import runpy
+
+    # noinspection PyUnresolvedReferences
+    import vtkmodules.vtkInteractionStyle
+    # noinspection PyUnresolvedReferences
+    import vtkmodules.vtkRenderingOpenGL2
+    import vtkmodules.vtkRenderingCore
+    from vtkmodules.vtkIOImage import vtkPNGReader, vtkPNGWriter
+    from vtkmodules.vtkImagingCore import vtkImageDifference, vtkImageExtractComponents
+    from vtkmodules.vtkRenderingUI import vtkGenericRenderWindowInteractor
+
+    windows = list()
+    captured = list()
+
+    def capture(render_window):
+        if captured or render_window is None:
+            return
+        render_window.Render()
+        window_to_image = vtkmodules.vtkRenderingCore.vtkWindowToImageFilter()
+        window_to_image.SetInput(render_window)
+        window_to_image.SetInputBufferTypeToRGB()
+        window_to_image.ReadFrontBufferOff()
+        window_to_image.Update()
+        captured.append(window_to_image.GetOutput())
+
+    class TestingRenderWindow(vtkmodules.vtkRenderingCore.vtkRenderWindow):
+        def __init__(self):
+            self.SetOffScreenRendering(True)
+            windows.append(self)
+
+    class TestingInteractor(vtkGenericRenderWindowInteractor):
+        def Start(self):
+            capture(self.GetRenderWindow())
+
+    vtkmodules.vtkRenderingCore.vtkRenderWindow = TestingRenderWindow
+    vtkmodules.vtkRenderingCore.vtkRenderWindowInteractor = TestingInteractor
+
+    res = {'status': 'passed', 'message': '', 'error': None}
+    directory = os.path.dirname(os.path.abspath(path))
+    # Any files written by the example go in the scratch folder, the example folder is
+    #  on the path so that the examples can import their siblings.
+    Path(work_dir).mkdir(parents=True, exist_ok=True)
+    os.chdir(work_dir)
+    sys.path.insert(0, directory)
+    sys.argv = [path] + example_args
+    try:
+        runpy.run_path(path, run_name='__main__')
+    except SystemExit as e:
+        if e.code == 2:
+            # The argparse usage error, most likely the example needs arguments.
+            return {'status': 'skipped', 'message': 'Exited with 2, it may need arguments.', 'error': None}
+        if e.code not in (None, 0):
+            return {'status': 'failed', 'message': f'Exited with {e.code}.', 'error': None}
+    except Exception:
+        return {'status': 'error', 'message': traceback.format_exc(), 'error': None}
+
+    if not captured and windows:
+        capture(windows[0])
+    if not captured:
+        res['message'] = 'No image was rendered.'
+        if baseline_path is not None:
+            res['status'] = 'failed'
+        return res
+
+    Path(image_path).parent.mkdir(parents=True, exist_ok=True)
+    writer = vtkPNGWriter()
+    writer.SetFileName(image_path)
+    writer.SetInputData(captured[0])
+    writer.Write()
+    if baseline_path is None:
+        res['message'] = 'No baseline image.'
+        return res
+    with open(baseline_path, 'rb') as f:
+        if f.read(len(PNG_SIGNATURE)) != PNG_SIGNATURE:
+            # Most likely a Git LFS pointer.
+            return {'status': 'skipped', 'message': 'The baseline is not a PNG file, try: git lfs pull', 'error': None}
+
+    reader = vtkPNGReader()
+    reader.SetFileName(baseline_path)
+    reader.Update()
+    baseline = reader.GetOutput()
+    if baseline.GetNumberOfScalarComponents() > 3:
+        rgb = vtkImageExtractComponents()
+        rgb.SetInputConnection(reader.GetOutputPort())
+        rgb.SetComponents(0, 1, 2)
+        rgb.Update()
+        baseline = rgb.GetOutput()
+    if baseline.GetDimensions() != captured[0].GetDimensions():
+        res['status'] = 'failed'
+        res['message'] = f'The image size {captured[0].GetDimensions()[:2]} does not match' \
+                         f' the baseline size {baseline.GetDimensions()[:2]}.'
+        return res
+    difference = vtkImageDifference()
+    difference.SetInputData(captured[0])
+    difference.SetImageData(baseline)
+    difference.Update()
+    res['error'] = difference.GetThresholdedError()
+    if res['error'] > error_threshold:
+        res['status'] = 'failed'
+        res['message'] = f'The image difference {res["error"]:0.3f} exceeds {error_threshold}.'
+    return res
+
+
+def child_main(args):
+    """
+    Run a single example, the result is written as JSON to a file.
+    """
+    with open(args.child[0]) as f:
+        task = json.load(f)
+    res = run_example(task['path'], task['args'], task['image'], task['baseline'], task['error_threshold'],
+                      task['work_dir'])
+    with open(args.child[1], 'w') as f:
+        json.dump(res, f)
+    # Exit without running the destructors of any windows or interactors left by the example.
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(0)
+
+
+def find_examples(python_dir, baseline_dir, select, no_baseline):
+    """
+    Find the examples to run.
+    :return: A list of (example, path, baseline path) where example is e.g. GeometricObjects/Cone
+              and the baseline path is None if there is no baseline image.
+    """
+    sources = [Path(python_dir, s) for s in select] if select else [Path(python_dir)]
+    files = set()
+    for source in sources:
+        if source.is_file():
+            files.add(source)
+        elif source.with_suffix('.py').is_file():
+            files.add(source.with_suffix('.py'))
+        else:
+            files.update(source.rglob('*.py'))
+    res = list()
+    for path in sorted(files):
+        example = path.relative_to(python_dir).with_suffix('').as_posix()
+        baseline = Path(baseline_dir, str(Path(example).parent), 'Test' + path.stem + '.png')
+        if baseline.is_file():
+            res.append((example, path, baseline))
+        elif no_baseline:
+            res.append((example, path, None))
+    return res
+
+
+def run_in_child(task, timeout):
+    """
+    Run an example in a new process.
+    """
+    start = time.perf_counter()
+    with tempfile.TemporaryDirectory(prefix='PythonRegressionTests') as tmp_dir:
+        task_path = os.path.join(tmp_dir, 'task.json')
+        result_path = os.path.join(tmp_dir, 'result.json')
+        with open(task_path, 'w') as f:
+            json.dump(task, f)
+        cmd = [sys.executable, os.path.abspath(__file__), '.', '--child', task_path, result_path]
+        try:
+            process = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, timeout=timeout)
+            output = process.stdout.decode('utf-8', errors='replace')
+            if os.path.isfile(result_path):
+                with open(result_path) as f:
+                    res = json.load(f)
+            else:
+                res = {'status': 'error', 'message': f'The process exited with {process.returncode}.\n'
+                                                     + output[-2000:], 'error': None}
+        except subprocess.TimeoutExpired:
+            res = {'status': 'timeout', 'message': f'The example took longer than {timeout}s.', 'error': None}
+    res['time'] = time.perf_counter() - start
+    res['example'] = task['example']
+    res['image'] = task['image']
+    return res
+
+
+def write_junit(path, results, elapsed):
+    suite = ElementTree.Element('testsuite', name='PythonExamples', tests=str(len(results)),
+                                failures=str(sum(r['status'] == 'failed' for r in results)),
+                                errors=str(sum(r['status'] in ('error', 'timeout') for r in results)),
+                                skipped=str(sum(r['status'] == 'skipped' for r in results)),
+                                time=f'{elapsed:0.3f}')
+    for r in results:
+        topic, name = os.path.split(r['example'])
+        case = ElementTree.SubElement(suite, 'testcase', classname=topic.replace('/', '.'), name=name,
+                                      time=f'{r["time"]:0.3f}')
+        if r['status'] == 'failed':
+            ElementTree.SubElement(case, 'failure', message=r['message'].splitlines()[0]).text = r['message']
+        elif r['status'] in ('error', 'timeout'):
+            ElementTree.SubElement(case, 'error', message=r['message'].strip().splitlines()[-1]).text = r['message']
+        elif r['status'] == 'skipped':
+            ElementTree.SubElement(case, 'skipped', message=r['message'])
+    ElementTree.ElementTree(suite).write(path, encoding='utf-8', xml_declaration=True)
+
+
+def main():
+    args = get_program_parameters()
+    if args.child:
+        child_main(args)
+        return
+
+    src_dir = Path(args.vtk_examples).resolve()
+    python_dir = Path(src_dir, 'Python')
+    baseline_dir = Path(src_dir, 'Testing', 'Baseline', 'Python')
+    data_dir = Path(src_dir, 'Testing', 'Data')
+    # The examples are run in a scratch folder, so a relative output folder is resolved here.
+    output_dir = Path(args.output).resolve() if args.output else Path(tempfile.gettempdir(), 'vtk-examples',
+                                                                      'PythonTests')
+    example_args = dict()
+    if args.arguments:
+        with open(args.arguments) as f:
+            example_args = json.load(f)
+
+    tasks = list()
+    for example, path, baseline in find_examples(python_dir, baseline_dir, args.select, args.no_baseline):
+        tasks.append({'example': example, 'path': str(path),
+                      'args': [a.replace('${DATA}', str(data_dir)) for a in example_args.get(example, list())],
+                      'image': str(Path(output_dir, str(Path(example).parent), 'Test' + path.stem + '.png')),
+                      'baseline': None if baseline is None else str(baseline),
+                      'error_threshold': args.error_threshold,
+                      'work_dir': str(Path(output_dir, 'Work', example))})
+    print(f'Running {len(tasks)} examples with {args.workers} workers.')
+
+    start = time.perf_counter()
+    results = list()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=args.workers) as executor:
+        futures = [executor.submit(run_in_child, task, args.timeout) for task in tasks]
+        for future in concurrent.futures.as_completed(futures):
+            r = future.result()
+            results.append(r)
+            if r['status'] != 'passed':
+                print(f'{r["status"]:>8s} {r["example"]}: {r["message"].strip().splitlines()[-1]}')
+    elapsed = time.perf_counter() - start
+    results.sort(key=lambda x: x['example'])
+
+    counts = {s: sum(r['status'] == s for r in results) for s in ['passed', 'failed', 'error', 'timeout', 'skipped']}
+    print(', '.join(f'{k}: {v}' for k, v in counts.items()))
+    print(f'Images: {output_dir}')
+    print('Time taken: {:0.3f}s'.format(elapsed))
+
+    if args.report:
+        with open(args.report, 'w') as f:
+            json.dump({'elapsed': elapsed, 'counts': counts, 'results': results}, f, indent=2)
+    if args.junit:
+        write_junit(args.junit, results, elapsed)
+    if counts['failed'] + counts['error'] + counts['timeout']:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+
+def get_program_parameters():
+    import argparse
+    description = 'Measure the import time and memory used when the Python examples start.'
+    epilogue = '''
+For each example, only its top level imports are run in a new interpreter.
+The time taken by the imports, the time taken by the interpreter and the peak memory
+ (maximum resident set size) are recorded.
+
+Use -b to also measure "import vtk" as a baseline.
+
+Typical usage:
+   PythonStartupBenchmark.py -b some_path/vtk-examples/src/Python
+   PythonStartupBenchmark.py -r 3 -o startup.csv some_path/vtk-examples/src/Python/GeometricObjects/Cone.py
+'''
+    parser = argparse.ArgumentParser(description=description, epilog=epilogue,
+                                     formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument('source', nargs='+', help='The path to the example file or folder.')
+    parser.add_argument('-r', '--repeat', type=int, default=1,
+                        help='The number of times to run each example, the fastest time is kept.')
+    parser.add_argument('-b', '--baseline', action='store_true', help='Also measure "import vtk".')
+    parser.add_argument('-o', '--output', help='Write the results to this CSV file.')
+    args = parser.parse_args()
+    return args.source, args.repeat, args.baseline, args.output
+
+
+# This is run in a new interpreter, it runs the top level imports of the file given as the first argument.
+CHILD = '''
+import ast
+import json
+import os
+import resource
+import sys
+import time
+
+path = sys.argv[1]
+if path == 'import vtk':
+    nodes = ast.parse(path).body
+else:
+    sys.path.insert(0, os.path.dirname(os.path.abspath(path)))
+    with open(path) as f:
+        tree = ast.parse(f.read(), path)
+    nodes = [n for n in tree.body if isinstance(n, (ast.Import, ast.ImportFrom)) or (
+            isinstance(n, ast.Try) and all(isinstance(b, (ast.Import, ast.ImportFrom)) for b in n.body))]
+code = compile(ast.Module(body=nodes, type_ignores=[]), path, 'exec')
+start = time.perf_counter()
+exec(code, {'__name__': 'startup'})
+import_time = time.perf_counter() - start
+max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+# Linux reports kilobytes, macOS reports bytes.
+if sys.platform != 'darwin':
+    max_rss *= 1024
+print(json.dumps({'import_time': import_time, 'max_rss': max_rss}))
+'''
+
+
+def measure(path, repeat):
+    """
+    Measure the startup of an example.
+    :param path: The path to the example or 'import vtk'.
+    :param repeat: The number of times to run the example.
+    :return: A dict of the fastest import and process times and the peak memory, None if the imports failed.
+    """
+    res = None
+    for i in range(repeat):
+        start = time.perf_counter()
+        process = subprocess.run([sys.executable, '-c', CHILD, path], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        process_time = time.perf_counter() - start
+        if process.returncode != 0:
+            print(f'{path}: {process.stderr.decode("utf-8").strip().splitlines()[-1]}')
+            return None
+        r = json.loads(process.stdout.decode('utf-8').strip().splitlines()[-1])
+        r['process_time'] = process_time
+        if res is None or r['process_time'] < res['process_time']:
+            res = r
+    return res
+
+
+def get_python_files(sources):
+    for source in sources:
+        if os.path.isfile(source):
+            yield source
+        else:
+            for root, dirs, files in os.walk(source):
+                for f in sorted(files):
+                    if f.endswith('.py'):
+                        yield os.path.join(root, f)
+
+
+def main():
+    sources, repeat, baseline, output = get_program_parameters()
+    paths = list(get_python_files(sources))
+    if baseline:
+        paths.insert(0, 'import vtk')
+
+    fmt = '{:>10s} {:>10s} {:>10s}  {:s}'
+    print(fmt.format('Import ms', 'Process ms', 'RSS MB', 'Example'))
+    results = dict()
+    for path in paths:
+        r = measure(path, repeat)
+        if r is None:
+            continue
+        results[path] = r
+        print(fmt.format(f'{r["import_time"] * 1000:0.1f}', f'{r["process_time"] * 1000:0.1f}',
+                         f'{r["max_rss"] / 2 ** 20:0.1f}', path))
+
+    examples = [v for k, v in results.items() if k != 'import vtk']
+    if examples:
+        print(f'Examples: {len(examples)}')
+        for key, name, scale, unit in [('import_time', 'Import', 1000, 'ms'),
+                                       ('process_time', 'Process', 1000, 'ms'),
+                                       ('max_rss', 'RSS', 2 ** -20, 'MB')]:
+            values = [v[key] * scale for v in examples]
+            print(f'{name:>8s}: mean {statistics.mean(values):0.1f}{unit}, median {statistics.median(values):0.1f}{unit},'
+                  f' max {max(values):0.1f}{unit}, total {sum(values):0.1f}{unit}')
+
+    if output:
+        with open(output, 'w') as f:
+            f.write('example,import_time_s,process_time_s,max_rss_bytes\n')
+            for k, v in results.items():
+                f.write(f'{k},{v["import_time"]:0.6f},{v["process_time"]:0.6f},{v["max_rss"]}\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -3,18 +3,21 @@
 import concurrent.futures
 import contextlib
 import hashlib
+import io
+import json
 import os
 import re
 import shutil
-import subprocess
 import sys
 import tarfile
-import tempfile
 import time
 from collections import Counter
 from urllib.parse import urlencode
 from urllib.request import urlopen
 
+import WhatModulesVTK
+from ExampleIndex import ExampleIndex
+
 try:
     import markdown
 except ModuleNotFoundError:
@@ -29,8 +32,15 @@ def get_program_parameters():
     epilogue = '''
 
     Note:
-       The time taken for the first run on this script will be around 370s as caches have to be created,
-       subsequent runs take around 2-5s since existing caches will be used.
+       The first run of this script has to walk the VTK source to map the includes to modules,
+       the maps are cached for each revision of the VTK source and the includes used by the examples
+       are found in parallel. Subsequent runs take around 2-5s since existing caches will be used.
+
+       A build manifest records the inputs of each example page and tarball, so only the pages
+       and tarballs whose inputs have changed are regenerated. Use -f to regenerate everything.
+
+       The example files and the .extras files are found using the example index, see ExampleIndex.py,
+       by default it is kept in WEB_REPO_DIR/src/Cache with the other caches.
     '''
     parser = argparse.ArgumentParser(description=description, epilog=epilogue,
                                      formatter_class=argparse.RawDescriptionHelpFormatter)
@@ -42,9 +52,14 @@ def get_program_parameters():
     parser.add_argument('web_repo_dir',
                         help='The path to the folder containing the web source files e.g. <local_path>/<site_name>')
     parser.add_argument('vtk_src_dir', help='The local directory containing the VTK source')
+    parser.add_argument('-f', '--full', action='store_true',
+                        help='Ignore the build manifest and regenerate all the example pages and tarballs.')
+    parser.add_argument('-i', '--index', default=None,
+                        help='The path to the example index, see ExampleIndex.py.')
     args = parser.parse_args()
 
-    return args.repo_dir, args.site_url, args.web_site_url, args.web_repo_url, args.web_repo_dir, args.vtk_src_dir
+    return args.repo_dir, args.site_url, args.web_site_url, args.web_repo_url, args.web_repo_dir, args.vtk_src_dir, \
+           args.full, args.index
 
 
 class ElapsedTime:
@@ -130,76 +145,60 @@ def load_vtk_modules_cache(cache_path):
     return cache_dict
 
 
-def get_vtk_modules(repo_path, vtk_modules_cache, vtk_src_dir, src_file, src, stats):
+def get_vtk_modules(vtk_modules_cache, src_file):
     """
-    If the source code VTK modules are not in the cache, get them.
-    :param repo_path:
-    :param vtk_modules_cache:
-    :param vtk_src_dir:
-    :param src_file:
-    :param src:
-    :param stats: Statistics
-    :return:
+    Get the VTK modules for the source code from the cache.
+    The cache is brought up to date by update_vtk_modules_cache().
+    :param vtk_modules_cache: The VTK modules cache.
+    :param src_file: The source file.
+    :return: The VTK modules.
     """
-    # compute sha of src
-    sha = hashlib.sha256(str.encode(src)).hexdigest()
-    if src_file in list(vtk_modules_cache.keys()):
-        words = vtk_modules_cache[src_file].split()
-        if str(sha) == words[0]:
-            stats['vtk_modules_hits'] += 1
-            return words[1:]
-    stats['vtk_modules_misses'] += 1
-    path = make_path(repo_path, 'Admin', 'WhatModulesVTK.py')
-    if os.path.exists(path):
-        try:
-            cmd = path + ' -p ' + vtk_src_dir + ' -s ' + src_file
-            process = subprocess.run(cmd, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, )
-        except subprocess.CalledProcessError as err:
-            print('ERROR:', err)
-            if process.returncode != 0:
-                print('returncode:', process.returncode)
-                print('Have {} bytes in stdout:\n{}'.format(
-                    len(process.stdout),
-                    process.stdout.decode('utf-8'))
-                )
-                print('Have {} bytes in stderr:\n{}'.format(
-                    len(process.stderr),
-                    process.stderr.decode('utf-8'))
-                )
-        result = process.stdout.decode('utf-8')
-        vtk_modules = parse_WhatModulesVTKOutput(result)
-
-        vtk_modules_cache[str(src_file)] = sha
-        for vtk_module in vtk_modules:
-            vtk_modules_cache[str(src_file)] += " " + vtk_module
-        print("VTK Modules: cache miss: ", str(src_file))
-        return vtk_modules_cache
-    else:
-        s = 'Unable to continue, the path: {} \nDoes not exist.'.format(path)
-        sys.exit(s)
+    return vtk_modules_cache[src_file].split()[1:]
 
 
-def parse_WhatModulesVTKOutput(str_to_parse):
+def update_vtk_modules_cache(vtk_modules_cache, vtk_src_dir, maps_cache_path, src_files, stats):
     """
-    Parse the string looking for any VTK modules.
-    :param str_to_parse: The string to parse
-    :return: The VTK modules found.
+    Find the VTK modules for the source files that are not in the cache or have changed.
+
+    The maps of includes to paths and paths to modules are built once for each revision of
+     the VTK source and saved in maps_cache_path, then the includes in each source file
+     are found using a process pool.
+    :param vtk_modules_cache: The VTK modules cache.
+    :param vtk_src_dir: The VTK source directory.
+    :param maps_cache_path: The path to the cache of include and module maps.
+    :param src_files: The source files.
+    :param stats: Statistics
+    :return:
     """
-    words = str_to_parse.split('\n')
-    vtk_modules = list()
-    for word in words:
-        if "find_package" in word:
-            continue
-        if ")" in word:
-            continue
-        if "Your" in word:
-            continue
-        if "All" in word:
-            continue
-        if word == "":
-            continue
-        vtk_modules.append(word.strip())
-    return vtk_modules
+    misses = dict()
+    for src_file in src_files:
+        with open(src_file, 'r') as ifh:
+            src = ifh.read()
+        # compute sha of src
+        sha = hashlib.sha256(str.encode(src)).hexdigest()
+        if src_file in vtk_modules_cache:
+            words = vtk_modules_cache[src_file].split()
+            if str(sha) == words[0]:
+                stats['vtk_modules_hits'] += 1
+                continue
+        stats['vtk_modules_misses'] += 1
+        misses[src_file] = sha
+    if not misses:
+        return
+
+    try:
+        includes_to_paths, paths_to_modules = WhatModulesVTK.LoadModuleMaps(vtk_src_dir, maps_cache_path)
+    except IOError as err:
+        sys.exit('Unable to continue, {}'.format(err))
+
+    with concurrent.futures.ProcessPoolExecutor() as executor:
+        all_includes = executor.map(WhatModulesVTK.FindIncludes, misses.keys(), chunksize=16)
+        for src_file, includes in zip(misses.keys(), all_includes):
+            modules = WhatModulesVTK.ModulesForIncludes(includes, includes_to_paths, paths_to_modules)
+            vtk_modules_cache[src_file] = misses[src_file]
+            for vtk_module in sorted(modules):
+                vtk_modules_cache[src_file] += " " + vtk_module.replace('VTK::', 'vtk')
+            print("VTK Modules: cache miss: ", src_file)
 
 
 def load_test_image_cache(cache_path):
@@ -592,11 +591,77 @@ def fill_Qt_CMake_lists(cmake_contents, example_name, vtk_modules, web_repo_url)
     return r3
 
 
+def file_digest(path):
+    """
+    The sha256 of a file.
+    :param path: The path to the file.
+    :return: The hex digest or an empty string if the file does not exist.
+    """
+    if not os.path.isfile(path):
+        return ''
+    with open(path, 'rb') as ifh:
+        return hashlib.sha256(ifh.read()).hexdigest()
+
+
+def load_manifest(manifest_path, signature):
+    """
+    Load the build manifest.
+    The manifest records the inputs of each example page and tarball along with the
+     outputs they produced. If the signature has changed, everything will be rebuilt.
+    :param manifest_path: The path to the manifest.
+    :param signature: A hash of the script, templates and parameters used in this run.
+    :return: The manifest.
+    """
+    manifest = {'signature': signature, 'pages': dict(), 'tarballs': dict()}
+    if os.path.isfile(manifest_path):
+        with open(manifest_path, 'r') as ifh:
+            try:
+                previous = json.load(ifh)
+            except ValueError:
+                return manifest
+        if previous.get('signature') == signature:
+            manifest['pages'] = previous.get('pages', dict())
+            manifest['tarballs'] = previous.get('tarballs', dict())
+    return manifest
+
+
+def example_page_inputs(lang, lang_ext, example_name, kit_name, other_languages, repo_path, vtk_modules_dict):
+    """
+    Compute a hash of everything that goes into the page for an example.
+    :param lang: The language.
+    :param lang_ext: The language extension.
+    :param example_name: The example name.
+    :param kit_name: The kit name.
+    :param other_languages: The links to the example in other languages.
+    :param repo_path: Repository path.
+    :param vtk_modules_dict: The VTK modules dictionary.
+    :return: The hash.
+    """
+    h = hashlib.sha256()
+    example_path = os.path.join(repo_path, lang, kit_name, example_name)
+    source_file_name = example_path + lang_ext
+    baseline_path = os.path.join(repo_path, 'Testing', 'Baseline', lang, kit_name, 'Test' + example_name + '.png')
+    h.update(str(os.path.isfile(baseline_path)).encode('utf-8'))
+    h.update(''.join(other_languages).encode('utf-8'))
+    for p in [source_file_name, example_path + '.md', example_path + '.extras', example_path + '.cmake']:
+        h.update(file_digest(p).encode('utf-8'))
+    if os.path.isfile(example_path + '.extras'):
+        with open(example_path + '.extras', 'r') as extras_file:
+            for line in extras_file:
+                line = line.strip()
+                if line != '':
+                    h.update(file_digest(os.path.join(repo_path, lang, kit_name, line)).encode('utf-8'))
+    if lang_ext == '.cxx':
+        h.update(vtk_modules_dict.get(source_file_name, '').encode('utf-8'))
+    return h.hexdigest()
+
+
 def make_markdown_example_page(f, lang, lang_ext, root, available_languages, repo_path, doc_path,
                                kit_name, repo_name, web_repo_url, user_name, vtk_modules_dict, vtk_src_dir,
-                               example_to_file_names, example_to_CMake, code_to_page, stats):
+                               example_to_file_names, example_to_CMake, code_to_page, manifest, stats):
     """
     Here we make the markdown page for a given example.
+    If the inputs to the page are the same as those recorded in the manifest, the page is not regenerated.
     :param f: The example.
     :param lang: The language.
     :param lang_ext: The language extension.
@@ -613,6 +678,7 @@ def make_markdown_example_page(f, lang, lang_ext, root, available_languages, rep
     :param example_to_file_names: A dictionary to hold the file names for each example.
     :param example_to_CMake: A dictionary to hold CMakeLists.txt file.
     :param code_to_page: A dictionary to hold code name and page name.
+    :param manifest: The build manifest.
     :param stats: Statistics
     :return:
     """
@@ -634,6 +700,25 @@ def make_markdown_example_page(f, lang, lang_ext, root, available_languages, rep
         if path_name != '':
             os.makedirs(path_name)
     dest = os.path.join(doc_path, lang, kit_name, example_name + '.md')
+    count_key = {'.cxx': 'cxx_count', '.cs': 'cs_count', '.py': 'py_count', '.java': 'java_count'}[lang_ext]
+    page_key = make_path(lang, kit_name, example_name + '.md', relative=True)
+    inputs = example_page_inputs(lang, lang_ext, example_name, kit_name, other_languages, repo_path,
+                                 vtk_modules_dict)
+    entry = manifest['pages'].get(page_key)
+    if entry and entry['inputs'] == inputs and os.path.isfile(dest):
+        # The page is up to date, restore what the page generation would have recorded.
+        stats[count_key] += 1
+        stats['pages_unchanged'] += 1
+        if example_name not in example_to_file_names:
+            example_to_file_names[example_name] = set()
+        example_to_file_names[example_name].update(entry['file_names'])
+        if entry['cmake'] is not None:
+            example_to_CMake[example_name] = entry['cmake']
+        code_to_page[example_name + lang_ext] = entry['page']
+        manifest['seen'].add(page_key)
+        return
+    stats['pages_made'] += 1
+    file_names = set()
     # Generate markdown for the example web page
     with open(dest, 'w') as md_file:
         md_file.write(
@@ -694,7 +779,7 @@ def make_markdown_example_page(f, lang, lang_ext, root, available_languages, rep
         if lang_ext == '.cxx':
             md_file.write('``` c++ ' + hilite_lines + '\n')
             # Get the vtk_modules used in this example
-            vtk_modules = get_vtk_modules(repo_path, vtk_modules_dict, vtk_src_dir, source_file_name, src, stats)
+            vtk_modules = get_vtk_modules(vtk_modules_dict, source_file_name)
             stats['cxx_count'] += 1
         elif lang_ext == '.cs':
             md_file.write('``` csharp ' + hilite_lines + '\n')
@@ -713,6 +798,7 @@ def make_markdown_example_page(f, lang, lang_ext, root, available_languages, rep
             example_to_file_names[example_name] = set()
         source_file = os.path.join(repo_path, lang, kit_name, example_name + example_ext)
         example_to_file_names[example_name].add(source_file)
+        file_names.add(source_file)
 
         extras_path = os.path.join(repo_path, lang, kit_name, example_name + '.extras')
         extra_names = ''
@@ -726,6 +812,7 @@ def make_markdown_example_page(f, lang, lang_ext, root, available_languages, rep
                     source_file = os.path.join(repo_path, lang, kit_name, line)
 
                     example_to_file_names[example_name].add(source_file)
+                    file_names.add(source_file)
                     with open(extra_path, 'r') as extra_fh:
                         extra_code = extra_fh.read()
                     write_extra_Cxx_code(md_file, line, extra_code)
@@ -764,6 +851,10 @@ def make_markdown_example_page(f, lang, lang_ext, root, available_languages, rep
             example_to_CMake[example_name] = get_VTK_CMake_file(cmake)
             md_file.write(cmake)
     code_to_page[example_name + lang_ext] = '/' + lang + '/' + kit_name + '/' + example_name
+    manifest['pages'][page_key] = {'inputs': inputs, 'file_names': sorted(file_names),
+                                   'cmake': example_to_CMake[example_name] if lang == 'Cxx' else None,
+                                   'page': code_to_page[example_name + lang_ext]}
+    manifest['seen'].add(page_key)
 
 
 def make_instruction_pages(web_repo_url, web_site_url, site_repo_url, root_path, repo_dir, doc_path, from_file,
@@ -813,18 +904,94 @@ def make_instruction_pages(web_repo_url, web_site_url, site_repo_url, root_path,
             ofh.write(line)
 
 
-def make_tarballs(repo_path, web_repo_dir, example_to_file_names, example_to_CMake, ref_mtime):
+def make_tar_info(name, ref_mtime, size=0, is_dir=False):
+    """
+    Make a tar header with a consistent mtime, mode and ownership.
+    Since the mtime is stored in the tar header for each file and directory,
+     we need consistent headers so that a tar of an unchanged example will be
+     equal to the one in the repo.
+    :param name: The name of the member in the archive.
+    :param ref_mtime: The reference mtime.
+    :param size: The size of the file.
+    :param is_dir: True if the member is a directory.
+    :return: The TarInfo.
+    """
+    info = tarfile.TarInfo(name)
+    info.mtime = int(ref_mtime)
+    info.uid = info.gid = 0
+    info.uname = info.gname = ''
+    if is_dir:
+        info.type = tarfile.DIRTYPE
+        info.mode = 0o755
+    else:
+        info.size = size
+        info.mode = 0o644
+    return info
+
+
+def make_tarball(example, file_names, cmake_contents, ref_mtime):
+    """
+    Create the tarball for an example in memory.
+    The tarball contains the example's files, a CMakeLists.txt file and an empty build
+     directory. The build directory is handy when you want to configure with CMake and
+     build the example.
+    :param example: The example name.
+    :param file_names: The file names for the example.
+    :param cmake_contents: The contents of the CMakeLists.txt file.
+    :param ref_mtime: The reference mtime.
+    :return: The bytes of the tarball.
+    """
+    members = {'CMakeLists.txt': cmake_contents.encode('utf-8'), 'build': None}
+    for file_name in file_names:
+        with open(file_name, 'rb') as ifh:
+            members[os.path.split(file_name)[1]] = ifh.read()
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode='w', format=tarfile.GNU_FORMAT) as tar:
+        tar.addfile(make_tar_info(example, ref_mtime, is_dir=True))
+        for name in sorted(members):
+            arcname = example + '/' + name
+            if members[name] is None:
+                tar.addfile(make_tar_info(arcname, ref_mtime, is_dir=True))
+            else:
+                tar.addfile(make_tar_info(arcname, ref_mtime, size=len(members[name])), io.BytesIO(members[name]))
+    return buffer.getvalue()
+
+
+def write_tarball(tar_fn, example, file_names, cmake_contents, ref_mtime):
+    """
+    Write the tarball for an example if its contents have changed.
+    :param tar_fn: The path to the tarball.
+    :param example: The example name.
+    :param file_names: The file names for the example.
+    :param cmake_contents: The contents of the CMakeLists.txt file.
+    :param ref_mtime: The reference mtime.
+    :return: True if the tarball was written.
+    """
+    contents = make_tarball(example, file_names, cmake_contents, ref_mtime)
+    if os.path.isfile(tar_fn) and os.path.getsize(tar_fn) == len(contents):
+        with open(tar_fn, 'rb') as ifh:
+            if ifh.read() == contents:
+                return False
+    with open(tar_fn, 'wb') as ofh:
+        ofh.write(contents)
+    return True
+
+
+def make_tarballs(repo_path, web_repo_dir, example_to_file_names, example_to_CMake, ref_mtime, manifest, stats):
     """
     Create tarballs for each example.
+    Tarballs whose inputs are unchanged since the last run are not recreated,
+     tarballs whose bytes would not change are not rewritten and
+     tarballs for examples that no longer exist are removed.
     :param repo_path: Repository path.
     :param example_to_file_names: A dictionary to holding the file names for each example.
     :param example_to_CMake: A dictionary to holding the CMakeLists.txt file.
     :param ref_mtime: The reference reference mtime.
+    :param manifest: The build manifest.
+    :param stats: Statistics
     :return:
     """
 
-    tmp_dir = tempfile.mkdtemp(prefix='VTKTarballs') + '/'
-
     # Create the Tarballs directory in the source tree if not present
     # If it does not exist, assume the tarball repo has not been cloned
     # and we need to ignore tar files
@@ -835,52 +1002,71 @@ def make_tarballs(repo_path, web_repo_dir, example_to_file_names, example_to_CMa
         #     ofh.write('*,tar\n')
 
     # Create tarballs
-    # For each example page, create a directory and copy that example's files
-    # into the directory
-    # If the example has a CMakeLists.txt file, copy that.
-    # Also, create a subdir called build. This directory is handy when you want to
-    # configure with CMake and build the example.
-    for example in example_to_file_names:
+    # Only examples with a CMakeLists.txt file have a tarball.
+    # The tarballs are stored in the source tree.
+    futures = dict()
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        for example in example_to_file_names:
+            if example not in example_to_CMake:
+                continue
+            h = hashlib.sha256()
+            for exampleFileName in sorted(example_to_file_names[example]):
+                h.update(os.path.split(exampleFileName)[1].encode('utf-8'))
+                h.update(file_digest(exampleFileName).encode('utf-8'))
+            h.update(example_to_CMake[example][0].encode('utf-8'))
+            h.update(str(ref_mtime).encode('utf-8'))
+            inputs = h.hexdigest()
+            tar_fn = make_path(tar_dir, example + '.tar')
+            if manifest['tarballs'].get(example) == inputs and os.path.isfile(tar_fn):
+                stats['tarballs_unchanged'] += 1
+                continue
+            manifest['tarballs'][example] = inputs
+            futures[executor.submit(write_tarball, tar_fn, example, example_to_file_names[example],
+                                    example_to_CMake[example][0], ref_mtime)] = example
+        for future in concurrent.futures.as_completed(futures):
+            if future.result():
+                stats['tarballs_made'] += 1
+            else:
+                stats['tarballs_unchanged'] += 1
+
+    # Remove the tarballs for examples that no longer exist
+    for example in list(manifest['tarballs'].keys()):
         if example not in example_to_CMake:
+            tar_fn = make_path(tar_dir, example + '.tar')
+            if os.path.isfile(tar_fn):
+                os.remove(tar_fn)
+            del manifest['tarballs'][example]
+            stats['tarballs_removed'] += 1
+
+
+def get_example_files(example_index, repo_path, lang, lang_ext, all_extras):
+    """
+    Find the example source files for a language.
+    :param example_index: The example index.
+    :param repo_path: Repository path.
+    :param lang: The language.
+    :param lang_ext: The language extension.
+    :param all_extras: The files listed as extras, these are not examples.
+    :return: Yields the root, kit name and file name of each example.
+    """
+    excluded = ['Boneyard', 'Broken', 'Deprecated', 'Untested', 'Databases', 'Wishlist']
+    for key, file_paths in example_index.example_file_paths(lang).items():
+        # The key is e.g. Cxx/GeometricObjects, the kit name is GeometricObjects.
+        kit_name = key[len(lang) + 1:]
+        if kit_name == '':
+            continue
+        if any(kit_name.find(e) >= 0 for e in excluded):
             continue
-        # Make the temporary directories for the example
-        src_dir = make_path(tmp_dir, example)
-        # codeFileName = srcDir + '/' + example + '.cxx'
-        if not os.path.exists(src_dir):
-            os.makedirs(src_dir)
-
-            # An example may have multiple source files
-            for exampleFileName in example_to_file_names[example]:
-                # Get the file name
-                tar_fn = make_path(src_dir, os.path.split(exampleFileName)[1])
-                # Copy the code for the example
-                shutil.copy(exampleFileName, tar_fn)
-                os.utime(tar_fn, (ref_mtime, ref_mtime))
-
-        # Some examples do not have a CMakeLists.txt file
-        if example in example_to_CMake:
-            os.makedirs(make_path(src_dir, 'build'))
-            cmake_fn = make_path(src_dir, 'CMakeLists.txt')
-            with open(cmake_fn, 'w') as cmake_fh:
-                cmake_fh.write(example_to_CMake[example][0])
-            os.utime(cmake_fn, (ref_mtime, ref_mtime))
-
-        # Set the mtimes for the directories containing the example
-        # Since the mtime is stored in the tar header for each file and directory,
-        # we need a consistent time so that a tar of an unchanged example will be equal
-        # to the one in the repo
-        os.utime(src_dir, (ref_mtime, ref_mtime))
-        os.utime(make_path(src_dir, 'build'), (ref_mtime, ref_mtime))
-
-        # Now create the tar file for the example
-        # The tarballs are stored in the source tree
-        tar = tarfile.open(make_path(web_repo_dir, 'Tarballs', example + '.tar'), 'w')
-        tar.add(src_dir, arcname=example)
-        tar.close()
-
-    os.utime(tmp_dir, (0, ref_mtime))
-    # Cleanup the temporary directories
-    shutil.rmtree(tmp_dir)
+        root = make_path(repo_path, key)
+        for path in file_paths:
+            f = os.path.basename(path)
+            # skip files that are listed as extras
+            if f in all_extras:
+                continue
+            example_ext = os.path.splitext(f)[1]
+            if example_ext != lang_ext:
+                continue
+            yield root, kit_name, f
 
 
 def get_statistics(stats):
@@ -906,6 +1092,12 @@ def get_statistics(stats):
     res.append('  Test Image Cache misses:  ' + str(stats['test_image_misses']))
     res.append('  VTK Modules Cache hits:   ' + str(stats['vtk_modules_hits']))
     res.append('  VTK Modules Cache misses: ' + str(stats['vtk_modules_misses']))
+    res.append('  Example pages made:       ' + str(stats['pages_made']))
+    res.append('  Example pages unchanged:  ' + str(stats['pages_unchanged']))
+    res.append('  Example pages removed:    ' + str(stats['pages_removed']))
+    res.append('  Tarballs made:            ' + str(stats['tarballs_made']))
+    res.append('  Tarballs unchanged:       ' + str(stats['tarballs_unchanged']))
+    res.append('  Tarballs removed:         ' + str(stats['tarballs_removed']))
     return res
 
 
@@ -922,8 +1114,15 @@ def main():
     stats['java_count'] = 0
     stats['thumb_count'] = 0
     stats['doxy_count'] = 0
-
-    repo_dir, site_url, web_site_url, web_repo_url, web_repo_dir, vtk_src_dir = get_program_parameters()
+    stats['pages_made'] = 0
+    stats['pages_unchanged'] = 0
+    stats['pages_removed'] = 0
+    stats['tarballs_made'] = 0
+    stats['tarballs_unchanged'] = 0
+    stats['tarballs_removed'] = 0
+
+    repo_dir, site_url, web_site_url, web_repo_url, web_repo_dir, vtk_src_dir, full, index_path = \
+        get_program_parameters()
     print('Paths and folders to use:')
     print('REPO_DIR:      ', repo_dir)
     print('SITE_URL:      ', site_url)
@@ -973,6 +1172,20 @@ def main():
     if ref_stat2.st_mtime > ref_stat1.st_mtime:
         ref_mtime = ref_stat2.st_mtime
 
+    # Load the build manifest, the pages and tarballs are rebuilt if this script,
+    # the CMakeLists templates or the parameters change.
+    manifest_path = make_path(cache_path, 'Manifest.json')
+    h = hashlib.sha256()
+    for p in [os.path.abspath(__file__), make_path(repo_path, 'Admin/VTKQtCMakeLists'),
+              make_path(repo_path, 'Admin/VTKCMakeLists')]:
+        h.update(file_digest(p).encode('utf-8'))
+    h.update(' '.join([repo_path, doc_path, site_url, web_site_url, web_repo_url, str(ref_mtime)]).encode('utf-8'))
+    manifest = load_manifest(manifest_path, h.hexdigest())
+    if full:
+        manifest['pages'] = dict()
+        manifest['tarballs'] = dict()
+    manifest['seen'] = set()
+
     # Create a dict to hold code name and page name
     code_to_page = dict()
 
@@ -1085,60 +1298,35 @@ def main():
         os.makedirs(dest)
     shutil.copy(make_path(repo_path, 'VTKBookLaTeX/VTKTextBook.md'), dest)
 
-    # Scan all Cxx directories and look for extras
+    # Bring the example index up to date, it holds the example files and the Cxx extras.
+    if index_path is None:
+        index_path = make_path(cache_path, 'ExampleIndex.json')
+    example_index = ExampleIndex(repo_path, index_path).update()
     all_extras = set()
-    for root, dirs, files in os.walk(repo_path):
-        to_find = make_path(repo_path, 'Cxx')
-        start = root.find(to_find)
-        if start < 0:
-            continue
-        for f in files:
-            file_name = os.path.splitext(f)
-            if file_name[1] == '.extras':
-                extras_path = make_path(root, f)
-                with open(extras_path, 'r') as ifn:
-                    for line in ifn:
-                        line = line.strip()
-                        all_extras.add(line)
+    for file_names in example_index.extras('Cxx').values():
+        all_extras.update(file_names)
 
-    for lang, lang_ext in list(available_languages.items()):
-        to_find = os.path.join(repo_dir, lang)
-        for root, dirs, files in os.walk(repo_path):
-            start = root.find(to_find)
-            if start < 0:
-                continue
-            # Get the part of the file name that comes after repo_dir
-            # e.g. if the file name is VTKExamples/src/Cxx/GeometricObjects/Line,
-            # Path will be GeometricObjects/Line
-            kit_name = root[start + 1 + len(to_find):]
+    # Bring the VTK modules cache up to date for the C++ examples.
+    cxx_files = [os.path.join(repo_path, 'Cxx', kit_name, f)
+                 for root, kit_name, f in get_example_files(example_index, repo_path, 'Cxx', '.cxx', all_extras)]
+    update_vtk_modules_cache(vtk_modules_dict, vtk_src_dir, make_path(cache_path, 'VTKModuleMaps.cache'),
+                             cxx_files, stats)
 
-            if kit_name == '':
-                continue
-            if kit_name.find('Boneyard') >= 0:
-                continue
-            if kit_name.find('Broken') >= 0:
-                continue
-            if kit_name.find('Deprecated') >= 0:
-                continue
-            if kit_name.find('Untested') >= 0:
-                continue
-            if kit_name.find('Databases') >= 0:
-                continue
-            if kit_name.find('Wishlist') >= 0:
-                continue
-            for f in files:
-                # skip files that are listed as extras
-                if f in all_extras:
-                    continue
-                if f == 'CMakeLists.txt':
-                    continue
-                example_ext = os.path.splitext(f)[1]
-                if example_ext != lang_ext:
-                    continue
-                # Make the markdown page for each example
-                make_markdown_example_page(f, lang, lang_ext, root, available_languages, repo_path, doc_path,
-                                           kit_name, repo_name, web_repo_url, user_name, vtk_modules_dict, vtk_src_dir,
-                                           example_to_file_names, example_to_CMake, code_to_page, stats)
+    for lang, lang_ext in list(available_languages.items()):
+        for root, kit_name, f in get_example_files(example_index, repo_path, lang, lang_ext, all_extras):
+            # Make the markdown page for each example
+            make_markdown_example_page(f, lang, lang_ext, root, available_languages, repo_path, doc_path,
+                                       kit_name, repo_name, web_repo_url, user_name, vtk_modules_dict, vtk_src_dir,
+                                       example_to_file_names, example_to_CMake, code_to_page, manifest, stats)
+
+    # Remove the pages for examples that no longer exist
+    for page_key in list(manifest['pages'].keys()):
+        if page_key not in manifest['seen']:
+            page_fn = make_path(doc_path, page_key)
+            if os.path.isfile(page_fn):
+                os.remove(page_fn)
+            del manifest['pages'][page_key]
+            stats['pages_removed'] += 1
 
     # Generate an html page that links each example code file to its Wiki Example page
     with open(os.path.join(doc_path, 'ExampleCodeToWikiPage.html'), 'w') as index_file:
@@ -1153,7 +1341,11 @@ def main():
             index_file.write("<br>\n")
 
     # Create tarballs for each example
-    make_tarballs(repo_path, web_repo_dir, example_to_file_names, example_to_CMake, ref_mtime)
+    make_tarballs(repo_path, web_repo_dir, example_to_file_names, example_to_CMake, ref_mtime, manifest, stats)
+
+    # Save the build manifest
+    with open(manifest_path, 'w') as ofh:
+        json.dump({k: manifest[k] for k in ['signature', 'pages', 'tarballs']}, ofh)
 
     # Update the test image cache file if necessary
     if stats['test_image_misses'] > 0:
@@ -2,14 +2,15 @@
 # -*- coding: utf-8 -*-
 
 import json
-import os
 import re
 import time
 from collections import defaultdict
 from dataclasses import dataclass
-from pathlib import Path, PurePath
+from pathlib import Path
 from urllib.request import urlopen
 
+from ExampleIndex import ExampleIndex
+
 
 def get_program_parameters():
     import argparse
@@ -22,6 +23,8 @@ The markdown tables and the JSON file are written to some_path/src/Coverage
 Note:
    To add links to the VTK class documentation on the web, just add -a as a parameter.
    To vary the number of columns for unused classes to say 8, just add -c8 as a parameter.
+   The classes used in each example are read from a persisted index that is updated incrementally,
+      use -i to specify where it is stored.
 '''
     parser = argparse.ArgumentParser(description=description, epilog=epilogue,
                                      formatter_class=argparse.RawTextHelpFormatter)
@@ -35,9 +38,11 @@ Note:
                         help='Specify the number of columns for excluded VTK classes output, default is 5.', nargs='?',
                         const=3, type=int, default=3)
     parser.add_argument('-a', '--add_vtk_html', help='Add html paths to the VTK classes.', action='store_true')
+    parser.add_argument('-i', '--index', default=None,
+                        help='The path to the example index, see ExampleIndex.py.')
 
     args = parser.parse_args()
-    return args.vtk_examples, args.coverage_dest, args.columns, args.excluded_columns, args.add_vtk_html
+    return args.vtk_examples, args.coverage_dest, args.columns, args.excluded_columns, args.add_vtk_html, args.index
 
 
 @dataclass(frozen=True)
@@ -70,13 +75,14 @@ class VTKClassesInExamples(object):
     Determine what classes are being used or not used in the examples.
     """
 
-    def __init__(self, base_directory, output_directory, columns, excluded_columns, add_vtk_html):
+    def __init__(self, base_directory, output_directory, columns, excluded_columns, add_vtk_html, index_path=None):
         """
         :param base_directory: The path to the VTK Examples sources, usually some_path/vtk-examples/src
         :param output_directory: Where the coverage file will be written.
         :param columns: When generating the classes not used table, the number of columns to use.
         :param excluded_columns: When generating the excluded classes table, the number of columns to use.
         :param add_vtk_html: True if the Doxygen documentation paths are to be added to the vtk classes in the tables.
+        :param index_path: The path to the persisted example index.
         """
         self.example_types = ['CSharp', 'Cxx', 'Java', 'Python']
         # Classes common to most examples.
@@ -88,6 +94,7 @@ class VTKClassesInExamples(object):
         self.columns = columns
         self.excluded_columns = excluded_columns
         self.add_vtk_html = add_vtk_html
+        self.example_index = ExampleIndex(base_directory, index_path)
 
         # A dictionary consisting of the class name as the key and the link class name as the value.
         self.vtk_classes = dict()
@@ -143,75 +150,19 @@ class VTKClassesInExamples(object):
 
     def get_example_file_paths(self):
         """
-        For each example, get the example file paths.
+        For each example, get the example file paths from the example index.
+        The index is updated first, only new or modified examples are rescanned.
         """
+        self.example_index.update()
         for eg in self.example_types:
-            # Get the paths to the examples in a particular sub directory e.g Cxx.
-            file_paths = defaultdict(list)
-            directory = Path(self.base_directory, eg)
-            # Does the directory exist?
-            if not directory.is_dir():
-                raise RuntimeError(f'Non-existent folder: {str(directory)}')
-            exclude_dirs = ['Deprecated']
-            if eg == 'CSharp':
-                fn_pattern = re.compile(r'^[0-9a-zA-Z_\-]+\.cs$')
-            elif eg == 'Cxx':
-                fn_pattern = re.compile(
-                    r'^[0-9a-zA-Z_\-]+\.(hxx|HXX|hpp|HPP|[hH]\+\+|[hH]|cpp|CPP|cxx|CXX|[cC]\+\+|txx|TXX)$')
-                exclude_dirs = exclude_dirs + ['CMakeTechniques', 'Untested']
-            elif eg == 'Java':
-                fn_pattern = re.compile(r'^[0-9a-zA-Z_\-]+\.java$')
-            elif eg == 'Python':
-                fn_pattern = re.compile(r'^[0-9a-zA-Z_\-]+\.py$')
-            else:
-                raise RuntimeError('Unknown example type.')
-
-            # Walk the tree.
-            for root, directories, files in os.walk(str(directory)):
-                sp = PurePath(root).parts
-                idx = sp.index(eg)
-                key = '/'.join(sp[idx:])
-                if exclude_dirs:
-                    if sp[idx] in exclude_dirs:
-                        continue
-                for filename in files:
-                    m = fn_pattern.match(filename)
-                    if m:
-                        file_paths[key].append(str(Path(root, filename)))
-            self.example_file_paths[eg] = file_paths
+            self.example_file_paths[eg] = self.example_index.example_file_paths(eg)
 
     def vtk_classes_in_examples(self):
         """
         Find the vtk classes used in the examples.
         """
         for eg in self.example_types:
-            res = defaultdict(lambda: defaultdict(set))
-            if eg == 'CSharp':
-                class_pattern = re.compile(r'^[A-Za-z0-9=. <>()_\t]+(vtk[A-Za-z0-9]+)')
-            elif eg == 'Cxx':
-                class_pattern = re.compile(
-                    r'^[ \t]*#include[ ]+<(vtk[A-Za-z0-9]+)+.h>$|'  # match: #include <vtkClass.h>
-                    r'.*[< ]+(vtk[A-Za-z0-9]+)[> ]|'  # match: <vtkClass>
-                    r'.*[= ]+(vtk[A-Za-z0-9]+)[ ]*::New'  # match: vtkClass::New()
-                )
-            elif eg == 'Java':
-                class_pattern = re.compile(r'^[A-Za-z0-9=. _\t]+new[ ]+(vtk[A-Za-z0-9]+)[ ]*\(')
-            elif eg == 'Python':
-                class_pattern = re.compile(r'^[A-Za-z0-9=. ()_\t]+(vtk[A-Za-z0-9]+)[ ]*\(')
-            else:
-                raise RuntimeError('Unknown example type.')
-
-            for k, v in self.example_file_paths[eg].items():
-                for fn in v:
-                    # Open and read the file building a list of classes.
-                    with open(fn) as f:
-                        for line in f:
-                            m = class_pattern.match(line)
-                            if m:
-                                c = m.group(m.lastindex)
-                                if c in self.vtk_classes:
-                                    res[c][k].add(Path(fn).stem)
-            self.classes_used[eg] = res
+            self.classes_used[eg] = self.example_index.classes_used(eg, self.vtk_classes)
 
     def make_crossreferences(self):
         """
@@ -408,12 +359,13 @@ class VTKClassesInExamples(object):
 
 
 def main():
-    example_source, coverage_dest, columns, excluded_columns, add_vtk_html = get_program_parameters()
+    example_source, coverage_dest, columns, excluded_columns, add_vtk_html, index_path = get_program_parameters()
     if not Path(example_source).is_dir():
         print(f'The path: {example_source} does not exist.')
     if not Path(coverage_dest).is_dir():
         print(f'The path: {coverage_dest} does not exist.')
-    vtk_classes = VTKClassesInExamples(example_source, coverage_dest, columns, excluded_columns, add_vtk_html)
+    vtk_classes = VTKClassesInExamples(example_source, coverage_dest, columns, excluded_columns, add_vtk_html,
+                                       index_path)
     vtk_classes.build_tables()
     vtk_classes.print_tables()
 
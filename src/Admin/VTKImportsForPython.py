@@ -0,0 +1,309 @@
+#!/usr/bin/env python
+
+import importlib
+import io
+import os
+import pkgutil
+import re
+import subprocess
+import sys
+import tokenize
+
+import WhatModulesVTK
+
+
+def get_program_parameters():
+    import argparse
+    description = 'Replace "import vtk" in Python examples with imports from the individual vtkmodules.'
+    epilogue = '''
+Importing vtk loads every wrapped VTK module, importing only the modules that an example
+ uses makes the example start faster and use less memory.
+
+The modules for the vtk classes are found from the installed VTK Python wheel.
+Modules that provide the implementations of the rendering classes, e.g. vtkRenderingOpenGL2,
+ are imported when a module that depends on them is used.
+
+Without -w, the modules imported by each example are checked against the modules
+ needed by the classes it uses. If the path to the VTK source is given, the modules are
+ also checked against the modules found by WhatModulesVTK.py.
+
+Typical usage:
+   To rewrite the imports in the Python examples:
+      VTKImportsForPython.py -w some_path/vtk-examples/src/Python
+   To check the imports against the VTK source:
+      VTKImportsForPython.py -p some_path/VTK some_path/vtk-examples/src/Python
+'''
+    parser = argparse.ArgumentParser(description=description, epilog=epilogue,
+                                     formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument('source', nargs='+', help='The path to the example file or folder.')
+    parser.add_argument('-w', '--write', action='store_true', help='Rewrite the imports in the examples.')
+    parser.add_argument('-p', '--path', help='The path to the VTK source tree.')
+    parser.add_argument('-c', '--cache',
+                        help='A file used to save the include and module maps for the VTK source revision.')
+    args = parser.parse_args()
+    return args.source, args.write, args.path, args.cache
+
+
+# Classes that are no longer in VTK, mapped to the module they were in.
+LEGACY_CLASSES = {
+    'vtkCompositePolyDataMapper2': 'vtkRenderingOpenGL2',
+    'vtkGeoAssignCoordinates': 'vtkGeovisCore',
+    'vtkGeoGraticule': 'vtkGeovisCore',
+}
+
+# If an example uses a module that depends on the first module,
+#  the modules providing the implementations are imported.
+IMPLEMENTATION_MODULES = [
+    ('vtkRenderingCore', ['vtkInteractionStyle', 'vtkRenderingFreeType', 'vtkRenderingOpenGL2']),
+    ('vtkRenderingContext2D', ['vtkRenderingContextOpenGL2']),
+    ('vtkRenderingVolume', ['vtkRenderingVolumeOpenGL2']),
+    ('vtkDomainsChemistry', ['vtkDomainsChemistryOpenGL2']),
+    ('vtkIOExport', ['vtkIOExportOpenGL2', 'vtkRenderingGL2PSOpenGL2']),
+]
+
+# The old package paths of the Python only modules.
+PACKAGE_RENAMES = [
+    (re.compile(r'^(\s*)(from|import)[ ]+vtk\.qt4\.'), r'\1\2 vtkmodules.qt.'),
+    (re.compile(r'^(\s*)(from|import)[ ]+vtk\.(util|qt|numpy_interface|tk|wx|gtk)\b'), r'\1\2 vtkmodules.\3'),
+]
+
+IMPORT_VTK = re.compile(r'^import[ ]+vtk[ ]*$')
+FROM_VTK_MODULE = re.compile(r'^from[ ]+vtk\.(vtk[A-Za-z0-9]+)[ ]+import[ ]+([A-Za-z0-9_, ]+)$')
+IMPORTED_MODULES = re.compile(r'^\s*(?:import|from)[ ]+vtkmodules\.(vtk[A-Za-z0-9]+)\b')
+
+
+def get_installed_modules():
+    """
+    The names of the wrapped VTK modules that are installed.
+    """
+    import vtkmodules
+    return sorted(m.name for m in pkgutil.iter_modules(vtkmodules.__path__)
+                  if m.name.startswith('vtk') and not m.name.endswith('Python'))
+
+
+def get_name_modules(installed_modules):
+    """
+    Build a dict that maps the names of the vtk classes, functions and constants to their module.
+    """
+    name_modules = dict(LEGACY_CLASSES)
+    for module in installed_modules:
+        try:
+            mod = importlib.import_module('vtkmodules.' + module)
+        except ImportError:
+            continue
+        for name in dir(mod):
+            if not name.startswith('_') and name not in name_modules:
+                name_modules[name] = module
+    # The extra functionality for vtkVariant, these replace the classes in vtkCommonCore.
+    from vtkmodules.util import vtkVariant
+    for name in dir(vtkVariant):
+        if name.startswith('vtkVariant') and name != 'vtkVariant':
+            name_modules[name] = 'util.vtkVariant'
+    return name_modules
+
+
+def get_module_dependencies(module, cache):
+    """
+    The set of VTK modules loaded when a module is imported.
+    The module is imported in a separate process and the results are cached.
+    """
+    if module not in cache:
+        res = {module}
+        if not module.startswith('util.'):
+            cmd = ('import sys, vtkmodules.' + module +
+                   "; print(' '.join(m[11:] for m in sys.modules if m.startswith('vtkmodules.vtk')))")
+            process = subprocess.run([sys.executable, '-c', cmd], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+            if process.returncode == 0:
+                res.update(process.stdout.decode('utf-8').split())
+        cache[module] = res
+    return cache[module]
+
+
+def get_implementation_modules(modules, installed_modules, dependencies_cache):
+    """
+    The modules providing the implementations needed by the modules.
+    """
+    res = set()
+    all_modules = set()
+    for module in modules:
+        all_modules.update(get_module_dependencies(module, dependencies_cache))
+    for module, implementations in IMPLEMENTATION_MODULES:
+        if module in all_modules:
+            res.update(m for m in implementations if m in installed_modules)
+    return res - set(modules)
+
+
+def find_vtk_names(contents):
+    """
+    Find the names accessed as vtk.name in the code, ignoring comments and strings.
+    :return: A list of (row, col, name) where row and col are the position of vtk.
+    """
+    res = list()
+    tokens = [t for t in tokenize.generate_tokens(io.StringIO(contents).readline)
+              if t.type not in (tokenize.NL, tokenize.NEWLINE, tokenize.COMMENT, tokenize.INDENT, tokenize.DEDENT)]
+    for i, t in enumerate(tokens[:-2]):
+        if t.type == tokenize.NAME and t.string == 'vtk' and tokens[i + 1].string == '.' \
+                and tokens[i + 2].type == tokenize.NAME \
+                and (i == 0 or tokens[i - 1].string not in ['.', 'from', 'import']):
+            res.append((t.start[0], t.start[1], tokens[i + 2].string))
+    return res
+
+
+def make_imports(names_by_module, implementation_modules):
+    """
+    Make the import statements.
+    """
+    res = list()
+    for module in sorted(implementation_modules):
+        res.append('# noinspection PyUnresolvedReferences')
+        res.append('import vtkmodules.' + module)
+    for module in sorted(names_by_module):
+        names = sorted(names_by_module[module])
+        if len(names) == 1:
+            res.append(f'from vtkmodules.{module} import {names[0]}')
+        else:
+            res.append(f'from vtkmodules.{module} import (')
+            res.append(',\n'.join('    ' + name for name in names))
+            res.append(')')
+    return res
+
+
+def convert_file(path, name_modules, installed_modules, dependencies_cache):
+    """
+    Rewrite the vtk imports in a Python file.
+    :return: The new contents, None if the file does not need changing and
+              a list of the names that could not be resolved.
+    """
+    with open(path, 'r') as fid:
+        contents = fid.read()
+    lines = contents.splitlines(keepends=True)
+
+    # Rewrite the packages that have moved into vtkmodules.
+    for i, line in enumerate(lines):
+        for prog, repl in PACKAGE_RENAMES:
+            lines[i] = prog.sub(repl, lines[i])
+
+    names_by_module = dict()
+    import_line = None
+    for i, line in enumerate(lines):
+        if IMPORT_VTK.match(line):
+            if import_line is None:
+                import_line = i
+            lines[i] = ''
+            continue
+        m = FROM_VTK_MODULE.match(line)
+        if m:
+            for name in m.group(2).split(','):
+                names_by_module.setdefault(m.group(1), set()).add(name.strip())
+            if import_line is None:
+                import_line = i
+            lines[i] = ''
+
+    unresolved = set()
+    found = find_vtk_names(contents)
+    if found and import_line is None:
+        return None, ['import vtk']
+    # Remove vtk. working backwards along each line.
+    for row, col, name in sorted(found, reverse=True):
+        if name not in name_modules:
+            unresolved.add(name)
+            continue
+        names_by_module.setdefault(name_modules[name], set()).add(name)
+        line = lines[row - 1]
+        lines[row - 1] = line[:col] + line[col + len('vtk.'):]
+    if unresolved:
+        return None, sorted(unresolved)
+
+    if import_line is not None:
+        implementation_modules = get_implementation_modules(
+            [m for m in names_by_module if not m.startswith('util.')], installed_modules, dependencies_cache)
+        lines[import_line] = '\n'.join(make_imports(names_by_module, implementation_modules)) + '\n'
+    new_contents = ''.join(lines)
+    if new_contents == contents:
+        return None, []
+    return new_contents, []
+
+
+def check_file(path, name_modules, installed_modules, dependencies_cache, maps=None):
+    """
+    Check the modules imported by a Python file.
+    :return: A list of the problems found.
+    """
+    res = list()
+    with open(path, 'r') as fid:
+        contents = fid.read()
+    if find_vtk_names(contents):
+        res.append('uses import vtk')
+        return res
+    imported = set()
+    for line in contents.splitlines():
+        m = IMPORTED_MODULES.match(line)
+        if m:
+            imported.add(m.group(1))
+    if not imported:
+        return res
+    name_prog = re.compile(r'^(vtk[A-Za-z0-9]+|VTK_[A-Z0-9_]+)$')
+    needed = set()
+    for t in tokenize.generate_tokens(io.StringIO(contents).readline):
+        if t.type == tokenize.NAME and name_prog.match(t.string) and t.string not in installed_modules:
+            module = name_modules.get(t.string)
+            if module is not None and not module.startswith('util.'):
+                needed.add(module)
+    needed |= get_implementation_modules(needed, installed_modules, dependencies_cache)
+    if needed - imported:
+        res.append('not imported: ' + ' '.join(sorted(needed - imported)))
+    if imported - needed:
+        res.append('not needed: ' + ' '.join(sorted(imported - needed)))
+
+    if maps:
+        # Check against the modules found by WhatModulesVTK.
+        includes_to_paths, paths_to_modules = maps
+        includes = WhatModulesVTK.FindPythonIncludes(path)
+        direct = {paths_to_modules[includes_to_paths[inc]] for inc in includes
+                  if inc in includes_to_paths and includes_to_paths[inc] in paths_to_modules}
+        found = WhatModulesVTK.ModulesForIncludes(includes, includes_to_paths, paths_to_modules)
+        imported = {'VTK::' + m[3:] for m in imported}
+        if direct - imported:
+            res.append('WhatModulesVTK, not imported: ' + ' '.join(sorted(direct - imported)))
+        if imported - found:
+            res.append('WhatModulesVTK, not listed: ' + ' '.join(sorted(imported - found)))
+    return res
+
+
+def get_python_files(sources):
+    for source in sources:
+        if os.path.isfile(source):
+            yield source
+        else:
+            for root, dirs, files in os.walk(source):
+                for f in sorted(files):
+                    if f.endswith('.py'):
+                        yield os.path.join(root, f)
+
+
+def main():
+    sources, write, vtk_source_dir, cache_path = get_program_parameters()
+    installed_modules = get_installed_modules()
+    name_modules = get_name_modules(installed_modules)
+    dependencies_cache = dict()
+    maps = None
+    if vtk_source_dir:
+        maps = WhatModulesVTK.LoadModuleMaps(vtk_source_dir, cache_path)
+
+    for path in get_python_files(sources):
+        if write:
+            new_contents, unresolved = convert_file(path, name_modules, installed_modules, dependencies_cache)
+            if unresolved:
+                print(f'{path}: not converted, unresolved: {" ".join(unresolved)}')
+            elif new_contents is not None:
+                with open(path, 'w') as fid:
+                    fid.write(new_contents)
+                print(f'{path}: converted')
+        else:
+            res = check_file(path, name_modules, installed_modules, dependencies_cache, maps)
+            if res:
+                print(f'{path}: ' + '; '.join(res))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,20 +1,27 @@
 #!/usr/bin/env python
 
+import json
 import os
 import re
+import subprocess
+import tokenize
 
 
 def get_program_parameters():
     import argparse
     description = 'Generate a FindPackage(VTK COMPONENTS) that lists all modules referenced by a set of files.'
     epilogue = '''
+    The application files can be C++ or Python files,
+     for Python files the vtk classes used in the file are mapped to their modules.
     '''
     parser = argparse.ArgumentParser(description=description, epilog=epilogue,
                                      formatter_class=argparse.RawDescriptionHelpFormatter)
     parser.add_argument('-p', '--path', help='The path to the VTK source tree.')
     parser.add_argument('-s', '--source', nargs='+', help='The path to the application file or folder.')
+    parser.add_argument('-c', '--cache',
+                        help='A file used to save the include and module maps for the VTK source revision.')
     args = parser.parse_args()
-    return args.path, args.source
+    return args.path, args.source, args.cache
 
 
 def IncludesToPaths(path):
@@ -51,6 +58,51 @@ def FindModules(path):
     return pathToModule
 
 
+def GetVTKRevision(vtkSourceDir):
+    """
+    Get the git revision of the VTK source, None if it is not a git repository.
+    """
+    try:
+        process = subprocess.run(['git', '-C', vtkSourceDir, 'rev-parse', 'HEAD'],
+                                 stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return process.stdout.decode('utf-8').strip()
+
+
+def LoadModuleMaps(vtkSourceDir, cachePath=None):
+    """
+    Build the dicts that map include files to paths and paths to modules.
+
+    Walking the VTK source is slow, so if a cache path is given the maps are saved there
+     along with the revision of the VTK source and reused until the revision changes.
+    If the revision cannot be found the maps are always rebuilt.
+    """
+    sourceDir = os.path.abspath(vtkSourceDir)
+    revision = GetVTKRevision(sourceDir)
+    if cachePath and revision and os.path.isfile(cachePath):
+        with open(cachePath, 'r') as fid:
+            try:
+                cache = json.load(fid)
+            except ValueError:
+                cache = dict()
+        if cache.get('revision') == revision and cache.get('vtkSourceDir') == sourceDir:
+            return cache['includesToPaths'], cache['pathsToModules']
+
+    includesToPaths = IncludesToPaths(sourceDir)
+    pathsToModules = FindModules(sourceDir)
+
+    # Test to see if VTK source is provided
+    if len(pathsToModules) == 0:
+        raise IOError(vtkSourceDir + ' is not a VTK source directory. It does not contain any vtk.module files.')
+
+    if cachePath and revision:
+        with open(cachePath, 'w') as fid:
+            json.dump({'revision': revision, 'vtkSourceDir': sourceDir,
+                       'includesToPaths': includesToPaths, 'pathsToModules': pathsToModules}, fid)
+    return includesToPaths, pathsToModules
+
+
 def FindIncludes(path):
     """
     Build a set that contains vtk includes.
@@ -64,6 +116,20 @@ def FindIncludes(path):
     return includes
 
 
+def FindPythonIncludes(path):
+    """
+    Build a set that contains the includes corresponding to the vtk classes used in a Python file.
+    """
+    includes = set()
+    classProg = re.compile(r'^vtk[A-Za-z0-9]+$')
+    with open(path, 'r') as fid:
+        # Only look at the names in the code, not in the comments and strings.
+        for token in tokenize.generate_tokens(fid.readline):
+            if token.type == tokenize.NAME and classProg.match(token.string):
+                includes.add(token.string + '.h')
+    return includes
+
+
 def FindModuleFiles(path):
     """
     Get a list of module files in the VTK directory.
@@ -87,37 +153,12 @@ def MakeFindPackage(modules):
     return res
 
 
-def GenerateFindPackage(vtkSourceDir, sourceFiles):
-    # Generate dict's for mapping includes to modules
-    includesToPaths = IncludesToPaths(vtkSourceDir)
-    pathsToModules = FindModules(vtkSourceDir)
-
-    # Test to see if VTK source is provided
-    if len(pathsToModules) == 0:
-        raise IOError(vtkSourceDir + ' is not a VTK source directory. It does not contain any vtk.module files.')
-
-    valid_extensions = ['.h', '.hxx', '.cpp', '.cxx', '.cc']
-
-    # Build a set of includes for all command line files
-    allIncludes = set()
-    for f in sourceFiles:
-        if os.path.isfile(f):
-            filename, file_extension = os.path.splitext(f)
-            if file_extension in valid_extensions:
-                allIncludes.update(FindIncludes(f))
-        else:
-            # We have a folder so look through all the files.
-            for path, dirs, files in os.walk(f):
-                for fn in files:
-                    filename, file_extension = os.path.splitext(fn)
-                    if file_extension in valid_extensions:
-                        allIncludes.update(FindIncludes(os.path.join(path, fn)))
-    if len(allIncludes) == 0:
-        return
-
-    # Build a set that contains all modules referenced in command line files
+def ModulesForIncludes(includes, includesToPaths, pathsToModules):
+    """
+    Build a set that contains all modules referenced by the includes.
+    """
     allModules = set()
-    for inc in allIncludes:
+    for inc in includes:
         if inc in includesToPaths:
             module = includesToPaths[inc]
             if module in pathsToModules:
@@ -140,6 +181,38 @@ def GenerateFindPackage(vtkSourceDir, sourceFiles):
         allModules.add('VTK::IOExportOpenGL2')
         allModules.add('VTK::IOExportPDF')
         allModules.add('VTK::RenderingContextOpenGL2')
+    return allModules
+
+
+def GenerateFindPackage(vtkSourceDir, sourceFiles, cachePath=None):
+    # Generate dict's for mapping includes to modules
+    includesToPaths, pathsToModules = LoadModuleMaps(vtkSourceDir, cachePath)
+
+    valid_extensions = ['.h', '.hxx', '.cpp', '.cxx', '.cc']
+
+    # Build a set of includes for all command line files
+    allIncludes = set()
+    for f in sourceFiles:
+        if os.path.isfile(f):
+            filename, file_extension = os.path.splitext(f)
+            if file_extension in valid_extensions:
+                allIncludes.update(FindIncludes(f))
+            elif file_extension == '.py':
+                allIncludes.update(FindPythonIncludes(f))
+        else:
+            # We have a folder so look through all the files.
+            for path, dirs, files in os.walk(f):
+                for fn in files:
+                    filename, file_extension = os.path.splitext(fn)
+                    if file_extension in valid_extensions:
+                        allIncludes.update(FindIncludes(os.path.join(path, fn)))
+                    elif file_extension == '.py':
+                        allIncludes.update(FindPythonIncludes(os.path.join(path, fn)))
+    if len(allIncludes) == 0:
+        return
+
+    # Build a set that contains all modules referenced in command line files
+    allModules = ModulesForIncludes(allIncludes, includesToPaths, pathsToModules)
 
     modules = {'All modules referenced in the files:': allModules}
     res = list()
@@ -152,11 +225,11 @@ def GenerateFindPackage(vtkSourceDir, sourceFiles):
 
 
 def main():
-    vtkSourceDir, sourceFiles = get_program_parameters()
+    vtkSourceDir, sourceFiles, cachePath = get_program_parameters()
     if vtkSourceDir is None or sourceFiles is None:
         raise IOError('We need a VTK source directory and the source files.')
 
-    res = GenerateFindPackage(vtkSourceDir, sourceFiles)
+    res = GenerateFindPackage(vtkSourceDir, sourceFiles, cachePath)
     print(res)
 
 
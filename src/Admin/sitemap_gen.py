@@ -1,331 +1,459 @@
-#!/usr/bin/env python
-"""
-    Copyright (C) 2007-2009 Vladimir Toncar
-
-    Contributors:
-        Redirect handling by Pavel "ShadoW" Dvorak
-        Converted to Python3 by Andrew Maclean
-
-    This program is free software; you can redistribute it and/or modify
-    it under the terms of the GNU General Public License as published by
-    the Free Software Foundation; either version 3 of the License, or
-    (at your option) any later version.
-
-    This program is distributed in the hope that it will be useful,
-    but WITHOUT ANY WARRANTY; without even the implied warranty of
-    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
-    GNU General Public License for more details.
-
-"""
-
-import getopt
-import sys
-import time
-import xml.sax.saxutils
-from html.parser import HTMLParser
-from urllib import robotparser
-from urllib.error import URLError
-from urllib.parse import urlparse, urljoin, urlsplit, urldefrag
-from urllib.request import build_opener, install_opener
-from urllib.request import urlopen
-
-helpText = """sitemap_gen.py version 1.1.0 (2009-09-05)
-
-This script crawls a web site from a given starting URL and generates
-a Sitemap file in the format that is accepted by Google. The crawler
-does not follow links to other web sites. It also respects the 'nofollow'
-tags and will not crawl into directories disallowed in the robots.txt file.
-
-Command line syntax:
-
-python sitemap_gen.py <options> <starting URL>
-
-Available options:
--h         --help                Print this text and exit
-
--b <ext>   --block <ext>         Exclude URLs with the given extension;
-                                 <ext> must be without the leading dot.
-                                 The comparison is case insensitive, so
-                                 for example DOC and doc are treated
-                                 the same. You can use this option several
-                                 times to block several extensions.
-
--c <value> --changefreq <value>  Set the change frequency. The given value
-                                 is used in all sitemap entries (maybe a
-                                 future version of this script will change
-                                 that). The allowed values are: always,
-                                 hourly, daily, weekly, monthly, yearly,
-                                 never.
-
--p <prio>  --priority <prio>     Set the priority. The value must be from
-                                 the interval between 0.0 and 1.0. The value
-                                 will be used in all sitemap entries.
-
--m <value> --max-urls <value>    Set the maximum number of URLs to be crawled.
-                                 The default value is 1000 and the largest
-                                 value that you can set is 50000 (the script
-                                 generates only a single sitemap file).
-
--o <file>  --output-file <file>  Set the name of the geneated sitemap file.
-                                 The default file name is sitemap.xml.
-
-Usage example:
-python sitemap_gen.py -b doc -b bmp -o test_sitemap.xml http://www.your-site-name.com/index.html
-
-For more information, visit http://toncar.cz/opensource/sitemap_gen.html
-
-"""
-
-allowedChangefreq = ["always", "hourly", "daily", "weekly", "monthly", "yearly", "never"]
-
-
-def getPage(url):
-    try:
-        f = urlopen(url)
-        page = ""
-        for i in f.readlines():
-            page += str(i)
-        time_struct = time.strptime(f.headers['last-modified'], '%a, %d %b %Y %H:%M:%S %Z')
-        date = (time_struct.tm_year, time_struct.tm_mon, time_struct.tm_wday)
-        f.close()
-        return (page, date, f.url)
-    except URLError as detail:
-        print("%s. Skipping..." % detail)
-        return (None, (0, 0, 0), "")
-
-
-# end def
-
-
-def joinUrls(baseUrl, newUrl):
-    helpUrl, fragment = urldefrag(newUrl)
-    return urljoin(baseUrl, helpUrl)
-
-
-# end def
-
-
-def getRobotParser(startUrl):
-    rp = robotparser.RobotFileParser()
-
-    robotUrl = urljoin(startUrl, "/robots.txt")
-    page, date, url = getPage(robotUrl)
-
-    if page is None:
-        print("Could not read ROBOTS.TXT at:", robotUrl)
-        return None
-    # end if
-
-    rp.parse(page)
-    print("Found ROBOTS.TXT at:", robotUrl)
-    return rp
-
-
-# end def
-
-
-class MyHTMLParser(HTMLParser):
-
-    def __init__(self, pageMap, redirects, baseUrl, maxUrls, blockExtensions, robotParser):
-        HTMLParser.__init__(self)
-        self.pageMap = pageMap
-        self.redirects = redirects
-        self.baseUrl = baseUrl
-        self.server = urlsplit(baseUrl)[1]
-        self.maxUrls = maxUrls
-        self.blockExtensions = blockExtensions
-        self.robotParser = robotParser
-
-    # end def
-
-    def hasBlockedExtension(self, url):
-        p = urlparse(url)
-        path = p[2].upper()  # path attribute
-        # In python 2.5, endswith() also accepts a tuple,
-        # but let's make it backwards compatible
-        for i in self.blockExtensions:
-            if path.endswith(i):
-                return 1
-        return 0
-
-    # end def
-
-    def handle_starttag(self, tag, attrs):
-        if len(self.pageMap) >= self.maxUrls:
-            return
-
-        if (tag.upper() == "BASE"):
-            if (attrs[0][0].upper() == "HREF"):
-                self.baseUrl = joinUrls(self.baseUrl, attrs[0][1])
-                print("BASE URL set to", self.baseUrl)
-
-        if (tag.upper() == "A"):
-            # print("Attrs:", attrs)
-            url = ""
-            # Let's scan the list of tag's attributes
-            for attr in attrs:
-                # print("  attr:", attr)
-                if (attr[0].upper() == "REL") and (attr[1].upper().find('NOFOLLOW') != -1):
-                    # We have discovered a nofollow, so we won't continue
-                    return
-                elif (attr[0].upper() == "HREF") and (attr[1].upper().find('MAILTO:') == -1):
-                    # We have discovered a link that is not a Mailto:
-                    url = joinUrls(self.baseUrl, attr[1])
-            # end for
-            # if the url is empty, there was none in the list of attributes
-            if url == "":
-                return
-
-            # Check if we want to follow the link
-            if urlsplit(url)[1] != self.server:
-                return
-            if self.hasBlockedExtension(url) or self.redirects.count(url) > 0:
-                return
-            if (self.robotParser is not None) and not (self.robotParser.can_fetch("*", url)):
-                print("URL restricted by ROBOTS.TXT: ", url)
-                return
-            # It's OK to add url to the map and fetch it later
-            if url not in self.pageMap:
-                self.pageMap[url] = ()
-        # end if
-    # end def
-
-
-# end class
-
-
-def getUrlToProcess(pageMap):
-    for i in pageMap.keys():
-        if pageMap[i] == ():
-            return i
-    return None
-
-
-def parsePages(startUrl, maxUrls, blockExtensions):
-    pageMap = {}
-    pageMap[startUrl] = ()
-    redirects = []
-
-    robotParser = getRobotParser(startUrl)
-    while True:
-        url = getUrlToProcess(pageMap)
-        if url is None:
-            break
-        print(" ", url)
-        page, date, newUrl = getPage(url)
-        if page is None:
-            del pageMap[url]
-        elif url != newUrl:
-            print("Redirect -> " + newUrl)
-            del pageMap[url]
-            pageMap[newUrl] = ()
-            redirects.append(url)
-        else:
-            pageMap[url] = date
-            parser = MyHTMLParser(pageMap, redirects, url, maxUrls, blockExtensions, robotParser)
-            try:
-                parser.feed(page)
-                parser.close()
-            except UnicodeDecodeError:
-                print("Failed decoding %s . Try to check if the page is valid." % url)
-    # end while
-
-    return pageMap
-
-
-# end def
-
-
-def generateSitemapFile(pageMap, fileName, changefreq="", priority=0.0):
-    fw = open(fileName, "wt")
-    fw.write('''<?xml version="1.0" encoding="UTF-8"?>
-<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n''')
-    for i in pageMap.keys():
-        fw.write('<url>\n  <loc>%s</loc>\n' % (xml.sax.saxutils.escape(i)))
-        if pageMap[i] not in [(), (0, 0, 0)]:
-            fw.write('  <lastmod>%4d-%02d-%02d</lastmod>\n' % pageMap[i])
-        if changefreq != "":
-            fw.write('  <changefreq>%s</changefreq>\n' % (changefreq))
-        if priority > 0.0:
-            fw.write('  <priority>%1.1f</priority>\n' % (priority))
-        fw.write('</url>\n')
-    # end for
-    fw.write('</urlset>')
-    fw.close()
-
-
-# end def
-
-
-def main():
-    try:
-        opts, args = getopt.getopt(
-            sys.argv[1:],
-            "hb:c:m:p:o:",
-            ["help", "block=", "changefreq=", "max-urls=", "priority=", "output-file="]
-        )
-    except getopt.GetoptError:
-        print(helpText)
-        return
-
-    blockExtensions = []
-    changefreq = ""
-    priority = 0.0
-    fileName = "sitemap.xml"
-    maxUrls = 1000
-    pageMap = {}
-
-    for opt, arg in opts:
-        if opt in ("-h", "--help"):
-            print(helpText)
-            return
-        elif opt in ("-b", "--block"):
-            blockExtensions.append("." + arg.upper())
-        elif opt in ("-c", "--changefreq"):
-            if arg in allowedChangefreq:
-                changefreq = arg
-            else:
-                print("Allowed changefreq values are:")
-                for i in allowedChangefreq:
-                    print(i)
-                print("")
-                return
-        elif opt in ("-m", "--max-urls"):
-            maxUrls = int(arg)
-            if (maxUrls < 0) or (maxUrls > 50000):
-                print("The maximum number of URLs must be greater than 0 and smaller than 50000")
-                return
-        elif opt in ("-p", "--priority"):
-            priority = float(arg)
-            if (priority < 0.0) or (priority > 1.0):
-                print("Priority must be between 0.0 and 1.0")
-                return
-        elif opt in ("-o", "--output-file"):
-            fileName = arg
-            if fileName in ("", ".", ".."):
-                print("Please provide a sensible file name")
-                return
-        # end if
-
-    if len(args) == 0:
-        print("You must provide the starting URL.\nTry the -h option for help.")
-        return
-
-    # Set user agent string
-    opener = build_opener()
-    opener.addheaders = [('User-agent', 'sitemap_gen/1.0')]
-    install_opener(opener)
-
-    # Start processing
-    print("Crawling the site...")
-    pageMap = parsePages(args[0], maxUrls, blockExtensions)
-    print("Generating sitemap: %d URLs" % len(pageMap))
-    generateSitemapFile(pageMap, fileName, changefreq, priority)
-    print("Finished.")
-
-
-# end def
-
-
-if __name__ == '__main__':
-    main()
+#!/usr/bin/env python
+"""
+    Copyright (C) 2007-2009 Vladimir Toncar
+
+    Contributors:
+        Redirect handling by Pavel "ShadoW" Dvorak
+        Converted to Python3 by Andrew Maclean
+
+    This program is free software; you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation; either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+"""
+
+import concurrent.futures
+import getopt
+import json
+import os
+import sys
+import time
+import xml.sax.saxutils
+from collections import deque
+from html.parser import HTMLParser
+from urllib import robotparser
+from urllib.error import HTTPError, URLError
+from urllib.parse import urlparse, urljoin, urlsplit, urldefrag
+from urllib.request import build_opener, install_opener
+from urllib.request import Request, urlopen
+
+helpText = """sitemap_gen.py version 1.2.0
+
+This script crawls a web site from a given starting URL and generates
+a Sitemap file in the format that is accepted by Google. The crawler
+does not follow links to other web sites. It also respects the 'nofollow'
+tags and will not crawl into directories disallowed in the robots.txt file.
+
+Command line syntax:
+
+python sitemap_gen.py <options> <starting URL>
+
+Available options:
+-h         --help                Print this text and exit
+
+-b <ext>   --block <ext>         Exclude URLs with the given extension;
+                                 <ext> must be without the leading dot.
+                                 The comparison is case insensitive, so
+                                 for example DOC and doc are treated
+                                 the same. You can use this option several
+                                 times to block several extensions.
+
+-c <value> --changefreq <value>  Set the change frequency. The given value
+                                 is used in all sitemap entries (maybe a
+                                 future version of this script will change
+                                 that). The allowed values are: always,
+                                 hourly, daily, weekly, monthly, yearly,
+                                 never.
+
+-p <prio>  --priority <prio>     Set the priority. The value must be from
+                                 the interval between 0.0 and 1.0. The value
+                                 will be used in all sitemap entries.
+
+-m <value> --max-urls <value>    Set the maximum number of URLs to be crawled.
+                                 The default value is 1000 and the largest
+                                 value that you can set is 50000 (the script
+                                 generates only a single sitemap file).
+
+-o <file>  --output-file <file>  Set the name of the geneated sitemap file.
+                                 The default file name is sitemap.xml.
+
+-w <value> --workers <value>     Set the number of pages that are fetched
+                                 at the same time. The default value is 8.
+
+-x <file>  --cache-file <file>   Keep the Last-Modified dates and the links
+                                 of the pages in this file. When the site is
+                                 crawled again, a page is only downloaded if
+                                 it has changed since the last crawl,
+                                 otherwise its date and links are reused.
+
+Usage example:
+python sitemap_gen.py -b doc -b bmp -o test_sitemap.xml http://www.your-site-name.com/index.html
+
+To crawl a local copy of the site, serve it with e.g.:
+python -m http.server -d docs 8000
+python sitemap_gen.py -x sitemap_cache.json -o test_sitemap.xml http://localhost:8000/
+
+For more information, visit http://toncar.cz/opensource/sitemap_gen.html
+
+"""
+
+allowedChangefreq = ["always", "hourly", "daily", "weekly", "monthly", "yearly", "never"]
+
+
+def parseDate(lastModified):
+    try:
+        time_struct = time.strptime(lastModified, '%a, %d %b %Y %H:%M:%S %Z')
+        return (time_struct.tm_year, time_struct.tm_mon, time_struct.tm_mday)
+    except (TypeError, ValueError):
+        return (0, 0, 0)
+
+
+# end def
+
+
+def getPage(url, lastModified=None):
+    """
+    Fetch a page, if lastModified is given the page is only downloaded if it
+    has changed since then.
+
+    Returns (page, lastModified, url) where url is the URL of the page after
+    any redirects. The page is None if it could not be read, "" if it is
+    not an HTML page and the url is None if the page has not changed.
+    """
+    request = Request(url)
+    if lastModified:
+        request.add_header('If-Modified-Since', lastModified)
+    try:
+        with urlopen(request, timeout=60) as f:
+            page = ""
+            if f.headers.get_content_type() in ("text/html", "text/plain"):
+                page = f.read().decode(f.headers.get_content_charset() or "utf-8", errors="replace")
+            return (page, f.headers['last-modified'], f.url)
+    except HTTPError as detail:
+        if detail.code == 304:
+            return ("", lastModified, None)
+        print("%s: %s. Skipping..." % (url, detail))
+    except (URLError, OSError) as detail:
+        print("%s: %s. Skipping..." % (url, detail))
+    return (None, None, "")
+
+
+# end def
+
+
+def joinUrls(baseUrl, newUrl):
+    helpUrl, fragment = urldefrag(newUrl)
+    return urljoin(baseUrl, helpUrl)
+
+
+# end def
+
+
+def getRobotParser(startUrl):
+    rp = robotparser.RobotFileParser()
+
+    robotUrl = urljoin(startUrl, "/robots.txt")
+    page, lastModified, url = getPage(robotUrl)
+
+    if not page:
+        print("Could not read ROBOTS.TXT at:", robotUrl)
+        return None
+    # end if
+
+    rp.parse(page.splitlines())
+    print("Found ROBOTS.TXT at:", robotUrl)
+    return rp
+
+
+# end def
+
+
+def hasBlockedExtension(url, blockExtensions):
+    path = urlparse(url)[2].upper()  # path attribute
+    return path.endswith(tuple(blockExtensions))
+
+
+# end def
+
+
+class MyHTMLParser(HTMLParser):
+    """
+    Collect the links in a page, the links are checked by the crawler.
+    """
+
+    def __init__(self, baseUrl):
+        HTMLParser.__init__(self)
+        self.baseUrl = baseUrl
+        self.links = []
+
+    # end def
+
+    def handle_starttag(self, tag, attrs):
+        if (tag.upper() == "BASE"):
+            if attrs and (attrs[0][0].upper() == "HREF"):
+                self.baseUrl = joinUrls(self.baseUrl, attrs[0][1])
+                print("BASE URL set to", self.baseUrl)
+
+        if (tag.upper() == "A"):
+            url = ""
+            # Let's scan the list of tag's attributes
+            for attr in attrs:
+                value = attr[1] or ""
+                if (attr[0].upper() == "REL") and (value.upper().find('NOFOLLOW') != -1):
+                    # We have discovered a nofollow, so we won't continue
+                    return
+                elif (attr[0].upper() == "HREF") and (value.upper().find('MAILTO:') == -1):
+                    # We have discovered a link that is not a Mailto:
+                    url = joinUrls(self.baseUrl, value)
+            # end for
+            # if the url is empty, there was none in the list of attributes
+            if url != "":
+                self.links.append(url)
+        # end if
+    # end def
+
+
+# end class
+
+
+def getLinks(url, page):
+    parser = MyHTMLParser(url)
+    try:
+        parser.feed(page)
+        parser.close()
+    except UnicodeDecodeError:
+        print("Failed decoding %s . Try to check if the page is valid." % url)
+    return parser.links
+
+
+# end def
+
+
+def processPage(url, cached):
+    """
+    Fetch a page and find its links, this is run in a worker thread.
+
+    Returns (lastModified, newUrl, links), newUrl is None if the page could not be read.
+    If the page is in the cache and has not changed, the cached links are returned.
+    """
+    page, lastModified, newUrl = getPage(url, cached.get("lastModified") if cached else None)
+    if page is None:
+        return (None, None, [])
+    if newUrl is None:
+        return (lastModified, url, cached.get("links", []))
+    if newUrl != url:
+        return (lastModified, newUrl, [])
+    return (lastModified, url, getLinks(url, page) if page else [])
+
+
+# end def
+
+
+def loadCache(cacheFile):
+    if not cacheFile or not os.path.isfile(cacheFile):
+        return {}
+    try:
+        with open(cacheFile) as f:
+            return json.load(f)
+    except ValueError:
+        return {}
+
+
+# end def
+
+
+def saveCache(cache, cacheFile):
+    tmp = cacheFile + ".tmp"
+    with open(tmp, "wt") as f:
+        json.dump(cache, f)
+    os.replace(tmp, cacheFile)
+
+
+# end def
+
+
+def writeSitemapEntry(fw, url, date, changefreq="", priority=0.0):
+    fw.write('<url>\n  <loc>%s</loc>\n' % (xml.sax.saxutils.escape(url)))
+    if date != (0, 0, 0):
+        fw.write('  <lastmod>%4d-%02d-%02d</lastmod>\n' % date)
+    if changefreq != "":
+        fw.write('  <changefreq>%s</changefreq>\n' % (changefreq))
+    if priority > 0.0:
+        fw.write('  <priority>%1.1f</priority>\n' % (priority))
+    fw.write('</url>\n')
+
+
+# end def
+
+
+def parsePages(startUrl, maxUrls, blockExtensions, fw, changefreq="", priority=0.0, workers=8, cacheFile=None):
+    """
+    Crawl the site and write the sitemap entries as the pages are processed.
+
+    The pages waiting to be fetched are kept in a queue, up to workers pages
+    are fetched at the same time. The results are processed in the order the
+    pages were queued, so the sitemap does not depend on the number of workers.
+
+    Returns the number of URLs written.
+    """
+    server = urlsplit(startUrl)[1]
+    robotParser = getRobotParser(startUrl)
+    oldCache = loadCache(cacheFile)
+    cache = {}
+
+    # The URLs that have been queued, fetched, redirected or rejected.
+    seen = {startUrl}
+    redirects = set()
+    frontier = deque([startUrl])
+    inFlight = deque()
+    # The number of URLs that are or will be in the sitemap.
+    numUrls = 1
+    written = 0
+
+    def addUrl(url):
+        nonlocal numUrls
+        if numUrls >= maxUrls or url in seen:
+            return
+        # A rejected link is only checked once.
+        seen.add(url)
+        # Check if we want to follow the link
+        if urlsplit(url)[1] != server:
+            return
+        if hasBlockedExtension(url, blockExtensions) or url in redirects:
+            return
+        if (robotParser is not None) and not (robotParser.can_fetch("*", url)):
+            print("URL restricted by ROBOTS.TXT: ", url)
+            return
+        # It's OK to add url to the queue and fetch it later
+        frontier.append(url)
+        numUrls += 1
+
+    # end def
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        while frontier or inFlight:
+            while frontier and len(inFlight) < workers:
+                url = frontier.popleft()
+                inFlight.append((url, executor.submit(processPage, url, oldCache.get(url))))
+            url, future = inFlight.popleft()
+            lastModified, newUrl, links = future.result()
+            print(" ", url)
+            if newUrl is None:
+                numUrls -= 1
+            elif url != newUrl:
+                print("Redirect -> " + newUrl)
+                numUrls -= 1
+                redirects.add(url)
+                if newUrl not in seen:
+                    seen.add(newUrl)
+                    frontier.append(newUrl)
+                    numUrls += 1
+            else:
+                writeSitemapEntry(fw, url, parseDate(lastModified), changefreq, priority)
+                written += 1
+                if lastModified:
+                    cache[url] = {"lastModified": lastModified, "links": links}
+                for link in links:
+                    addUrl(link)
+        # end while
+
+    if cacheFile:
+        saveCache(cache, cacheFile)
+    return written
+
+
+# end def
+
+
+def generateSitemapFile(startUrl, maxUrls, blockExtensions, fileName, changefreq="", priority=0.0, workers=8,
+                        cacheFile=None):
+    # The sitemap is written to a temporary file that replaces the old one when the crawl is finished.
+    tmp = fileName + ".tmp"
+    with open(tmp, "wt") as fw:
+        fw.write('''<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n''')
+        numUrls = parsePages(startUrl, maxUrls, blockExtensions, fw, changefreq, priority, workers, cacheFile)
+        fw.write('</urlset>')
+    os.replace(tmp, fileName)
+    return numUrls
+
+
+# end def
+
+
+def main():
+    try:
+        opts, args = getopt.getopt(
+            sys.argv[1:],
+            "hb:c:m:p:o:w:x:",
+            ["help", "block=", "changefreq=", "max-urls=", "priority=", "output-file=", "workers=", "cache-file="]
+        )
+    except getopt.GetoptError:
+        print(helpText)
+        return
+
+    blockExtensions = []
+    changefreq = ""
+    priority = 0.0
+    fileName = "sitemap.xml"
+    maxUrls = 1000
+    workers = 8
+    cacheFile = None
+
+    for opt, arg in opts:
+        if opt in ("-h", "--help"):
+            print(helpText)
+            return
+        elif opt in ("-b", "--block"):
+            blockExtensions.append("." + arg.upper())
+        elif opt in ("-c", "--changefreq"):
+            if arg in allowedChangefreq:
+                changefreq = arg
+            else:
+                print("Allowed changefreq values are:")
+                for i in allowedChangefreq:
+                    print(i)
+                print("")
+                return
+        elif opt in ("-m", "--max-urls"):
+            maxUrls = int(arg)
+            if (maxUrls < 0) or (maxUrls > 50000):
+                print("The maximum number of URLs must be greater than 0 and smaller than 50000")
+                return
+        elif opt in ("-p", "--priority"):
+            priority = float(arg)
+            if (priority < 0.0) or (priority > 1.0):
+                print("Priority must be between 0.0 and 1.0")
+                return
+        elif opt in ("-o", "--output-file"):
+            fileName = arg
+            if fileName in ("", ".", ".."):
+                print("Please provide a sensible file name")
+                return
+        elif opt in ("-w", "--workers"):
+            workers = int(arg)
+            if workers < 1:
+                print("The number of workers must be at least 1")
+                return
+        elif opt in ("-x", "--cache-file"):
+            cacheFile = arg
+        # end if
+
+    if len(args) == 0:
+        print("You must provide the starting URL.\nTry the -h option for help.")
+        return
+
+    # Set user agent string
+    opener = build_opener()
+    opener.addheaders = [('User-agent', 'sitemap_gen/1.0')]
+    install_opener(opener)
+
+    # Start processing
+    print("Crawling the site and generating the sitemap:", fileName)
+    start = time.perf_counter()
+    numUrls = generateSitemapFile(args[0], maxUrls, blockExtensions, fileName, changefreq, priority, workers,
+                                  cacheFile)
+    print("Finished: %d URLs in %0.1fs" % (numUrls, time.perf_counter() - start))
+
+
+# end def
+
+
+if __name__ == '__main__':
+    main()
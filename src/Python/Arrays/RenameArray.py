@@ -1,18 +1,20 @@
-import vtk
+from vtkmodules.vtkCommonDataModel import vtkPolyData
+from vtkmodules.vtkFiltersSources import vtkSphereSource
+from vtkmodules.vtkIOXML import vtkXMLPolyDataWriter
 
 
 def main():
     # setup sphere
-    sphereSource = vtk.vtkSphereSource()
+    sphereSource = vtkSphereSource()
     sphereSource.Update()
 
-    polydata = vtk.vtkPolyData()
+    polydata = vtkPolyData()
     polydata.ShallowCopy(sphereSource.GetOutput())
 
     normals = polydata.GetPointData().GetNormals()
     normals.SetName('TestN')
 
-    writer = vtk.vtkXMLPolyDataWriter()
+    writer = vtkXMLPolyDataWriter()
     writer.SetFileName('Test.vtp')
     writer.SetInputData(polydata)
     writer.Write()
@@ -1,31 +1,48 @@
 #!/usr/bin/env python
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonDataModel import vtkMultiBlockDataSet
+from vtkmodules.vtkFiltersCore import vtkExtractEdges
+from vtkmodules.vtkFiltersGeometry import vtkCompositeDataGeometryFilter
+from vtkmodules.vtkFiltersSources import vtkSphereSource
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
 
 
 def main():
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
     # PART 1 Make some Data.
     # Make a tree.
-    root = vtk.vtkMultiBlockDataSet()
+    root = vtkMultiBlockDataSet()
 
-    branch = vtk.vtkMultiBlockDataSet()
+    branch = vtkMultiBlockDataSet()
     root.SetBlock(0, branch)
 
     # Make some leaves.
-    leaf1 = vtk.vtkSphereSource()
+    leaf1 = vtkSphereSource()
     leaf1.SetCenter(0, 0, 0)
     leaf1.Update()
     branch.SetBlock(0, leaf1.GetOutput())
 
-    leaf2 = vtk.vtkSphereSource()
+    leaf2 = vtkSphereSource()
     leaf2.SetCenter(1.75, 2.5, 0)
     leaf2.SetRadius(1.5)
     leaf2.Update()
     branch.SetBlock(1, leaf2.GetOutput())
 
-    leaf3 = vtk.vtkSphereSource()
+    leaf3 = vtkSphereSource()
     leaf3.SetCenter(4, 0, 0)
     leaf3.SetRadius(2)
     leaf3.Update()
@@ -33,7 +50,7 @@ def main():
 
     # PART 2 Do something with the data
     # a non composite aware filter, the pipeline will iterate
-    edges = vtk.vtkExtractEdges()
+    edges = vtkExtractEdges()
     edges.SetInputData(root)
 
     # PART 3 Show the data
@@ -41,19 +58,19 @@ def main():
     # this filter aggregates all blocks into one polydata
     # this is handy for display, although fairly limited
     # see vtkCompositePolyDataMapper2 for something better
-    polydata = vtk.vtkCompositeDataGeometryFilter()
+    polydata = vtkCompositeDataGeometryFilter()
     polydata.SetInputConnection(edges.GetOutputPort())
 
     # Create the Renderer, RenderWindow, and RenderWindowInteractor.
-    renderer = vtk.vtkRenderer()
-    renderWindow = vtk.vtkRenderWindow()
+    renderer = vtkRenderer()
+    renderWindow = vtkRenderWindow()
     renderWindow.AddRenderer(renderer)
-    renderWindowInteractor = vtk.vtkRenderWindowInteractor()
+    renderWindowInteractor = vtkRenderWindowInteractor()
     renderWindowInteractor.SetRenderWindow(renderWindow)
 
-    mapper = vtk.vtkPolyDataMapper()
+    mapper = vtkPolyDataMapper()
     mapper.SetInputConnection(0, polydata.GetOutputPort(0))
-    actor = vtk.vtkActor()
+    actor = vtkActor()
     actor.GetProperty().SetColor(colors.GetColor3d('Yellow'))
     actor.GetProperty().SetLineWidth(2)
     actor.SetMapper(mapper)
@@ -1,11 +1,53 @@
 #!/usr/bin/env python
 
 import numpy as np
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonComputationalGeometry import vtkParametricSpline
+from vtkmodules.vtkCommonCore import (
+    mutable,
+    vtkPoints
+)
+from vtkmodules.vtkCommonDataModel import (
+    vtkCellArray,
+    vtkCellLocator,
+    vtkPolyData
+)
+from vtkmodules.vtkFiltersCore import vtkCleanPolyData
+from vtkmodules.vtkFiltersModeling import vtkLoopSubdivisionFilter
+from vtkmodules.vtkFiltersSources import vtkParametricFunctionSource
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
+from vtkmodules.util import numpy_support
+
+
+def get_program_parameters():
+    import argparse
+    description = 'Draw a spline over a smoothed, triangulated height field.'
+    epilogue = '''
+   '''
+    parser = argparse.ArgumentParser(description=description, epilog=epilogue,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-s', '--shared_points', action='store_true',
+                        help='The triangles share the grid points instead of each having their own points.')
+    args = parser.parse_args()
+    return args.shared_points
 
 
 def main():
-    named_colors = vtk.vtkNamedColors()
+    shared_points = get_program_parameters()
+
+    named_colors = vtkNamedColors()
 
     # Make a 32 x 32 grid.
     size = 32
@@ -17,79 +59,24 @@ def main():
     topography = np.random.randint(0, 5, (size, size))
 
     # Define points, triangles and colors
-    colors = vtk.vtkUnsignedCharArray()
-    colors.SetNumberOfComponents(3)
-    points = vtk.vtkPoints()
-    triangles = vtk.vtkCellArray()
-
-    # Build the meshgrid manually.
-    count = 0
-    for i in range(size - 1):
-        for j in range(size - 1):
-            z1 = topography[i][j]
-            z2 = topography[i][j + 1]
-            z3 = topography[i + 1][j]
-
-            # Triangle 1
-            points.InsertNextPoint(i, j, z1)
-            points.InsertNextPoint(i, (j + 1), z2)
-            points.InsertNextPoint((i + 1), j, z3)
-
-            triangle = vtk.vtkTriangle()
-            triangle.GetPointIds().SetId(0, count)
-            triangle.GetPointIds().SetId(1, count + 1)
-            triangle.GetPointIds().SetId(2, count + 2)
-
-            triangles.InsertNextCell(triangle)
-
-            z1 = topography[i][j + 1]
-            z2 = topography[i + 1][j + 1]
-            z3 = topography[i + 1][j]
-
-            # Triangle 2
-            points.InsertNextPoint(i, (j + 1), z1)
-            points.InsertNextPoint((i + 1), (j + 1), z2)
-            points.InsertNextPoint((i + 1), j, z3)
-
-            triangle = vtk.vtkTriangle()
-            triangle.GetPointIds().SetId(0, count + 3)
-            triangle.GetPointIds().SetId(1, count + 4)
-            triangle.GetPointIds().SetId(2, count + 5)
-
-            count += 6
-
-            triangles.InsertNextCell(triangle)
-
-            # Add some color.
-            r = [int(i / float(size) * 255), int(j / float(size) * 255), 0]
-            colors.InsertNextTypedTuple(r)
-            colors.InsertNextTypedTuple(r)
-            colors.InsertNextTypedTuple(r)
-            colors.InsertNextTypedTuple(r)
-            colors.InsertNextTypedTuple(r)
-            colors.InsertNextTypedTuple(r)
-
-    # Create a polydata object.
-    trianglePolyData = vtk.vtkPolyData()
-
-    # Add the geometry and topology to the polydata.
-    trianglePolyData.SetPoints(points)
-    trianglePolyData.GetPointData().SetScalars(colors)
-    trianglePolyData.SetPolys(triangles)
+    trianglePolyData = make_height_field(topography, shared_points)
 
     # Clean the polydata so that the edges are shared!
-    cleanPolyData = vtk.vtkCleanPolyData()
+    cleanPolyData = vtkCleanPolyData()
     cleanPolyData.SetInputData(trianglePolyData)
+    if shared_points:
+        # The points are already shared.
+        cleanPolyData.PointMergingOff()
 
     # Use a filter to smooth the data (will add triangles and smooth).
-    smooth_loop = vtk.vtkLoopSubdivisionFilter()
+    smooth_loop = vtkLoopSubdivisionFilter()
     smooth_loop.SetNumberOfSubdivisions(3)
     smooth_loop.SetInputConnection(cleanPolyData.GetOutputPort())
 
     # Create a mapper and actor for smoothed dataset.
-    mapper = vtk.vtkPolyDataMapper()
+    mapper = vtkPolyDataMapper()
     mapper.SetInputConnection(smooth_loop.GetOutputPort())
-    actor_loop = vtk.vtkActor()
+    actor_loop = vtkActor()
     actor_loop.SetMapper(mapper)
     actor_loop.GetProperty().SetInterpolationToFlat()
 
@@ -98,7 +85,7 @@ def main():
 
     # Define a cellLocator to be able to compute intersections between lines.
     # and the surface
-    locator = vtk.vtkCellLocator()
+    locator = vtkCellLocator()
     locator.SetDataSet(smooth_loop.GetOutput())
     locator.BuildLocator()
 
@@ -108,17 +95,17 @@ def main():
 
     # Make a list of points. Each point is the intersection of a vertical line
     # defined by p1 and p2 and the surface.
-    points = vtk.vtkPoints()
+    points = vtkPoints()
     for i in range(maxloop):
         p1 = [2 + i * dist, 16, -1]
         p2 = [2 + i * dist, 16, 6]
 
         # Outputs (we need only pos which is the x, y, z position
         # of the intersection)
-        t = vtk.mutable(0)
+        t = mutable(0)
         pos = [0.0, 0.0, 0.0]
         pcoords = [0.0, 0.0, 0.0]
-        subId = vtk.mutable(0)
+        subId = mutable(0)
         locator.IntersectWithLine(p1, p2, tolerance, t, pos, pcoords, subId)
 
         # Add a slight offset in z.
@@ -127,27 +114,27 @@ def main():
         points.InsertNextPoint(pos)
 
     # Create a spline and add the points
-    spline = vtk.vtkParametricSpline()
+    spline = vtkParametricSpline()
     spline.SetPoints(points)
-    functionSource = vtk.vtkParametricFunctionSource()
+    functionSource = vtkParametricFunctionSource()
     functionSource.SetUResolution(maxloop)
     functionSource.SetParametricFunction(spline)
 
     # Map the spline
-    mapper = vtk.vtkPolyDataMapper()
+    mapper = vtkPolyDataMapper()
     mapper.SetInputConnection(functionSource.GetOutputPort())
 
     # Define the line actor
-    actor = vtk.vtkActor()
+    actor = vtkActor()
     actor.SetMapper(mapper)
     actor.GetProperty().SetColor(named_colors.GetColor3d('Red'))
     actor.GetProperty().SetLineWidth(3)
 
     # Visualize
-    renderer = vtk.vtkRenderer()
-    renderWindow = vtk.vtkRenderWindow()
+    renderer = vtkRenderer()
+    renderWindow = vtkRenderWindow()
     renderWindow.AddRenderer(renderer)
-    renderWindowInteractor = vtk.vtkRenderWindowInteractor()
+    renderWindowInteractor = vtkRenderWindowInteractor()
     renderWindowInteractor.SetRenderWindow(renderWindow)
 
     # Add actors and render
@@ -167,5 +154,59 @@ def main():
     renderWindowInteractor.Start()
 
 
+def make_height_field(topography, shared_points=False):
+    """
+    Make a triangle mesh of a height field, each grid cell is split into two triangles.
+
+    The points, cells and colors are built from NumPy arrays that VTK uses without copying.
+
+    :param topography: The heights, an array of shape (nx, ny).
+    :param shared_points: If True, the triangles share the grid points and the cells are colored,
+                           otherwise each triangle has its own points and the points are colored.
+    :return: The polydata.
+    """
+    nx, ny = topography.shape
+    # The indices of the grid cells.
+    i, j = np.meshgrid(np.arange(nx - 1), np.arange(ny - 1), indexing='ij')
+    i = i.ravel()
+    j = j.ravel()
+    cell_colors = np.zeros((i.size, 3), dtype=np.uint8)
+    cell_colors[:, 0] = i / float(nx) * 255
+    cell_colors[:, 1] = j / float(ny) * 255
+
+    if shared_points:
+        pi, pj = np.meshgrid(np.arange(nx), np.arange(ny), indexing='ij')
+        pi = pi.ravel()
+        pj = pj.ravel()
+        # The corners of the cells: a = (i, j), b = (i, j + 1), c = (i + 1, j), d = (i + 1, j + 1).
+        a = i * ny + j
+        connectivity = np.column_stack((a, a + 1, a + ny, a + 1, a + ny + 1, a + ny)).ravel()
+    else:
+        # The same corners, each triangle has its own copies of the points.
+        pi = (i[:, np.newaxis] + np.array([0, 0, 1, 0, 1, 1])).ravel()
+        pj = (j[:, np.newaxis] + np.array([0, 1, 0, 1, 1, 0])).ravel()
+        connectivity = np.arange(pi.size)
+    xyz = np.column_stack((pi, pj, topography[pi, pj])).astype(np.float32)
+    connectivity = connectivity.astype(np.int64)
+    offsets = np.arange(0, connectivity.size + 1, 3, dtype=np.int64)
+
+    points = vtkPoints()
+    points.SetData(numpy_support.numpy_to_vtk(xyz, deep=False))
+    triangles = vtkCellArray()
+    triangles.SetData(numpy_support.numpy_to_vtkIdTypeArray(offsets, deep=False),
+                      numpy_support.numpy_to_vtkIdTypeArray(connectivity, deep=False))
+
+    poly_data = vtkPolyData()
+    poly_data.SetPoints(points)
+    poly_data.SetPolys(triangles)
+    if shared_points:
+        colors = numpy_support.numpy_to_vtk(np.repeat(cell_colors, 2, axis=0), deep=False)
+        poly_data.GetCellData().SetScalars(colors)
+    else:
+        colors = numpy_support.numpy_to_vtk(np.repeat(cell_colors, 6, axis=0), deep=False)
+        poly_data.GetPointData().SetScalars(colors)
+    return poly_data
+
+
 if __name__ == '__main__':
     main()
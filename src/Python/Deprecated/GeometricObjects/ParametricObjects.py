@@ -1,11 +1,27 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonComputationalGeometry import vtkParametricFigure8Klein
+from vtkmodules.vtkFiltersSources import vtkParametricFunctionSource
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkPolyDataMapper,
+    vtkProperty,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
 
 
 def main():
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
     colors.SetColor("BkgColor", [26, 51, 102, 255])
 
@@ -16,7 +32,7 @@ def main():
     # parametricObject = vtk.vtkParametricDini()
     # parametricObject = vtk.vtkParametricEllipsoid()
     # parametricObject = vtk.vtkParametricEnneper()
-    parametricObject = vtk.vtkParametricFigure8Klein()
+    parametricObject = vtkParametricFigure8Klein()
     # parametricObject = vtk.vtkParametricKlein()
     # parametricObject = vtk.vtkParametricMobius()
     # parametricObject = vtk.vtkParametricRandomHills()
@@ -26,29 +42,29 @@ def main():
     # parametricObject = vtk.vtkParametricSuperToroid()
     # parametricObject = vtk.vtkParametricTorus()
 
-    parametricFunctionSource = vtk.vtkParametricFunctionSource()
+    parametricFunctionSource = vtkParametricFunctionSource()
     parametricFunctionSource.SetParametricFunction(parametricObject)
     parametricFunctionSource.Update()
 
     # Visualize
-    backProperty = vtk.vtkProperty()
+    backProperty = vtkProperty()
     backProperty.SetColor(colors.GetColor3d("Tomato"))
 
-    mapper = vtk.vtkPolyDataMapper()
+    mapper = vtkPolyDataMapper()
     mapper.SetInputConnection(parametricFunctionSource.GetOutputPort())
 
     # Create an actor for the contours
-    actor = vtk.vtkActor()
+    actor = vtkActor()
     actor.SetMapper(mapper)
     actor.GetProperty().SetColor(colors.GetColor3d("Banana"))
     actor.GetProperty().SetSpecular(.5)
     actor.GetProperty().SetSpecularPower(20)
     actor.SetBackfaceProperty(backProperty)
-    renderer = vtk.vtkRenderer()
-    renderWindow = vtk.vtkRenderWindow()
+    renderer = vtkRenderer()
+    renderWindow = vtkRenderWindow()
     renderWindow.SetWindowName("Parametric Objects")
     renderWindow.AddRenderer(renderer)
-    interactor = vtk.vtkRenderWindowInteractor()
+    interactor = vtkRenderWindowInteractor()
     interactor.SetRenderWindow(renderWindow)
 
     renderer.AddActor(actor)
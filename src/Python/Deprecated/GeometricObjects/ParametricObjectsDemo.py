@@ -1,46 +1,85 @@
 # !/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonComputationalGeometry import (
+    vtkParametricBoy,
+    vtkParametricConicSpiral,
+    vtkParametricCrossCap,
+    vtkParametricDini,
+    vtkParametricEllipsoid,
+    vtkParametricEnneper,
+    vtkParametricFigure8Klein,
+    vtkParametricKlein,
+    vtkParametricMobius,
+    vtkParametricRandomHills,
+    vtkParametricRoman,
+    vtkParametricSpline,
+    vtkParametricSuperEllipsoid,
+    vtkParametricSuperToroid,
+    vtkParametricTorus
+)
+from vtkmodules.vtkCommonCore import (
+    vtkMinimalStandardRandomSequence,
+    vtkPoints
+)
+from vtkmodules.vtkFiltersSources import vtkParametricFunctionSource
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkActor2D,
+    vtkPolyDataMapper,
+    vtkProperty,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer,
+    vtkTextMapper,
+    vtkTextProperty
+)
 
 
 def main():
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
     colors.SetColor("BkgColor", [26, 51, 102, 255])
 
     parametricObjects = list()
-    parametricObjects.append(vtk.vtkParametricBoy())
-    parametricObjects.append(vtk.vtkParametricConicSpiral())
-    parametricObjects.append(vtk.vtkParametricCrossCap())
-    parametricObjects.append(vtk.vtkParametricDini())
+    parametricObjects.append(vtkParametricBoy())
+    parametricObjects.append(vtkParametricConicSpiral())
+    parametricObjects.append(vtkParametricCrossCap())
+    parametricObjects.append(vtkParametricDini())
 
-    parametricObjects.append(vtk.vtkParametricEllipsoid())
+    parametricObjects.append(vtkParametricEllipsoid())
     parametricObjects[-1].SetXRadius(0.5)
     parametricObjects[-1].SetYRadius(2.0)
-    parametricObjects.append(vtk.vtkParametricEnneper())
-    parametricObjects.append(vtk.vtkParametricFigure8Klein())
-    parametricObjects.append(vtk.vtkParametricKlein())
+    parametricObjects.append(vtkParametricEnneper())
+    parametricObjects.append(vtkParametricFigure8Klein())
+    parametricObjects.append(vtkParametricKlein())
 
-    parametricObjects.append(vtk.vtkParametricMobius())
+    parametricObjects.append(vtkParametricMobius())
     parametricObjects[-1].SetRadius(2)
     parametricObjects[-1].SetMinimumV(-0.5)
     parametricObjects[-1].SetMaximumV(0.5)
-    parametricObjects.append(vtk.vtkParametricRandomHills())
+    parametricObjects.append(vtkParametricRandomHills())
     parametricObjects[-1].AllowRandomGenerationOff()
-    parametricObjects.append(vtk.vtkParametricRoman())
-    parametricObjects.append(vtk.vtkParametricSuperEllipsoid())
+    parametricObjects.append(vtkParametricRoman())
+    parametricObjects.append(vtkParametricSuperEllipsoid())
     parametricObjects[-1].SetN1(0.5)
     parametricObjects[-1].SetN2(0.1)
 
-    parametricObjects.append(vtk.vtkParametricSuperToroid())
+    parametricObjects.append(vtkParametricSuperToroid())
     parametricObjects[-1].SetN1(0.2)
     parametricObjects[-1].SetN2(3.0)
-    parametricObjects.append(vtk.vtkParametricTorus())
-    parametricObjects.append(vtk.vtkParametricSpline())
+    parametricObjects.append(vtkParametricTorus())
+    parametricObjects.append(vtkParametricSpline())
     # Add some points to the parametric spline.
-    inputPoints = vtk.vtkPoints()
-    rng = vtk.vtkMinimalStandardRandomSequence()
+    inputPoints = vtkPoints()
+    rng = vtkMinimalStandardRandomSequence()
     rng.SetSeed(8775070)
     for i in range(0, 10):
         rng.Next()
@@ -60,42 +99,42 @@ def main():
     textactors = list()
 
     # Create one text property for all
-    textProperty = vtk.vtkTextProperty()
+    textProperty = vtkTextProperty()
     textProperty.SetFontSize(12)
     textProperty.SetJustificationToCentered()
 
-    backProperty = vtk.vtkProperty()
+    backProperty = vtkProperty()
     backProperty.SetColor(colors.GetColor3d("Tomato"))
 
     # Create a parametric function source, renderer, mapper, and actor
     # for each object
     for i in range(0, len(parametricObjects)):
-        parametricFunctionSources.append(vtk.vtkParametricFunctionSource())
+        parametricFunctionSources.append(vtkParametricFunctionSource())
         parametricFunctionSources[i].SetParametricFunction(parametricObjects[i])
         parametricFunctionSources[i].SetUResolution(51)
         parametricFunctionSources[i].SetVResolution(51)
         parametricFunctionSources[i].SetWResolution(51)
         parametricFunctionSources[i].Update()
 
-        mappers.append(vtk.vtkPolyDataMapper())
+        mappers.append(vtkPolyDataMapper())
         mappers[i].SetInputConnection(parametricFunctionSources[i].GetOutputPort())
 
-        actors.append(vtk.vtkActor())
+        actors.append(vtkActor())
         actors[i].SetMapper(mappers[i])
         actors[i].GetProperty().SetColor(colors.GetColor3d("Banana"))
         actors[i].GetProperty().SetSpecular(.5)
         actors[i].GetProperty().SetSpecularPower(20)
         actors[i].SetBackfaceProperty(backProperty)
 
-        textmappers.append(vtk.vtkTextMapper())
+        textmappers.append(vtkTextMapper())
         textmappers[i].SetInput(parametricObjects[i].GetClassName())
         textmappers[i].SetTextProperty(textProperty)
 
-        textactors.append(vtk.vtkActor2D())
+        textactors.append(vtkActor2D())
         textactors[i].SetMapper(textmappers[i])
         textactors[i].SetPosition(100, 16)
 
-        renderers.append(vtk.vtkRenderer())
+        renderers.append(vtkRenderer())
         renderers[i].AddActor(actors[i])
         renderers[i].AddActor(textactors[i])
         renderers[i].SetBackground(colors.GetColor3d("BkgColor"))
@@ -104,7 +143,7 @@ def main():
     xGridDimensions = 4
     yGridDimensions = 4
     rendererSize = 200
-    renderWindow = vtk.vtkRenderWindow()
+    renderWindow = vtkRenderWindow()
     renderWindow.SetWindowName("Parametric Objects Demonstration")
     renderWindow.SetSize(rendererSize * xGridDimensions, rendererSize * yGridDimensions)
     for row in range(0, yGridDimensions):
@@ -120,7 +159,7 @@ def main():
             if index > (len(actors) - 1):
                 # Add a renderer even if there is no actor.
                 # This makes the render window background all the same color.
-                ren = vtk.vtkRenderer()
+                ren = vtkRenderer()
                 ren.SetBackground(colors.GetColor3d("BkgColor"))
                 ren.SetViewport(viewport)
                 renderWindow.AddRenderer(ren)
@@ -134,7 +173,7 @@ def main():
             renderers[index].ResetCameraClippingRange()
             renderWindow.AddRenderer(renderers[index])
 
-    interactor = vtk.vtkRenderWindowInteractor()
+    interactor = vtkRenderWindowInteractor()
     interactor.SetRenderWindow(renderWindow)
 
     renderWindow.Render()
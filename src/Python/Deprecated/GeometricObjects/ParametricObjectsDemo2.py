@@ -1,25 +1,52 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonComputationalGeometry import (
+    vtkParametricBohemianDome,
+    vtkParametricBour,
+    vtkParametricCatalanMinimal,
+    vtkParametricHenneberg,
+    vtkParametricKuen,
+    vtkParametricPluckerConoid,
+    vtkParametricPseudosphere
+)
+from vtkmodules.vtkFiltersSources import vtkParametricFunctionSource
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkActor2D,
+    vtkPolyDataMapper,
+    vtkProperty,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer,
+    vtkTextMapper,
+    vtkTextProperty
+)
 
 
 def main():
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
     colors.SetColor("BkgColor", [26, 51, 102, 255])
 
     parametricObjects = list()
-    parametricObjects.append(vtk.vtkParametricBohemianDome())
+    parametricObjects.append(vtkParametricBohemianDome())
     parametricObjects[-1].SetA(5.0)
     parametricObjects[-1].SetB(1.0)
     parametricObjects[-1].SetC(2.0)
-    parametricObjects.append(vtk.vtkParametricBour())
-    parametricObjects.append(vtk.vtkParametricCatalanMinimal())
-    parametricObjects.append(vtk.vtkParametricHenneberg())
-    parametricObjects.append(vtk.vtkParametricKuen())
-    parametricObjects.append(vtk.vtkParametricPluckerConoid())
-    parametricObjects.append(vtk.vtkParametricPseudosphere())
+    parametricObjects.append(vtkParametricBour())
+    parametricObjects.append(vtkParametricCatalanMinimal())
+    parametricObjects.append(vtkParametricHenneberg())
+    parametricObjects.append(vtkParametricKuen())
+    parametricObjects.append(vtkParametricPluckerConoid())
+    parametricObjects.append(vtkParametricPseudosphere())
 
     parametricFunctionSources = list()
     renderers = list()
@@ -29,41 +56,41 @@ def main():
     textactors = list()
 
     # Create one text property for all
-    textProperty = vtk.vtkTextProperty()
+    textProperty = vtkTextProperty()
     textProperty.SetFontSize(12)
     textProperty.SetJustificationToCentered()
 
-    backProperty = vtk.vtkProperty()
+    backProperty = vtkProperty()
     backProperty.SetColor(colors.GetColor3d("Tomato"))
 
     # Create a parametric function source, renderer, mapper, and actor
     # for each object
     for i in range(0, len(parametricObjects)):
         parametricFunctionSources.append(
-            vtk.vtkParametricFunctionSource())
+            vtkParametricFunctionSource())
         parametricFunctionSources[i].SetParametricFunction(parametricObjects[i])
         parametricFunctionSources[i].Update()
 
-        mappers.append(vtk.vtkPolyDataMapper())
+        mappers.append(vtkPolyDataMapper())
         mappers[i].SetInputConnection(
             parametricFunctionSources[i].GetOutputPort())
 
-        actors.append(vtk.vtkActor())
+        actors.append(vtkActor())
         actors[i].SetMapper(mappers[i])
         actors[i].GetProperty().SetColor(colors.GetColor3d("Banana"))
         actors[i].GetProperty().SetSpecular(.5)
         actors[i].GetProperty().SetSpecularPower(20)
         actors[i].SetBackfaceProperty(backProperty)
 
-        textmappers.append(vtk.vtkTextMapper())
+        textmappers.append(vtkTextMapper())
         textmappers[i].SetInput(parametricObjects[i].GetClassName())
         textmappers[i].SetTextProperty(textProperty)
 
-        textactors.append(vtk.vtkActor2D())
+        textactors.append(vtkActor2D())
         textactors[i].SetMapper(textmappers[i])
         textactors[i].SetPosition(100, 16)
 
-        renderers.append(vtk.vtkRenderer())
+        renderers.append(vtkRenderer())
         renderers[i].AddActor(actors[i])
         renderers[i].AddActor(textactors[i])
         renderers[i].SetBackground(colors.GetColor3d("BkgColor"))
@@ -72,7 +99,7 @@ def main():
     xGridDimensions = 4
     yGridDimensions = 2
     rendererSize = 200
-    renderWindow = vtk.vtkRenderWindow()
+    renderWindow = vtkRenderWindow()
     renderWindow.SetWindowName("Parametric Objects Demonstration2")
     renderWindow.SetSize(rendererSize * xGridDimensions,
                          rendererSize * yGridDimensions)
@@ -89,7 +116,7 @@ def main():
             if index > (len(actors) - 1):
                 # Add a renderer even if there is no actor.
                 # This makes the render window background all the same color.
-                ren = vtk.vtkRenderer()
+                ren = vtkRenderer()
                 ren.SetBackground(colors.GetColor3d("BkgColor"))
                 ren.SetViewport(viewport)
                 renderWindow.AddRenderer(ren)
@@ -103,7 +130,7 @@ def main():
             renderers[index].ResetCameraClippingRange()
             renderWindow.AddRenderer(renderers[index])
 
-    interactor = vtk.vtkRenderWindowInteractor()
+    interactor = vtkRenderWindowInteractor()
     interactor.SetRenderWindow(renderWindow)
 
     renderWindow.Render()
@@ -1,15 +1,31 @@
 #!/usr/bin/python
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonCore import vtkDoubleArray
+from vtkmodules.vtkCommonDataModel import vtkMutableDirectedGraph
+from vtkmodules.vtkGeovisCore import vtkGeoAssignCoordinates
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkGraphMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
 
 
 def main():
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
-    g = vtk.vtkMutableDirectedGraph()
-    latitude = vtk.vtkDoubleArray()
+    g = vtkMutableDirectedGraph()
+    latitude = vtkDoubleArray()
     latitude.SetName('latitude')
-    longitude = vtk.vtkDoubleArray()
+    longitude = vtkDoubleArray()
     longitude.SetName('longitude')
     for i in range(-90, 90, 10):
         for j in range(-180, 180, 20):
@@ -19,7 +35,7 @@ def main():
     g.GetVertexData().AddArray(latitude)
     g.GetVertexData().AddArray(longitude)
 
-    assign = vtk.vtkGeoAssignCoordinates()
+    assign = vtkGeoAssignCoordinates()
     assign.SetInputData(g)
 
     assign.SetLatitudeArrayName('latitude')
@@ -27,14 +43,14 @@ def main():
     assign.SetGlobeRadius(1.0)
     assign.Update()
 
-    mapper = vtk.vtkGraphMapper()
+    mapper = vtkGraphMapper()
     mapper.SetInputConnection(assign.GetOutputPort())
-    actor = vtk.vtkActor()
+    actor = vtkActor()
     actor.SetMapper(mapper)
-    ren = vtk.vtkRenderer()
+    ren = vtkRenderer()
     ren.AddActor(actor)
-    iren = vtk.vtkRenderWindowInteractor()
-    renWin = vtk.vtkRenderWindow()
+    iren = vtkRenderWindowInteractor()
+    renWin = vtkRenderWindow()
     renWin.AddRenderer(ren)
     renWin.SetInteractor(iren)
     ren.SetBackground(colors.GetColor3d('MidnightBlue'))
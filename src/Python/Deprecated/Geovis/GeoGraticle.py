@@ -1,22 +1,42 @@
 #!/usr/bin/env python
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkFiltersGeneral import vtkTransformFilter
+from vtkmodules.vtkGeovisCore import (
+    vtkGeoGraticule,
+    vtkGeoProjection,
+    vtkGeoTransform
+)
+from vtkmodules.vtkIOXML import vtkXMLPolyDataReader
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
 
 
 def main():
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
-    geoGraticle = vtk.vtkGeoGraticule()
-    transformProjection = vtk.vtkGeoTransform()
-    destinationProjection = vtk.vtkGeoProjection()
-    sourceProjection = vtk.vtkGeoProjection()
-    transformGraticle = vtk.vtkTransformFilter()
+    geoGraticle = vtkGeoGraticule()
+    transformProjection = vtkGeoTransform()
+    destinationProjection = vtkGeoProjection()
+    sourceProjection = vtkGeoProjection()
+    transformGraticle = vtkTransformFilter()
 
-    reader = vtk.vtkXMLPolyDataReader()
-    transformReader = vtk.vtkTransformFilter()
-    graticleMapper = vtk.vtkPolyDataMapper()
-    readerMapper = vtk.vtkPolyDataMapper()
-    graticleActor = vtk.vtkActor()
-    readerActor = vtk.vtkActor()
+    reader = vtkXMLPolyDataReader()
+    transformReader = vtkTransformFilter()
+    graticleMapper = vtkPolyDataMapper()
+    readerMapper = vtkPolyDataMapper()
+    graticleActor = vtkActor()
+    readerActor = vtkActor()
 
     geoGraticle.SetGeometryType(geoGraticle.POLYLINES)
     geoGraticle.SetLatitudeLevel(2)
@@ -34,9 +54,9 @@ def main():
     graticleMapper.SetInputConnection(transformGraticle.GetOutputPort())
     graticleActor.SetMapper(graticleMapper)
 
-    renderWindow = vtk.vtkRenderWindow()
-    renderer = vtk.vtkRenderer()
-    interactor = vtk.vtkRenderWindowInteractor()
+    renderWindow = vtkRenderWindow()
+    renderer = vtkRenderer()
+    interactor = vtkRenderWindowInteractor()
     renderWindow.SetInteractor(interactor)
     renderWindow.AddRenderer(renderer)
     renderWindow.SetSize(640, 480)
@@ -1,50 +1,72 @@
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonDataModel import vtkPolyData
+from vtkmodules.vtkFiltersCore import (
+    vtkAppendPolyData,
+    vtkCleanPolyData
+)
+from vtkmodules.vtkFiltersSources import (
+    vtkConeSource,
+    vtkSphereSource
+)
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
 
 
 def main():
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
     # Set the background color.
     colors.SetColor('BkgColor', [0.3, 0.2, 0.1, 1.0])
 
-    input1 = vtk.vtkPolyData()
-    input2 = vtk.vtkPolyData()
+    input1 = vtkPolyData()
+    input2 = vtkPolyData()
 
-    sphereSource = vtk.vtkSphereSource()
+    sphereSource = vtkSphereSource()
     sphereSource.SetCenter(5, 0, 0)
     sphereSource.Update()
 
     input1.ShallowCopy(sphereSource.GetOutput())
 
-    coneSource = vtk.vtkConeSource()
+    coneSource = vtkConeSource()
     coneSource.Update()
 
     input2.ShallowCopy(coneSource.GetOutput())
 
     # Append the two meshes
-    appendFilter = vtk.vtkAppendPolyData()
+    appendFilter = vtkAppendPolyData()
     appendFilter.AddInputData(input1)
     appendFilter.AddInputData(input2)
 
     appendFilter.Update()
 
     #  Remove any duplicate points.
-    cleanFilter = vtk.vtkCleanPolyData()
+    cleanFilter = vtkCleanPolyData()
     cleanFilter.SetInputConnection(appendFilter.GetOutputPort())
     cleanFilter.Update()
 
     # Create a mapper and actor
-    mapper = vtk.vtkPolyDataMapper()
+    mapper = vtkPolyDataMapper()
     mapper.SetInputConnection(cleanFilter.GetOutputPort())
 
-    actor = vtk.vtkActor()
+    actor = vtkActor()
     actor.SetMapper(mapper)
 
     # Create a renderer, render window, and interactor
-    renderer = vtk.vtkRenderer()
-    renderWindow = vtk.vtkRenderWindow()
+    renderer = vtkRenderer()
+    renderWindow = vtkRenderWindow()
     renderWindow.AddRenderer(renderer)
-    renderWindowInteractor = vtk.vtkRenderWindowInteractor()
+    renderWindowInteractor = vtkRenderWindowInteractor()
     renderWindowInteractor.SetRenderWindow(renderWindow)
 
     # Add the actors to the scene
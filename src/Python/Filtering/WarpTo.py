@@ -1,40 +1,56 @@
 #!/usr/bin/env python
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkFiltersCore import vtkTubeFilter
+from vtkmodules.vtkFiltersGeneral import vtkWarpTo
+from vtkmodules.vtkFiltersSources import vtkLineSource
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkDataSetMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
 
 def main():
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
     # Create the RenderWindow, Renderer and both Actors
-    renderer = vtk.vtkRenderer()
-    renderWindow = vtk.vtkRenderWindow()
+    renderer = vtkRenderer()
+    renderWindow = vtkRenderWindow()
     renderWindow.AddRenderer(renderer)
-    renderWindowInteractor = vtk.vtkRenderWindowInteractor()
+    renderWindowInteractor = vtkRenderWindowInteractor()
     renderWindowInteractor.SetRenderWindow(renderWindow)
     
     # Create a line
-    lineSource = vtk.vtkLineSource()
+    lineSource = vtkLineSource()
     lineSource.SetPoint1(0.0, 0.0, 0.0)
     lineSource.SetPoint2(0.0, 1.0, 0.0)
     lineSource.SetResolution(20)
     lineSource.Update()
     
     # Create a tube (cylinder) around the line
-    tubeFilter = vtk.vtkTubeFilter()
+    tubeFilter = vtkTubeFilter()
     tubeFilter.SetInputConnection(lineSource.GetOutputPort())
     tubeFilter.SetRadius(.01) #default is .5
     tubeFilter.SetNumberOfSides(50)
     tubeFilter.Update()
     
-    warpTo = vtk.vtkWarpTo()
+    warpTo = vtkWarpTo()
     warpTo.SetInputConnection(tubeFilter.GetOutputPort())
     warpTo.SetPosition(10, 1, 0)
     warpTo.SetScaleFactor(5)
     warpTo.AbsoluteOn()
     
-    mapper = vtk.vtkDataSetMapper()
+    mapper = vtkDataSetMapper()
     mapper.SetInputConnection(warpTo.GetOutputPort())
     mapper.ScalarVisibilityOff()
     
-    actor = vtk.vtkActor()
+    actor = vtkActor()
     actor.SetMapper(mapper)
     actor.GetProperty().SetColor(colors.GetColor3d('Gold'))
 
@@ -1,7 +1,55 @@
 # !/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import (
+    vtkColorSeries,
+    vtkNamedColors
+)
+from vtkmodules.vtkCommonCore import (
+    vtkIntArray,
+    vtkLookupTable,
+    vtkMinimalStandardRandomSequence,
+    vtkPoints
+)
+from vtkmodules.vtkCommonDataModel import (
+    VTK_CUBIC_LINE,
+    VTK_HEXAHEDRON,
+    VTK_LINE,
+    VTK_PYRAMID,
+    VTK_QUAD,
+    VTK_QUADRATIC_EDGE,
+    VTK_QUADRATIC_HEXAHEDRON,
+    VTK_QUADRATIC_PYRAMID,
+    VTK_QUADRATIC_QUAD,
+    VTK_QUADRATIC_TETRA,
+    VTK_QUADRATIC_TRIANGLE,
+    VTK_QUADRATIC_WEDGE,
+    VTK_TETRA,
+    VTK_TRIANGLE,
+    VTK_WEDGE,
+    vtkCellTypes
+)
+from vtkmodules.vtkFiltersGeneral import (
+    vtkShrinkFilter,
+    vtkTessellatorFilter
+)
+from vtkmodules.vtkFiltersSources import vtkCellTypeSource
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkActor2D,
+    vtkDataSetMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer,
+    vtkTextMapper,
+    vtkTextProperty
+)
 
 
 def main():
@@ -9,36 +57,36 @@ def main():
 
     # Store the cell class names in a dictionary.
     cellMap = dict()
-    cellMap[vtk.vtkCellTypes.GetClassNameFromTypeId(vtk.VTK_LINE)] = vtk.VTK_LINE
-    cellMap[vtk.vtkCellTypes.GetClassNameFromTypeId(vtk.VTK_QUADRATIC_EDGE)] = vtk.VTK_QUADRATIC_EDGE
-    cellMap[vtk.vtkCellTypes.GetClassNameFromTypeId(vtk.VTK_CUBIC_LINE)] = vtk.VTK_CUBIC_LINE
-
-    cellMap[vtk.vtkCellTypes.GetClassNameFromTypeId(vtk.VTK_TRIANGLE)] = vtk.VTK_TRIANGLE
-    cellMap[vtk.vtkCellTypes.GetClassNameFromTypeId(vtk.VTK_QUADRATIC_TRIANGLE)] = vtk.VTK_QUADRATIC_TRIANGLE
-    cellMap[vtk.vtkCellTypes.GetClassNameFromTypeId(vtk.VTK_QUAD)] = vtk.VTK_QUAD
-    cellMap[vtk.vtkCellTypes.GetClassNameFromTypeId(vtk.VTK_QUADRATIC_QUAD)] = vtk.VTK_QUADRATIC_QUAD
-
-    cellMap[vtk.vtkCellTypes.GetClassNameFromTypeId(vtk.VTK_TETRA)] = vtk.VTK_TETRA
-    cellMap[vtk.vtkCellTypes.GetClassNameFromTypeId(vtk.VTK_HEXAHEDRON)] = vtk.VTK_HEXAHEDRON
-    cellMap[vtk.vtkCellTypes.GetClassNameFromTypeId(vtk.VTK_WEDGE)] = vtk.VTK_WEDGE
-    cellMap[vtk.vtkCellTypes.GetClassNameFromTypeId(vtk.VTK_PYRAMID)] = vtk.VTK_PYRAMID
-    cellMap[vtk.vtkCellTypes.GetClassNameFromTypeId(vtk.VTK_QUADRATIC_WEDGE)] = vtk.VTK_QUADRATIC_WEDGE
-    cellMap[vtk.vtkCellTypes.GetClassNameFromTypeId(vtk.VTK_QUADRATIC_PYRAMID)] = vtk.VTK_QUADRATIC_PYRAMID
-    cellMap[vtk.vtkCellTypes.GetClassNameFromTypeId(vtk.VTK_QUADRATIC_HEXAHEDRON)] = vtk.VTK_QUADRATIC_HEXAHEDRON
-    cellMap[vtk.vtkCellTypes.GetClassNameFromTypeId(vtk.VTK_QUADRATIC_TETRA)] = vtk.VTK_QUADRATIC_TETRA
+    cellMap[vtkCellTypes.GetClassNameFromTypeId(VTK_LINE)] = VTK_LINE
+    cellMap[vtkCellTypes.GetClassNameFromTypeId(VTK_QUADRATIC_EDGE)] = VTK_QUADRATIC_EDGE
+    cellMap[vtkCellTypes.GetClassNameFromTypeId(VTK_CUBIC_LINE)] = VTK_CUBIC_LINE
+
+    cellMap[vtkCellTypes.GetClassNameFromTypeId(VTK_TRIANGLE)] = VTK_TRIANGLE
+    cellMap[vtkCellTypes.GetClassNameFromTypeId(VTK_QUADRATIC_TRIANGLE)] = VTK_QUADRATIC_TRIANGLE
+    cellMap[vtkCellTypes.GetClassNameFromTypeId(VTK_QUAD)] = VTK_QUAD
+    cellMap[vtkCellTypes.GetClassNameFromTypeId(VTK_QUADRATIC_QUAD)] = VTK_QUADRATIC_QUAD
+
+    cellMap[vtkCellTypes.GetClassNameFromTypeId(VTK_TETRA)] = VTK_TETRA
+    cellMap[vtkCellTypes.GetClassNameFromTypeId(VTK_HEXAHEDRON)] = VTK_HEXAHEDRON
+    cellMap[vtkCellTypes.GetClassNameFromTypeId(VTK_WEDGE)] = VTK_WEDGE
+    cellMap[vtkCellTypes.GetClassNameFromTypeId(VTK_PYRAMID)] = VTK_PYRAMID
+    cellMap[vtkCellTypes.GetClassNameFromTypeId(VTK_QUADRATIC_WEDGE)] = VTK_QUADRATIC_WEDGE
+    cellMap[vtkCellTypes.GetClassNameFromTypeId(VTK_QUADRATIC_PYRAMID)] = VTK_QUADRATIC_PYRAMID
+    cellMap[vtkCellTypes.GetClassNameFromTypeId(VTK_QUADRATIC_HEXAHEDRON)] = VTK_QUADRATIC_HEXAHEDRON
+    cellMap[vtkCellTypes.GetClassNameFromTypeId(VTK_QUADRATIC_TETRA)] = VTK_QUADRATIC_TETRA
 
     if cellName not in cellMap:
         print('Cell type ', cellName, ' is not supported.')
         return
-    source = vtk.vtkCellTypeSource()
+    source = vtkCellTypeSource()
     source.SetCellType(cellMap[cellName])
     source.Update()
     print('Cell: ', cellName)
 
     originalPoints = source.GetOutput().GetPoints()
-    points = vtk.vtkPoints()
+    points = vtkPoints()
     points.SetNumberOfPoints(source.GetOutput().GetNumberOfPoints())
-    rng = vtk.vtkMinimalStandardRandomSequence()
+    rng = vtkMinimalStandardRandomSequence()
     rng.SetSeed(5070)  # for testing
     for i in range(0, points.GetNumberOfPoints()):
         perturbation = [0.0] * 3
@@ -54,7 +102,7 @@ def main():
 
     numCells = source.GetOutput().GetNumberOfCells()
     print('Number of cells: ', numCells)
-    idArray = vtk.vtkIntArray()
+    idArray = vtkIntArray()
     idArray.SetNumberOfTuples(numCells)
     for i in range(0, numCells):
         idArray.InsertTuple1(i, i + 1)
@@ -62,62 +110,62 @@ def main():
     source.GetOutput().GetCellData().AddArray(idArray)
     source.GetOutput().GetCellData().SetActiveScalars('Ids')
 
-    shrink = vtk.vtkShrinkFilter()
+    shrink = vtkShrinkFilter()
     shrink.SetInputConnection(source.GetOutputPort())
     shrink.SetShrinkFactor(.8)
 
-    tessellate = vtk.vtkTessellatorFilter()
+    tessellate = vtkTessellatorFilter()
     tessellate.SetInputConnection(shrink.GetOutputPort())
     tessellate.SetMaximumNumberOfSubdivisions(3)
 
     # Create a lookup table to map cell data to colors.
-    lut = vtk.vtkLookupTable()
+    lut = vtkLookupTable()
 
-    colorSeries = vtk.vtkColorSeries()
+    colorSeries = vtkColorSeries()
     seriesEnum = colorSeries.BREWER_QUALITATIVE_SET3
     colorSeries.SetColorScheme(seriesEnum)
     colorSeries.BuildLookupTable(lut, colorSeries.ORDINAL)
 
     # Fill in a few known colors, the rest will be generated if needed.
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
     # Create a mapper and actor.
-    mapper = vtk.vtkDataSetMapper()
+    mapper = vtkDataSetMapper()
     mapper.SetInputConnection(source.GetOutputPort())
     mapper.SetInputConnection(shrink.GetOutputPort())
     mapper.SetScalarRange(0, numCells + 1)
     mapper.SetLookupTable(lut)
     mapper.SetScalarModeToUseCellData()
     mapper.SetResolveCoincidentTopologyToPolygonOffset()
-    if (source.GetCellType() == vtk.VTK_QUADRATIC_PYRAMID or
-            source.GetCellType() == vtk.VTK_QUADRATIC_WEDGE):
+    if (source.GetCellType() == VTK_QUADRATIC_PYRAMID or
+            source.GetCellType() == VTK_QUADRATIC_WEDGE):
         mapper.SetInputConnection(shrink.GetOutputPort())
     else:
         mapper.SetInputConnection(tessellate.GetOutputPort())
-    actor = vtk.vtkActor()
+    actor = vtkActor()
     actor.SetMapper(mapper)
     actor.GetProperty().EdgeVisibilityOn()
     #  actor.GetProperty().SetLineWidth(3)
 
-    textProperty = vtk.vtkTextProperty()
+    textProperty = vtkTextProperty()
     textProperty.SetFontSize(20)
     textProperty.SetJustificationToCentered()
     textProperty.SetColor(colors.GetColor3d('Lamp_Black'))
 
-    textMapper = vtk.vtkTextMapper()
+    textMapper = vtkTextMapper()
     textMapper.SetInput(cellName)
     textMapper.SetTextProperty(textProperty)
 
-    textActor = vtk.vtkActor2D()
+    textActor = vtkActor2D()
     textActor.SetMapper(textMapper)
     textActor.SetPosition(320, 20)
 
     # Create a renderer, render window, and interactor.
-    renderer = vtk.vtkRenderer()
-    renderWindow = vtk.vtkRenderWindow()
+    renderer = vtkRenderer()
+    renderWindow = vtkRenderWindow()
     renderWindow.SetWindowName('CellTypeSource')
     renderWindow.AddRenderer(renderer)
-    renderWindowInteractor = vtk.vtkRenderWindowInteractor()
+    renderWindowInteractor = vtkRenderWindowInteractor()
     renderWindowInteractor.SetRenderWindow(renderWindow)
 
     # Add the actors to the scene.
@@ -3,11 +3,35 @@
 
 import math
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonCore import (
+    vtkMath,
+    vtkPoints
+)
+from vtkmodules.vtkCommonDataModel import (
+    vtkCellArray,
+    vtkPolyData,
+    vtkPolyLine
+)
+from vtkmodules.vtkFiltersModeling import vtkLinearExtrusionFilter
+from vtkmodules.vtkInteractionStyle import vtkInteractorStyleTrackballCamera
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkCamera,
+    vtkPolyDataMapper,
+    vtkProperty,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
 
 
 def main():
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
     angle = 0
     r1 = 50
@@ -15,68 +39,68 @@ def main():
     centerX = 10.0
     centerY = 5.0
 
-    points = vtk.vtkPoints()
+    points = vtkPoints()
     idx = 0
-    while angle <= 2.0 * vtk.vtkMath.Pi() + (vtk.vtkMath.Pi() / 60.0):
+    while angle <= 2.0 * vtkMath.Pi() + (vtkMath.Pi() / 60.0):
         points.InsertNextPoint(r1 * math.cos(angle) + centerX,
                                r2 * math.sin(angle) + centerY,
                                0.0)
-        angle = angle + (vtk.vtkMath.Pi() / 60.0)
+        angle = angle + (vtkMath.Pi() / 60.0)
         idx += 1
 
-    line = vtk.vtkPolyLine()
+    line = vtkPolyLine()
     line.GetPointIds().SetNumberOfIds(idx)
     for i in range(0, idx):
         line.GetPointIds().SetId(i, i)
 
-    lines = vtk.vtkCellArray()
+    lines = vtkCellArray()
     lines.InsertNextCell(line)
 
-    polyData = vtk.vtkPolyData()
+    polyData = vtkPolyData()
     polyData.SetPoints(points)
     polyData.SetLines(lines)
 
-    extrude = vtk.vtkLinearExtrusionFilter()
+    extrude = vtkLinearExtrusionFilter()
     extrude.SetInputData(polyData)
     extrude.SetExtrusionTypeToNormalExtrusion()
     extrude.SetVector(0, 0, 100.0)
     extrude.Update()
 
-    lineMapper = vtk.vtkPolyDataMapper()
+    lineMapper = vtkPolyDataMapper()
     lineMapper.SetInputData(polyData)
 
-    lineActor = vtk.vtkActor()
+    lineActor = vtkActor()
     lineActor.SetMapper(lineMapper)
     lineActor.GetProperty().SetColor(colors.GetColor3d("Peacock"))
 
-    mapper = vtk.vtkPolyDataMapper()
+    mapper = vtkPolyDataMapper()
     mapper.SetInputConnection(extrude.GetOutputPort())
 
-    back = vtk.vtkProperty()
+    back = vtkProperty()
     back.SetColor(colors.GetColor3d("Tomato"))
 
-    actor = vtk.vtkActor()
+    actor = vtkActor()
     actor.SetMapper(mapper)
     actor.GetProperty().SetColor(colors.GetColor3d("Banana"))
     actor.SetBackfaceProperty(back)
 
-    ren = vtk.vtkRenderer()
+    ren = vtkRenderer()
     ren.SetBackground(colors.GetColor3d("SlateGray"))
     ren.AddActor(actor)
     ren.AddActor(lineActor)
 
-    renWin = vtk.vtkRenderWindow()
+    renWin = vtkRenderWindow()
     renWin.SetWindowName("EllipticalCylinder")
     renWin.AddRenderer(ren)
     renWin.SetSize(600, 600)
 
-    iren = vtk.vtkRenderWindowInteractor()
+    iren = vtkRenderWindowInteractor()
     iren.SetRenderWindow(renWin)
 
-    style = vtk.vtkInteractorStyleTrackballCamera()
+    style = vtkInteractorStyleTrackballCamera()
     iren.SetInteractorStyle(style)
 
-    camera = vtk.vtkCamera()
+    camera = vtkCamera()
     camera.SetPosition(0, 1, 0)
     camera.SetFocalPoint(0, 0, 0)
     camera.SetViewUp(0, 0, 1)
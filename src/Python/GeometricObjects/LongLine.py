@@ -1,7 +1,26 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonCore import vtkPoints
+from vtkmodules.vtkCommonDataModel import (
+    vtkCellArray,
+    vtkLine,
+    vtkPolyData
+)
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
 
 
 def main():
@@ -13,7 +32,7 @@ def main():
     p3 = [1.0, 2.0, 3.0]
 
     # Create a vtkPoints object and store the points in it
-    points = vtk.vtkPoints()
+    points = vtkPoints()
     points.InsertNextPoint(origin)
     points.InsertNextPoint(p0)
     points.InsertNextPoint(p1)
@@ -21,16 +40,16 @@ def main():
     points.InsertNextPoint(p3)
 
     # Create a cell array to store the lines in and add the lines to it
-    lines = vtk.vtkCellArray()
+    lines = vtkCellArray()
 
     for i in range(0, 3):
-        line = vtk.vtkLine()
+        line = vtkLine()
         line.GetPointIds().SetId(0, i)
         line.GetPointIds().SetId(1, i + 1)
         lines.InsertNextCell(line)
 
     # Create a polydata to store everything in
-    linesPolyData = vtk.vtkPolyData()
+    linesPolyData = vtkPolyData()
 
     # Add the points to the dataset
     linesPolyData.SetPoints(points)
@@ -39,22 +58,22 @@ def main():
     linesPolyData.SetLines(lines)
 
     # Setup actor and mapper
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
-    mapper = vtk.vtkPolyDataMapper()
+    mapper = vtkPolyDataMapper()
     mapper.SetInputData(linesPolyData)
 
-    actor = vtk.vtkActor()
+    actor = vtkActor()
     actor.SetMapper(mapper)
     actor.GetProperty().SetLineWidth(4)
     actor.GetProperty().SetColor(colors.GetColor3d('Peacock'))
 
     # Setup render window, renderer, and interactor
-    renderer = vtk.vtkRenderer()
-    renderWindow = vtk.vtkRenderWindow()
+    renderer = vtkRenderer()
+    renderWindow = vtkRenderWindow()
     renderWindow.SetWindowName('LongLine')
     renderWindow.AddRenderer(renderer)
-    renderWindowInteractor = vtk.vtkRenderWindowInteractor()
+    renderWindowInteractor = vtkRenderWindowInteractor()
     renderWindowInteractor.SetRenderWindow(renderWindow)
     renderer.AddActor(actor)
 
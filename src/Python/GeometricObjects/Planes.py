@@ -1,30 +1,53 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonDataModel import (
+    vtkPlanes,
+    vtkPolyData
+)
+from vtkmodules.vtkFiltersCore import vtkHull
+from vtkmodules.vtkFiltersSources import vtkSphereSource
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkActor2D,
+    vtkCamera,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer,
+    vtkTextMapper,
+    vtkTextProperty
+)
 
 
 def main():
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
     planes = list()
     titles = list()
 
     # Using frustum planes.
     titles.append('Using frustum planes')
-    camera = vtk.vtkCamera()
+    camera = vtkCamera()
     planesArray = [0] * 24
     camera.GetFrustumPlanes(1, planesArray)
-    planes.append(vtk.vtkPlanes())
+    planes.append(vtkPlanes())
     planes[0].SetFrustumPlanes(planesArray)
 
     # Using bounds.
     titles.append('Using bounds')
-    sphereSource = vtk.vtkSphereSource()
+    sphereSource = vtkSphereSource()
     sphereSource.Update()
     bounds = [0] * 6
     sphereSource.GetOutput().GetBounds(bounds)
-    planes.append(vtk.vtkPlanes())
+    planes.append(vtkPlanes())
     planes[1].SetBounds(bounds)
 
     # At this point we have the planes created by both of the methods above.
@@ -34,15 +57,15 @@ def main():
     # and visualise it.
 
     # Create a common text property.
-    textProperty = vtk.vtkTextProperty()
+    textProperty = vtkTextProperty()
     textProperty.SetFontSize(16)
     textProperty.SetJustificationToCentered()
 
-    renWin = vtk.vtkRenderWindow()
+    renWin = vtkRenderWindow()
     renWin.SetSize(600, 600)
     renWin.SetWindowName('Planes')
 
-    iRen = vtk.vtkRenderWindowInteractor()
+    iRen = vtkRenderWindowInteractor()
     iRen.SetRenderWindow(renWin)
 
     hulls = list()
@@ -53,10 +76,10 @@ def main():
     textMappers = list()
     textActors = list()
     for i in range(0, len(planes)):
-        hulls.append(vtk.vtkHull())
+        hulls.append(vtkHull())
         hulls[i].SetPlanes(planes[i])
 
-        pds.append(vtk.vtkPolyData())
+        pds.append(vtkPolyData())
 
         # To generate the convex hull we supply a vtkPolyData object and a bounding box.
         # We define the bounding box to be where we expect the resulting polyhedron to lie.
@@ -64,23 +87,23 @@ def main():
         # polygons that are eventually clipped.
         hulls[i].GenerateHull(pds[i], -200, 200, -200, 200, -200, 200)
 
-        mappers.append(vtk.vtkPolyDataMapper())
+        mappers.append(vtkPolyDataMapper())
         mappers[i].SetInputData(pds[i])
 
-        actors.append(vtk.vtkActor())
+        actors.append(vtkActor())
         actors[i].SetMapper(mappers[i])
         actors[i].GetProperty().SetColor(colors.GetColor3d('Moccasin'))
         actors[i].GetProperty().SetSpecular(0.8)
         actors[i].GetProperty().SetSpecularPower(30)
 
-        renderers.append(vtk.vtkRenderer())
+        renderers.append(vtkRenderer())
         renderers[i].AddActor(actors[i])
 
-        textMappers.append(vtk.vtkTextMapper())
+        textMappers.append(vtkTextMapper())
         textMappers[i].SetInput(titles[i])
         textMappers[i].SetTextProperty(textProperty)
 
-        textActors.append(vtk.vtkActor2D())
+        textActors.append(vtkActor2D())
         textActors[i].SetMapper(textMappers[i])
         textActors[i].SetPosition(100, 10)
         renderers[i].AddViewProp(textActors[i])
@@ -105,7 +128,7 @@ def main():
             if index > (len(actors) - 1):
                 # Add a renderer even if there is no actor.
                 # This makes the render window background all the same color.
-                ren = vtk.vtkRenderer()
+                ren = vtkRenderer()
                 ren.SetBackground(colors.GetColor3d('DarkSlateGray'))
                 ren.SetViewport(viewport)
                 renWin.AddRenderer(ren)
@@ -1,15 +1,17 @@
 #!/usr/bin/env python
 from __future__ import print_function
 
-import vtk
+from vtkmodules.vtkCommonCore import vtkPoints
+from vtkmodules.vtkCommonDataModel import vtkPlanesIntersection
+from vtkmodules.vtkFiltersSources import vtkSphereSource
 
-sphereSource = vtk.vtkSphereSource()
+sphereSource = vtkSphereSource()
 sphereSource.Update()
 
 bounds = [0 for i in range(6)]
 sphereSource.GetOutput().GetBounds(bounds)
 
-box = vtk.vtkPoints()
+box = vtkPoints()
 
 box.SetNumberOfPoints(8)
 
@@ -29,7 +31,7 @@ box.SetPoint(5, xMin, yMin, zMin)
 box.SetPoint(6, xMin, yMax, zMin)
 box.SetPoint(7, xMin, yMax, zMax)
 
-planesIntersection = vtk.vtkPlanesIntersection()
+planesIntersection = vtkPlanesIntersection()
 planesIntersection.SetBounds(bounds)
 
 intersects = planesIntersection.IntersectsRegion(box)
@@ -1,19 +1,38 @@
 #!/usr/bin/env python
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonCore import vtkPoints
+from vtkmodules.vtkCommonDataModel import (
+    vtkCellArray,
+    vtkPolyData,
+    vtkPolygon
+)
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
 
 def main():
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
     # Setup four points
-    points = vtk.vtkPoints()
+    points = vtkPoints()
     points.InsertNextPoint(0.0, 0.0, 0.0)
     points.InsertNextPoint(1.0, 0.0, 0.0)
     points.InsertNextPoint(1.0, 1.0, 0.0)
     points.InsertNextPoint(0.0, 1.0, 0.0)
 
     # Create the polygon
-    polygon = vtk.vtkPolygon()
+    polygon = vtkPolygon()
     polygon.GetPointIds().SetNumberOfIds(4)  # make a quad
     polygon.GetPointIds().SetId(0, 0)
     polygon.GetPointIds().SetId(1, 1)
@@ -21,28 +40,28 @@ def main():
     polygon.GetPointIds().SetId(3, 3)
 
     # Add the polygon to a list of polygons
-    polygons = vtk.vtkCellArray()
+    polygons = vtkCellArray()
     polygons.InsertNextCell(polygon)
 
     # Create a PolyData
-    polygonPolyData = vtk.vtkPolyData()
+    polygonPolyData = vtkPolyData()
     polygonPolyData.SetPoints(points)
     polygonPolyData.SetPolys(polygons)
 
     # Create a mapper and actor
-    mapper = vtk.vtkPolyDataMapper()
+    mapper = vtkPolyDataMapper()
     mapper.SetInputData(polygonPolyData)
 
-    actor = vtk.vtkActor()
+    actor = vtkActor()
     actor.SetMapper(mapper)
     actor.GetProperty().SetColor(colors.GetColor3d('Silver'))
 
     # Visualize
-    renderer = vtk.vtkRenderer()
-    renderWindow = vtk.vtkRenderWindow()
+    renderer = vtkRenderer()
+    renderWindow = vtkRenderWindow()
     renderWindow.SetWindowName('Polygon')
     renderWindow.AddRenderer(renderer)
-    renderWindowInteractor = vtk.vtkRenderWindowInteractor()
+    renderWindowInteractor = vtkRenderWindowInteractor()
     renderWindowInteractor.SetRenderWindow(renderWindow)
 
     renderer.AddActor(actor)
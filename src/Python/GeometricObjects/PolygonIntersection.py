@@ -1,18 +1,22 @@
 #!/usr/bin/env python
 from __future__ import print_function
 
-import vtk
+from vtkmodules.vtkCommonCore import (
+    mutable,
+    vtkPoints
+)
+from vtkmodules.vtkCommonDataModel import vtkPolygon
 
 def main():
     # Create a square in the x-y plane.
-    points = vtk.vtkPoints()
+    points = vtkPoints()
     points.InsertNextPoint(0.0, 0.0, 0.0)
     points.InsertNextPoint(1.0, 0.0, 0.0)
     points.InsertNextPoint(1.0, 1.0, 0.0)
     points.InsertNextPoint(0.0, 1.0, 0.0)
 
     # Create the polygon
-    polygon = vtk.vtkPolygon()
+    polygon = vtkPolygon()
     polygon.GetPoints().DeepCopy(points)
     polygon.GetPointIds().SetNumberOfIds(4)  # The 4 corners of the square
     for i in range(4):
@@ -24,10 +28,10 @@ def main():
     tolerance = 0.001
 
     # Outputs
-    t = vtk.mutable(0)  # Parametric coordinate of intersection (0 (corresponding to p1) to 1 (corresponding to p2))
+    t = mutable(0)  # Parametric coordinate of intersection (0 (corresponding to p1) to 1 (corresponding to p2))
     x = [0.0, 0.0, 0.0]
     pcoords = [0.0, 0.0, 0.0]
-    subId = vtk.mutable(0)
+    subId = mutable(0)
     iD = polygon.IntersectWithLine(p1, p2, tolerance, t, x, pcoords, subId)
 
     print('intersected? ', 'Yes' if iD == 1 else 'No')
@@ -1,16 +1,38 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonCore import (
+    vtkIdList,
+    vtkPoints
+)
+from vtkmodules.vtkCommonDataModel import (
+    VTK_POLYHEDRON,
+    vtkUnstructuredGrid
+)
+from vtkmodules.vtkIOXML import vtkXMLUnstructuredGridWriter
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkDataSetMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
 
 
 def main():
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
     # create polyhedron (cube)
     # The point Ids are: [0, 1, 2, 3, 4, 5, 6, 7]
 
-    points = vtk.vtkPoints()
+    points = vtkPoints()
     points.InsertNextPoint(-1.0, -1.0, -1.0)
     points.InsertNextPoint(1.0, -1.0, -1.0)
     points.InsertNextPoint(1.0, 1.0, -1.0)
@@ -22,38 +44,38 @@ def main():
 
     # These are the point ids corresponding to each face.
     faces = [[0, 3, 2, 1], [0, 4, 7, 3], [4, 5, 6, 7], [5, 1, 2, 6], [0, 1, 5, 4], [2, 3, 7, 6]]
-    faceId = vtk.vtkIdList()
+    faceId = vtkIdList()
     faceId.InsertNextId(6)  # Six faces make up the cell.
     for face in faces:
         faceId.InsertNextId(len(face))  # The number of points in the face.
         [faceId.InsertNextId(i) for i in face]
 
-    ugrid = vtk.vtkUnstructuredGrid()
+    ugrid = vtkUnstructuredGrid()
     ugrid.SetPoints(points)
-    ugrid.InsertNextCell(vtk.VTK_POLYHEDRON, faceId)
+    ugrid.InsertNextCell(VTK_POLYHEDRON, faceId)
 
     # Here we write out the cube.
-    writer = vtk.vtkXMLUnstructuredGridWriter()
+    writer = vtkXMLUnstructuredGridWriter()
     writer.SetInputData(ugrid)
     writer.SetFileName('polyhedron.vtu')
     writer.SetDataModeToAscii()
     writer.Update()
 
     # Create a mapper and actor
-    mapper = vtk.vtkDataSetMapper()
+    mapper = vtkDataSetMapper()
     mapper.SetInputData(ugrid)
 
-    actor = vtk.vtkActor()
+    actor = vtkActor()
     actor.SetMapper(mapper)
     actor.GetProperty().SetColor(
         colors.GetColor3d('Silver'))
 
     # Visualize
-    renderer = vtk.vtkRenderer()
-    renderWindow = vtk.vtkRenderWindow()
+    renderer = vtkRenderer()
+    renderWindow = vtkRenderWindow()
     renderWindow.SetWindowName('Polyhedron')
     renderWindow.AddRenderer(renderer)
-    renderWindowInteractor = vtk.vtkRenderWindowInteractor()
+    renderWindowInteractor = vtkRenderWindowInteractor()
     renderWindowInteractor.SetRenderWindow(renderWindow)
 
     renderer.AddActor(actor)
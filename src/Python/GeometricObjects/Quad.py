@@ -1,9 +1,28 @@
 #!/usr/bin/env python
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonCore import vtkPoints
+from vtkmodules.vtkCommonDataModel import (
+    vtkCellArray,
+    vtkPolyData,
+    vtkQuad
+)
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
 
 def main():
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
     # Create four points (must be in counter clockwise order)
     p0 = [0.0, 0.0, 0.0]
@@ -12,44 +31,44 @@ def main():
     p3 = [0.0, 1.0, 0.0]
 
     # Add the points to a vtkPoints object
-    points = vtk.vtkPoints()
+    points = vtkPoints()
     points.InsertNextPoint(p0)
     points.InsertNextPoint(p1)
     points.InsertNextPoint(p2)
     points.InsertNextPoint(p3)
 
     # Create a quad on the four points
-    quad = vtk.vtkQuad()
+    quad = vtkQuad()
     quad.GetPointIds().SetId(0, 0)
     quad.GetPointIds().SetId(1, 1)
     quad.GetPointIds().SetId(2, 2)
     quad.GetPointIds().SetId(3, 3)
 
     # Create a cell array to store the quad in
-    quads = vtk.vtkCellArray()
+    quads = vtkCellArray()
     quads.InsertNextCell(quad)
 
     # Create a polydata to store everything in
-    polydata = vtk.vtkPolyData()
+    polydata = vtkPolyData()
 
     # Add the points and quads to the dataset
     polydata.SetPoints(points)
     polydata.SetPolys(quads)
 
     # Setup actor and mapper
-    mapper = vtk.vtkPolyDataMapper()
+    mapper = vtkPolyDataMapper()
     mapper.SetInputData(polydata)
 
-    actor = vtk.vtkActor()
+    actor = vtkActor()
     actor.SetMapper(mapper)
     actor.GetProperty().SetColor(colors.GetColor3d('Silver'))
 
     # Setup render window, renderer, and interactor
-    renderer = vtk.vtkRenderer()
-    renderWindow = vtk.vtkRenderWindow()
+    renderer = vtkRenderer()
+    renderWindow = vtkRenderWindow()
     renderWindow.SetWindowName('Quad')
     renderWindow.AddRenderer(renderer)
-    renderWindowInteractor = vtk.vtkRenderWindowInteractor()
+    renderWindowInteractor = vtkRenderWindowInteractor()
     renderWindowInteractor.SetRenderWindow(renderWindow)
 
     renderer.AddActor(actor)
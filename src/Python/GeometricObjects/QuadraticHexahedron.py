@@ -1,24 +1,48 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonCore import (
+    vtkMinimalStandardRandomSequence,
+    vtkPoints
+)
+from vtkmodules.vtkCommonDataModel import (
+    vtkQuadraticHexahedron,
+    vtkUnstructuredGrid
+)
+from vtkmodules.vtkFiltersCore import vtkGlyph3D
+from vtkmodules.vtkFiltersGeneral import vtkTessellatorFilter
+from vtkmodules.vtkFiltersSources import vtkSphereSource
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkDataSetMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
 
 
 def main():
-    namedColors = vtk.vtkNamedColors()
+    namedColors = vtkNamedColors()
 
     uGrid = MakeQuadraticHexahedron()
 
-    tessellate = vtk.vtkTessellatorFilter()
+    tessellate = vtkTessellatorFilter()
     tessellate.SetInputData(uGrid)
     tessellate.SetMaximumNumberOfSubdivisions(2)
 
-    mapper = vtk.vtkDataSetMapper()
+    mapper = vtkDataSetMapper()
     mapper.SetInputConnection(tessellate.GetOutputPort())
     mapper.ScalarVisibilityOff()
 
     # Create an actor for the grid
-    actor = vtk.vtkActor()
+    actor = vtkActor()
     actor.SetMapper(mapper)
     actor.GetProperty().SetDiffuseColor(
         namedColors.GetColor3d('Tomato'))
@@ -26,30 +50,30 @@ def main():
         namedColors.GetColor3d('IvoryBlack'))
     actor.GetProperty().EdgeVisibilityOn()
 
-    sphereSource = vtk.vtkSphereSource()
+    sphereSource = vtkSphereSource()
     sphereSource.SetRadius(0.02)
 
-    glyph3D = vtk.vtkGlyph3D()
+    glyph3D = vtkGlyph3D()
     glyph3D.SetInputData(uGrid)
     glyph3D.SetSourceConnection(sphereSource.GetOutputPort())
     glyph3D.ScalingOff()
     glyph3D.Update()
 
-    glyph3DMapper = vtk.vtkDataSetMapper()
+    glyph3DMapper = vtkDataSetMapper()
     glyph3DMapper.SetInputConnection(glyph3D.GetOutputPort())
     glyph3DMapper.ScalarVisibilityOff()
 
-    glyph3DActor = vtk.vtkActor()
+    glyph3DActor = vtkActor()
     glyph3DActor.SetMapper(glyph3DMapper)
     glyph3DActor.GetProperty().SetColor(
         namedColors.GetColor3d('Banana'))
 
     # Visualize
-    renderer = vtk.vtkRenderer()
-    renderWindow = vtk.vtkRenderWindow()
+    renderer = vtkRenderer()
+    renderWindow = vtkRenderWindow()
     renderWindow.SetWindowName('QuadraticHexahedron')
     renderWindow.AddRenderer(renderer)
-    interactor = vtk.vtkRenderWindowInteractor()
+    interactor = vtkRenderWindowInteractor()
     interactor.SetRenderWindow(renderWindow)
 
     renderer.AddActor(actor)
@@ -61,11 +85,11 @@ def main():
 
 
 def MakeQuadraticHexahedron():
-    aHexahedron = vtk.vtkQuadraticHexahedron()
-    points = vtk.vtkPoints()
+    aHexahedron = vtkQuadraticHexahedron()
+    points = vtkPoints()
 
     pcoords = aHexahedron.GetParametricCoords()
-    rng = vtk.vtkMinimalStandardRandomSequence()
+    rng = vtkMinimalStandardRandomSequence()
     points.SetNumberOfPoints(aHexahedron.GetNumberOfPoints())
     rng.SetSeed(5070)  # for testing
     for i in range(0, aHexahedron.GetNumberOfPoints()):
@@ -79,7 +103,7 @@ def MakeQuadraticHexahedron():
                         pcoords[3 * i + 2] + perturbation[2])
 
     # Add the points and hexahedron to an unstructured grid
-    uGrid = vtk.vtkUnstructuredGrid()
+    uGrid = vtkUnstructuredGrid()
     uGrid.SetPoints(points)
     uGrid.InsertNextCell(aHexahedron.GetCellType(), aHexahedron.GetPointIds())
 
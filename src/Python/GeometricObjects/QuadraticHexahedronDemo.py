@@ -1,15 +1,50 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingContextOpenGL2
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonCore import (
+    vtkCommand,
+    vtkMinimalStandardRandomSequence,
+    vtkPoints
+)
+from vtkmodules.vtkCommonDataModel import (
+    vtkGenericCell,
+    vtkQuadraticHexahedron,
+    vtkUnstructuredGrid
+)
+from vtkmodules.vtkFiltersCore import vtkGlyph3D
+from vtkmodules.vtkFiltersGeneral import vtkTessellatorFilter
+from vtkmodules.vtkFiltersSources import vtkSphereSource
+from vtkmodules.vtkInteractionWidgets import (
+    vtkSliderRepresentation2D,
+    vtkSliderWidget
+)
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkActor2D,
+    vtkDataSetMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer,
+    vtkTextMapper,
+    vtkTextProperty
+)
 
 
 def main():
-    namedColors = vtk.vtkNamedColors()
+    namedColors = vtkNamedColors()
 
     uGrid = MakeQuadraticHexahedron()
 
-    tessellate = vtk.vtkTessellatorFilter()
+    tessellate = vtkTessellatorFilter()
     tessellate.SetInputData(uGrid)
     tessellate.SetChordError(0.035)
     tessellate.Update()
@@ -17,7 +52,7 @@ def main():
     cellMap = dict()
 
     numTets = 0
-    cell = vtk.vtkGenericCell()
+    cell = vtkGenericCell()
     it = tessellate.GetOutput().NewCellIterator()
     it.InitTraversal()
     while not it.IsDoneWithTraversal():
@@ -26,12 +61,12 @@ def main():
         numTets += 1
         it.GoToNextCell()
 
-    mapper = vtk.vtkDataSetMapper()
+    mapper = vtkDataSetMapper()
     mapper.SetInputConnection(tessellate.GetOutputPort())
     mapper.ScalarVisibilityOff()
 
     # Create an actor for the grid
-    actor = vtk.vtkActor()
+    actor = vtkActor()
     actor.SetMapper(mapper)
     actor.GetProperty().SetDiffuseColor(
         namedColors.GetColor3d('Tomato'))
@@ -39,46 +74,46 @@ def main():
         namedColors.GetColor3d('IvoryBlack'))
     actor.GetProperty().EdgeVisibilityOn()
 
-    sphereSource = vtk.vtkSphereSource()
+    sphereSource = vtkSphereSource()
     sphereSource.SetRadius(0.02)
 
-    glyph3D = vtk.vtkGlyph3D()
+    glyph3D = vtkGlyph3D()
     glyph3D.SetInputData(uGrid)
     glyph3D.SetSourceConnection(sphereSource.GetOutputPort())
     glyph3D.ScalingOff()
     glyph3D.Update()
 
-    glyph3DMapper = vtk.vtkDataSetMapper()
+    glyph3DMapper = vtkDataSetMapper()
     glyph3DMapper.SetInputConnection(glyph3D.GetOutputPort())
     glyph3DMapper.ScalarVisibilityOff()
 
-    glyph3DActor = vtk.vtkActor()
+    glyph3DActor = vtkActor()
     glyph3DActor.SetMapper(glyph3DMapper)
     glyph3DActor.GetProperty().SetColor(
         namedColors.GetColor3d('Banana'))
 
-    textProperty = vtk.vtkTextProperty()
+    textProperty = vtkTextProperty()
     textProperty.SetFontSize(24)
 
     ss = '# of Tetras: ' + str(numTets)
-    textMapper = vtk.vtkTextMapper()
+    textMapper = vtkTextMapper()
     textMapper.SetInput(ss)
     textMapper.SetTextProperty(textProperty)
 
-    textActor = vtk.vtkActor2D()
+    textActor = vtkActor2D()
     textActor.SetMapper(textMapper)
     textActor.SetPosition(10, 400)
 
     # Visualize
-    renderer = vtk.vtkRenderer()
-    renderWindow = vtk.vtkRenderWindow()
+    renderer = vtkRenderer()
+    renderWindow = vtkRenderWindow()
     renderWindow.SetWindowName('QuadraticHexahedronDemo')
     renderWindow.AddRenderer(renderer)
     renderWindow.SetSize(640, 512)
-    interactor = vtk.vtkRenderWindowInteractor()
+    interactor = vtkRenderWindowInteractor()
     interactor.SetRenderWindow(renderWindow)
 
-    widget = vtk.vtkSliderWidget()
+    widget = vtkSliderWidget()
     MakeWidget(widget, tessellate, textMapper, interactor)
 
     renderer.AddActor(actor)
@@ -106,7 +141,7 @@ class SliderCallbackChordError():
         cellMap = dict()
 
         numTets = 0
-        cell = vtk.vtkGenericCell()
+        cell = vtkGenericCell()
         it = self.tessellate.GetOutput().NewCellIterator()
         it.InitTraversal()
         while not it.IsDoneWithTraversal():
@@ -125,7 +160,7 @@ def MakeWidget(widget, tessellate, textMapper, interactor):
     titleHeight = 0.04
     labelHeight = 0.04
 
-    sliderRepChordError = vtk.vtkSliderRepresentation2D()
+    sliderRepChordError = vtkSliderRepresentation2D()
 
     sliderRepChordError.SetMinimumValue(0.0)
     sliderRepChordError.SetMaximumValue(0.07)
@@ -147,15 +182,15 @@ def MakeWidget(widget, tessellate, textMapper, interactor):
     widget.SetAnimationModeToAnimate()
     widget.EnabledOn()
 
-    widget.AddObserver(vtk.vtkCommand.InteractionEvent, SliderCallbackChordError(tessellate, textMapper))
+    widget.AddObserver(vtkCommand.InteractionEvent, SliderCallbackChordError(tessellate, textMapper))
 
 
 def MakeQuadraticHexahedron():
-    aHexahedron = vtk.vtkQuadraticHexahedron()
-    points = vtk.vtkPoints()
+    aHexahedron = vtkQuadraticHexahedron()
+    points = vtkPoints()
 
     pcoords = aHexahedron.GetParametricCoords()
-    rng = vtk.vtkMinimalStandardRandomSequence()
+    rng = vtkMinimalStandardRandomSequence()
     points.SetNumberOfPoints(aHexahedron.GetNumberOfPoints())
     rng.SetSeed(5070)  # for testing
     for i in range(0, aHexahedron.GetNumberOfPoints()):
@@ -169,7 +204,7 @@ def MakeQuadraticHexahedron():
                         pcoords[3 * i + 2] + perturbation[2])
 
     # Add the points and hexahedron to an unstructured grid
-    uGrid = vtk.vtkUnstructuredGrid()
+    uGrid = vtkUnstructuredGrid()
     uGrid.SetPoints(points)
     uGrid.InsertNextCell(aHexahedron.GetCellType(), aHexahedron.GetPointIds())
 
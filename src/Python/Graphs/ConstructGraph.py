@@ -1,10 +1,19 @@
 #!/usr/bin/env python
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingContextOpenGL2
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonDataModel import vtkMutableUndirectedGraph
+from vtkmodules.vtkViewsInfovis import vtkGraphLayoutView
 
 
 def main():
-    g = vtk.vtkMutableUndirectedGraph()
+    g = vtkMutableUndirectedGraph()
 
     v1 = g.AddVertex()
     v2 = g.AddVertex()
@@ -16,7 +25,7 @@ def main():
     g.AddEdge(v1, v2)
     print('Number of vertices:', g.GetNumberOfVertices())
     print('Number of edges:', g.GetNumberOfEdges())
-    graphLayoutView = vtk.vtkGraphLayoutView()
+    graphLayoutView = vtkGraphLayoutView()
     graphLayoutView.AddRepresentationFromInput(g)
     graphLayoutView.ResetCamera()
     graphLayoutView.Render()
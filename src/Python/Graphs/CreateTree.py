@@ -2,11 +2,25 @@
 
 # This example creates a tree and labels the vertices and edges.
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingContextOpenGL2
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonCore import vtkStringArray
+from vtkmodules.vtkCommonDataModel import (
+    vtkMutableDirectedGraph,
+    vtkTree
+)
+from vtkmodules.vtkViewsCore import vtkViewTheme
+from vtkmodules.vtkViewsInfovis import vtkGraphLayoutView
 
 
 def main():
-    graph = vtk.vtkMutableDirectedGraph()
+    graph = vtkMutableDirectedGraph()
 
     a = graph.AddVertex()
     b = graph.AddChild(a)
@@ -15,7 +29,7 @@ def main():
     e = graph.AddChild(c)
     f = graph.AddChild(c)
 
-    vertex_labels = vtk.vtkStringArray()
+    vertex_labels = vtkStringArray()
     vertex_labels.SetName('VertexLabel')
     vertex_labels.InsertValue(a, 'a')
     vertex_labels.InsertValue(b, 'b')
@@ -24,7 +38,7 @@ def main():
     vertex_labels.InsertValue(e, 'e')
     vertex_labels.InsertValue(f, 'f')
     graph.GetVertexData().AddArray(vertex_labels)
-    edge_labels = vtk.vtkStringArray()
+    edge_labels = vtkStringArray()
     edge_labels.SetName('EdgeLabel')
     edge_labels.InsertValue(graph.GetEdgeId(a, b), 'a -> b')
     edge_labels.InsertValue(graph.GetEdgeId(a, c), 'a -> c')
@@ -33,16 +47,16 @@ def main():
     edge_labels.InsertValue(graph.GetEdgeId(c, f), 'c -> f')
     graph.GetEdgeData().AddArray(edge_labels)
 
-    tree = vtk.vtkTree()
+    tree = vtkTree()
     valid_tree = tree.CheckedShallowCopy(graph)
     if not valid_tree:
         print('Invalid tree')
         return
 
-    view = vtk.vtkGraphLayoutView()
+    view = vtkGraphLayoutView()
     view.SetRepresentationFromInput(tree)
     # Apply a theme to the views
-    theme = vtk.vtkViewTheme()
+    theme = vtkViewTheme()
     view.ApplyViewTheme(theme.CreateMellowTheme())
     view.SetVertexColorArrayName('VertexDegree')
     view.SetColorVertices(True)
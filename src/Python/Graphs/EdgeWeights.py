@@ -1,12 +1,22 @@
 #!/usr/bin/env python
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingContextOpenGL2
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonCore import vtkDoubleArray
+from vtkmodules.vtkCommonDataModel import vtkMutableDirectedGraph
+from vtkmodules.vtkViewsInfovis import vtkGraphLayoutView
 
 
 def main():
     # colors = vtk.vtkNamedColors()
 
-    g = vtk.vtkMutableDirectedGraph()
+    g = vtkMutableDirectedGraph()
 
     # Create 3 vertices
     v1 = g.AddVertex()
@@ -19,7 +29,7 @@ def main():
     g.AddGraphEdge(v1, v3)
 
     # Create the edge weight array
-    weights = vtk.vtkDoubleArray()
+    weights = vtkDoubleArray()
     weights.SetNumberOfComponents(1)
     weights.SetName('Weights')
 
@@ -31,7 +41,7 @@ def main():
     # Add the edge weight array to the graph
     g.GetEdgeData().AddArray(weights)
 
-    graphLayoutView = vtk.vtkGraphLayoutView()
+    graphLayoutView = vtkGraphLayoutView()
     graphLayoutView.AddRepresentationFromInput(g)
     graphLayoutView.SetLayoutStrategy('Simple 2D')
     graphLayoutView.GetLayoutStrategy().SetEdgeWeightField('Weights')
@@ -1,11 +1,26 @@
 #!/usr/bin/env python
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingContextOpenGL2
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonCore import (
+    vtkDoubleArray,
+    vtkIntArray
+)
+from vtkmodules.vtkCommonDataModel import vtkMutableUndirectedGraph
+from vtkmodules.vtkInfovisLayout import vtkCircularLayoutStrategy
+from vtkmodules.vtkViewsInfovis import vtkGraphLayoutView
 
 
 def main():
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
-    g = vtk.vtkMutableUndirectedGraph()
+    g = vtkMutableUndirectedGraph()
 
     # Create 3 vertices
     v1 = g.AddVertex()
@@ -18,7 +33,7 @@ def main():
     g.AddEdge(v1, v3)
 
     # Create the edge weight array
-    weights = vtk.vtkDoubleArray()
+    weights = vtkDoubleArray()
     weights.SetNumberOfComponents(1)
     weights.SetName('Weights')
 
@@ -28,7 +43,7 @@ def main():
     weights.InsertNextValue(2.0)
 
     # Create an array for the vertex labels
-    vertexIDs = vtk.vtkIntArray()
+    vertexIDs = vtkIntArray()
     vertexIDs.SetNumberOfComponents(1)
     vertexIDs.SetName('VertexIDs')
 
@@ -41,9 +56,9 @@ def main():
     g.GetEdgeData().AddArray(weights)
     g.GetVertexData().AddArray(vertexIDs)
 
-    circularLayoutStrategy = vtk.vtkCircularLayoutStrategy()
+    circularLayoutStrategy = vtkCircularLayoutStrategy()
 
-    graphLayoutView = vtk.vtkGraphLayoutView()
+    graphLayoutView = vtkGraphLayoutView()
     graphLayoutView.AddRepresentationFromInput(g)
 
     graphLayoutView.SetLayoutStrategy(circularLayoutStrategy)
@@ -1,16 +1,25 @@
 #!/usr/bin/env python
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingContextOpenGL2
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkInfovisCore import vtkRandomGraphSource
+from vtkmodules.vtkViewsInfovis import vtkGraphLayoutView
 
 
 def main():
-    randomGraphSource = vtk.vtkRandomGraphSource()
+    randomGraphSource = vtkRandomGraphSource()
     randomGraphSource.SetNumberOfVertices(5)
     randomGraphSource.SetNumberOfEdges(4)
     # This ensures repeatable results for testing. Turn this off for real use.
     randomGraphSource.SetSeed(0)
     randomGraphSource.Update()
 
-    graphLayoutView = vtk.vtkGraphLayoutView()
+    graphLayoutView = vtkGraphLayoutView()
     graphLayoutView.AddRepresentationFromInput(randomGraphSource.GetOutput())
     graphLayoutView.ResetCamera()
     graphLayoutView.Render()
@@ -1,11 +1,31 @@
 #!/usr/bin/env python
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingContextOpenGL2
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonCore import (
+    vtkFloatArray,
+    vtkIntArray,
+    vtkLookupTable
+)
+from vtkmodules.vtkCommonDataModel import vtkMutableUndirectedGraph
+from vtkmodules.vtkRenderingCore import vtkGraphToGlyphs
+from vtkmodules.vtkViewsCore import vtkViewTheme
+from vtkmodules.vtkViewsInfovis import (
+    vtkGraphLayoutView,
+    vtkRenderedGraphRepresentation
+)
 
 
 def main():
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
-    g = vtk.vtkMutableUndirectedGraph()
+    g = vtkMutableUndirectedGraph()
 
     v1 = g.AddVertex()
     v2 = g.AddVertex()
@@ -13,7 +33,7 @@ def main():
     g.AddEdge(v1, v2)
     g.AddEdge(v1, v2)
 
-    scales = vtk.vtkFloatArray()
+    scales = vtkFloatArray()
     scales.SetNumberOfComponents(1)
     scales.SetName('Scales')
     scales.InsertNextValue(2.0)
@@ -23,11 +43,11 @@ def main():
     g.GetVertexData().AddArray(scales)
 
     # Create the color array
-    vertexColors = vtk.vtkIntArray()
+    vertexColors = vtkIntArray()
     vertexColors.SetNumberOfComponents(1)
     vertexColors.SetName('Color')
 
-    lookupTable = vtk.vtkLookupTable()
+    lookupTable = vtkLookupTable()
     lookupTable.SetNumberOfTableValues(2)
     lookupTable.SetTableValue(0, colors.GetColor4d('Yellow'))
     lookupTable.SetTableValue(1, colors.GetColor4d('Lime'))
@@ -39,18 +59,18 @@ def main():
     # Add the color array to the graph
     g.GetVertexData().AddArray(vertexColors)
 
-    theme = vtk.vtkViewTheme()
+    theme = vtkViewTheme()
     theme.SetPointLookupTable(lookupTable)
 
-    layoutView = vtk.vtkGraphLayoutView()
+    layoutView = vtkGraphLayoutView()
     layoutView.AddRepresentationFromInput(g)
     layoutView.ApplyViewTheme(theme)
     layoutView.ScaledGlyphsOn()
     layoutView.SetScalingArrayName('Scales')
     layoutView.SetVertexColorArrayName('Color')
     layoutView.ColorVerticesOn()
-    rGraph = vtk.vtkRenderedGraphRepresentation()
-    gGlyph = vtk.vtkGraphToGlyphs()
+    rGraph = vtkRenderedGraphRepresentation()
+    gGlyph = vtkGraphToGlyphs()
     rGraph.SafeDownCast(layoutView.GetRepresentation()).SetGlyphType(gGlyph.CIRCLE)
     layoutView.ResetCamera()
     layoutView.Render()
@@ -1,11 +1,20 @@
 #!/usr/bin/env python
 
-import vtk
-
-source = vtk.vtkRandomGraphSource()
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingContextOpenGL2
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkInfovisCore import vtkRandomGraphSource
+from vtkmodules.vtkViewsInfovis import vtkGraphLayoutView
+
+source = vtkRandomGraphSource()
 source.Update()
 
-view = vtk.vtkGraphLayoutView()
+view = vtkGraphLayoutView()
 view.AddRepresentationFromInputConnection(source.GetOutputPort())
 
 
@@ -1,10 +1,24 @@
 #!/usr/bin/env python
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingContextOpenGL2
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonCore import vtkPoints
+from vtkmodules.vtkCommonDataModel import vtkMutableUndirectedGraph
+from vtkmodules.vtkRenderingCore import (
+    vtkRenderWindow,
+    vtkRenderWindowInteractor
+)
+from vtkmodules.vtkViewsInfovis import vtkGraphLayoutView
 
 
 def main():
     # Create the first graph
-    g0 = vtk.vtkMutableUndirectedGraph()
+    g0 = vtkMutableUndirectedGraph()
 
     v1 = g0.AddVertex()
     v2 = g0.AddVertex()
@@ -15,7 +29,7 @@ def main():
     g0.AddEdge(v1, v3)
 
     # Create points
-    points = vtk.vtkPoints()
+    points = vtkPoints()
     points.InsertNextPoint(0.0, 0.0, 0.0)
     points.InsertNextPoint(1.0, 0.0, 0.0)
     points.InsertNextPoint(0.0, 1.0, 0.0)
@@ -24,7 +38,7 @@ def main():
     g0.SetPoints(points)
 
     # Create the second graph
-    g1 = vtk.vtkMutableUndirectedGraph()
+    g1 = vtkMutableUndirectedGraph()
 
     v1 = g1.AddVertex()
     v2 = g1.AddVertex()
@@ -32,7 +46,7 @@ def main():
     g1.AddEdge(v1, v2)
 
     # Create points
-    points = vtk.vtkPoints()
+    points = vtkPoints()
     points.InsertNextPoint(0.0, 0.0, 0.0)
     points.InsertNextPoint(1.0, 0.0, 0.0)
 
@@ -40,17 +54,17 @@ def main():
     g1.SetPoints(points)
 
     # There will be one render window
-    renderWindow = vtk.vtkRenderWindow()
+    renderWindow = vtkRenderWindow()
     renderWindow.SetSize(600, 300)
 
-    renderWindowInteractor = vtk.vtkRenderWindowInteractor()
+    renderWindowInteractor = vtkRenderWindowInteractor()
 
     # Define viewport ranges
     # (xmin, ymin, xmax, ymax)
     leftViewport = [0.0, 0.0, 0.5, 1.0]
     rightViewport = [0.5, 0.0, 1.0, 1.0]
 
-    graphLayoutView0 = vtk.vtkGraphLayoutView()
+    graphLayoutView0 = vtkGraphLayoutView()
     graphLayoutView0.SetRenderWindow(renderWindow)
     graphLayoutView0.SetInteractor(renderWindowInteractor)
     graphLayoutView0.GetRenderer().SetViewport(leftViewport)
@@ -58,7 +72,7 @@ def main():
     graphLayoutView0.ResetCamera()
     graphLayoutView0.Render()
 
-    graphLayoutView1 = vtk.vtkGraphLayoutView()
+    graphLayoutView1 = vtkGraphLayoutView()
     graphLayoutView1.SetRenderWindow(renderWindow)
     graphLayoutView1.SetInteractor(renderWindowInteractor)
     graphLayoutView1.GetRenderer().SetViewport(rightViewport)
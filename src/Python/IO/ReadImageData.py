@@ -1,7 +1,21 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkIOXML import vtkXMLImageDataReader
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkDataSetMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
 
 
 def get_program_parameters():
@@ -16,37 +30,37 @@ def get_program_parameters():
 
 
 def main():
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
     file_name = get_program_parameters()
 
     # Read the source file.
-    reader = vtk.vtkXMLImageDataReader()
+    reader = vtkXMLImageDataReader()
     reader.SetFileName(file_name)
 
     # Create the mapper that creates graphics elements
-    mapper = vtk.vtkDataSetMapper()
+    mapper = vtkDataSetMapper()
     mapper.SetInputConnection(reader.GetOutputPort())
 
     # Create the Actor
-    actor = vtk.vtkActor()
+    actor = vtkActor()
     actor.SetMapper(mapper)
     # show the edges of the image grid
     actor.GetProperty().SetRepresentationToWireframe()
 
     # Create the Renderer
-    renderer = vtk.vtkRenderer()
+    renderer = vtkRenderer()
     renderer.AddActor(actor)
     renderer.ResetCamera()
     renderer.SetBackground(colors.GetColor3d('Silver'))
 
     # Create the RendererWindow
-    renderer_window = vtk.vtkRenderWindow()
+    renderer_window = vtkRenderWindow()
     renderer_window.AddRenderer(renderer)
     renderer_window.SetWindowName('ReadImageData')
 
     # Create the RendererWindowInteractor and display the vti file
-    interactor = vtk.vtkRenderWindowInteractor()
+    interactor = vtkRenderWindowInteractor()
     interactor.SetRenderWindow(renderer_window)
     interactor.Initialize()
     interactor.Start()
@@ -1,7 +1,22 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkIOXML import vtkXMLUnstructuredGridReader
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkDataSetMapper,
+    vtkProperty,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
 
 
 def get_program_parameters():
@@ -16,12 +31,12 @@ def get_program_parameters():
 
 
 def main():
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
     file_name = get_program_parameters()
 
     # Read the source file.
-    reader = vtk.vtkXMLUnstructuredGridReader()
+    reader = vtkXMLUnstructuredGridReader()
     reader.SetFileName(file_name)
     reader.Update()  # Needed because of GetScalarRange
     output = reader.GetOutput()
@@ -29,35 +44,35 @@ def main():
 
     # Create the mapper that corresponds the objects of the vtk.vtk file
     # into graphics elements
-    mapper = vtk.vtkDataSetMapper()
+    mapper = vtkDataSetMapper()
     mapper.SetInputData(output)
     # mapper.SetScalarRange(scalar_range)
     mapper.ScalarVisibilityOff()
 
     # Create the Actor
-    actor = vtk.vtkActor()
+    actor = vtkActor()
     actor.SetMapper(mapper)
     actor.GetProperty().EdgeVisibilityOn()
     actor.GetProperty().SetLineWidth(2.0)
     actor.GetProperty().SetColor(colors.GetColor3d("MistyRose"))
 
-    backface = vtk.vtkProperty()
+    backface = vtkProperty()
     backface.SetColor(colors.GetColor3d('Tomato'))
     actor.SetBackfaceProperty(backface)
 
     # Create the Renderer
-    renderer = vtk.vtkRenderer()
+    renderer = vtkRenderer()
     renderer.AddActor(actor)
     renderer.SetBackground(colors.GetColor3d('Wheat'))
 
     # Create the RendererWindow
-    renderer_window = vtk.vtkRenderWindow()
+    renderer_window = vtkRenderWindow()
     renderer_window.SetSize(640, 480)
     renderer_window.AddRenderer(renderer)
     renderer_window.SetWindowName('ReadUnstructuredGrid')
 
     # Create the RendererWindowInteractor and display the vtk_file
-    interactor = vtk.vtkRenderWindowInteractor()
+    interactor = vtkRenderWindowInteractor()
     interactor.SetRenderWindow(renderer_window)
     interactor.Initialize()
     interactor.Start()
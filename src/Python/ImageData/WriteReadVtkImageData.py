@@ -1,4 +1,24 @@
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonCore import VTK_DOUBLE
+from vtkmodules.vtkCommonDataModel import vtkImageData
+from vtkmodules.vtkFiltersGeometry import vtkImageDataGeometryFilter
+from vtkmodules.vtkIOXML import (
+    vtkXMLImageDataReader,
+    vtkXMLImageDataWriter
+)
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
 
 
 def get_program_parameters():
@@ -15,13 +35,13 @@ def get_program_parameters():
 
 
 def main():
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
     filename = get_program_parameters()
 
-    imageData = vtk.vtkImageData()
+    imageData = vtkImageData()
     imageData.SetDimensions(3, 4, 5)
-    imageData.AllocateScalars(vtk.VTK_DOUBLE, 1)
+    imageData.AllocateScalars(VTK_DOUBLE, 1)
 
     dims = imageData.GetDimensions()
 
@@ -31,38 +51,38 @@ def main():
             for x in range(dims[0]):
                 imageData.SetScalarComponentFromDouble(x, y, z, 0, 2.0)
 
-    writer = vtk.vtkXMLImageDataWriter()
+    writer = vtkXMLImageDataWriter()
     writer.SetFileName(filename)
     writer.SetInputData(imageData)
     writer.Write()
 
     # Read the file (to test that it was written correctly)
-    reader = vtk.vtkXMLImageDataReader()
+    reader = vtkXMLImageDataReader()
     reader.SetFileName(filename)
     reader.Update()
 
     # Convert the image to a polydata
-    imageDataGeometryFilter = vtk.vtkImageDataGeometryFilter()
+    imageDataGeometryFilter = vtkImageDataGeometryFilter()
     imageDataGeometryFilter.SetInputConnection(reader.GetOutputPort())
     imageDataGeometryFilter.Update()
 
-    mapper = vtk.vtkPolyDataMapper()
+    mapper = vtkPolyDataMapper()
     mapper.SetInputConnection(imageDataGeometryFilter.GetOutputPort())
 
-    actor = vtk.vtkActor()
+    actor = vtkActor()
     actor.SetMapper(mapper)
     actor.GetProperty().SetPointSize(3)
 
     # Setup rendering
-    renderer = vtk.vtkRenderer()
+    renderer = vtkRenderer()
     renderer.AddActor(actor)
     renderer.SetBackground(colors.GetColor3d('White'))
     renderer.ResetCamera()
 
-    renderWindow = vtk.vtkRenderWindow()
+    renderWindow = vtkRenderWindow()
     renderWindow.AddRenderer(renderer)
 
-    renderWindowInteractor = vtk.vtkRenderWindowInteractor()
+    renderWindowInteractor = vtkRenderWindowInteractor()
 
     renderWindowInteractor.SetRenderWindow(renderWindow)
     renderWindowInteractor.Initialize()
@@ -3,43 +3,63 @@
 """
 """
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonDataModel import vtkSphere
+from vtkmodules.vtkIOImage import vtkImageReader2Factory
+from vtkmodules.vtkImagingCore import (
+    vtkImageCast,
+    vtkImageShiftScale
+)
+from vtkmodules.vtkImagingGeneral import vtkImageGaussianSmooth
+from vtkmodules.vtkImagingHybrid import vtkSampleFunction
+from vtkmodules.vtkImagingMath import vtkImageMathematics
+from vtkmodules.vtkInteractionStyle import vtkInteractorStyleImage
+from vtkmodules.vtkRenderingCore import (
+    vtkImageActor,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
 
 
 def main():
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
     fileName = get_program_parameters()
 
     # Read the image.
-    readerFactory = vtk.vtkImageReader2Factory()
+    readerFactory = vtkImageReader2Factory()
     reader = readerFactory.CreateImageReader2(fileName)
     reader.SetFileName(fileName)
     reader.Update()
 
-    cast = vtk.vtkImageCast()
+    cast = vtkImageCast()
     cast.SetInputConnection(reader.GetOutputPort())
     cast.SetOutputScalarTypeToDouble()
 
     # Get rid of the discrete scalars.
-    smooth = vtk.vtkImageGaussianSmooth()
+    smooth = vtkImageGaussianSmooth()
     smooth.SetInputConnection(cast.GetOutputPort())
     smooth.SetStandardDeviations(0.8, 0.8, 0)
 
-    m1 = vtk.vtkSphere()
+    m1 = vtkSphere()
     m1.SetCenter(310, 130, 0)
     m1.SetRadius(0)
 
-    m2 = vtk.vtkSampleFunction()
+    m2 = vtkSampleFunction()
     m2.SetImplicitFunction(m1)
     m2.SetModelBounds(0, 264, 0, 264, 0, 1)
     m2.SetSampleDimensions(264, 264, 1)
 
-    m3 = vtk.vtkImageShiftScale()
+    m3 = vtkImageShiftScale()
     m3.SetInputConnection(m2.GetOutputPort())
     m3.SetScale(0.000095)
 
-    div = vtk.vtkImageMathematics()
+    div = vtkImageMathematics()
     div.SetInputConnection(0, smooth.GetOutputPort())
     div.SetInputConnection(1, m3.GetOutputPort())
     div.SetOperationToMultiply()
@@ -47,12 +67,12 @@ def main():
     # Create the actors.
     colorWindow = 256.0
     colorLevel = 127.5
-    originalActor = vtk.vtkImageActor()
+    originalActor = vtkImageActor()
     originalActor.GetMapper().SetInputConnection(cast.GetOutputPort())
     originalActor.GetProperty().SetColorWindow(colorWindow)
     originalActor.GetProperty().SetColorLevel(colorLevel)
 
-    filteredActor = vtk.vtkImageActor()
+    filteredActor = vtkImageActor()
     filteredActor.GetMapper().SetInputConnection(div.GetOutputPort())
 
     # Define the viewport ranges.
@@ -61,26 +81,26 @@ def main():
     filteredViewport = [0.5, 0.0, 1.0, 1.0]
 
     # Setup the renderers.
-    originalRenderer = vtk.vtkRenderer()
+    originalRenderer = vtkRenderer()
     originalRenderer.SetViewport(originalViewport)
     originalRenderer.AddActor(originalActor)
     originalRenderer.ResetCamera()
     originalRenderer.SetBackground(colors.GetColor3d("SlateGray"))
 
-    filteredRenderer = vtk.vtkRenderer()
+    filteredRenderer = vtkRenderer()
     filteredRenderer.SetViewport(filteredViewport)
     filteredRenderer.AddActor(filteredActor)
     filteredRenderer.ResetCamera()
     filteredRenderer.SetBackground(colors.GetColor3d("LightSlateGray"))
 
-    renderWindow = vtk.vtkRenderWindow()
+    renderWindow = vtkRenderWindow()
     renderWindow.SetSize(600, 300)
     renderWindow.AddRenderer(originalRenderer)
     renderWindow.AddRenderer(filteredRenderer)
     renderWindow.SetWindowName('Attenuation')
 
-    renderWindowInteractor = vtk.vtkRenderWindowInteractor()
-    style = vtk.vtkInteractorStyleImage()
+    renderWindowInteractor = vtkRenderWindowInteractor()
+    style = vtkInteractorStyleImage()
 
     renderWindowInteractor.SetInteractorStyle(style)
 
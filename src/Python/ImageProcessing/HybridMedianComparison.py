@@ -3,7 +3,29 @@
 """
 """
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonDataModel import vtkImageData
+from vtkmodules.vtkIOImage import vtkImageReader2Factory
+from vtkmodules.vtkImagingCore import (
+    vtkImageCast,
+    vtkImageThreshold
+)
+from vtkmodules.vtkImagingGeneral import (
+    vtkImageHybridMedian2D,
+    vtkImageMedian3D
+)
+from vtkmodules.vtkImagingMath import vtkImageMathematics
+from vtkmodules.vtkImagingSources import vtkImageNoiseSource
+from vtkmodules.vtkInteractionStyle import vtkInteractorStyleImage
+from vtkmodules.vtkRenderingCore import (
+    vtkImageActor,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
 
 
 def main():
@@ -12,7 +34,7 @@ def main():
     fileName = get_program_parameters()
 
     # Read the image.
-    readerFactory = vtk.vtkImageReader2Factory()
+    readerFactory = vtkImageReader2Factory()
     reader = readerFactory.CreateImageReader2(fileName)
     reader.SetFileName(fileName)
     reader.Update()
@@ -24,29 +46,29 @@ def main():
     middleSlice = (reader.GetOutput().GetExtent()[5] - reader.GetOutput().GetExtent()[4]) // 2
 
     # Work with double images.
-    cast = vtk.vtkImageCast()
+    cast = vtkImageCast()
     cast.SetInputConnection(reader.GetOutputPort())
     cast.SetOutputScalarTypeToDouble()
     cast.Update()
 
-    originalData = vtk.vtkImageData()
+    originalData = vtkImageData()
     originalData.DeepCopy(cast.GetOutput())
 
-    noisyData = vtk.vtkImageData()
+    noisyData = vtkImageData()
 
     AddShotNoise(originalData, noisyData, 2000.0, 0.1, reader.GetOutput().GetExtent())
-    median = vtk.vtkImageMedian3D()
+    median = vtkImageMedian3D()
     median.SetInputData(noisyData)
     median.SetKernelSize(5, 5, 1)
 
-    hybridMedian1 = vtk.vtkImageHybridMedian2D()
+    hybridMedian1 = vtkImageHybridMedian2D()
     hybridMedian1.SetInputData(noisyData)
-    hybridMedian = vtk.vtkImageHybridMedian2D()
+    hybridMedian = vtkImageHybridMedian2D()
     hybridMedian.SetInputConnection(hybridMedian1.GetOutputPort())
 
     colorWindow = (scalarRange[1] - scalarRange[0]) * 0.8
     colorLevel = colorWindow / 2
-    originalActor = vtk.vtkImageActor()
+    originalActor = vtkImageActor()
     originalActor.GetMapper().SetInputData(originalData)
     originalActor.GetProperty().SetColorWindow(colorWindow)
     originalActor.GetProperty().SetColorLevel(colorLevel)
@@ -54,34 +76,34 @@ def main():
     originalActor.SetDisplayExtent(reader.GetDataExtent()[0], reader.GetDataExtent()[1], reader.GetDataExtent()[2],
                                    reader.GetDataExtent()[3], middleSlice, middleSlice)
 
-    noisyActor = vtk.vtkImageActor()
+    noisyActor = vtkImageActor()
     noisyActor.GetMapper().SetInputData(noisyData)
     noisyActor.GetProperty().SetColorWindow(colorWindow)
     noisyActor.GetProperty().SetColorLevel(colorLevel)
     noisyActor.GetProperty().SetInterpolationTypeToNearest()
     noisyActor.SetDisplayExtent(originalActor.GetDisplayExtent())
 
-    hybridMedianActor = vtk.vtkImageActor()
+    hybridMedianActor = vtkImageActor()
     hybridMedianActor.GetMapper().SetInputConnection(hybridMedian.GetOutputPort())
     hybridMedianActor.GetProperty().SetColorWindow(colorWindow)
     hybridMedianActor.GetProperty().SetColorLevel(colorLevel)
     hybridMedianActor.GetProperty().SetInterpolationTypeToNearest()
     hybridMedianActor.SetDisplayExtent(originalActor.GetDisplayExtent())
 
-    medianActor = vtk.vtkImageActor()
+    medianActor = vtkImageActor()
     medianActor.GetMapper().SetInputConnection(median.GetOutputPort())
     medianActor.GetProperty().SetColorWindow(colorWindow)
     medianActor.GetProperty().SetColorLevel(colorLevel)
     medianActor.GetProperty().SetInterpolationTypeToNearest()
 
     # Setup the renderers.
-    originalRenderer = vtk.vtkRenderer()
+    originalRenderer = vtkRenderer()
     originalRenderer.AddActor(originalActor)
-    noisyRenderer = vtk.vtkRenderer()
+    noisyRenderer = vtkRenderer()
     noisyRenderer.AddActor(noisyActor)
-    hybridRenderer = vtk.vtkRenderer()
+    hybridRenderer = vtkRenderer()
     hybridRenderer.AddActor(hybridMedianActor)
-    medianRenderer = vtk.vtkRenderer()
+    medianRenderer = vtkRenderer()
     medianRenderer.AddActor(medianActor)
 
     renderers = list()
@@ -95,7 +117,7 @@ def main():
     xGridDimensions = 2
     yGridDimensions = 2
 
-    renderWindow = vtk.vtkRenderWindow()
+    renderWindow = vtkRenderWindow()
     renderWindow.SetSize(
         rendererSize * xGridDimensions, rendererSize * yGridDimensions)
     for row in range(0, yGridDimensions):
@@ -108,8 +130,8 @@ def main():
             renderWindow.AddRenderer(renderers[index])
     renderWindow.SetWindowName('HybridMedianComparison')
 
-    renderWindowInteractor = vtk.vtkRenderWindowInteractor()
-    style = vtk.vtkInteractorStyleImage()
+    renderWindowInteractor = vtkRenderWindowInteractor()
+    style = vtkInteractorStyleImage()
 
     renderWindowInteractor.SetInteractorStyle(style)
     renderWindowInteractor.SetRenderWindow(renderWindow)
@@ -138,28 +160,28 @@ def get_program_parameters():
 
 
 def AddShotNoise(inputImage, outputImage, noiseAmplitude, noiseFraction, extent):
-    shotNoiseSource = vtk.vtkImageNoiseSource()
+    shotNoiseSource = vtkImageNoiseSource()
     shotNoiseSource.SetWholeExtent(extent)
     shotNoiseSource.SetMinimum(0.0)
     shotNoiseSource.SetMaximum(1.0)
 
-    shotNoiseThresh1 = vtk.vtkImageThreshold()
+    shotNoiseThresh1 = vtkImageThreshold()
     shotNoiseThresh1.SetInputConnection(shotNoiseSource.GetOutputPort())
     shotNoiseThresh1.ThresholdByLower(1.0 - noiseFraction)
     shotNoiseThresh1.SetInValue(0)
     shotNoiseThresh1.SetOutValue(noiseAmplitude)
-    shotNoiseThresh2 = vtk.vtkImageThreshold()
+    shotNoiseThresh2 = vtkImageThreshold()
     shotNoiseThresh2.SetInputConnection(shotNoiseSource.GetOutputPort())
     shotNoiseThresh2.ThresholdByLower(noiseFraction)
     shotNoiseThresh2.SetInValue(1.0 - noiseAmplitude)
     shotNoiseThresh2.SetOutValue(0.0)
 
-    shotNoise = vtk.vtkImageMathematics()
+    shotNoise = vtkImageMathematics()
     shotNoise.SetInputConnection(0, shotNoiseThresh1.GetOutputPort())
     shotNoise.SetInputConnection(1, shotNoiseThresh2.GetOutputPort())
     shotNoise.SetOperationToAdd()
 
-    add = vtk.vtkImageMathematics()
+    add = vtkImageMathematics()
     add.SetInputData(0, inputImage)
     add.SetInputConnection(1, shotNoise.GetOutputPort())
     add.SetOperationToAdd()
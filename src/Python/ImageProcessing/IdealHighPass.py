@@ -3,87 +3,107 @@
 """
 """
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkIOImage import vtkImageReader2Factory
+from vtkmodules.vtkImagingColor import vtkImageMapToWindowLevelColors
+from vtkmodules.vtkImagingCore import vtkImageExtractComponents
+from vtkmodules.vtkImagingFourier import (
+    vtkImageButterworthHighPass,
+    vtkImageFFT,
+    vtkImageIdealHighPass,
+    vtkImageRFFT
+)
+from vtkmodules.vtkInteractionStyle import vtkInteractorStyleImage
+from vtkmodules.vtkRenderingCore import (
+    vtkImageActor,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
 
 
 def main():
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
     fileName = get_program_parameters()
 
     # Read the image.
-    readerFactory = vtk.vtkImageReader2Factory()
+    readerFactory = vtkImageReader2Factory()
     reader = readerFactory.CreateImageReader2(fileName)
     reader.SetFileName(fileName)
     reader.Update()
 
-    fft = vtk.vtkImageFFT()
+    fft = vtkImageFFT()
     fft.SetInputConnection(reader.GetOutputPort())
 
-    idealHighPass = vtk.vtkImageIdealHighPass()
+    idealHighPass = vtkImageIdealHighPass()
     idealHighPass.SetInputConnection(fft.GetOutputPort())
     idealHighPass.SetXCutOff(0.1)
     idealHighPass.SetYCutOff(0.1)
 
-    idealRfft = vtk.vtkImageRFFT()
+    idealRfft = vtkImageRFFT()
     idealRfft.SetInputConnection(idealHighPass.GetOutputPort())
 
-    idealReal = vtk.vtkImageExtractComponents()
+    idealReal = vtkImageExtractComponents()
     idealReal.SetInputConnection(idealRfft.GetOutputPort())
     idealReal.SetComponents(0)
 
-    butterworthHighPass = vtk.vtkImageButterworthHighPass()
+    butterworthHighPass = vtkImageButterworthHighPass()
     butterworthHighPass.SetInputConnection(fft.GetOutputPort())
     butterworthHighPass.SetXCutOff(0.1)
     butterworthHighPass.SetYCutOff(0.1)
 
-    butterworthRfft = vtk.vtkImageRFFT()
+    butterworthRfft = vtkImageRFFT()
     butterworthRfft.SetInputConnection(butterworthHighPass.GetOutputPort())
 
-    butterworthReal = vtk.vtkImageExtractComponents()
+    butterworthReal = vtkImageExtractComponents()
     butterworthReal.SetInputConnection(butterworthRfft.GetOutputPort())
     butterworthReal.SetComponents(0)
 
     # Create the actors.
-    idealColor = vtk.vtkImageMapToWindowLevelColors()
+    idealColor = vtkImageMapToWindowLevelColors()
     idealColor.SetWindow(500)
     idealColor.SetLevel(0)
     idealColor.SetInputConnection(idealReal.GetOutputPort())
 
-    idealActor = vtk.vtkImageActor()
+    idealActor = vtkImageActor()
     idealActor.GetMapper().SetInputConnection(idealColor.GetOutputPort())
     idealActor.GetProperty().SetInterpolationTypeToNearest()
 
-    butterworthColor = vtk.vtkImageMapToWindowLevelColors()
+    butterworthColor = vtkImageMapToWindowLevelColors()
     butterworthColor.SetWindow(500)
     butterworthColor.SetLevel(0)
     butterworthColor.SetInputConnection(butterworthReal.GetOutputPort())
 
-    butterworthActor = vtk.vtkImageActor()
+    butterworthActor = vtkImageActor()
     butterworthActor.GetMapper().SetInputConnection(butterworthColor.GetOutputPort())
     butterworthActor.GetProperty().SetInterpolationTypeToNearest()
 
     # Setup the renderers.
-    idealRenderer = vtk.vtkRenderer()
+    idealRenderer = vtkRenderer()
     idealRenderer.SetViewport(0.0, 0.0, 0.5, 1.0)
     idealRenderer.AddActor(idealActor)
     idealRenderer.ResetCamera()
     idealRenderer.SetBackground(colors.GetColor3d("SlateGray"))
 
-    butterworthRenderer = vtk.vtkRenderer()
+    butterworthRenderer = vtkRenderer()
     butterworthRenderer.SetViewport(0.5, 0.0, 1.0, 1.0)
     butterworthRenderer.AddActor(butterworthActor)
     butterworthRenderer.SetActiveCamera(idealRenderer.GetActiveCamera())
     butterworthRenderer.SetBackground(colors.GetColor3d("LightSlateGray"))
 
-    renderWindow = vtk.vtkRenderWindow()
+    renderWindow = vtkRenderWindow()
     renderWindow.SetSize(600, 300)
     renderWindow.SetWindowName('IdealHighPass')
     renderWindow.AddRenderer(idealRenderer)
     renderWindow.AddRenderer(butterworthRenderer)
 
-    renderWindowInteractor = vtk.vtkRenderWindowInteractor()
-    style = vtk.vtkInteractorStyleImage()
+    renderWindowInteractor = vtkRenderWindowInteractor()
+    style = vtkInteractorStyleImage()
 
     renderWindowInteractor.SetInteractorStyle(style)
 
@@ -3,7 +3,22 @@
 """
 """
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkIOImage import vtkImageReader2Factory
+from vtkmodules.vtkImagingMorphological import (
+    vtkImageDilateErode3D,
+    vtkImageSeedConnectivity
+)
+from vtkmodules.vtkInteractionStyle import vtkInteractorStyleImage
+from vtkmodules.vtkRenderingCore import (
+    vtkImageActor,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
 
 
 def main():
@@ -12,53 +27,53 @@ def main():
     fileName = get_program_parameters()
 
     # Read the image.
-    readerFactory = vtk.vtkImageReader2Factory()
+    readerFactory = vtkImageReader2Factory()
     reader = readerFactory.CreateImageReader2(fileName)
     reader.SetFileName(fileName)
     reader.Update()
 
     # Dilate
-    dilate = vtk.vtkImageDilateErode3D()
+    dilate = vtkImageDilateErode3D()
     dilate.SetInputConnection(reader.GetOutputPort())
     dilate.SetDilateValue(0)
     dilate.SetErodeValue(255)
     dilate.SetKernelSize(31, 31, 1)
 
     # Erode
-    erode = vtk.vtkImageDilateErode3D()
+    erode = vtkImageDilateErode3D()
     erode.SetInputConnection(reader.GetOutputPort())
     erode.SetDilateValue(255)
     erode.SetErodeValue(0)
     erode.SetKernelSize(31, 31, 1)
 
     # Opening - dilate then erode.
-    dilate1 = vtk.vtkImageDilateErode3D()
+    dilate1 = vtkImageDilateErode3D()
     dilate1.SetInputConnection(reader.GetOutputPort())
     dilate1.SetDilateValue(0)
     dilate1.SetErodeValue(255)
     dilate1.SetKernelSize(31, 31, 1)
 
-    erode1 = vtk.vtkImageDilateErode3D()
+    erode1 = vtkImageDilateErode3D()
     erode1.SetInputConnection(dilate1.GetOutputPort())
     erode1.SetDilateValue(255)
     erode1.SetErodeValue(0)
     erode1.SetKernelSize(31, 31, 1)
 
     # Closing - erode then dilate.
-    erode2 = vtk.vtkImageDilateErode3D()
+    erode2 = vtkImageDilateErode3D()
     erode2.SetInputConnection(reader.GetOutputPort())
     erode2.SetDilateValue(255)
     erode2.SetErodeValue(0)
     erode2.SetKernelSize(31, 31, 1)
 
-    dilate2 = vtk.vtkImageDilateErode3D()
+    dilate2 = vtkImageDilateErode3D()
     dilate2.SetInputConnection(erode2.GetOutputPort())
     dilate2.SetDilateValue(0)
     dilate2.SetErodeValue(255)
     dilate2.SetKernelSize(31, 31, 1)
 
     # Connectivity
-    con = vtk.vtkImageSeedConnectivity()
+    con = vtkImageSeedConnectivity()
     con.SetInputConnection(reader.GetOutputPort())
     con.AddSeed(300, 200)
     con.SetInputConnectValue(0)
@@ -66,42 +81,42 @@ def main():
     con.SetOutputUnconnectedValue(255)
 
     # Actors
-    originalActor = vtk.vtkImageActor()
+    originalActor = vtkImageActor()
     originalActor.GetMapper().SetInputConnection(reader.GetOutputPort())
     originalActor.GetProperty().SetInterpolationTypeToNearest()
 
-    connectedActor = vtk.vtkImageActor()
+    connectedActor = vtkImageActor()
     connectedActor.GetMapper().SetInputConnection(con.GetOutputPort())
     connectedActor.GetProperty().SetInterpolationTypeToNearest()
 
-    erodeActor = vtk.vtkImageActor()
+    erodeActor = vtkImageActor()
     erodeActor.GetMapper().SetInputConnection(erode.GetOutputPort())
     erodeActor.GetProperty().SetInterpolationTypeToNearest()
 
-    dilateActor = vtk.vtkImageActor()
+    dilateActor = vtkImageActor()
     dilateActor.GetMapper().SetInputConnection(dilate.GetOutputPort())
     dilateActor.GetProperty().SetInterpolationTypeToNearest()
 
-    openingActor = vtk.vtkImageActor()
+    openingActor = vtkImageActor()
     openingActor.GetMapper().SetInputConnection(dilate2.GetOutputPort())
     openingActor.GetProperty().SetInterpolationTypeToNearest()
 
-    closingActor = vtk.vtkImageActor()
+    closingActor = vtkImageActor()
     closingActor.GetMapper().SetInputConnection(erode1.GetOutputPort())
     closingActor.GetProperty().SetInterpolationTypeToNearest()
 
     # Setup renderers
-    originalRenderer = vtk.vtkRenderer()
+    originalRenderer = vtkRenderer()
     originalRenderer.AddActor(originalActor)
-    connectedRenderer = vtk.vtkRenderer()
+    connectedRenderer = vtkRenderer()
     connectedRenderer.AddActor(connectedActor)
-    dilateRenderer = vtk.vtkRenderer()
+    dilateRenderer = vtkRenderer()
     dilateRenderer.AddActor(dilateActor)
-    erodeRenderer = vtk.vtkRenderer()
+    erodeRenderer = vtkRenderer()
     erodeRenderer.AddActor(erodeActor)
-    closingRenderer = vtk.vtkRenderer()
+    closingRenderer = vtkRenderer()
     closingRenderer.AddActor(closingActor)
-    openingRenderer = vtk.vtkRenderer()
+    openingRenderer = vtkRenderer()
     openingRenderer.AddActor(openingActor)
 
     renderers = list()
@@ -117,7 +132,7 @@ def main():
     xGridDimensions = 2
     yGridDimensions = 3
 
-    renderWindow = vtk.vtkRenderWindow()
+    renderWindow = vtkRenderWindow()
     renderWindow.SetSize(
         rendererSize * xGridDimensions, rendererSize * yGridDimensions)
     for row in range(0, yGridDimensions):
@@ -130,8 +145,8 @@ def main():
             renderWindow.AddRenderer(renderers[index])
     renderWindow.SetWindowName('MorphologyComparison')
 
-    renderWindowInteractor = vtk.vtkRenderWindowInteractor()
-    style = vtk.vtkInteractorStyleImage()
+    renderWindowInteractor = vtkRenderWindowInteractor()
+    style = vtkInteractorStyleImage()
 
     renderWindowInteractor.SetInteractorStyle(style)
     renderWindowInteractor.SetRenderWindow(renderWindow)
@@ -1,40 +1,53 @@
 #!/usr/bin/env python
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkImagingCore import vtkImageCast
+from vtkmodules.vtkImagingSources import vtkImageMandelbrotSource
+from vtkmodules.vtkInteractionStyle import vtkInteractorStyleImage
+from vtkmodules.vtkRenderingCore import (
+    vtkImageActor,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
 
 
 def main():
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
     # Create a float image
-    source = vtk.vtkImageMandelbrotSource()
+    source = vtkImageMandelbrotSource()
     source.Update()
 
     print(source.GetOutput().GetScalarTypeAsString())
 
-    castFilter = vtk.vtkImageCast()
+    castFilter = vtkImageCast()
     castFilter.SetInputConnection(source.GetOutputPort())
     castFilter.SetOutputScalarTypeToUnsignedChar()
     castFilter.Update()
 
     # Create an actor
-    actor = vtk.vtkImageActor()
+    actor = vtkImageActor()
     actor.GetMapper().SetInputConnection(castFilter.GetOutputPort())
 
     # Setup renderer
-    renderer = vtk.vtkRenderer()
+    renderer = vtkRenderer()
     renderer.AddActor(actor)
     renderer.SetBackground(colors.GetColor3d('DarkSlateGray'))
     renderer.ResetCamera()
 
     # Setup render window
-    renderWindow = vtk.vtkRenderWindow()
+    renderWindow = vtkRenderWindow()
     renderWindow.AddRenderer(renderer)
     renderWindow.SetWindowName('Cast')
 
     # Setup render window interactor
-    renderWindowInteractor = vtk.vtkRenderWindowInteractor()
-    style = vtk.vtkInteractorStyleImage()
+    renderWindowInteractor = vtkRenderWindowInteractor()
+    style = vtkInteractorStyleImage()
     renderWindowInteractor.SetInteractorStyle(style)
 
     # Render and start interaction
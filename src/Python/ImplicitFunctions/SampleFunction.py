@@ -1,18 +1,35 @@
 #!/usr/bin/env python
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonDataModel import vtkSuperquadric
+from vtkmodules.vtkFiltersCore import vtkContourFilter
+from vtkmodules.vtkFiltersModeling import vtkOutlineFilter
+from vtkmodules.vtkImagingHybrid import vtkSampleFunction
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
 
 
 def main():
     value = 2.0
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
-    implicitFunction = vtk.vtkSuperquadric()
+    implicitFunction = vtkSuperquadric()
     implicitFunction.SetPhiRoundness(2.5)
     implicitFunction.SetThetaRoundness(.5)
 
     # Sample the function.
-    sample = vtk.vtkSampleFunction()
+    sample = vtkSampleFunction()
     sample.SetSampleDimensions(50, 50, 50)
     sample.SetImplicitFunction(implicitFunction)
 
@@ -20,41 +37,41 @@ def main():
     sample.SetModelBounds(xmin, xmax, ymin, ymax, zmin, zmax)
 
     # Create the 0 isosurface.
-    contours = vtk.vtkContourFilter()
+    contours = vtkContourFilter()
     contours.SetInputConnection(sample.GetOutputPort())
     contours.GenerateValues(1, 2.0, 2.0)
 
     # Map the contours to graphical primitives.
-    contourMapper = vtk.vtkPolyDataMapper()
+    contourMapper = vtkPolyDataMapper()
     contourMapper.SetInputConnection(contours.GetOutputPort())
     contourMapper.SetScalarRange(0.0, 1.2)
 
     # Create an actor for the contours.
-    contourActor = vtk.vtkActor()
+    contourActor = vtkActor()
     contourActor.SetMapper(contourMapper)
 
     # Create a box around the function to indicate the sampling volume. 
 
     # Create outline.
-    outline = vtk.vtkOutlineFilter()
+    outline = vtkOutlineFilter()
     outline.SetInputConnection(sample.GetOutputPort())
 
     # Map it to graphics primitives.
-    outlineMapper = vtk.vtkPolyDataMapper()
+    outlineMapper = vtkPolyDataMapper()
     outlineMapper.SetInputConnection(outline.GetOutputPort())
 
     # Create an actor.
-    outlineActor = vtk.vtkActor()
+    outlineActor = vtkActor()
     outlineActor.SetMapper(outlineMapper)
     outlineActor.GetProperty().SetColor(colors.GetColor3d("Black"))
 
     # Visualize.
-    renderer = vtk.vtkRenderer()
-    renderWindow = vtk.vtkRenderWindow()
+    renderer = vtkRenderer()
+    renderWindow = vtkRenderWindow()
     renderWindow.AddRenderer(renderer)
     renderWindow.SetWindowName('ImplicitSphere1')
 
-    interactor = vtk.vtkRenderWindowInteractor()
+    interactor = vtkRenderWindowInteractor()
     interactor.SetRenderWindow(renderWindow)
 
     renderer.AddActor(contourActor)
@@ -1,24 +1,41 @@
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonDataModel import vtkPolyData
+from vtkmodules.vtkFiltersSources import (
+    vtkPointSource,
+    vtkSphereSource
+)
+from vtkmodules.vtkInteractionStyle import vtkInteractorStyleTrackballCamera
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkGlyph3DMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
 
 
 def main():
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
     # create a rendering window and renderer
-    ren = vtk.vtkRenderer()
-    renWin = vtk.vtkRenderWindow()
+    ren = vtkRenderer()
+    renWin = vtkRenderWindow()
     renWin.AddRenderer(ren)
     renWin.SetWindowName('InteractorStyleTrackballCamera')
 
     # create a renderwindowinteractor
-    iren = vtk.vtkRenderWindowInteractor()
+    iren = vtkRenderWindowInteractor()
     iren.SetRenderWindow(renWin)
 
-    style = vtk.vtkInteractorStyleTrackballCamera()
+    style = vtkInteractorStyleTrackballCamera()
     iren.SetInteractorStyle(style)
 
     # create source
-    src = vtk.vtkPointSource()
+    src = vtkPointSource()
     src.SetCenter(0, 0, 0)
     src.SetNumberOfPoints(50)
     src.SetRadius(5)
@@ -53,19 +70,19 @@ def point_to_glyph(points, scale):
     for i in range(0, 3):
         max_len = max(bounds[i + 1] - bounds[i], max_len)
 
-    sphere_source = vtk.vtkSphereSource()
+    sphere_source = vtkSphereSource()
     sphere_source.SetRadius(scale * max_len)
 
-    pd = vtk.vtkPolyData()
+    pd = vtkPolyData()
     pd.SetPoints(points)
 
-    mapper = vtk.vtkGlyph3DMapper()
+    mapper = vtkGlyph3DMapper()
     mapper.SetInputData(pd)
     mapper.SetSourceConnection(sphere_source.GetOutputPort())
     mapper.ScalarVisibilityOff()
     mapper.ScalingOff()
 
-    actor = vtk.vtkActor()
+    actor = vtkActor()
     actor.SetMapper(mapper)
 
     return actor
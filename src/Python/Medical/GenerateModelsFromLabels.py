@@ -1,37 +1,74 @@
 #!/usr/bin/env python
 
+import concurrent.futures
 import os
 import sys
+import time
 
-import vtk
+from vtkmodules.vtkCommonCore import (
+    VTK_VERSION_NUMBER,
+    vtkVersion
+)
+from vtkmodules.vtkCommonDataModel import (
+    vtkDataObject,
+    vtkDataSetAttributes,
+    vtkImageData
+)
+from vtkmodules.vtkFiltersCore import (
+    vtkMaskFields,
+    vtkThreshold,
+    vtkWindowedSincPolyDataFilter
+)
+from vtkmodules.vtkFiltersGeneral import (
+    vtkDiscreteFlyingEdges3D,
+    vtkDiscreteMarchingCubes
+)
+from vtkmodules.vtkFiltersGeometry import vtkGeometryFilter
+from vtkmodules.vtkIOImage import vtkMetaImageReader
+from vtkmodules.vtkIOXML import vtkXMLPolyDataWriter
+from vtkmodules.vtkImagingStatistics import vtkImageAccumulate
+
+try:
+    import numpy as np
+    from vtkmodules.util import numpy_support
+except ModuleNotFoundError:
+    np = None
 
 
 def main():
     # vtkDiscreteFlyingEdges3D was introduced in VTK >= 8.2
     use_flying_edges = vtk_version_ok(8, 2, 0)
+    # vtkThreshold.ThresholdBetween was replaced in VTK >= 9.1
+    use_threshold_range = vtk_version_ok(9, 1, 0)
 
-    file_name, start_label, end_label = get_program_parameters()
+    file_name, start_label, end_label, per_label, workers = get_program_parameters()
     if start_label > end_label:
         end_label, start_label = start_label, end_label
 
+    if per_label:
+        if np is not None:
+            generate_models_per_label(file_name, start_label, end_label, use_flying_edges, workers)
+            return
+        print('NumPy is needed to generate the models one label at a time.')
+
     # Create all of the classes we will need
-    reader = vtk.vtkMetaImageReader()
-    histogram = vtk.vtkImageAccumulate()
+    reader = vtkMetaImageReader()
+    histogram = vtkImageAccumulate()
     if use_flying_edges:
         try:
             using_marching_cubes = False
-            discrete_cubes = vtk.vtkDiscreteFlyingEdges3D()
+            discrete_cubes = vtkDiscreteFlyingEdges3D()
         except AttributeError:
             using_marching_cubes = True
-            discrete_cubes = vtk.vtkDiscreteMarchingCubes()
+            discrete_cubes = vtkDiscreteMarchingCubes()
     else:
         using_marching_cubes = True
-        discrete_cubes = vtk.vtkDiscreteMarchingCubes()
-    smoother = vtk.vtkWindowedSincPolyDataFilter()
-    selector = vtk.vtkThreshold()
-    scalars_off = vtk.vtkMaskFields()
-    geometry = vtk.vtkGeometryFilter()
-    writer = vtk.vtkXMLPolyDataWriter()
+        discrete_cubes = vtkDiscreteMarchingCubes()
+    smoother = vtkWindowedSincPolyDataFilter()
+    selector = vtkThreshold()
+    scalars_off = vtkMaskFields()
+    geometry = vtkGeometryFilter()
+    writer = vtkXMLPolyDataWriter()
 
     # Define all of the variables
     file_prefix = 'Label'
@@ -70,21 +107,21 @@ def main():
     selector.SetInputConnection(smoother.GetOutputPort())
     if use_flying_edges:
         if using_marching_cubes:
-            selector.SetInputArrayToProcess(0, 0, 0, vtk.vtkDataObject().FIELD_ASSOCIATION_CELLS,
-                                            vtk.vtkDataSetAttributes().SCALARS)
+            selector.SetInputArrayToProcess(0, 0, 0, vtkDataObject().FIELD_ASSOCIATION_CELLS,
+                                            vtkDataSetAttributes().SCALARS)
         else:
-            selector.SetInputArrayToProcess(0, 0, 0, vtk.vtkDataObject().FIELD_ASSOCIATION_POINTS,
-                                            vtk.vtkDataSetAttributes().SCALARS)
+            selector.SetInputArrayToProcess(0, 0, 0, vtkDataObject().FIELD_ASSOCIATION_POINTS,
+                                            vtkDataSetAttributes().SCALARS)
     else:
-        selector.SetInputArrayToProcess(0, 0, 0, vtk.vtkDataObject().FIELD_ASSOCIATION_CELLS,
-                                        vtk.vtkDataSetAttributes().SCALARS)
+        selector.SetInputArrayToProcess(0, 0, 0, vtkDataObject().FIELD_ASSOCIATION_CELLS,
+                                        vtkDataSetAttributes().SCALARS)
 
     # Strip the scalars from the output
     scalars_off.SetInputConnection(selector.GetOutputPort())
-    scalars_off.CopyAttributeOff(vtk.vtkMaskFields().POINT_DATA,
-                                 vtk.vtkDataSetAttributes().SCALARS)
-    scalars_off.CopyAttributeOff(vtk.vtkMaskFields().CELL_DATA,
-                                 vtk.vtkDataSetAttributes().SCALARS)
+    scalars_off.CopyAttributeOff(vtkMaskFields().POINT_DATA,
+                                 vtkDataSetAttributes().SCALARS)
+    scalars_off.CopyAttributeOff(vtkMaskFields().CELL_DATA,
+                                 vtkDataSetAttributes().SCALARS)
 
     geometry.SetInputConnection(scalars_off.GetOutputPort())
 
@@ -97,7 +134,11 @@ def main():
             continue
 
         # select the cells for a given label
-        selector.ThresholdBetween(i, i)
+        if use_threshold_range:
+            selector.SetLowerThreshold(i)
+            selector.SetUpperThreshold(i)
+        else:
+            selector.ThresholdBetween(i, i)
 
         # output the polydata
         output_fn = '{:s}{:d}.vtp'.format(file_prefix, i)
@@ -113,14 +154,149 @@ def get_program_parameters():
     epilogue = '''
 These volumes are normally the output of a segmentation algorithm.
 The polydata for each label will be output into a separate file.
+
+With -p the volume is scanned once to find the bounding box of each label, then each model
+ is generated from the voxels in its bounding box. Several labels are processed at the same
+ time and each file is written as soon as its model is made.
     '''
     parser = argparse.ArgumentParser(description=description, epilog=epilogue,
                                      formatter_class=argparse.RawDescriptionHelpFormatter)
     parser.add_argument('filename', help='Input volume e.g. Frog/frogtissue.mhd.')
     parser.add_argument('startlabel', type=int, help='The starting label in the input volume, e,g, 1.')
     parser.add_argument('endlabel', type=int, help='The ending label in the input volume e.g. 29')
+    parser.add_argument('-p', '--per_label', action='store_true',
+                        help='Generate each model from the bounding box of its label, several labels at a time.')
+    parser.add_argument('-w', '--workers', type=int, default=os.cpu_count(),
+                        help='The number of labels processed at the same time with -p.')
     args = parser.parse_args()
-    return args.filename, args.startlabel, args.endlabel
+    return args.filename, args.startlabel, args.endlabel, args.per_label, args.workers
+
+
+def generate_models_per_label(file_name, start_label, end_label, use_flying_edges, workers):
+    """
+    Generate the model for each label from the voxels in the bounding box of the label.
+
+    The labels are processed concurrently and each model is written as soon as it is made,
+     so only the surfaces of the labels being processed are held in memory.
+    Each surface is smoothed on its own, rather than as part of the surface of all the labels.
+
+    :param file_name: The label volume.
+    :param start_label: The first label.
+    :param end_label: The last label.
+    :param use_flying_edges: Use vtkDiscreteFlyingEdges3D if it is available.
+    :param workers: The number of labels to process at the same time.
+    :return:
+    """
+    file_prefix = 'Label'
+
+    start = time.perf_counter()
+    reader = vtkMetaImageReader()
+    reader.SetFileName(file_name)
+    reader.Update()
+    image = reader.GetOutput()
+    extent = image.GetExtent()
+    dims = image.GetDimensions()
+    # Indexed [k, j, i].
+    volume = numpy_support.vtk_to_numpy(image.GetPointData().GetScalars()).reshape(dims[2], dims[1], dims[0])
+    bounds = label_bounds(volume, start_label, end_label)
+    print('{:s} found {:d} labels in {:0.3f}s'.format(os.path.basename(sys.argv[0]), len(bounds),
+                                                      time.perf_counter() - start))
+
+    def make_model(label):
+        # The voxels in the bounding box of the label and a layer of voxels around it.
+        lo = [max(0, b - 1) for b in bounds[label][0::2]]
+        hi = [min(d - 1, b + 1) for b, d in zip(bounds[label][1::2], dims)]
+        voi = np.ascontiguousarray(volume[lo[2]:hi[2] + 1, lo[1]:hi[1] + 1, lo[0]:hi[0] + 1])
+        sub_image = vtkImageData()
+        sub_image.SetOrigin(image.GetOrigin())
+        sub_image.SetSpacing(image.GetSpacing())
+        sub_image.SetDirectionMatrix(image.GetDirectionMatrix())
+        sub_image.SetExtent(extent[0] + lo[0], extent[0] + hi[0], extent[2] + lo[1], extent[2] + hi[1],
+                            extent[4] + lo[2], extent[4] + hi[2])
+        sub_image.GetPointData().SetScalars(numpy_support.numpy_to_vtk(voi.ravel(), deep=False))
+
+        discrete_cubes = None
+        if use_flying_edges:
+            try:
+                discrete_cubes = vtkDiscreteFlyingEdges3D()
+            except AttributeError:
+                pass
+        if discrete_cubes is None:
+            discrete_cubes = vtkDiscreteMarchingCubes()
+        discrete_cubes.SetInputData(sub_image)
+        discrete_cubes.SetValue(0, label)
+
+        smoother = vtkWindowedSincPolyDataFilter()
+        smoother.SetInputConnection(discrete_cubes.GetOutputPort())
+        smoother.SetNumberOfIterations(15)
+        smoother.BoundarySmoothingOff()
+        smoother.FeatureEdgeSmoothingOff()
+        smoother.SetFeatureAngle(120.0)
+        smoother.SetPassBand(0.001)
+        smoother.NonManifoldSmoothingOn()
+        smoother.NormalizeCoordinatesOn()
+
+        # Strip the scalars from the output
+        scalars_off = vtkMaskFields()
+        scalars_off.SetInputConnection(smoother.GetOutputPort())
+        scalars_off.CopyAttributeOff(vtkMaskFields().POINT_DATA,
+                                     vtkDataSetAttributes().SCALARS)
+        scalars_off.CopyAttributeOff(vtkMaskFields().CELL_DATA,
+                                     vtkDataSetAttributes().SCALARS)
+
+        output_fn = '{:s}{:d}.vtp'.format(file_prefix, label)
+        writer = vtkXMLPolyDataWriter()
+        writer.SetInputConnection(scalars_off.GetOutputPort())
+        writer.SetFileName(output_fn)
+        writer.Write()
+        return output_fn, scalars_off.GetOutput().GetNumberOfCells()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(make_model, label) for label in sorted(bounds)]
+        for future in concurrent.futures.as_completed(futures):
+            output_fn, number_of_cells = future.result()
+            print('{:s} wrote {:s}, {:d} cells'.format(os.path.basename(sys.argv[0]), output_fn, number_of_cells))
+    print('{:s} generated {:d} models in {:0.3f}s'.format(os.path.basename(sys.argv[0]), len(bounds),
+                                                          time.perf_counter() - start))
+
+
+def label_bounds(volume, start_label, end_label):
+    """
+    Find the labels in the volume and their bounding boxes.
+
+    Each axis is scanned once, a slice at a time, recording the labels present in each slice.
+
+    :param volume: The label volume, a NumPy array indexed [k, j, i].
+    :param start_label: The first label.
+    :param end_label: The last label.
+    :return: A dictionary of {label: [i_min, i_max, j_min, j_max, k_min, k_max]}.
+    """
+    if end_label < start_label:
+        return dict()
+    number_of_bins = end_label - start_label + 1
+    is_float = np.issubdtype(volume.dtype, np.floating)
+    present = list()
+    for axis in (2, 1, 0):
+        in_slice = np.zeros((volume.shape[axis], number_of_bins), dtype=bool)
+        for index in range(volume.shape[axis]):
+            values = np.take(volume, index, axis=axis).ravel()
+            # Values outside the range of labels are ignored, as are non-integral values in a
+            #  floating point volume.
+            mask = (values >= start_label) & (values <= end_label)
+            if is_float:
+                mask &= values == np.floor(values)
+            labels = (values[mask] - start_label).astype(np.intp)
+            in_slice[index] = np.bincount(labels, minlength=number_of_bins) > 0
+        present.append(in_slice)
+    res = dict()
+    for label in range(start_label, end_label + 1):
+        if not present[0][:, label - start_label].any():
+            continue
+        res[label] = list()
+        for in_slice in present:
+            indices = np.flatnonzero(in_slice[:, label - start_label])
+            res[label] += [int(indices[0]), int(indices[-1])]
+    return res
 
 
 def vtk_version_ok(major, minor, build):
@@ -134,9 +310,9 @@ def vtk_version_ok(major, minor, build):
     """
     needed_version = 10000000000 * int(major) + 100000000 * int(minor) + int(build)
     try:
-        vtk_version_number = vtk.VTK_VERSION_NUMBER
+        vtk_version_number = VTK_VERSION_NUMBER
     except AttributeError:  # as error:
-        ver = vtk.vtkVersion()
+        ver = vtkVersion()
         vtk_version_number = 10000000000 * ver.GetVTKMajorVersion() + 100000000 * ver.GetVTKMinorVersion() \
                              + ver.GetVTKBuildVersion()
     if vtk_version_number >= needed_version:
@@ -1,13 +1,39 @@
 #!/usr/bin/env python
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonCore import (
+    VTK_VERSION_NUMBER,
+    vtkVersion
+)
+from vtkmodules.vtkFiltersCore import (
+    vtkFlyingEdges3D,
+    vtkMarchingCubes,
+    vtkStripper
+)
+from vtkmodules.vtkFiltersModeling import vtkOutlineFilter
+from vtkmodules.vtkIOImage import vtkMetaImageReader
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkCamera,
+    vtkPolyDataMapper,
+    vtkProperty,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
 
 
 def main():
     # vtkFlyingEdges3D was introduced in VTK >= 8.2
     use_flying_edges = vtk_version_ok(8, 2, 0)
 
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
     file_name = get_program_parameters()
 
@@ -19,11 +45,11 @@ def main():
     # draws into the render window, the interactor enables mouse- and
     # keyboard-based interaction with the data within the render window.
     #
-    a_renderer = vtk.vtkRenderer()
-    ren_win = vtk.vtkRenderWindow()
+    a_renderer = vtkRenderer()
+    ren_win = vtkRenderWindow()
     ren_win.AddRenderer(a_renderer)
 
-    iren = vtk.vtkRenderWindowInteractor()
+    iren = vtkRenderWindowInteractor()
     iren.SetRenderWindow(ren_win)
 
     # The following reader is used to read a series of 2D slices (images)
@@ -32,7 +58,7 @@ def main():
     # uses the FilePrefix in combination with the slice number to construct
     # filenames using the format FilePrefix.%d. (In this case the FilePrefix
     # is the root name of the file: quarter.)
-    reader = vtk.vtkMetaImageReader()
+    reader = vtkMetaImageReader()
     reader.SetFileName(file_name)
 
     # An isosurface, or contour value of 500 is known to correspond to the
@@ -41,29 +67,29 @@ def main():
     # isosurface these render much faster on many systems.
     if use_flying_edges:
         try:
-            skin_extractor = vtk.vtkFlyingEdges3D()
+            skin_extractor = vtkFlyingEdges3D()
         except AttributeError:
-            skin_extractor = vtk.vtkMarchingCubes()
+            skin_extractor = vtkMarchingCubes()
     else:
-        skin_extractor = vtk.vtkMarchingCubes()
+        skin_extractor = vtkMarchingCubes()
     skin_extractor.SetInputConnection(reader.GetOutputPort())
     skin_extractor.SetValue(0, 500)
 
-    skin_stripper = vtk.vtkStripper()
+    skin_stripper = vtkStripper()
     skin_stripper.SetInputConnection(skin_extractor.GetOutputPort())
 
-    skin_mapper = vtk.vtkPolyDataMapper()
+    skin_mapper = vtkPolyDataMapper()
     skin_mapper.SetInputConnection(skin_stripper.GetOutputPort())
     skin_mapper.ScalarVisibilityOff()
 
-    skin = vtk.vtkActor()
+    skin = vtkActor()
     skin.SetMapper(skin_mapper)
     skin.GetProperty().SetDiffuseColor(colors.GetColor3d('SkinColor'))
     skin.GetProperty().SetSpecular(0.3)
     skin.GetProperty().SetSpecularPower(20)
     skin.GetProperty().SetOpacity(0.5)
 
-    back_prop = vtk.vtkProperty()
+    back_prop = vtkProperty()
     back_prop.SetDiffuseColor(colors.GetColor3d('BackfaceColor'))
     skin.SetBackfaceProperty(back_prop)
 
@@ -73,34 +99,34 @@ def main():
     # isosurface these render much faster on may systems.
     if use_flying_edges:
         try:
-            bone_extractor = vtk.vtkFlyingEdges3D()
+            bone_extractor = vtkFlyingEdges3D()
         except AttributeError:
-            bone_extractor = vtk.vtkMarchingCubes()
+            bone_extractor = vtkMarchingCubes()
     else:
-        bone_extractor = vtk.vtkMarchingCubes()
+        bone_extractor = vtkMarchingCubes()
     bone_extractor.SetInputConnection(reader.GetOutputPort())
     bone_extractor.SetValue(0, 1150)
 
-    bone_stripper = vtk.vtkStripper()
+    bone_stripper = vtkStripper()
     bone_stripper.SetInputConnection(bone_extractor.GetOutputPort())
 
-    bone_mapper = vtk.vtkPolyDataMapper()
+    bone_mapper = vtkPolyDataMapper()
     bone_mapper.SetInputConnection(bone_stripper.GetOutputPort())
     bone_mapper.ScalarVisibilityOff()
 
-    bone = vtk.vtkActor()
+    bone = vtkActor()
     bone.SetMapper(bone_mapper)
     bone.GetProperty().SetDiffuseColor(colors.GetColor3d('Ivory'))
 
     # An outline provides context around the data.
     #
-    outline_data = vtk.vtkOutlineFilter()
+    outline_data = vtkOutlineFilter()
     outline_data.SetInputConnection(reader.GetOutputPort())
 
-    map_outline = vtk.vtkPolyDataMapper()
+    map_outline = vtkPolyDataMapper()
     map_outline.SetInputConnection(outline_data.GetOutputPort())
 
-    outline = vtk.vtkActor()
+    outline = vtkActor()
     outline.SetMapper(map_outline)
     outline.GetProperty().SetColor(colors.GetColor3d('Black'))
 
@@ -108,7 +134,7 @@ def main():
     # and Position form a vector direction. Later on (ResetCamera() method)
     # this vector is used to position the camera to look at the data in
     # this direction.
-    a_camera = vtk.vtkCamera()
+    a_camera = vtkCamera()
     a_camera.SetViewUp(0, 0, -1)
     a_camera.SetPosition(0, -1, 0)
     a_camera.SetFocalPoint(0, 0, 0)
@@ -171,9 +197,9 @@ def vtk_version_ok(major, minor, build):
     """
     needed_version = 10000000000 * int(major) + 100000000 * int(minor) + int(build)
     try:
-        vtk_version_number = vtk.VTK_VERSION_NUMBER
+        vtk_version_number = VTK_VERSION_NUMBER
     except AttributeError:  # as error:
-        ver = vtk.vtkVersion()
+        ver = vtkVersion()
         vtk_version_number = 10000000000 * ver.GetVTKMajorVersion() + 100000000 * ver.GetVTKMinorVersion() \
                              + ver.GetVTKBuildVersion()
     if vtk_version_number >= needed_version:
@@ -1,13 +1,41 @@
 #!/usr/bin/env python
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonCore import (
+    VTK_VERSION_NUMBER,
+    vtkLookupTable,
+    vtkVersion
+)
+from vtkmodules.vtkFiltersCore import (
+    vtkFlyingEdges3D,
+    vtkMarchingCubes,
+    vtkStripper
+)
+from vtkmodules.vtkFiltersModeling import vtkOutlineFilter
+from vtkmodules.vtkIOImage import vtkMetaImageReader
+from vtkmodules.vtkImagingCore import vtkImageMapToColors
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkCamera,
+    vtkImageActor,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
 
 
 def main():
     # vtkFlyingEdges3D was introduced in VTK >= 8.2
     use_flying_edges = vtk_version_ok(8, 2, 0)
 
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
     file_name = get_program_parameters()
 
@@ -19,10 +47,10 @@ def main():
     # mouse- and keyboard-based interaction with the data within the
     # render window.
     #
-    a_renderer = vtk.vtkRenderer()
-    ren_win = vtk.vtkRenderWindow()
+    a_renderer = vtkRenderer()
+    ren_win = vtkRenderWindow()
     ren_win.AddRenderer(a_renderer)
-    iren = vtk.vtkRenderWindowInteractor()
+    iren = vtkRenderWindowInteractor()
     iren.SetRenderWindow(ren_win)
 
     # Set a background color for the renderer and set the size of the
@@ -36,7 +64,7 @@ def main():
     # reader uses the FilePrefix in combination with the slice number to
     # construct filenames using the format FilePrefix.%d. (In this case
     # the FilePrefix is the root name of the file: quarter.)
-    reader = vtk.vtkMetaImageReader()
+    reader = vtkMetaImageReader()
     reader.SetFileName(file_name)
     reader.Update()
 
@@ -47,24 +75,24 @@ def main():
     # systems.
     if use_flying_edges:
         try:
-            skin_extractor = vtk.vtkFlyingEdges3D()
+            skin_extractor = vtkFlyingEdges3D()
         except AttributeError:
-            skin_extractor = vtk.vtkMarchingCubes()
+            skin_extractor = vtkMarchingCubes()
     else:
-        skin_extractor = vtk.vtkMarchingCubes()
+        skin_extractor = vtkMarchingCubes()
     skin_extractor.SetInputConnection(reader.GetOutputPort())
     skin_extractor.SetValue(0, 500)
     skin_extractor.Update()
 
-    skin_stripper = vtk.vtkStripper()
+    skin_stripper = vtkStripper()
     skin_stripper.SetInputConnection(skin_extractor.GetOutputPort())
     skin_stripper.Update()
 
-    skin_mapper = vtk.vtkPolyDataMapper()
+    skin_mapper = vtkPolyDataMapper()
     skin_mapper.SetInputConnection(skin_stripper.GetOutputPort())
     skin_mapper.ScalarVisibilityOff()
 
-    skin = vtk.vtkActor()
+    skin = vtkActor()
     skin.SetMapper(skin_mapper)
     skin.GetProperty().SetDiffuseColor(colors.GetColor3d('SkinColor'))
     skin.GetProperty().SetSpecular(0.3)
@@ -77,35 +105,35 @@ def main():
     # systems.
     if use_flying_edges:
         try:
-            bone_extractor = vtk.vtkFlyingEdges3D()
+            bone_extractor = vtkFlyingEdges3D()
         except AttributeError:
-            bone_extractor = vtk.vtkMarchingCubes()
+            bone_extractor = vtkMarchingCubes()
     else:
-        bone_extractor = vtk.vtkMarchingCubes()
+        bone_extractor = vtkMarchingCubes()
     bone_extractor.SetInputConnection(reader.GetOutputPort())
     bone_extractor.SetValue(0, 1150)
 
-    bone_stripper = vtk.vtkStripper()
+    bone_stripper = vtkStripper()
     bone_stripper.SetInputConnection(bone_extractor.GetOutputPort())
 
-    bone_mapper = vtk.vtkPolyDataMapper()
+    bone_mapper = vtkPolyDataMapper()
     bone_mapper.SetInputConnection(bone_stripper.GetOutputPort())
     bone_mapper.ScalarVisibilityOff()
 
-    bone = vtk.vtkActor()
+    bone = vtkActor()
     bone.SetMapper(bone_mapper)
     bone.GetProperty().SetDiffuseColor(colors.GetColor3d('Ivory'))
 
     # An outline provides context around the data.
     #
-    outline_data = vtk.vtkOutlineFilter()
+    outline_data = vtkOutlineFilter()
     outline_data.SetInputConnection(reader.GetOutputPort())
     outline_data.Update()
 
-    map_outline = vtk.vtkPolyDataMapper()
+    map_outline = vtkPolyDataMapper()
     map_outline.SetInputConnection(outline_data.GetOutputPort())
 
-    outline = vtk.vtkActor()
+    outline = vtkActor()
     outline.SetMapper(map_outline)
     outline.GetProperty().SetColor(colors.GetColor3d('Black'))
 
@@ -114,7 +142,7 @@ def main():
     # different coloration.
 
     # Start by creating a black/white lookup table.
-    bw_lut = vtk.vtkLookupTable()
+    bw_lut = vtkLookupTable()
     bw_lut.SetTableRange(0, 2000)
     bw_lut.SetSaturationRange(0, 0)
     bw_lut.SetHueRange(0, 0)
@@ -123,7 +151,7 @@ def main():
 
     # Now create a lookup table that consists of the full hue circle
     # (from HSV).
-    hue_lut = vtk.vtkLookupTable()
+    hue_lut = vtkLookupTable()
     hue_lut.SetTableRange(0, 2000)
     hue_lut.SetHueRange(0, 1)
     hue_lut.SetSaturationRange(1, 1)
@@ -132,7 +160,7 @@ def main():
 
     # Finally, create a lookup table with a single hue but having a range
     # in the saturation of the hue.
-    sat_lut = vtk.vtkLookupTable()
+    sat_lut = vtkLookupTable()
     sat_lut.SetTableRange(0, 2000)
     sat_lut.SetHueRange(0.6, 0.6)
     sat_lut.SetSaturationRange(0, 1)
@@ -147,36 +175,36 @@ def main():
     # values, which the vtkImageMapToColors produces.) Note also that by
     # specifying the DisplayExtent, the pipeline requests data of this extent
     # and the vtkImageMapToColors only processes a slice of data.
-    sagittal_colors = vtk.vtkImageMapToColors()
+    sagittal_colors = vtkImageMapToColors()
     sagittal_colors.SetInputConnection(reader.GetOutputPort())
     sagittal_colors.SetLookupTable(bw_lut)
     sagittal_colors.Update()
 
-    sagittal = vtk.vtkImageActor()
+    sagittal = vtkImageActor()
     sagittal.GetMapper().SetInputConnection(sagittal_colors.GetOutputPort())
     sagittal.SetDisplayExtent(128, 128, 0, 255, 0, 92)
     sagittal.ForceOpaqueOn()
 
     # Create the second (axial) plane of the three planes. We use the
     # same approach as before except that the extent differs.
-    axial_colors = vtk.vtkImageMapToColors()
+    axial_colors = vtkImageMapToColors()
     axial_colors.SetInputConnection(reader.GetOutputPort())
     axial_colors.SetLookupTable(hue_lut)
     axial_colors.Update()
 
-    axial = vtk.vtkImageActor()
+    axial = vtkImageActor()
     axial.GetMapper().SetInputConnection(axial_colors.GetOutputPort())
     axial.SetDisplayExtent(0, 255, 0, 255, 46, 46)
     axial.ForceOpaqueOn()
 
     # Create the third (coronal) plane of the three planes. We use
     # the same approach as before except that the extent differs.
-    coronal_colors = vtk.vtkImageMapToColors()
+    coronal_colors = vtkImageMapToColors()
     coronal_colors.SetInputConnection(reader.GetOutputPort())
     coronal_colors.SetLookupTable(sat_lut)
     coronal_colors.Update()
 
-    coronal = vtk.vtkImageActor()
+    coronal = vtkImageActor()
     coronal.GetMapper().SetInputConnection(coronal_colors.GetOutputPort())
     coronal.SetDisplayExtent(0, 255, 128, 128, 0, 92)
     coronal.ForceOpaqueOn()
@@ -185,7 +213,7 @@ def main():
     # FocalPoint and Position form a vector direction. Later on
     # (ResetCamera() method) this vector is used to position the camera
     # to look at the data in this direction.
-    a_camera = vtk.vtkCamera()
+    a_camera = vtkCamera()
     a_camera.SetViewUp(0, 0, -1)
     a_camera.SetPosition(0, -1, 0)
     a_camera.SetFocalPoint(0, 0, 0)
@@ -260,9 +288,9 @@ def vtk_version_ok(major, minor, build):
     """
     needed_version = 10000000000 * int(major) + 100000000 * int(minor) + int(build)
     try:
-        vtk_version_number = vtk.VTK_VERSION_NUMBER
+        vtk_version_number = VTK_VERSION_NUMBER
     except AttributeError:  # as error:
-        ver = vtk.vtkVersion()
+        ver = vtkVersion()
         vtk_version_number = 10000000000 * ver.GetVTKMajorVersion() + 100000000 * ver.GetVTKMinorVersion() \
                              + ver.GetVTKBuildVersion()
     if vtk_version_number >= needed_version:
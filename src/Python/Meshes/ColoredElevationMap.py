@@ -1,17 +1,38 @@
 #!/usr/bin/env python
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonCore import (
+    vtkLookupTable,
+    vtkMinimalStandardRandomSequence,
+    vtkPoints,
+    vtkUnsignedCharArray
+)
+from vtkmodules.vtkCommonDataModel import vtkPolyData
+from vtkmodules.vtkFiltersCore import vtkDelaunay2D
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
 
 def main():
-    named_colors = vtk.vtkNamedColors()
+    named_colors = vtkNamedColors()
 
     # Create a grid points
-    points = vtk.vtkPoints()
+    points = vtkPoints()
     GridSize = 20;
     xx=0.0 
     yy=0.0
     zz=0.0
-    rng = vtk.vtkMinimalStandardRandomSequence()
+    rng = vtkMinimalStandardRandomSequence()
     rng.SetSeed(8775586)  # For testing.
     for x in range(0, GridSize):
         for y in range(0, GridSize):
@@ -25,11 +46,11 @@ def main():
          
  
     # Add the grid points to a polydata object
-    inputPolyData = vtk.vtkPolyData()
+    inputPolyData = vtkPolyData()
     inputPolyData.SetPoints(points)
  
     # Triangulate the grid points
-    delaunay = vtk.vtkDelaunay2D()
+    delaunay = vtkDelaunay2D()
     delaunay.SetInputData(inputPolyData)
     delaunay.Update()
     outputPolyData = delaunay.GetOutput()
@@ -45,12 +66,12 @@ def main():
     print('maxz: {:< 6.3}'.format(maxz))
  
     # Create the color map
-    colorLookupTable = vtk.vtkLookupTable()
+    colorLookupTable = vtkLookupTable()
     colorLookupTable.SetTableRange(minz, maxz)
     colorLookupTable.Build()
  
     # Generate the colors for each point based on the color map
-    colors = vtk.vtkUnsignedCharArray()
+    colors = vtkUnsignedCharArray()
     colors.SetNumberOfComponents(3)
     colors.SetName('Colors')
  
@@ -78,19 +99,19 @@ def main():
     outputPolyData.GetPointData().SetScalars(colors)
  
     # Create a mapper and actor
-    mapper = vtk.vtkPolyDataMapper()
+    mapper = vtkPolyDataMapper()
     mapper.SetInputData(outputPolyData)
 
-    actor = vtk.vtkActor()
+    actor = vtkActor()
     actor.SetMapper(mapper)
  
     # Create a renderer, render window, and interactor
-    renderer = vtk.vtkRenderer()
-    renderWindow = vtk.vtkRenderWindow()
+    renderer = vtkRenderer()
+    renderWindow = vtkRenderWindow()
     renderWindow.AddRenderer(renderer)
     renderWindow.SetWindowName('ColoredElevationMap')
 
-    renderWindowInteractor = vtk.vtkRenderWindowInteractor()
+    renderWindowInteractor = vtkRenderWindowInteractor()
     renderWindowInteractor.SetRenderWindow(renderWindow)
  
     # Add the actor to the scene
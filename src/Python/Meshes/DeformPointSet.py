@@ -1,21 +1,42 @@
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonCore import vtkPoints
+from vtkmodules.vtkCommonDataModel import (
+    vtkCellArray,
+    vtkPolyData
+)
+from vtkmodules.vtkFiltersCore import vtkElevationFilter
+from vtkmodules.vtkFiltersGeneral import vtkDeformPointSet
+from vtkmodules.vtkFiltersSources import vtkSphereSource
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
 
 
 def main():
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
     
     # Set the background color.
     # colors.SetColor('bkg', [0.2, 0.3, 0.4, 1.0])
 
     # Create a sphere to deform
-    sphere = vtk.vtkSphereSource()
+    sphere = vtkSphereSource()
     sphere.SetThetaResolution(51)
     sphere.SetPhiResolution(17)
     sphere.Update()
     bounds = sphere.GetOutput().GetBounds()
 
     # Create a filter to color the sphere
-    ele = vtk.vtkElevationFilter()
+    ele = vtkElevationFilter()
     ele.SetInputConnection(sphere.GetOutputPort())
     ele.SetLowPoint(0,0,-0.5);
     ele.SetHighPoint(0,0,0.5);
@@ -28,7 +49,7 @@ def main():
     ele.Update()
 
     # Create a mesh to deform the sphere
-    pts = vtk.vtkPoints()
+    pts = vtkPoints()
     pts.SetNumberOfPoints(6)
     pts.SetPoint(0,
                  bounds[0] - 0.1 * (bounds[1] - bounds[0]),
@@ -54,7 +75,7 @@ def main():
                  (bounds[1] + bounds[0]) / 2.0,
                  (bounds[3] + bounds[2]) / 2.0,
                  bounds[5] + 0.1 * (bounds[5] - bounds[4]))
-    tris = vtk.vtkCellArray()
+    tris = vtkCellArray()
 
     cells = [[2, 0, 4], [1, 2, 4], [3, 1, 4], [0, 3, 4], [0, 2, 5], [2, 1, 5], [1, 3, 5], [3, 0, 5]]
 
@@ -63,18 +84,18 @@ def main():
         for c in cell:
             tris.InsertCellPoint(c)
 
-    pd = vtk.vtkPolyData()
+    pd = vtkPolyData()
     pd.SetPoints(pts)
     pd.SetPolys(tris)
 
-    meshMapper = vtk.vtkPolyDataMapper()
+    meshMapper = vtkPolyDataMapper()
     meshMapper.SetInputData(pd)
-    meshActor = vtk.vtkActor()
+    meshActor = vtkActor()
     meshActor.SetMapper(meshMapper)
     meshActor.GetProperty().SetRepresentationToWireframe()
     meshActor.GetProperty().SetColor(colors.GetColor3d('Black'))
 
-    deform = vtk.vtkDeformPointSet()
+    deform = vtkDeformPointSet()
     deform.SetInputData(ele.GetOutput())
     deform.SetControlMeshData(pd)
     deform.Update()
@@ -85,15 +106,15 @@ def main():
                  bounds[5] + .8 * (bounds[5] - bounds[4]))
     pts.Modified()
 
-    polyMapper = vtk.vtkPolyDataMapper()
+    polyMapper = vtkPolyDataMapper()
     polyMapper.SetInputConnection(deform.GetOutputPort())
-    polyActor = vtk.vtkActor()
+    polyActor = vtkActor()
     polyActor.SetMapper(polyMapper)
 
-    renderer = vtk.vtkRenderer()
-    renWin = vtk.vtkRenderWindow()
+    renderer = vtkRenderer()
+    renWin = vtkRenderWindow()
     renWin.AddRenderer(renderer)
-    iren = vtk.vtkRenderWindowInteractor()
+    iren = vtkRenderWindowInteractor()
     iren.SetRenderWindow(renWin)
 
     renderer.AddActor(polyActor)
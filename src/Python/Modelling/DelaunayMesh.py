@@ -8,15 +8,40 @@ We create a fancy image of a 2D Delaunay triangulation. Points are
  randomly generated.
 """
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonCore import (
+    vtkMinimalStandardRandomSequence,
+    vtkPoints
+)
+from vtkmodules.vtkCommonDataModel import vtkPolyData
+from vtkmodules.vtkFiltersCore import (
+    vtkDelaunay2D,
+    vtkExtractEdges,
+    vtkGlyph3D,
+    vtkTubeFilter
+)
+from vtkmodules.vtkFiltersSources import vtkSphereSource
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
 
 
 def main():
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
     # Generate some "random" points.
-    points = vtk.vtkPoints()
-    randomSequence = vtk.vtkMinimalStandardRandomSequence()
+    points = vtkPoints()
+    randomSequence = vtkMinimalStandardRandomSequence()
     randomSequence.SetSeed(1)
     for i in range(0, 50):
         p1 = randomSequence.GetValue()
@@ -26,30 +51,30 @@ def main():
         points.InsertPoint(i, p1, p2, 0.0)
 
     # Create a polydata with the points we just created.
-    profile = vtk.vtkPolyData()
+    profile = vtkPolyData()
     profile.SetPoints(points)
 
     # Perform a 2D Delaunay triangulation on them.
-    delny = vtk.vtkDelaunay2D()
+    delny = vtkDelaunay2D()
     delny.SetInputData(profile)
     delny.SetTolerance(0.001)
-    mapMesh = vtk.vtkPolyDataMapper()
+    mapMesh = vtkPolyDataMapper()
     mapMesh.SetInputConnection(delny.GetOutputPort())
-    meshActor = vtk.vtkActor()
+    meshActor = vtkActor()
     meshActor.SetMapper(mapMesh)
     meshActor.GetProperty().SetColor(colors.GetColor3d('MidnightBlue'))
 
     # We will now create a nice looking mesh by wrapping the edges in tubes,
     # and putting fat spheres at the points.
-    extract = vtk.vtkExtractEdges()
+    extract = vtkExtractEdges()
     extract.SetInputConnection(delny.GetOutputPort())
-    tubes = vtk.vtkTubeFilter()
+    tubes = vtkTubeFilter()
     tubes.SetInputConnection(extract.GetOutputPort())
     tubes.SetRadius(0.01)
     tubes.SetNumberOfSides(6)
-    mapEdges = vtk.vtkPolyDataMapper()
+    mapEdges = vtkPolyDataMapper()
     mapEdges.SetInputConnection(tubes.GetOutputPort())
-    edgeActor = vtk.vtkActor()
+    edgeActor = vtkActor()
     edgeActor.SetMapper(mapEdges)
     edgeActor.GetProperty().SetColor(colors.GetColor3d('peacock'))
     edgeActor.GetProperty().SetSpecularColor(1, 1, 1)
@@ -58,16 +83,16 @@ def main():
     edgeActor.GetProperty().SetAmbient(0.2)
     edgeActor.GetProperty().SetDiffuse(0.8)
 
-    ball = vtk.vtkSphereSource()
+    ball = vtkSphereSource()
     ball.SetRadius(0.025)
     ball.SetThetaResolution(12)
     ball.SetPhiResolution(12)
-    balls = vtk.vtkGlyph3D()
+    balls = vtkGlyph3D()
     balls.SetInputConnection(delny.GetOutputPort())
     balls.SetSourceConnection(ball.GetOutputPort())
-    mapBalls = vtk.vtkPolyDataMapper()
+    mapBalls = vtkPolyDataMapper()
     mapBalls.SetInputConnection(balls.GetOutputPort())
-    ballActor = vtk.vtkActor()
+    ballActor = vtkActor()
     ballActor.SetMapper(mapBalls)
     ballActor.GetProperty().SetColor(colors.GetColor3d('hot_pink'))
     ballActor.GetProperty().SetSpecularColor(1, 1, 1)
@@ -77,10 +102,10 @@ def main():
     ballActor.GetProperty().SetDiffuse(0.8)
 
     # Create the rendering window, renderer, and interactive renderer.
-    ren = vtk.vtkRenderer()
-    renWin = vtk.vtkRenderWindow()
+    ren = vtkRenderer()
+    renWin = vtkRenderWindow()
     renWin.AddRenderer(ren)
-    iren = vtk.vtkRenderWindowInteractor()
+    iren = vtkRenderWindowInteractor()
     iren.SetRenderWindow(renWin)
 
     # Add the actors to the renderer, set the background and size.
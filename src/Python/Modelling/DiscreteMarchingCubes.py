@@ -1,49 +1,116 @@
 #!/usr/bin/env python
 
-import vtk
+import math
+import time
+
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonCore import (
+    VTK_VERSION_NUMBER,
+    vtkLookupTable,
+    vtkMinimalStandardRandomSequence,
+    vtkVersion
+)
+from vtkmodules.vtkCommonDataModel import (
+    vtkImageData,
+    vtkSphere
+)
+from vtkmodules.vtkFiltersGeneral import (
+    vtkDiscreteFlyingEdges3D,
+    vtkDiscreteMarchingCubes
+)
+from vtkmodules.vtkImagingCore import vtkImageThreshold
+from vtkmodules.vtkImagingHybrid import vtkSampleFunction
+from vtkmodules.vtkImagingMath import vtkImageMathematics
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
+
+try:
+    import numpy as np
+    from vtkmodules.util import numpy_support
+except ModuleNotFoundError:
+    np = None
+
+
+def get_program_parameters():
+    import argparse
+    description = 'Generate surfaces from a label volume of randomly placed spheres.'
+    epilogue = '''
+    The spheres are placed in a cube with sides of length 100.
+    Increase the number of spheres and the dimensions of the volume to benchmark the contouring,
+     e.g. -n 10000 -r 2 -d 512
+   '''
+    parser = argparse.ArgumentParser(description=description, epilog=epilogue,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-n', '--number', default=20, type=int, help='The number of spheres.')
+    parser.add_argument('-r', '--radius', default=8, type=float, help='The radius of the spheres.')
+    parser.add_argument('-d', '--dimensions', default=100, type=int, help='The dimensions of the volume.')
+    parser.add_argument('-v', action='store_true', dest='vtk_only',
+                        help='Make the volume by sampling each sphere over the whole volume, this is slow.')
+    args = parser.parse_args()
+    return args.number, args.radius, args.dimensions, args.vtk_only
 
 
 def main():
+    n, radius, dimensions, vtk_only = get_program_parameters()
+
     # vtkDiscreteFlyingEdges3D was introduced in VTK >= 8.2
     use_flying_edges = vtk_version_ok(8, 2, 0)
 
-    n = 20
-    radius = 8
-    blob = make_blob(n, radius)
+    start = time.perf_counter()
+    if np is not None and not vtk_only:
+        blob = make_blob(n, radius, dimensions)
+    else:
+        blob = make_blob_vtk(n, radius, dimensions)
+    print('Label volume: {:d} labels, {:d}^3 voxels, {:0.3f}s'.format(n, dimensions, time.perf_counter() - start))
 
     if use_flying_edges:
         try:
-            discrete = vtk.vtkDiscreteFlyingEdges3D()
+            discrete = vtkDiscreteFlyingEdges3D()
         except AttributeError:
-            discrete = vtk.vtkDiscreteMarchingCubes()
+            discrete = vtkDiscreteMarchingCubes()
     else:
-        discrete = vtk.vtkDiscreteMarchingCubes()
+        discrete = vtkDiscreteMarchingCubes()
     discrete.SetInputData(blob)
     discrete.GenerateValues(n, 1, n)
+    start = time.perf_counter()
+    discrete.Update()
+    print('Contouring: {:d} triangles, {:0.3f}s'.format(discrete.GetOutput().GetNumberOfPolys(),
+                                                        time.perf_counter() - start))
 
     lut = make_colors(n)
 
-    mapper = vtk.vtkPolyDataMapper()
+    mapper = vtkPolyDataMapper()
     mapper.SetInputConnection(discrete.GetOutputPort())
     mapper.SetLookupTable(lut)
     mapper.SetScalarRange(0, lut.GetNumberOfColors())
 
     # Create the RenderWindow, Renderer and both Actors
     #
-    ren = vtk.vtkRenderer()
-    ren_win = vtk.vtkRenderWindow()
+    ren = vtkRenderer()
+    ren_win = vtkRenderWindow()
     ren_win.AddRenderer(ren)
     ren_win.SetWindowName('DiscreteMarchingCubes')
 
-    iren = vtk.vtkRenderWindowInteractor()
+    iren = vtkRenderWindowInteractor()
     iren.SetRenderWindow(ren_win)
 
-    actor = vtk.vtkActor()
+    actor = vtkActor()
     actor.SetMapper(mapper)
 
     ren.AddActor(actor)
 
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
     ren.SetBackground(colors.GetColor3d('Burlywood'))
 
     ren_win.Render()
@@ -62,9 +129,9 @@ def vtk_version_ok(major, minor, build):
     """
     needed_version = 10000000000 * int(major) + 100000000 * int(minor) + int(build)
     try:
-        vtk_version_number = vtk.VTK_VERSION_NUMBER
+        vtk_version_number = VTK_VERSION_NUMBER
     except AttributeError:  # as error:
-        ver = vtk.vtkVersion()
+        ver = vtkVersion()
         vtk_version_number = 10000000000 * ver.GetVTKMajorVersion() + 100000000 * ver.GetVTKMinorVersion() \
                              + ver.GetVTKBuildVersion()
     if vtk_version_number >= needed_version:
@@ -73,33 +140,98 @@ def vtk_version_ok(major, minor, build):
         return False
 
 
-def make_blob(n, radius):
-    blob_image = vtk.vtkImageData()
+def blob_centers(n, radius):
+    """
+    Generate the centers of the spheres.
 
+    :param n: The number of spheres.
+    :param radius: The radius of the spheres.
+    :return: A generator of the centers.
+    """
     max_r = 50 - 2.0 * radius
-    random_sequence = vtk.vtkMinimalStandardRandomSequence()
+    random_sequence = vtkMinimalStandardRandomSequence()
     random_sequence.SetSeed(5071)
     for i in range(0, n):
-
-        sphere = vtk.vtkSphere()
-        sphere.SetRadius(radius)
-
         x = random_sequence.GetRangeValue(-max_r, max_r)
         random_sequence.Next()
         y = random_sequence.GetRangeValue(-max_r, max_r)
         random_sequence.Next()
         z = random_sequence.GetRangeValue(-max_r, max_r)
         random_sequence.Next()
+        yield int(x), int(y), int(z)
+
+
+def make_blob(n, radius, dimensions=100):
+    """
+    Make a label volume of n spheres, sphere i is labelled i + 1.
+
+    Each sphere is only written into the voxels in its bounding box,
+     where spheres overlap the highest label is kept.
 
-        sphere.SetCenter(int(x), int(y), int(z))
+    :param n: The number of spheres.
+    :param radius: The radius of the spheres.
+    :param dimensions: The dimensions of the volume.
+    :return: The label volume.
+    """
+    spacing = 100.0 / (dimensions - 1)
+    coords = np.linspace(-50, 50, dimensions)
+    # Unsigned char scalars would be used directly as colors by the mapper.
+    if n < 2 ** 16:
+        dtype = np.uint16
+    else:
+        dtype = np.uint32
+    # Indexed [z, y, x] so that x varies fastest, as in vtkImageData.
+    labels = np.zeros((dimensions, dimensions, dimensions), dtype=dtype)
+
+    # A voxel is inside when the sphere function, (d^2 - r^2), is at most r^2.
+    r2 = radius * radius
+    half = math.sqrt(2.0 * r2)
+    for i, center in enumerate(blob_centers(n, radius)):
+        box = list()
+        d2 = 0
+        for axis, c in enumerate(reversed(center)):
+            lo = max(0, int(math.floor((c - half + 50) / spacing)))
+            hi = min(dimensions, int(math.ceil((c + half + 50) / spacing)) + 1)
+            box.append(slice(lo, hi))
+            shape = [1, 1, 1]
+            shape[axis] = hi - lo
+            d2 = d2 + ((coords[lo:hi] - c) ** 2).reshape(shape)
+        # The labels increase, so writing the label is the same as taking the maximum.
+        labels[tuple(box)][d2 - r2 <= r2] = i + 1
+
+    blob_image = vtkImageData()
+    blob_image.SetDimensions(dimensions, dimensions, dimensions)
+    blob_image.SetOrigin(-50, -50, -50)
+    blob_image.SetSpacing(spacing, spacing, spacing)
+    # The VTK array refers to the NumPy array rather than copying it.
+    blob_image.GetPointData().SetScalars(numpy_support.numpy_to_vtk(labels.ravel(), deep=False))
+    return blob_image
+
+
+def make_blob_vtk(n, radius, dimensions=100):
+    """
+    Make a label volume of n spheres by sampling each sphere over the whole volume.
+
+    :param n: The number of spheres.
+    :param radius: The radius of the spheres.
+    :param dimensions: The dimensions of the volume.
+    :return: The label volume.
+    """
+    blob_image = vtkImageData()
+
+    for i, center in enumerate(blob_centers(n, radius)):
+
+        sphere = vtkSphere()
+        sphere.SetRadius(radius)
+        sphere.SetCenter(center)
 
-        sampler = vtk.vtkSampleFunction()
+        sampler = vtkSampleFunction()
         sampler.SetImplicitFunction(sphere)
         sampler.SetOutputScalarTypeToFloat()
-        sampler.SetSampleDimensions(100, 100, 100)
+        sampler.SetSampleDimensions(dimensions, dimensions, dimensions)
         sampler.SetModelBounds(-50, 50, -50, 50, -50, 50)
 
-        thres = vtk.vtkImageThreshold()
+        thres = vtkImageThreshold()
         thres.SetInputConnection(sampler.GetOutputPort())
         thres.ThresholdByLower(radius * radius)
         thres.ReplaceInOn()
@@ -110,7 +242,7 @@ def make_blob(n, radius):
         if i == 0:
             blob_image.DeepCopy(thres.GetOutput())
 
-        max_value = vtk.vtkImageMathematics()
+        max_value = vtkImageMathematics()
         max_value.SetInputData(0, blob_image)
         max_value.SetInputData(1, thres.GetOutput())
         max_value.SetOperationToMax()
@@ -129,14 +261,14 @@ def make_colors(n):
     :return: The lookup table.
     """
 
-    lut = vtk.vtkLookupTable()
+    lut = vtkLookupTable()
     lut.SetNumberOfColors(n)
     lut.SetTableRange(0, n - 1)
     lut.SetScaleToLinear()
     lut.Build()
     lut.SetTableValue(0, 0, 0, 0, 1)
 
-    random_sequence = vtk.vtkMinimalStandardRandomSequence()
+    random_sequence = vtkMinimalStandardRandomSequence()
     random_sequence.SetSeed(5071)
     for i in range(1, n):
         r = random_sequence.GetRangeValue(0.4, 1)
@@ -1,23 +1,43 @@
 #!/usr/bin/env python
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonCore import vtkPoints
+from vtkmodules.vtkCommonDataModel import (
+    vtkCellArray,
+    vtkPolyData
+)
+from vtkmodules.vtkFiltersCore import vtkPolyDataNormals
+from vtkmodules.vtkFiltersModeling import vtkRotationalExtrusionFilter
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
 
 
 def main():
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
     # Create the RenderWindow, Renderer and Interactor.
     #
-    renderer = vtk.vtkRenderer()
-    renWin = vtk.vtkRenderWindow()
+    renderer = vtkRenderer()
+    renWin = vtkRenderWindow()
     renWin.AddRenderer(renderer)
 
-    iren = vtk.vtkRenderWindowInteractor()
+    iren = vtkRenderWindowInteractor()
     iren.SetRenderWindow(renWin)
 
     # Create the spring profile (a circle).
     #
-    points = vtk.vtkPoints()
+    points = vtkPoints()
     points.InsertPoint(0, 1.0, 0.0, 0.0)
     points.InsertPoint(1, 1.0732, 0.0, -0.1768)
     points.InsertPoint(2, 1.25, 0.0, -0.25)
@@ -27,7 +47,7 @@ def main():
     points.InsertPoint(6, 1.25, 0.0, 0.25)
     points.InsertPoint(7, 1.0732, 0.0, 0.1768)
 
-    poly = vtk.vtkCellArray()
+    poly = vtkCellArray()
     poly.InsertNextCell(8)  # The number of points.
     poly.InsertCellPoint(0)
     poly.InsertCellPoint(1)
@@ -38,27 +58,27 @@ def main():
     poly.InsertCellPoint(6)
     poly.InsertCellPoint(7)
 
-    profile = vtk.vtkPolyData()
+    profile = vtkPolyData()
     profile.SetPoints(points)
     profile.SetPolys(poly)
 
     # Extrude the profile to make a spring.
     #
-    extrude = vtk.vtkRotationalExtrusionFilter()
+    extrude = vtkRotationalExtrusionFilter()
     extrude.SetInputData(profile)
     extrude.SetResolution(360)
     extrude.SetTranslation(6)
     extrude.SetDeltaRadius(1.0)
     extrude.SetAngle(2160.0)  # six revolutions
 
-    normals = vtk.vtkPolyDataNormals()
+    normals = vtkPolyDataNormals()
     normals.SetInputConnection(extrude.GetOutputPort())
     normals.SetFeatureAngle(60)
 
-    mapper = vtk.vtkPolyDataMapper()
+    mapper = vtkPolyDataMapper()
     mapper.SetInputConnection(normals.GetOutputPort())
 
-    spring = vtk.vtkActor()
+    spring = vtkActor()
     spring.SetMapper(mapper)
     spring.GetProperty().SetColor(colors.GetColor3d("PowderBlue"))
     spring.GetProperty().SetDiffuse(0.7)
@@ -1,21 +1,71 @@
-import vtk
+import time
 
-colors = vtk.vtkNamedColors()
+import numpy as np
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonCore import (
+    vtkMinimalStandardRandomSequence,
+    vtkPoints
+)
+from vtkmodules.vtkCommonDataModel import (
+    vtkDataObject,
+    vtkPolyData
+)
+from vtkmodules.vtkFiltersSources import vtkSphereSource
+from vtkmodules.vtkInteractionStyle import vtkInteractorStyleTrackballCamera
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkGlyph3DMapper,
+    vtkHardwareSelector,
+    vtkPolyDataMapper,
+    vtkPropPicker,
+    vtkProperty,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
+from vtkmodules.util import numpy_support
+
+colors = vtkNamedColors()
 NUMBER_OF_SPHERES = 10
 
 
-class MouseInteractorHighLightActor(vtk.vtkInteractorStyleTrackballCamera):
+def get_program_parameters():
+    import argparse
+    description = 'Highlight a picked sphere.'
+    epilogue = '''
+    By default each sphere has its own source, mapper and actor.
+    With -i, all the spheres are drawn as instances of one sphere by a single vtkGlyph3DMapper,
+     and the picked sphere is found from the instance id reported by vtkHardwareSelector.
+    With -b, the camera is spun through 36 frames before interacting, and the number of props
+     rendered and the frame rate are reported, compare e.g.:
+       HighlightPickedActor.py -n 10000 -b
+       HighlightPickedActor.py -n 10000 -i -b
+   '''
+    parser = argparse.ArgumentParser(description=description, epilog=epilogue,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-n', '--number', default=NUMBER_OF_SPHERES, type=int, help='The number of spheres.')
+    parser.add_argument('-i', '--instanced', action='store_true', help='Draw the spheres with one vtkGlyph3DMapper.')
+    parser.add_argument('-b', '--benchmark', action='store_true', help='Report the frame rate.')
+    args = parser.parse_args()
+    return args.number, args.instanced, args.benchmark
+
+
+class MouseInteractorHighLightActor(vtkInteractorStyleTrackballCamera):
 
     def __init__(self, parent=None):
         self.AddObserver("LeftButtonPressEvent", self.leftButtonPressEvent)
 
         self.LastPickedActor = None
-        self.LastPickedProperty = vtk.vtkProperty()
+        self.LastPickedProperty = vtkProperty()
 
     def leftButtonPressEvent(self, obj, event):
         clickPos = self.GetInteractor().GetEventPosition()
 
-        picker = vtk.vtkPropPicker()
+        picker = vtkPropPicker()
         picker.Pick(clickPos[0], clickPos[1], 0, self.GetDefaultRenderer())
 
         # get the new
@@ -43,32 +93,62 @@ class MouseInteractorHighLightActor(vtk.vtkInteractorStyleTrackballCamera):
         return
 
 
-def main():
-    # A renderer and render window
-    renderer = vtk.vtkRenderer()
-    renderer.SetBackground(colors.GetColor3d('SteelBlue'))
+class MouseInteractorHighLightInstance(vtkInteractorStyleTrackballCamera):
 
-    renwin = vtk.vtkRenderWindow()
-    renwin.AddRenderer(renderer)
-    renwin.SetSize(640, 480)
-    renwin.SetWindowName('HighlightPickedActor')
+    def __init__(self, sphere_colors, color_array, parent=None):
+        """
+        :param sphere_colors: The colors of the instances as a NumPy array.
+        :param color_array: The VTK color array using sphere_colors.
+        """
+        self.AddObserver("LeftButtonPressEvent", self.leftButtonPressEvent)
 
-    # An interactor
-    interactor = vtk.vtkRenderWindowInteractor()
-    interactor.SetRenderWindow(renwin)
+        self.SphereColors = sphere_colors
+        self.ColorArray = color_array
+        self.LastPickedInstance = None
+        self.LastPickedColor = None
 
-    # add the custom style
-    style = MouseInteractorHighLightActor()
-    style.SetDefaultRenderer(renderer)
-    interactor.SetInteractorStyle(style)
+    def leftButtonPressEvent(self, obj, event):
+        clickPos = self.GetInteractor().GetEventPosition()
+
+        # The selected cell id of a vtkGlyph3DMapper is the instance id.
+        selector = vtkHardwareSelector()
+        selector.SetRenderer(self.GetDefaultRenderer())
+        selector.SetFieldAssociation(vtkDataObject.FIELD_ASSOCIATION_CELLS)
+        selector.SetArea(clickPos[0], clickPos[1], clickPos[0], clickPos[1])
+        selection = selector.Select()
+
+        # If something was selected
+        if selection.GetNumberOfNodes() > 0 and selection.GetNode(0).GetSelectionList().GetNumberOfTuples() > 0:
+            new_instance = selection.GetNode(0).GetSelectionList().GetValue(0)
+            # If we picked something before, reset its color
+            if self.LastPickedInstance is not None:
+                self.SphereColors[self.LastPickedInstance] = self.LastPickedColor
+
+            # Save the color of the picked instance so that we can
+            # restore it next time
+            self.LastPickedColor = self.SphereColors[new_instance].copy()
+            # Highlight the picked instance by changing its color
+            self.SphereColors[new_instance] = list(colors.GetColor3ub('Red'))
+            self.ColorArray.Modified()
+
+            # save the last picked instance
+            self.LastPickedInstance = new_instance
 
-    randomSequence = vtk.vtkMinimalStandardRandomSequence()
+        self.OnLeftButtonDown()
+        return
+
+
+def add_spheres(renderer, number_of_spheres):
+    """
+    Add each sphere with its own source, mapper and actor.
+    """
+    randomSequence = vtkMinimalStandardRandomSequence()
     # randomSequence.SetSeed(1043618065)
     # randomSequence.SetSeed(5170)
     randomSequence.SetSeed(8775070)
     # Add spheres to play with
-    for i in range(NUMBER_OF_SPHERES):
-        source = vtk.vtkSphereSource()
+    for i in range(number_of_spheres):
+        source = vtkSphereSource()
 
         # random position and radius
         x = randomSequence.GetRangeValue(-5.0, 5.0)
@@ -85,9 +165,9 @@ def main():
         source.SetPhiResolution(11)
         source.SetThetaResolution(21)
 
-        mapper = vtk.vtkPolyDataMapper()
+        mapper = vtkPolyDataMapper()
         mapper.SetInputConnection(source.GetOutputPort())
-        actor = vtk.vtkActor()
+        actor = vtkActor()
         actor.SetMapper(mapper)
 
         r = randomSequence.GetRangeValue(0.4, 1.0)
@@ -105,9 +185,106 @@ def main():
 
         renderer.AddActor(actor)
 
+
+def add_sphere_instances(renderer, number_of_spheres):
+    """
+    Add the spheres as instances of one sphere drawn by a vtkGlyph3DMapper.
+
+    The spheres have the same positions, radii and colors as those made by add_spheres().
+    :return: The colors of the instances as a NumPy array and the VTK color array that uses it.
+    """
+    randomSequence = vtkMinimalStandardRandomSequence()
+    randomSequence.SetSeed(8775070)
+    values = np.empty((number_of_spheres, 7))
+    for i in range(number_of_spheres):
+        # x, y, z, radius, r, g, b
+        for j, (lo, hi) in enumerate([(-5.0, 5.0)] * 3 + [(0.5, 1.0)] + [(0.4, 1.0)] * 3):
+            values[i, j] = randomSequence.GetRangeValue(lo, hi)
+            randomSequence.Next()
+
+    points = vtkPoints()
+    points.SetData(numpy_support.numpy_to_vtk(values[:, :3].copy()))
+    radii = numpy_support.numpy_to_vtk(values[:, 3].copy())
+    radii.SetName('Radius')
+    sphere_colors = (values[:, 4:] * 255).astype(np.uint8)
+    color_array = numpy_support.numpy_to_vtk(sphere_colors, deep=False)
+    color_array.SetName('Colors')
+
+    centers = vtkPolyData()
+    centers.SetPoints(points)
+    centers.GetPointData().AddArray(radii)
+    centers.GetPointData().SetScalars(color_array)
+
+    source = vtkSphereSource()
+    source.SetRadius(1.0)
+    source.SetPhiResolution(11)
+    source.SetThetaResolution(21)
+
+    mapper = vtkGlyph3DMapper()
+    mapper.SetInputData(centers)
+    mapper.SetSourceConnection(source.GetOutputPort())
+    mapper.SetScaleArray('Radius')
+    mapper.SetScaleModeToScaleByMagnitude()
+    mapper.ScalingOn()
+
+    actor = vtkActor()
+    actor.SetMapper(mapper)
+    actor.GetProperty().SetDiffuse(.8)
+    actor.GetProperty().SetSpecular(.5)
+    actor.GetProperty().SetSpecularColor(colors.GetColor3d('White'))
+    actor.GetProperty().SetSpecularPower(30.0)
+
+    renderer.AddActor(actor)
+    return sphere_colors, color_array
+
+
+def report_frame_rate(render_window, renderer, frames=36):
+    """
+    Report the props rendered, each is at least one draw call, and the frame rate
+     while the camera is rotated once around the scene.
+    """
+    render_window.Render()
+    start = time.perf_counter()
+    for i in range(frames):
+        renderer.GetActiveCamera().Azimuth(360.0 / frames)
+        render_window.Render()
+    elapsed = time.perf_counter() - start
+    print(f'Props rendered: {renderer.GetNumberOfPropsRendered()}, frame time: {elapsed / frames * 1000:0.2f}ms,'
+          f' FPS: {frames / elapsed:0.1f}')
+
+
+def main():
+    number_of_spheres, instanced, benchmark = get_program_parameters()
+
+    # A renderer and render window
+    renderer = vtkRenderer()
+    renderer.SetBackground(colors.GetColor3d('SteelBlue'))
+
+    renwin = vtkRenderWindow()
+    renwin.AddRenderer(renderer)
+    renwin.SetSize(640, 480)
+    renwin.SetWindowName('HighlightPickedActor')
+
+    # An interactor
+    interactor = vtkRenderWindowInteractor()
+    interactor.SetRenderWindow(renwin)
+
+    if instanced:
+        sphere_colors, color_array = add_sphere_instances(renderer, number_of_spheres)
+        style = MouseInteractorHighLightInstance(sphere_colors, color_array)
+    else:
+        add_spheres(renderer, number_of_spheres)
+        style = MouseInteractorHighLightActor()
+    # add the custom style
+    style.SetDefaultRenderer(renderer)
+    interactor.SetInteractorStyle(style)
+
     # Start
     interactor.Initialize()
     renwin.Render()
+    if benchmark:
+        print(f'Spheres: {number_of_spheres}, {"one vtkGlyph3DMapper" if instanced else "one actor each"}')
+        report_frame_rate(renwin, renderer)
     interactor.Start()
 
 
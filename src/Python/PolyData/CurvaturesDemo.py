@@ -28,15 +28,47 @@ This example also demonstrates the use of lists and the linking of the elements
 
 '''
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonComputationalGeometry import vtkParametricRandomHills
+from vtkmodules.vtkCommonCore import vtkLookupTable
+from vtkmodules.vtkCommonTransforms import vtkTransform
+from vtkmodules.vtkFiltersCore import (
+    vtkCleanPolyData,
+    vtkTriangleFilter
+)
+from vtkmodules.vtkFiltersGeneral import (
+    vtkCurvatures,
+    vtkTransformFilter
+)
+from vtkmodules.vtkFiltersSources import (
+    vtkParametricFunctionSource,
+    vtkSuperquadricSource
+)
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkActor2D,
+    vtkColorTransferFunction,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer,
+    vtkTextMapper,
+    vtkTextProperty
+)
 
 
 def main():
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
     # We are going to handle two different sources.
     # The first source is a superquadric source.
-    torus = vtk.vtkSuperquadricSource()
+    torus = vtkSuperquadricSource()
     torus.SetCenter(0.0, 0.0, 0.0)
     torus.SetScale(1.0, 1.0, 1.0)
     torus.SetPhiResolution(64)
@@ -47,29 +79,29 @@ def main():
     torus.SetToroidal(1)
 
     # Rotate the torus towards the observer (around the x-axis)
-    torusT = vtk.vtkTransform()
+    torusT = vtkTransform()
     torusT.RotateX(55)
 
-    torusTF = vtk.vtkTransformFilter()
+    torusTF = vtkTransformFilter()
     torusTF.SetInputConnection(torus.GetOutputPort())
     torusTF.SetTransform(torusT)
 
     # The quadric is made of strips, so pass it through a triangle filter as
     # the curvature filter only operates on polys
-    tri = vtk.vtkTriangleFilter()
+    tri = vtkTriangleFilter()
     tri.SetInputConnection(torusTF.GetOutputPort())
 
     # The quadric has nasty discontinuities from the way the edges are generated
     # so let's pass it though a CleanPolyDataFilter and merge any points which
     # are coincident, or very close
 
-    cleaner = vtk.vtkCleanPolyData()
+    cleaner = vtkCleanPolyData()
     cleaner.SetInputConnection(tri.GetOutputPort())
     cleaner.SetTolerance(0.005)
 
     # The next source will be a parametric function
-    rh = vtk.vtkParametricRandomHills()
-    rhFnSrc = vtk.vtkParametricFunctionSource()
+    rh = vtkParametricRandomHills()
+    rhFnSrc = vtkParametricFunctionSource()
     rhFnSrc.SetParametricFunction(rh)
 
     # Now we have the sources, lets put them into a list.
@@ -80,7 +112,7 @@ def main():
     sources.append(rhFnSrc)
 
     # Colour transfer function.
-    ctf = vtk.vtkColorTransferFunction()
+    ctf = vtkColorTransferFunction()
     ctf.SetColorSpaceToDiverging()
     p1 = [0.0] + list(colors.GetColor3d('MidnightBlue'))
     p2 = [1.0] + list(colors.GetColor3d('DarkOrange'))
@@ -93,7 +125,7 @@ def main():
     # Lookup table.
     lut = list()
     for idx in range(len(sources)):
-        lut.append(vtk.vtkLookupTable())
+        lut.append(vtkLookupTable())
         lut[idx].SetNumberOfColors(256)
         for i, item in enumerate(cc):
             lut[idx].SetTableValue(i, item[0], item[1], item[2], 1.0)
@@ -109,7 +141,7 @@ def main():
 
     curvatures = list()
     for idx in range(len(sources)):
-        curvatures.append(vtk.vtkCurvatures())
+        curvatures.append(vtkCurvatures())
         if idx % 2 == 0:
             curvatures[idx].SetCurvatureTypeToGaussian()
         else:
@@ -122,7 +154,7 @@ def main():
     textactors = list()
 
     # Create a common text property.
-    textProperty = vtk.vtkTextProperty()
+    textProperty = vtkTextProperty()
     textProperty.SetFontSize(24)
     textProperty.SetJustificationToCentered()
 
@@ -135,34 +167,34 @@ def main():
 
         curvatures[idx].SetInputConnection(sources[idx].GetOutputPort())
 
-        mappers.append(vtk.vtkPolyDataMapper())
+        mappers.append(vtkPolyDataMapper())
         mappers[idx].SetInputConnection(curvatures[idx].GetOutputPort())
         mappers[idx].SetLookupTable(lut[idx])
         mappers[idx].SetUseLookupTableScalarRange(1)
 
-        actors.append(vtk.vtkActor())
+        actors.append(vtkActor())
         actors[idx].SetMapper(mappers[idx])
 
-        textmappers.append(vtk.vtkTextMapper())
+        textmappers.append(vtkTextMapper())
         textmappers[idx].SetInput(names[idx])
         textmappers[idx].SetTextProperty(textProperty)
 
-        textactors.append(vtk.vtkActor2D())
+        textactors.append(vtkActor2D())
         textactors[idx].SetMapper(textmappers[idx])
         textactors[idx].SetPosition(250, 16)
 
-        renderers.append(vtk.vtkRenderer())
+        renderers.append(vtkRenderer())
 
     gridDimensions = 2
     rendererSize = 512
 
     for idx in range(len(sources)):
         if idx < gridDimensions * gridDimensions:
-            renderers.append(vtk.vtkRenderer)
+            renderers.append(vtkRenderer)
 
     # Create the RenderWindow
     #
-    renderWindow = vtk.vtkRenderWindow()
+    renderWindow = vtkRenderWindow()
     renderWindow.SetSize(rendererSize * gridDimensions, rendererSize * gridDimensions)
     renderWindow.SetWindowName('CurvaturesDemo')
 
@@ -188,7 +220,7 @@ def main():
             renderers[idx].AddActor(textactors[idx])
             renderers[idx].SetBackground(colors.GetColor3d('CornflowerBlue'))
 
-    interactor = vtk.vtkRenderWindowInteractor()
+    interactor = vtkRenderWindowInteractor()
     interactor.SetRenderWindow(renderWindow)
 
     renderWindow.Render()
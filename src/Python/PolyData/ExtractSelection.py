@@ -3,23 +3,45 @@ converted from:
  - http://www.vtk.org/Wiki/VTK/Examples/Python/PolyData/ExtractSelectionCells
 '''
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonCore import vtkIdTypeArray
+from vtkmodules.vtkCommonDataModel import (
+    vtkSelection,
+    vtkSelectionNode,
+    vtkUnstructuredGrid
+)
+from vtkmodules.vtkFiltersExtraction import vtkExtractSelection
+from vtkmodules.vtkFiltersSources import vtkPointSource
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkCamera,
+    vtkDataSetMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
 
 
 def main():
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
     # colors.SetColor('leftBkg', [0.6, 0.5, 0.4, 1.0])
     # colors.SetColor('centreBkg', [0.3, 0.1, 0.4, 1.0])
     # colors.SetColor('rightBkg', [0.4, 0.5, 0.6, 1.0])
 
-    pointSource = vtk.vtkPointSource()
+    pointSource = vtkPointSource()
     pointSource.SetNumberOfPoints(50)
     pointSource.Update()
 
     print('There are %s input points\n' % pointSource.GetOutput().GetNumberOfPoints())
 
-    ids = vtk.vtkIdTypeArray()
+    ids = vtkIdTypeArray()
     ids.SetNumberOfComponents(1)
 
     # Set values
@@ -28,7 +50,7 @@ def main():
         ids.InsertNextValue(i)
         i += 1
 
-    selectionNode = vtk.vtkSelectionNode()
+    selectionNode = vtkSelectionNode()
     selectionNode.SetFieldType(1)  # POINT
     #  CELL_DATA = 0
     #  POINT_DATA = 1
@@ -48,17 +70,17 @@ def main():
     # BLOCKS = 8
     selectionNode.SetSelectionList(ids)
 
-    selection = vtk.vtkSelection()
+    selection = vtkSelection()
     selection.AddNode(selectionNode)
 
-    extractSelection = vtk.vtkExtractSelection()
+    extractSelection = vtkExtractSelection()
 
     extractSelection.SetInputConnection(0, pointSource.GetOutputPort())
     extractSelection.SetInputData(1, selection)
     extractSelection.Update()
 
     # In selection
-    selected = vtk.vtkUnstructuredGrid()
+    selected = vtkUnstructuredGrid()
     selected.ShallowCopy(extractSelection.GetOutput())
 
     print('There are %s points in the selection' % selected.GetNumberOfPoints())
@@ -66,43 +88,43 @@ def main():
 
     # Get points that are NOT in the selection
     # invert the selection
-    selectionNode.GetProperties().Set(vtk.vtkSelectionNode.INVERSE(), 1)
+    selectionNode.GetProperties().Set(vtkSelectionNode.INVERSE(), 1)
     extractSelection.Update()
 
-    notSelected = vtk.vtkUnstructuredGrid()
+    notSelected = vtkUnstructuredGrid()
     notSelected.ShallowCopy(extractSelection.GetOutput())
 
     print('There are %s points NOT in the selection' % notSelected.GetNumberOfPoints())
     print('There are %s cells NOT in the selection' % notSelected.GetNumberOfCells())
 
-    inputMapper = vtk.vtkDataSetMapper()
+    inputMapper = vtkDataSetMapper()
     inputMapper.SetInputConnection(pointSource.GetOutputPort())
-    inputActor = vtk.vtkActor()
+    inputActor = vtkActor()
     inputActor.SetMapper(inputMapper)
     inputActor.GetProperty().SetColor(colors.GetColor3d('MidnightBlue'))
     inputActor.GetProperty().SetPointSize(5)
 
-    selectedMapper = vtk.vtkDataSetMapper()
+    selectedMapper = vtkDataSetMapper()
     selectedMapper.SetInputData(selected)
-    selectedActor = vtk.vtkActor()
+    selectedActor = vtkActor()
     selectedActor.SetMapper(selectedMapper)
     selectedActor.GetProperty().SetColor(colors.GetColor3d('MidnightBlue'))
     selectedActor.GetProperty().SetPointSize(5)
 
-    notSelectedMapper = vtk.vtkDataSetMapper()
+    notSelectedMapper = vtkDataSetMapper()
     notSelectedMapper.SetInputData(notSelected)
-    notSelectedActor = vtk.vtkActor()
+    notSelectedActor = vtkActor()
     notSelectedActor.SetMapper(notSelectedMapper)
     notSelectedActor.GetProperty().SetColor(colors.GetColor3d('MidnightBlue'))
     notSelectedActor.GetProperty().SetPointSize(5)
 
     # There will be one render window
-    renderWindow = vtk.vtkRenderWindow()
+    renderWindow = vtkRenderWindow()
     renderWindow.SetSize(900, 300)
     renderWindow.SetWindowName('ExtractSelection')
 
     # And one interactor
-    interactor = vtk.vtkRenderWindowInteractor()
+    interactor = vtkRenderWindowInteractor()
     interactor.SetRenderWindow(renderWindow)
 
     # Define viewport ranges
@@ -112,22 +134,22 @@ def main():
     rightViewport = [0.66, 0.0, 1.0, 1.0]
 
     # Create a camera for all renderers
-    camera = vtk.vtkCamera()
+    camera = vtkCamera()
 
     # Setup the renderers
-    leftRenderer = vtk.vtkRenderer()
+    leftRenderer = vtkRenderer()
     renderWindow.AddRenderer(leftRenderer)
     leftRenderer.SetViewport(leftViewport)
     leftRenderer.SetBackground(colors.GetColor3d('BurlyWood'))
     leftRenderer.SetActiveCamera(camera)
 
-    centerRenderer = vtk.vtkRenderer()
+    centerRenderer = vtkRenderer()
     renderWindow.AddRenderer(centerRenderer)
     centerRenderer.SetViewport(centerViewport)
     centerRenderer.SetBackground(colors.GetColor3d('orchid_dark'))
     centerRenderer.SetActiveCamera(camera)
 
-    rightRenderer = vtk.vtkRenderer()
+    rightRenderer = vtkRenderer()
     renderWindow.AddRenderer(rightRenderer)
     rightRenderer.SetViewport(rightViewport)
     rightRenderer.SetBackground(colors.GetColor3d('CornflowerBlue'))
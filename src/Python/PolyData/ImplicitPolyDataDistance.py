@@ -1,71 +1,104 @@
 import numpy as np
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonCore import (
+    vtkFloatArray,
+    vtkPoints
+)
+from vtkmodules.vtkCommonDataModel import vtkPolyData
+from vtkmodules.vtkFiltersCore import vtkImplicitPolyDataDistance
+from vtkmodules.vtkFiltersGeneral import vtkVertexGlyphFilter
+from vtkmodules.vtkFiltersSources import vtkSphereSource
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
+from vtkmodules.util import numpy_support
+
+
+def get_program_parameters():
+    import argparse
+    description = 'Evaluate the signed distance to a sphere over a grid of points.'
+    epilogue = '''
+   '''
+    parser = argparse.ArgumentParser(description=description, epilog=epilogue,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-r', '--resolution', default=40, type=int,
+                        help='The number of points along each side of the grid.')
+    args = parser.parse_args()
+    return args.resolution
 
 
 def main():
-    colors = vtk.vtkNamedColors()
+    resolution = get_program_parameters()
 
-    sphereSource = vtk.vtkSphereSource()
+    colors = vtkNamedColors()
+
+    sphereSource = vtkSphereSource()
     sphereSource.SetCenter(0.0, 0.0, 0.0)
     sphereSource.SetRadius(1.0)
     sphereSource.Update()
 
-    sphereMapper = vtk.vtkPolyDataMapper()
+    sphereMapper = vtkPolyDataMapper()
     sphereMapper.SetInputConnection(sphereSource.GetOutputPort())
     sphereMapper.ScalarVisibilityOff()
 
-    sphereActor = vtk.vtkActor()
+    sphereActor = vtkActor()
     sphereActor.SetMapper(sphereMapper)
     sphereActor.GetProperty().SetOpacity(0.3)
     sphereActor.GetProperty().SetColor(1, 0, 0)
 
-    implicitPolyDataDistance = vtk.vtkImplicitPolyDataDistance()
+    implicitPolyDataDistance = vtkImplicitPolyDataDistance()
     implicitPolyDataDistance.SetInput(sphereSource.GetOutput())
 
-    # Setup a grid
-    points = vtk.vtkPoints()
-    step = 0.1
-    for x in np.arange(-2, 2, step):
-        for y in np.arange(-2, 2, step):
-            for z in np.arange(-2, 2, step):
-                points.InsertNextPoint(x, y, z)
+    # Setup a grid, the points are (x, y, z) with z varying fastest.
+    coords = np.linspace(-2, 2, resolution, endpoint=False)
+    grid = np.stack(np.meshgrid(coords, coords, coords, indexing='ij'), axis=-1).reshape(-1, 3)
+    points = vtkPoints()
+    # The VTK array refers to the NumPy array rather than copying it.
+    points.SetData(numpy_support.numpy_to_vtk(grid, deep=False))
 
     # Add distances to each point
-    signedDistances = vtk.vtkFloatArray()
+    signedDistances = vtkFloatArray()
     signedDistances.SetNumberOfComponents(1)
     signedDistances.SetName('SignedDistances')
 
-    # Evaluate the signed distance function at all of the grid points
-    for pointId in range(points.GetNumberOfPoints()):
-        p = points.GetPoint(pointId)
-        signedDistance = implicitPolyDataDistance.EvaluateFunction(p)
-        signedDistances.InsertNextValue(signedDistance)
+    # Evaluate the signed distance function at all of the grid points in one call
+    implicitPolyDataDistance.FunctionValue(points.GetData(), signedDistances)
 
-    polyData = vtk.vtkPolyData()
+    polyData = vtkPolyData()
     polyData.SetPoints(points)
     polyData.GetPointData().SetScalars(signedDistances)
 
-    vertexGlyphFilter = vtk.vtkVertexGlyphFilter()
+    vertexGlyphFilter = vtkVertexGlyphFilter()
     vertexGlyphFilter.SetInputData(polyData)
     vertexGlyphFilter.Update()
 
-    signedDistanceMapper = vtk.vtkPolyDataMapper()
+    signedDistanceMapper = vtkPolyDataMapper()
     signedDistanceMapper.SetInputConnection(vertexGlyphFilter.GetOutputPort())
     signedDistanceMapper.ScalarVisibilityOn()
 
-    signedDistanceActor = vtk.vtkActor()
+    signedDistanceActor = vtkActor()
     signedDistanceActor.SetMapper(signedDistanceMapper)
 
-    renderer = vtk.vtkRenderer()
+    renderer = vtkRenderer()
     renderer.AddViewProp(sphereActor)
     renderer.AddViewProp(signedDistanceActor)
     renderer.SetBackground(colors.GetColor3d('SlateGray'))
 
-    renderWindow = vtk.vtkRenderWindow()
+    renderWindow = vtkRenderWindow()
     renderWindow.AddRenderer(renderer)
     renderWindow.SetWindowName('ImplicitPolyDataDistance')
 
-    renWinInteractor = vtk.vtkRenderWindowInteractor()
+    renWinInteractor = vtkRenderWindowInteractor()
     renWinInteractor.SetRenderWindow(renderWindow)
 
     renderWindow.Render()
@@ -1,7 +1,15 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-import vtk
+from vtkmodules.vtkCommonCore import (
+    vtkIdList,
+    vtkPoints
+)
+from vtkmodules.vtkCommonDataModel import (
+    vtkCellArray,
+    vtkLine,
+    vtkPolyData
+)
 
 
 def main():
@@ -12,7 +20,7 @@ def main():
     p3 = [1.0, 2.0, 3.0]
 
     # Create a vtkPoints object and store the points in it.
-    points = vtk.vtkPoints()
+    points = vtkPoints()
     points.InsertNextPoint(origin)
     points.InsertNextPoint(p0)
     points.InsertNextPoint(p1)
@@ -20,17 +28,17 @@ def main():
     points.InsertNextPoint(p3)
 
     # Create a cell array to store the lines in and add the lines to it.
-    lines = vtk.vtkCellArray()
+    lines = vtkCellArray()
 
     # Create four lines.
     for i in range(4):
-        line = vtk.vtkLine()
+        line = vtkLine()
         line.GetPointIds().SetId(0, i)
         line.GetPointIds().SetId(1, i + 1)
         lines.InsertNextCell(line)
 
     # Create a polydata to store everything in.
-    linesPolyData = vtk.vtkPolyData()
+    linesPolyData = vtkPolyData()
 
     # Add the points to the dataset.
     linesPolyData.SetPoints(points)
@@ -41,7 +49,7 @@ def main():
     print('There are {0} lines.'.format(linesPolyData.GetNumberOfLines()))
 
     linesPolyData.GetLines().InitTraversal()
-    idList = vtk.vtkIdList()
+    idList = vtkIdList()
     while (linesPolyData.GetLines().GetNextCell(idList)):
         print('Line has {0} points'.format(idList.GetNumberOfIds()))
         for pointId in range(idList.GetNumberOfIds() - 1):
@@ -1,11 +1,30 @@
 import math
 
-import vtk
+from vtkmodules.vtkCommonCore import VTK_UNSIGNED_CHAR
+from vtkmodules.vtkCommonDataModel import (
+    vtkImageData,
+    vtkPlane
+)
+from vtkmodules.vtkFiltersCore import (
+    vtkCutter,
+    vtkStripper
+)
+from vtkmodules.vtkFiltersModeling import vtkLinearExtrusionFilter
+from vtkmodules.vtkFiltersSources import vtkSphereSource
+from vtkmodules.vtkIOImage import (
+    vtkMetaImageWriter,
+    vtkPNGWriter
+)
+from vtkmodules.vtkIOXML import vtkXMLPolyDataWriter
+from vtkmodules.vtkImagingStencil import (
+    vtkImageStencil,
+    vtkPolyDataToImageStencil
+)
 
 
 def main():
     # 3D source sphere
-    sphereSource = vtk.vtkSphereSource()
+    sphereSource = vtkSphereSource()
     sphereSource.SetPhiResolution(30)
     sphereSource.SetThetaResolution(30)
     sphereSource.SetCenter(40, 40, 0)
@@ -13,14 +32,14 @@ def main():
 
     # generate circle by cutting the sphere with an implicit plane
     # (through its center, axis-aligned)
-    circleCutter = vtk.vtkCutter()
+    circleCutter = vtkCutter()
     circleCutter.SetInputConnection(sphereSource.GetOutputPort())
-    cutPlane = vtk.vtkPlane()
+    cutPlane = vtkPlane()
     cutPlane.SetOrigin(sphereSource.GetCenter())
     cutPlane.SetNormal(0, 0, 1)
     circleCutter.SetCutFunction(cutPlane)
 
-    stripper = vtk.vtkStripper()
+    stripper = vtkStripper()
     stripper.SetInputConnection(circleCutter.GetOutputPort())  # valid circle
     stripper.Update()
 
@@ -28,7 +47,7 @@ def main():
     circle = stripper.GetOutput()
 
     # write circle out
-    polyDataWriter = vtk.vtkXMLPolyDataWriter()
+    polyDataWriter = vtkXMLPolyDataWriter()
     polyDataWriter.SetInputData(circle)
 
     polyDataWriter.SetFileName('circle.vtp')
@@ -37,7 +56,7 @@ def main():
     polyDataWriter.Write()
 
     # prepare the binary image's voxel grid
-    whiteImage = vtk.vtkImageData()
+    whiteImage = vtkImageData()
     bounds = [0] * 6
     circle.GetBounds(bounds)
     spacing = [0] * 3  # desired volume spacing
@@ -60,7 +79,7 @@ def main():
     origin[1] = bounds[2]  # + spacing[1] / 2
     origin[2] = bounds[4]  # + spacing[2] / 2
     whiteImage.SetOrigin(origin)
-    whiteImage.AllocateScalars(vtk.VTK_UNSIGNED_CHAR, 1)
+    whiteImage.AllocateScalars(VTK_UNSIGNED_CHAR, 1)
 
     # fill the image with foreground voxels:
     inval = 255
@@ -71,7 +90,7 @@ def main():
         whiteImage.GetPointData().GetScalars().SetTuple1(i, inval)
 
     # sweep polygonal data (this is the important thing with contours!)
-    extruder = vtk.vtkLinearExtrusionFilter()
+    extruder = vtkLinearExtrusionFilter()
     extruder.SetInputData(circle)
     extruder.SetScaleFactor(1.0)
     # extruder.SetExtrusionTypeToNormalExtrusion()
@@ -80,7 +99,7 @@ def main():
     extruder.Update()
 
     # polygonal data -. image stencil:
-    pol2stenc = vtk.vtkPolyDataToImageStencil()
+    pol2stenc = vtkPolyDataToImageStencil()
     pol2stenc.SetTolerance(0)  # important if extruder.SetVector(0, 0, 1) !!!
     pol2stenc.SetInputConnection(extruder.GetOutputPort())
     pol2stenc.SetOutputOrigin(origin)
@@ -89,19 +108,19 @@ def main():
     pol2stenc.Update()
 
     # cut the corresponding white image and set the background:
-    imgstenc = vtk.vtkImageStencil()
+    imgstenc = vtkImageStencil()
     imgstenc.SetInputData(whiteImage)
     imgstenc.SetStencilConnection(pol2stenc.GetOutputPort())
     imgstenc.ReverseStencilOff()
     imgstenc.SetBackgroundValue(outval)
     imgstenc.Update()
 
-    imageWriter = vtk.vtkMetaImageWriter()
+    imageWriter = vtkMetaImageWriter()
     imageWriter.SetFileName('labelImage.mhd')
     imageWriter.SetInputConnection(imgstenc.GetOutputPort())
     imageWriter.Write()
 
-    imageWriter = vtk.vtkPNGWriter()
+    imageWriter = vtkPNGWriter()
     imageWriter.SetFileName('labelImage.png')
     imageWriter.SetInputConnection(imgstenc.GetOutputPort())
     imageWriter.Write()
@@ -1,57 +1,77 @@
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonCore import vtkPoints
+from vtkmodules.vtkCommonDataModel import (
+    vtkCellArray,
+    vtkLine,
+    vtkPolyData
+)
+from vtkmodules.vtkFiltersModeling import vtkRuledSurfaceFilter
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
 
 
 def main():
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
     # Create a rendering window and renderer
-    ren = vtk.vtkRenderer()
-    renWin = vtk.vtkRenderWindow()
+    ren = vtkRenderer()
+    renWin = vtkRenderWindow()
     renWin.AddRenderer(ren)
 
     # Create a renderwindowinteractor
-    iren = vtk.vtkRenderWindowInteractor()
+    iren = vtkRenderWindowInteractor()
     iren.SetRenderWindow(renWin)
 
     # Create the points fot the lines.
-    points = vtk.vtkPoints()
+    points = vtkPoints()
     points.InsertPoint(0, 0, 0, 1)
     points.InsertPoint(1, 1, 0, 0)
     points.InsertPoint(2, 0, 1, 0)
     points.InsertPoint(3, 1, 1, 1)
 
     # Create line1
-    line1 = vtk.vtkLine()
+    line1 = vtkLine()
     line1.GetPointIds().SetId(0, 0)
     line1.GetPointIds().SetId(1, 1)
 
     # Create line2
-    line2 = vtk.vtkLine()
+    line2 = vtkLine()
     line2.GetPointIds().SetId(0, 2)
     line2.GetPointIds().SetId(1, 3)
 
     # Create a cellArray containing the lines
-    lines = vtk.vtkCellArray()
+    lines = vtkCellArray()
     lines.InsertNextCell(line1)
     lines.InsertNextCell(line2)
 
     # Create the vtkPolyData to contain the points and cellArray with the lines
-    polydata = vtk.vtkPolyData()
+    polydata = vtkPolyData()
     polydata.SetPoints(points)
     polydata.SetLines(lines)
 
     # Create the ruledSurfaceFilter from the polydata containing the lines
-    ruledSurfaceFilter = vtk.vtkRuledSurfaceFilter()
+    ruledSurfaceFilter = vtkRuledSurfaceFilter()
     ruledSurfaceFilter.SetInputData(polydata)
     ruledSurfaceFilter.SetResolution(21, 21)
     ruledSurfaceFilter.SetRuledModeToResample()
 
     # Create the mapper with the ruledSurfaceFilter as input
-    mapper = vtk.vtkPolyDataMapper()
+    mapper = vtkPolyDataMapper()
     mapper.SetInputConnection(ruledSurfaceFilter.GetOutputPort())
 
     # Create the actor with the mapper
-    actor = vtk.vtkActor()
+    actor = vtkActor()
     actor.SetMapper(mapper)
     actor.GetProperty().SetColor(colors.GetColor3d("Banana"))
     actor.GetProperty().SetSpecular(0.6)
@@ -1,124 +1,111 @@
 #!/usr/bin/env python
 
-import numpy
-import vtk
+import numpy as np
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonCore import (
+    vtkMinimalStandardRandomSequence,
+    vtkPoints
+)
+from vtkmodules.vtkCommonDataModel import (
+    vtkCellArray,
+    vtkPolyData
+)
+from vtkmodules.vtkFiltersCore import vtkCleanPolyData
+from vtkmodules.vtkFiltersModeling import (
+    vtkButterflySubdivisionFilter,
+    vtkLoopSubdivisionFilter
+)
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
+from vtkmodules.util import numpy_support
+
+
+def get_program_parameters():
+    import argparse
+    description = 'Smooth a triangulated height field with subdivision filters.'
+    epilogue = '''
+   '''
+    parser = argparse.ArgumentParser(description=description, epilog=epilogue,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-s', '--shared_points', action='store_true',
+                        help='The triangles share the grid points instead of each having their own points.')
+    args = parser.parse_args()
+    return args.shared_points
 
 
 def main():
-    nc = vtk.vtkNamedColors()
+    shared_points = get_program_parameters()
+
+    nc = vtkNamedColors()
 
     # Make a 32 x 32 grid
     size = 32
 
-    rn = vtk.vtkMinimalStandardRandomSequence()
+    rn = vtkMinimalStandardRandomSequence()
     rn.SetSeed(1)
 
     # Define z values for the topography (random height)
-    topography = numpy.zeros([size, size])
+    topography = np.zeros([size, size])
     for i in range(size):
         for j in range(size):
             topography[i][j] = rn.GetRangeValue(0, 5)
             rn.Next()
 
     # Define points, triangles and colors
-    colors = vtk.vtkUnsignedCharArray()
-    colors.SetNumberOfComponents(3)
-    points = vtk.vtkPoints()
-    triangles = vtk.vtkCellArray()
-
-    # Build the meshgrid manually
-    count = 0
-    for i in range(size - 1):
-        for j in range(size - 1):
-            z1 = topography[i][j]
-            z2 = topography[i][j + 1]
-            z3 = topography[i + 1][j]
-
-            # Triangle 1
-            points.InsertNextPoint(i, j, z1)
-            points.InsertNextPoint(i, (j + 1), z2)
-            points.InsertNextPoint((i + 1), j, z3)
-
-            triangle = vtk.vtkTriangle()
-            triangle.GetPointIds().SetId(0, count)
-            triangle.GetPointIds().SetId(1, count + 1)
-            triangle.GetPointIds().SetId(2, count + 2)
-
-            triangles.InsertNextCell(triangle)
-
-            z1 = topography[i][j + 1]
-            z2 = topography[i + 1][j + 1]
-            z3 = topography[i + 1][j]
-
-            # Triangle 2
-            points.InsertNextPoint(i, (j + 1), z1)
-            points.InsertNextPoint((i + 1), (j + 1), z2)
-            points.InsertNextPoint((i + 1), j, z3)
-
-            triangle = vtk.vtkTriangle()
-            triangle.GetPointIds().SetId(0, count + 3)
-            triangle.GetPointIds().SetId(1, count + 4)
-            triangle.GetPointIds().SetId(2, count + 5)
-
-            count += 6
-
-            triangles.InsertNextCell(triangle)
-
-            # Add some color
-            r = [int(i / float(size) * 255), int(j / float(size) * 255), 0]
-            colors.InsertNextTypedTuple(r)
-            colors.InsertNextTypedTuple(r)
-            colors.InsertNextTypedTuple(r)
-            colors.InsertNextTypedTuple(r)
-            colors.InsertNextTypedTuple(r)
-            colors.InsertNextTypedTuple(r)
-
-    # Create a polydata object
-    trianglePolyData = vtk.vtkPolyData()
-
-    # Add the geometry and topology to the polydata
-    trianglePolyData.SetPoints(points)
-    trianglePolyData.GetPointData().SetScalars(colors)
-    trianglePolyData.SetPolys(triangles)
+    trianglePolyData = make_height_field(topography, shared_points)
 
     # Clean the polydata so that the edges are shared !
-    cleanPolyData = vtk.vtkCleanPolyData()
+    cleanPolyData = vtkCleanPolyData()
     cleanPolyData.SetInputData(trianglePolyData)
+    if shared_points:
+        # The points are already shared.
+        cleanPolyData.PointMergingOff()
 
     # Use a filter to smooth the data (will add triangles and smooth)
     # Use two different filters to show the difference
-    smooth_loop = vtk.vtkLoopSubdivisionFilter()
+    smooth_loop = vtkLoopSubdivisionFilter()
     smooth_loop.SetNumberOfSubdivisions(3)
     smooth_loop.SetInputConnection(cleanPolyData.GetOutputPort())
-    smooth_butterfly = vtk.vtkButterflySubdivisionFilter()
+    smooth_butterfly = vtkButterflySubdivisionFilter()
     smooth_butterfly.SetNumberOfSubdivisions(3)
     smooth_butterfly.SetInputConnection(cleanPolyData.GetOutputPort())
 
     # Create a mapper and actor for initial dataset
-    mapper = vtk.vtkPolyDataMapper()
+    mapper = vtkPolyDataMapper()
     mapper.SetInputData(trianglePolyData)
-    actor = vtk.vtkActor()
+    actor = vtkActor()
     actor.SetMapper(mapper)
 
     # Create a mapper and actor for smoothed dataset (vtkLoopSubdivisionFilter)
-    mapper = vtk.vtkPolyDataMapper()
+    mapper = vtkPolyDataMapper()
     mapper.SetInputConnection(smooth_loop.GetOutputPort())
-    actor_loop = vtk.vtkActor()
+    actor_loop = vtkActor()
     actor_loop.SetMapper(mapper)
     actor_loop.SetPosition(32, 0, 0)
 
     # Create a mapper and actor for smoothed dataset (vtkButterflySubdivisionFilter)
-    mapper = vtk.vtkPolyDataMapper()
+    mapper = vtkPolyDataMapper()
     mapper.SetInputConnection(smooth_butterfly.GetOutputPort())
-    actor_butterfly = vtk.vtkActor()
+    actor_butterfly = vtkActor()
     actor_butterfly.SetMapper(mapper)
     actor_butterfly.SetPosition(64, 0, 0)
 
     # Visualise
-    renderer = vtk.vtkRenderer()
-    renderWindow = vtk.vtkRenderWindow()
+    renderer = vtkRenderer()
+    renderWindow = vtkRenderWindow()
     renderWindow.AddRenderer(renderer)
-    renderWindowInteractor = vtk.vtkRenderWindowInteractor()
+    renderWindowInteractor = vtkRenderWindowInteractor()
     renderWindowInteractor.SetRenderWindow(renderWindow)
 
     # Add actors and render
@@ -135,5 +122,59 @@ def main():
     renderWindowInteractor.Start()
 
 
+def make_height_field(topography, shared_points=False):
+    """
+    Make a triangle mesh of a height field, each grid cell is split into two triangles.
+
+    The points, cells and colors are built from NumPy arrays that VTK uses without copying.
+
+    :param topography: The heights, an array of shape (nx, ny).
+    :param shared_points: If True, the triangles share the grid points and the cells are colored,
+                           otherwise each triangle has its own points and the points are colored.
+    :return: The polydata.
+    """
+    nx, ny = topography.shape
+    # The indices of the grid cells.
+    i, j = np.meshgrid(np.arange(nx - 1), np.arange(ny - 1), indexing='ij')
+    i = i.ravel()
+    j = j.ravel()
+    cell_colors = np.zeros((i.size, 3), dtype=np.uint8)
+    cell_colors[:, 0] = i / float(nx) * 255
+    cell_colors[:, 1] = j / float(ny) * 255
+
+    if shared_points:
+        pi, pj = np.meshgrid(np.arange(nx), np.arange(ny), indexing='ij')
+        pi = pi.ravel()
+        pj = pj.ravel()
+        # The corners of the cells: a = (i, j), b = (i, j + 1), c = (i + 1, j), d = (i + 1, j + 1).
+        a = i * ny + j
+        connectivity = np.column_stack((a, a + 1, a + ny, a + 1, a + ny + 1, a + ny)).ravel()
+    else:
+        # The same corners, each triangle has its own copies of the points.
+        pi = (i[:, np.newaxis] + np.array([0, 0, 1, 0, 1, 1])).ravel()
+        pj = (j[:, np.newaxis] + np.array([0, 1, 0, 1, 1, 0])).ravel()
+        connectivity = np.arange(pi.size)
+    xyz = np.column_stack((pi, pj, topography[pi, pj])).astype(np.float32)
+    connectivity = connectivity.astype(np.int64)
+    offsets = np.arange(0, connectivity.size + 1, 3, dtype=np.int64)
+
+    points = vtkPoints()
+    points.SetData(numpy_support.numpy_to_vtk(xyz, deep=False))
+    triangles = vtkCellArray()
+    triangles.SetData(numpy_support.numpy_to_vtkIdTypeArray(offsets, deep=False),
+                      numpy_support.numpy_to_vtkIdTypeArray(connectivity, deep=False))
+
+    poly_data = vtkPolyData()
+    poly_data.SetPoints(points)
+    poly_data.SetPolys(triangles)
+    if shared_points:
+        colors = numpy_support.numpy_to_vtk(np.repeat(cell_colors, 2, axis=0), deep=False)
+        poly_data.GetCellData().SetScalars(colors)
+    else:
+        colors = numpy_support.numpy_to_vtk(np.repeat(cell_colors, 6, axis=0), deep=False)
+        poly_data.GetPointData().SetScalars(colors)
+    return poly_data
+
+
 if __name__ == '__main__':
     main()
@@ -1,4 +1,9 @@
-import vtk
+from vtkmodules.vtkCommonCore import vtkPoints
+from vtkmodules.vtkCommonDataModel import (
+    vtkCellArray,
+    vtkPolyData
+)
+from vtkmodules.vtkIOXML import vtkXMLPolyDataWriter
 
 
 def get_program_parameters():
@@ -17,8 +22,8 @@ def get_program_parameters():
 def main():
     filename = get_program_parameters()
 
-    Points = vtk.vtkPoints()
-    Vertices = vtk.vtkCellArray()
+    Points = vtkPoints()
+    Vertices = vtkCellArray()
 
     id = Points.InsertNextPoint(1.0, 0.0, 0.0)
     Vertices.InsertNextCell(1)
@@ -30,12 +35,12 @@ def main():
     Vertices.InsertNextCell(1)
     Vertices.InsertCellPoint(id)
 
-    polydata = vtk.vtkPolyData()
+    polydata = vtkPolyData()
     polydata.SetPoints(Points)
     polydata.SetVerts(Vertices)
     polydata.Modified()
 
-    writer = vtk.vtkXMLPolyDataWriter()
+    writer = vtkXMLPolyDataWriter()
     writer.SetFileName(filename)
     writer.SetInputData(polydata)
     writer.Write()
@@ -1,57 +1,80 @@
 # Example in which a cube is used to define an implicit function (through vtkImplicitDataSet)
 # which is then used to clip a sphere
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonDataModel import vtkImplicitDataSet
+from vtkmodules.vtkFiltersCore import (
+    vtkClipPolyData,
+    vtkDelaunay3D,
+    vtkElevationFilter
+)
+from vtkmodules.vtkFiltersSources import (
+    vtkCubeSource,
+    vtkSphereSource
+)
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkDataSetMapper,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
 
-sphere = vtk.vtkSphereSource()
+sphere = vtkSphereSource()
 sphere.SetCenter(1, 1, 1)
 sphere.SetRadius(1)
 sphere.Update()
 
-cube = vtk.vtkCubeSource()
+cube = vtkCubeSource()
 cube.SetBounds(-1, 1, -1, 1, -1, 1)
 cube.Update()
 
 # Create 3D cells so vtkImplicitDataSet evaluates inside vs outside correctly
-tri = vtk.vtkDelaunay3D()
+tri = vtkDelaunay3D()
 tri.SetInputConnection(cube.GetOutputPort())
 tri.BoundingTriangulationOff()
 
 # vtkImplicitDataSet needs some scalars to interpolate to find inside/outside
-elev = vtk.vtkElevationFilter()
+elev = vtkElevationFilter()
 elev.SetInputConnection(tri.GetOutputPort())
 
-implicit = vtk.vtkImplicitDataSet()
+implicit = vtkImplicitDataSet()
 implicit.SetDataSet(elev.GetOutput())
 
-clipper = vtk.vtkClipPolyData()
+clipper = vtkClipPolyData()
 clipper.SetClipFunction(implicit)
 clipper.SetInputConnection(sphere.GetOutputPort())
 clipper.InsideOutOn()
 clipper.Update()
 
 # Vis for clipped sphere
-mapper = vtk.vtkPolyDataMapper()
+mapper = vtkPolyDataMapper()
 mapper.SetInputConnection(clipper.GetOutputPort())
-actor = vtk.vtkActor()
+actor = vtkActor()
 actor.SetMapper(mapper)
 
 # Vis for cube so can see it in relation to clipped sphere
-mapper2 = vtk.vtkDataSetMapper()
+mapper2 = vtkDataSetMapper()
 mapper2.SetInputConnection(elev.GetOutputPort())
-actor2 = vtk.vtkActor()
+actor2 = vtkActor()
 actor2.SetMapper(mapper2)
 actor2.GetProperty().SetRepresentationToWireframe()
 
-ren1 = vtk.vtkRenderer()
+ren1 = vtkRenderer()
 ren1.AddActor(actor)
 ren1.AddActor(actor2)
 ren1.SetBackground(0.1, 0.2, 0.4)
 
-renWin = vtk.vtkRenderWindow()
+renWin = vtkRenderWindow()
 renWin.AddRenderer(ren1)
 
-iren = vtk.vtkRenderWindowInteractor()
+iren = vtkRenderWindowInteractor()
 iren.SetRenderWindow(renWin)
 
 renWin.Render()
@@ -1,8 +1,31 @@
 #!/usr/bin/env python
 from __future__ import print_function
-import vtk
-
-tse = vtk.vtkTimeSourceExample()
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingVolumeOpenGL2
+from vtkmodules.vtkCommonDataModel import vtkPiecewiseFunction
+from vtkmodules.vtkFiltersGeneral import (
+    vtkDataSetTriangleFilter,
+    vtkTimeSourceExample
+)
+from vtkmodules.vtkInteractionStyle import vtkInteractorStyleTrackballCamera
+from vtkmodules.vtkRenderingAnnotation import vtkScalarBarActor
+from vtkmodules.vtkRenderingCore import (
+    vtkColorTransferFunction,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer,
+    vtkTextActor,
+    vtkTextProperty,
+    vtkVolume,
+    vtkVolumeProperty
+)
+from vtkmodules.vtkRenderingVolume import vtkUnstructuredGridVolumeRayCastMapper
+
+tse = vtkTimeSourceExample()
 ex = tse.GetExecutive()
 tse.UpdateInformation()
 
@@ -24,7 +47,7 @@ print(tse.GetOutput().GetBounds())
 grid = tse.GetOutput()
 print(grid)
 
-tri = vtk.vtkDataSetTriangleFilter()
+tri = vtkDataSetTriangleFilter()
 tri.SetInputData(grid)
 tri.SetTetrahedraOnly(1)
 tri.Update()
@@ -37,57 +60,57 @@ assert(iss > -1)
 drange = [0, 1]
 
 # Create transfer mapping scalar value to opacity.
-opacityFunction = vtk.vtkPiecewiseFunction()
+opacityFunction = vtkPiecewiseFunction()
 opacityFunction.AddPoint(drange[0], 0.0)
 opacityFunction.AddPoint(drange[1], 1.0)
 
 # Create transfer mapping scalar value to color.
-colorFunction = vtk.vtkColorTransferFunction()
+colorFunction = vtkColorTransferFunction()
 colorFunction.SetColorSpaceToHSV()
 colorFunction.HSVWrapOff()
 colorFunction.AddRGBPoint(drange[0], 0.0, 0.0, 1.0)
 colorFunction.AddRGBPoint(drange[1], 1.0, 0.0, 0.0)
 
-volumeProperty = vtk.vtkVolumeProperty()
+volumeProperty = vtkVolumeProperty()
 volumeProperty.SetScalarOpacity(opacityFunction)
 volumeProperty.SetColor(colorFunction)
 volumeProperty.ShadeOff()
 volumeProperty.SetInterpolationTypeToLinear()
 # volumeProperty.SetScalarOpacityUnitDistance(options.unit)
 
-volumeMapper = vtk.vtkUnstructuredGridVolumeRayCastMapper()
+volumeMapper = vtkUnstructuredGridVolumeRayCastMapper()
 # volumeMapper = vtk.vtkUnstructuredGridVolumeZSweepMapper()
 # volumeMapper = vtk.vtkProjectedTetrahedraMapper()
 # volumeMapper.SetBlendModeToMaximumIntensity()
 volumeMapper.SetInputData(output)
 
-volume = vtk.vtkVolume()
+volume = vtkVolume()
 volume.SetMapper(volumeMapper)
 volume.SetProperty(volumeProperty)
 
 # create a rendering window and renderer
-renderer = vtk.vtkRenderer()
+renderer = vtkRenderer()
 renderer.SetBackground(0, 0, 0)
 
-window = vtk.vtkRenderWindow()
+window = vtkRenderWindow()
 window.SetSize(512, 512)
 window.AddRenderer(renderer)
 
-interactor = vtk.vtkRenderWindowInteractor()
+interactor = vtkRenderWindowInteractor()
 interactor.SetRenderWindow(window)
 
-style = vtk.vtkInteractorStyleTrackballCamera()
+style = vtkInteractorStyleTrackballCamera()
 interactor.SetInteractorStyle(style)
 
 renderer.AddVolume(volume)
 
-scalarBar = vtk.vtkScalarBarActor()
+scalarBar = vtkScalarBarActor()
 scalarBar.SetLookupTable(colorFunction)
 scalarBar.SetOrientationToVertical()
 scalarBar.SetPosition(0.85, 0.7)
 scalarBar.SetPosition2(0.1, 0.3)
-propT = vtk.vtkTextProperty()
-propL = vtk.vtkTextProperty()
+propT = vtkTextProperty()
+propL = vtkTextProperty()
 propT.SetFontFamilyToArial()
 propT.ItalicOff()
 propT.BoldOn()
@@ -98,7 +121,7 @@ scalarBar.SetLabelFormat("%5.2f")
 renderer.AddActor(scalarBar)
 
 # setup the text and add it to the window
-textActor = vtk.vtkTextActor()
+textActor = vtkTextActor()
 textActor.GetTextProperty().SetFontSize(12)
 textActor.SetPosition2(10, 40)
 renderer.AddActor2D(textActor)
@@ -119,7 +142,7 @@ while time <= 1:
     # TODO FIXME if this block is not here than the volume renders wrongly
     # renderer.RemoveVolume(volume)
     # del volume
-    volume = vtk.vtkVolume()
+    volume = vtkVolume()
     volume.SetMapper(volumeMapper)
     volume.SetProperty(volumeProperty)
     renderer.AddVolume(volume)
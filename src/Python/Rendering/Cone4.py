@@ -4,11 +4,26 @@
 
 import time
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkFiltersSources import vtkConeSource
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkPolyDataMapper,
+    vtkProperty,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
 
 
 def main():
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
     #
     # Next we create an instance of vtkConeSource and set some of its
@@ -16,7 +31,7 @@ def main():
     # pipeline (it is a source process object); it produces data (output type is
     # vtkPolyData) which other filters may process.
     #
-    cone = vtk.vtkConeSource()
+    cone = vtkConeSource()
     cone.SetHeight(3.0)
     cone.SetRadius(1.0)
     cone.SetResolution(10)
@@ -28,7 +43,7 @@ def main():
     # vtkPolyDataMapper to map the polygonal data into graphics primitives. We
     # connect the output of the cone source to the input of this mapper.
     #
-    coneMapper = vtk.vtkPolyDataMapper()
+    coneMapper = vtkPolyDataMapper()
     coneMapper.SetInputConnection(cone.GetOutputPort())
 
     #
@@ -36,7 +51,7 @@ def main():
     # modified to give it different surface properties. By default, an actor
     # is create with a property so the GetProperty() method can be used.
     #
-    coneActor = vtk.vtkActor()
+    coneActor = vtkActor()
     coneActor.SetMapper(coneMapper)
     coneActor.GetProperty().SetColor(colors.GetColor3d('Peacock'))
     coneActor.GetProperty().SetDiffuse(0.7)
@@ -47,7 +62,7 @@ def main():
     # Create a property and directly manipulate it. Assign it to the
     # second actor.
     #
-    property = vtk.vtkProperty()
+    property = vtkProperty()
     property.SetColor(colors.GetColor3d('Tomato'))
     property.SetDiffuse(0.7)
     property.SetSpecular(0.4)
@@ -59,7 +74,7 @@ def main():
     # property can be shared among many actors. Note also that we use the
     # same mapper as the first actor did. This way we avoid duplicating
     # geometry, which may save lots of memory if the geometry is large.
-    coneActor2 = vtk.vtkActor()
+    coneActor2 = vtkActor()
     coneActor2.SetMapper(coneMapper)
     # coneActor2.GetProperty().SetColor(colors.GetColor3d('Peacock'))
     coneActor2.SetProperty(property)
@@ -70,7 +85,7 @@ def main():
     # viewport. It is part or all of a window on the screen and it is responsible
     # for drawing the actors it has.  We also set the background color here.
     #
-    ren1 = vtk.vtkRenderer()
+    ren1 = vtkRenderer()
     ren1.AddActor(coneActor)
     ren1.AddActor(coneActor2)
     ren1.SetBackground(colors.GetColor3d('LightSlateGray'))
@@ -80,12 +95,12 @@ def main():
     # We put our renderer into the render window using AddRenderer. We also
     # set the size to be 300 pixels by 300.
     #
-    renWin = vtk.vtkRenderWindow()
+    renWin = vtkRenderWindow()
     renWin.AddRenderer(ren1)
     renWin.SetSize(640, 480)
     renWin.SetWindowName('Cone4')
 
-    iren = vtk.vtkRenderWindowInteractor()
+    iren = vtkRenderWindowInteractor()
     iren.SetRenderWindow(renWin)
 
     #
@@ -1,9 +1,60 @@
 #!/usr/bin/env python
 
+import concurrent.futures
 import sys
 from pathlib import Path
 
-import vtk
+import numpy as np
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingContextOpenGL2
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonComputationalGeometry import (
+    vtkParametricBoy,
+    vtkParametricMobius,
+    vtkParametricRandomHills,
+    vtkParametricTorus
+)
+from vtkmodules.vtkCommonCore import (
+    VTK_FLOAT,
+    VTK_VERSION_NUMBER,
+    vtkCommand,
+    vtkVersion
+)
+from vtkmodules.vtkCommonDataModel import vtkImageData
+from vtkmodules.vtkCommonTransforms import vtkTransform
+from vtkmodules.vtkFiltersCore import (
+    vtkPolyDataTangents,
+    vtkTriangleFilter
+)
+from vtkmodules.vtkFiltersGeneral import vtkTransformPolyDataFilter
+from vtkmodules.vtkFiltersModeling import vtkLinearSubdivisionFilter
+from vtkmodules.vtkFiltersSources import (
+    vtkCubeSource,
+    vtkParametricFunctionSource,
+    vtkTexturedSphereSource
+)
+from vtkmodules.vtkIOImage import vtkImageReader2Factory
+from vtkmodules.vtkImagingCore import vtkImageFlip
+from vtkmodules.vtkInteractionWidgets import (
+    vtkOrientationMarkerWidget,
+    vtkSliderRepresentation2D,
+    vtkSliderWidget
+)
+from vtkmodules.vtkRenderingAnnotation import vtkAxesActor
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkSkybox,
+    vtkTexture
+)
+from vtkmodules.vtkRenderingOpenGL2 import vtkOpenGLRenderer
+from vtkmodules.util import numpy_support
 
 
 def get_program_parameters():
@@ -43,7 +94,7 @@ def main():
     # cubemap = ReadCubeMap(cube_path, '/skybox', '.jpg', 2)
 
     # Load the skybox
-    # Read it again as there is no deep copy for vtkTexture
+    # The decoded images are cached, so the skybox uses the same images as the cubemap.
     # skybox = ReadCubeMap(cube_path, '/', '.jpg', 0)
     skybox = ReadCubeMap(cube_path, '/', '.jpg', 1)
     # skybox = ReadCubeMap(cube_path, '/skybox', '.jpg', 2)
@@ -52,6 +103,8 @@ def main():
     skybox.EdgeClampOn()
 
     # Get the textures
+    # Decode the texture images together, GetTexture() then uses the decoded images.
+    ReadImages([fn for fn in (material_fn, albedo_fn, normal_fn, emissive_fn) if Path(fn).is_file()])
     material = GetTexture(material_fn)
     albedo = GetTexture(albedo_fn)
     albedo.UseSRGBColorSpaceOn()
@@ -77,7 +130,7 @@ def main():
     else:
         source = GetBoy()
 
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
     # Set the background color.
     colors.SetColor('BkgColor', [26, 51, 102, 255])
@@ -85,10 +138,10 @@ def main():
     # Let's make a complementary colour to VTKBlue
     colors.SetColor('VTKBlueComp', [249, 176, 114, 255])
 
-    renderer = vtk.vtkOpenGLRenderer()
-    renderWindow = vtk.vtkRenderWindow()
+    renderer = vtkOpenGLRenderer()
+    renderWindow = vtkRenderWindow()
     renderWindow.AddRenderer(renderer)
-    interactor = vtk.vtkRenderWindowInteractor()
+    interactor = vtkRenderWindowInteractor()
     interactor.SetRenderWindow(renderWindow)
 
     # Lets use a rough metallic surface
@@ -141,10 +194,10 @@ def main():
     sliderWidgetNormal.EnabledOn()
 
     # Build the pipeline
-    mapper = vtk.vtkPolyDataMapper()
+    mapper = vtkPolyDataMapper()
     mapper.SetInputData(source)
 
-    actor = vtk.vtkActor()
+    actor = vtkActor()
     actor.SetMapper(mapper)
 
     actor.GetProperty().SetInterpolationToPBR()
@@ -175,7 +228,7 @@ def main():
     renderer.AddActor(actor)
 
     # Comment out if you don't want a skybox
-    skyboxActor = vtk.vtkSkybox()
+    skyboxActor = vtkSkybox()
     skyboxActor.SetTexture(skybox)
     renderer.AddActor(skyboxActor)
 
@@ -183,19 +236,19 @@ def main():
 
     # Create the slider callbacks to manipulate metallicity, roughness
     # occlusion strength and normal scaling
-    sliderWidgetMetallic.AddObserver(vtk.vtkCommand.InteractionEvent, SliderCallbackMetallic(actor.GetProperty()))
-    sliderWidgetRoughness.AddObserver(vtk.vtkCommand.InteractionEvent, SliderCallbackRoughness(actor.GetProperty()))
-    sliderWidgetOcclusionStrength.AddObserver(vtk.vtkCommand.InteractionEvent,
+    sliderWidgetMetallic.AddObserver(vtkCommand.InteractionEvent, SliderCallbackMetallic(actor.GetProperty()))
+    sliderWidgetRoughness.AddObserver(vtkCommand.InteractionEvent, SliderCallbackRoughness(actor.GetProperty()))
+    sliderWidgetOcclusionStrength.AddObserver(vtkCommand.InteractionEvent,
                                               SliderCallbackOcclusionStrength(actor.GetProperty()))
-    sliderWidgetNormal.AddObserver(vtk.vtkCommand.InteractionEvent, SliderCallbackNormalScale(actor.GetProperty()))
+    sliderWidgetNormal.AddObserver(vtkCommand.InteractionEvent, SliderCallbackNormalScale(actor.GetProperty()))
 
     renderWindow.SetSize(640, 480)
     renderWindow.Render()
     renderWindow.SetWindowName('PhysicallyBasedRendering')
 
-    axes = vtk.vtkAxesActor()
+    axes = vtkAxesActor()
 
-    widget = vtk.vtkOrientationMarkerWidget()
+    widget = vtkOrientationMarkerWidget()
     rgba = [0.0, 0.0, 0.0, 0.0]
     colors.GetColor('Carrot', rgba)
     widget.SetOutlineColor(rgba[0], rgba[1], rgba[2])
@@ -222,9 +275,9 @@ def vtk_version_ok(major, minor, build):
     """
     needed_version = 10000000000 * int(major) + 100000000 * int(minor) + int(build)
     try:
-        vtk_version_number = vtk.VTK_VERSION_NUMBER
+        vtk_version_number = VTK_VERSION_NUMBER
     except AttributeError:  # as error:
-        ver = vtk.vtkVersion()
+        ver = vtkVersion()
         vtk_version_number = 10000000000 * ver.GetVTKMajorVersion() + 100000000 * ver.GetVTKMinorVersion() \
                              + ver.GetVTKBuildVersion()
     if vtk_version_number >= needed_version:
@@ -233,6 +286,50 @@ def vtk_version_ok(major, minor, build):
         return False
 
 
+# The decoded images, keyed by the file path and whether the image is flipped.
+DECODED_IMAGES = dict()
+
+
+def ReadImages(paths, flip_y=False):
+    """
+    Decode the images, several at a time.
+    The decoded images are cached so that each image is only read once,
+     textures using the same file share the decoded image.
+    :param paths: The image paths.
+    :param flip_y: Flip the images about the y axis.
+    :return: The images, None if an image could not be read.
+    """
+
+    def read(key):
+        fn = key[0]
+        readerFactory = vtkImageReader2Factory()
+        imgReader = readerFactory.CreateImageReader2(fn)
+        if imgReader is None:
+            return None
+        imgReader.SetFileName(fn)
+        if key[1]:
+            flip = vtkImageFlip()
+            flip.SetInputConnection(imgReader.GetOutputPort())
+            flip.SetFilteredAxis(1)  # flip y axis
+            flip.Update()
+            output = flip.GetOutput()
+        else:
+            imgReader.Update()
+            output = imgReader.GetOutput()
+        # Keep only the image, not the pipeline that made it.
+        image = vtkImageData()
+        image.ShallowCopy(output)
+        return image
+
+    keys = [(str(Path(path).resolve()), flip_y) for path in paths]
+    to_read = [key for key in dict.fromkeys(keys) if key not in DECODED_IMAGES]
+    if to_read:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(to_read)) as executor:
+            for key, image in zip(to_read, executor.map(read, to_read)):
+                DECODED_IMAGES[key] = image
+    return [DECODED_IMAGES[key] for key in keys]
+
+
 def ReadCubeMap(folderRoot, fileRoot, ext, key):
     """
     Read the cube map.
@@ -254,7 +351,7 @@ def ReadCubeMap(folderRoot, fileRoot, ext, key):
     else:
         print('ReadCubeMap(): invalid key, unable to continue.')
         sys.exit()
-    texture = vtk.vtkTexture()
+    texture = vtkTexture()
     texture.CubeMapOn()
     # Build the file names.
     for i in range(0, len(fns)):
@@ -262,18 +359,9 @@ def ReadCubeMap(folderRoot, fileRoot, ext, key):
         if not fns[i].is_file():
             print('Nonexistent texture file:', fns[i])
             return texture
-    i = 0
-    for fn in fns:
-        # Read the images
-        readerFactory = vtk.vtkImageReader2Factory()
-        imgReader = readerFactory.CreateImageReader2(str(fn))
-        imgReader.SetFileName(str(fn))
-
-        flip = vtk.vtkImageFlip()
-        flip.SetInputConnection(imgReader.GetOutputPort())
-        flip.SetFilteredAxis(1)  # flip y axis
-        texture.SetInputConnection(i, flip.GetOutputPort(0))
-        i += 1
+    # Read the images
+    for i, image in enumerate(ReadImages(fns, flip_y=True)):
+        texture.SetInputData(i, image)
     texture.MipmapOn()
     texture.InterpolateOn()
     return texture
@@ -295,13 +383,9 @@ def GetTexture(image_path):
     if extension not in validExtensions:
         print('Unable to read the texture file (wrong extension):', path)
         return None
-    texture = vtk.vtkTexture()
-    # Read the images
-    readerFactory = vtk.vtkImageReader2Factory()
-    imgReader = readerFactory.CreateImageReader2(str(path))
-    imgReader.SetFileName(str(path))
-
-    texture.SetInputConnection(imgReader.GetOutputPort())
+    texture = vtkTexture()
+    # Read the image
+    texture.SetInputData(ReadImages([path])[0])
     texture.Update()
 
     return texture
@@ -310,9 +394,9 @@ def GetTexture(image_path):
 def GetBoy():
     uResolution = 51
     vResolution = 51
-    surface = vtk.vtkParametricBoy()
+    surface = vtkParametricBoy()
 
-    source = vtk.vtkParametricFunctionSource()
+    source = vtkParametricFunctionSource()
     source.SetUResolution(uResolution)
     source.SetVResolution(vResolution)
     source.SetParametricFunction(surface)
@@ -321,7 +405,7 @@ def GetBoy():
     # Build the tcoords
     pd = UVTcoords(uResolution, vResolution, source.GetOutput())
     # Now the tangents
-    tangents = vtk.vtkPolyDataTangents()
+    tangents = vtkPolyDataTangents()
     tangents.SetInputData(pd)
     tangents.Update()
     return tangents.GetOutput()
@@ -330,11 +414,11 @@ def GetBoy():
 def GetMobius():
     uResolution = 51
     vResolution = 51
-    surface = vtk.vtkParametricMobius()
+    surface = vtkParametricMobius()
     surface.SetMinimumV(-0.25)
     surface.SetMaximumV(0.25)
 
-    source = vtk.vtkParametricFunctionSource()
+    source = vtkParametricFunctionSource()
     source.SetUResolution(uResolution)
     source.SetVResolution(vResolution)
     source.SetParametricFunction(surface)
@@ -343,13 +427,13 @@ def GetMobius():
     # Build the tcoords
     pd = UVTcoords(uResolution, vResolution, source.GetOutput())
     # Now the tangents
-    tangents = vtk.vtkPolyDataTangents()
+    tangents = vtkPolyDataTangents()
     tangents.SetInputData(pd)
     tangents.Update()
 
-    transform = vtk.vtkTransform()
+    transform = vtkTransform()
     transform.RotateX(90.0)
-    transformFilter = vtk.vtkTransformPolyDataFilter()
+    transformFilter = vtkTransformPolyDataFilter()
     transformFilter.SetInputConnection(tangents.GetOutputPort())
     transformFilter.SetTransform(transform)
     transformFilter.Update()
@@ -360,13 +444,13 @@ def GetMobius():
 def GetRandomHills():
     uResolution = 51
     vResolution = 51
-    surface = vtk.vtkParametricRandomHills()
+    surface = vtkParametricRandomHills()
     surface.SetRandomSeed(1)
     surface.SetNumberOfHills(30)
     # If you want a plane
     # surface.SetHillAmplitude(0)
 
-    source = vtk.vtkParametricFunctionSource()
+    source = vtkParametricFunctionSource()
     source.SetUResolution(uResolution)
     source.SetVResolution(vResolution)
     source.SetParametricFunction(surface)
@@ -375,14 +459,14 @@ def GetRandomHills():
     # Build the tcoords
     pd = UVTcoords(uResolution, vResolution, source.GetOutput())
     # Now the tangents
-    tangents = vtk.vtkPolyDataTangents()
+    tangents = vtkPolyDataTangents()
     tangents.SetInputData(pd)
     tangents.Update()
 
-    transform = vtk.vtkTransform()
+    transform = vtkTransform()
     transform.RotateZ(180.0)
     transform.RotateX(90.0)
-    transformFilter = vtk.vtkTransformPolyDataFilter()
+    transformFilter = vtkTransformPolyDataFilter()
     transformFilter.SetInputConnection(tangents.GetOutputPort())
     transformFilter.SetTransform(transform)
     transformFilter.Update()
@@ -393,9 +477,9 @@ def GetRandomHills():
 def GetTorus():
     uResolution = 51
     vResolution = 51
-    surface = vtk.vtkParametricTorus()
+    surface = vtkParametricTorus()
 
-    source = vtk.vtkParametricFunctionSource()
+    source = vtkParametricFunctionSource()
     source.SetUResolution(uResolution)
     source.SetVResolution(vResolution)
     source.SetParametricFunction(surface)
@@ -404,13 +488,13 @@ def GetTorus():
     # Build the tcoords
     pd = UVTcoords(uResolution, vResolution, source.GetOutput())
     # Now the tangents
-    tangents = vtk.vtkPolyDataTangents()
+    tangents = vtkPolyDataTangents()
     tangents.SetInputData(pd)
     tangents.Update()
 
-    transform = vtk.vtkTransform()
+    transform = vtkTransform()
     transform.RotateX(90.0)
-    transformFilter = vtk.vtkTransformPolyDataFilter()
+    transformFilter = vtkTransformPolyDataFilter()
     transformFilter.SetInputConnection(tangents.GetOutputPort())
     transformFilter.SetTransform(transform)
     transformFilter.Update()
@@ -421,29 +505,29 @@ def GetTorus():
 def GetSphere():
     thetaResolution = 32
     phiResolution = 32
-    surface = vtk.vtkTexturedSphereSource()
+    surface = vtkTexturedSphereSource()
     surface.SetThetaResolution(thetaResolution)
     surface.SetPhiResolution(phiResolution)
 
     # Now the tangents
-    tangents = vtk.vtkPolyDataTangents()
+    tangents = vtkPolyDataTangents()
     tangents.SetInputConnection(surface.GetOutputPort())
     tangents.Update()
     return tangents.GetOutput()
 
 
 def GetCube():
-    surface = vtk.vtkCubeSource()
+    surface = vtkCubeSource()
 
     # Triangulate
-    triangulation = vtk.vtkTriangleFilter()
+    triangulation = vtkTriangleFilter()
     triangulation.SetInputConnection(surface.GetOutputPort())
     # Subdivide the triangles
-    subdivide = vtk.vtkLinearSubdivisionFilter()
+    subdivide = vtkLinearSubdivisionFilter()
     subdivide.SetInputConnection(triangulation.GetOutputPort())
     subdivide.SetNumberOfSubdivisions(3)
     # Now the tangents
-    tangents = vtk.vtkPolyDataTangents()
+    tangents = vtkPolyDataTangents()
     tangents.SetInputConnection(subdivide.GetOutputPort())
     tangents.Update()
     return tangents.GetOutput()
@@ -452,36 +536,25 @@ def GetCube():
 def UVTcoords(uResolution, vResolution, pd):
     """
     Generate u, v texture coordinates on a parametric surface.
+
+    The (u, v) grid is built with NumPy and handed to VTK without copying it.
     :param uResolution: u resolution
     :param vResolution: v resolution
     :param pd: The polydata representing the surface.
     :return: The polydata with the texture coordinates added.
     """
-    u0 = 1.0
-    v0 = 0.0
-    du = 1.0 / (uResolution - 1)
-    dv = 1.0 / (vResolution - 1)
-    numPts = pd.GetNumberOfPoints()
-    tCoords = vtk.vtkFloatArray()
-    tCoords.SetNumberOfComponents(2)
-    tCoords.SetNumberOfTuples(numPts)
+    # The points are ordered with v varying fastest, u runs from 1 to 0 and v from 0 to 1.
+    u, v = np.meshgrid(np.linspace(1.0, 0.0, uResolution, dtype=np.float32),
+                       np.linspace(0.0, 1.0, vResolution, dtype=np.float32), indexing='ij')
+    tc = np.column_stack((u.ravel(), v.ravel()))
+    tCoords = numpy_support.numpy_to_vtk(tc, deep=False, array_type=VTK_FLOAT)
     tCoords.SetName('Texture Coordinates')
-    ptId = 0
-    u = u0
-    for i in range(0, uResolution):
-        v = v0
-        for j in range(0, vResolution):
-            tc = [u, v]
-            tCoords.SetTuple(ptId, tc)
-            v += dv
-            ptId += 1
-        u -= du
     pd.GetPointData().SetTCoords(tCoords)
     return pd
 
 
 def MakeSliderWidget(properties):
-    slider = vtk.vtkSliderRepresentation2D()
+    slider = vtkSliderRepresentation2D()
 
     slider.SetMinimumValue(properties.minimumValue)
     slider.SetMaximumValue(properties.maximumValue)
@@ -498,7 +571,7 @@ def MakeSliderWidget(properties):
     slider.SetTitleHeight(properties.titleHeight)
     slider.SetLabelHeight(properties.labelHeight)
 
-    sliderWidget = vtk.vtkSliderWidget()
+    sliderWidget = vtkSliderWidget()
     sliderWidget.SetRepresentation(slider)
 
     return sliderWidget
@@ -1,42 +1,60 @@
 #!/usr/bin/env python
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonCore import vtkLookupTable
+from vtkmodules.vtkCommonTransforms import vtkTransform
+from vtkmodules.vtkFiltersCore import vtkElevationFilter
+from vtkmodules.vtkFiltersGeneral import vtkTransformFilter
+from vtkmodules.vtkFiltersSources import vtkSphereSource
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkDataSetMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
 
 
 def main():
-    colors = vtk.vtkNamedColors()
-    renderer = vtk.vtkRenderer()
-    renWin = vtk.vtkRenderWindow()
+    colors = vtkNamedColors()
+    renderer = vtkRenderer()
+    renWin = vtkRenderWindow()
     renWin.AddRenderer(renderer)
-    iren = vtk.vtkRenderWindowInteractor()
+    iren = vtkRenderWindowInteractor()
     iren.SetRenderWindow(renWin)
 
-    sphere = vtk.vtkSphereSource()
+    sphere = vtkSphereSource()
     sphere.SetThetaResolution(12)
     sphere.SetPhiResolution(12)
 
-    aTransform = vtk.vtkTransform()
+    aTransform = vtkTransform()
     aTransform.Scale(1, 1.5, 2)
 
-    transFilter = vtk.vtkTransformFilter()
+    transFilter = vtkTransformFilter()
     transFilter.SetInputConnection(sphere.GetOutputPort())
     transFilter.SetTransform(aTransform)
 
-    colorIt = vtk.vtkElevationFilter()
+    colorIt = vtkElevationFilter()
     colorIt.SetInputConnection(transFilter.GetOutputPort())
     colorIt.SetLowPoint(0, 0, -1)
     colorIt.SetHighPoint(0, 0, 1)
 
-    lut = vtk.vtkLookupTable()
+    lut = vtkLookupTable()
     lut.SetHueRange(0.667, 0)
     lut.SetSaturationRange(1, 1)
     lut.SetValueRange(1, 1)
 
-    mapper = vtk.vtkDataSetMapper()
+    mapper = vtkDataSetMapper()
     mapper.SetLookupTable(lut)
     mapper.SetInputConnection(colorIt.GetOutputPort())
 
-    actor = vtk.vtkActor()
+    actor = vtkActor()
     actor.SetMapper(mapper)
 
     renderer.AddActor(actor)
@@ -2,50 +2,92 @@
 
 #  Translated from walkCow.tcl
 
-import vtk
-
-def walk_cow(file_name, figure):
+import os
+import queue
+import threading
+import time
+from fractions import Fraction
+from pathlib import Path
+
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonDataModel import vtkImageData
+from vtkmodules.vtkCommonTransforms import vtkTransform
+from vtkmodules.vtkFiltersGeneral import vtkAxes
+from vtkmodules.vtkIOGeometry import vtkBYUReader
+from vtkmodules.vtkIOImage import (
+    vtkBMPWriter,
+    vtkJPEGWriter,
+    vtkPNGWriter,
+    vtkPNMWriter,
+    vtkPostScriptWriter,
+    vtkTIFFWriter
+)
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer,
+    vtkWindowToImageFilter
+)
+
+try:
+    import numpy as np
+    from vtkmodules.util import numpy_support
+except ModuleNotFoundError:
+    np = None
+
+
+def walk_cow(file_name, figure, frames=None, offscreen=False):
     figure = abs(figure)
     if figure > 2:
         figure = 0
 
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
     # Set the background color.
     colors.SetColor('BkgColor1', [60, 93, 144, 255])
     colors.SetColor('BkgColor2', [26, 51, 102, 255])
 
-    ren = vtk.vtkRenderer()
-    renWin = vtk.vtkRenderWindow()
+    ren = vtkRenderer()
+    renWin = vtkRenderWindow()
     renWin.AddRenderer(ren)
     renWin.SetWindowName('WalkCow');
+    if offscreen:
+        renWin.SetOffScreenRendering(1)
 
-    iren = vtk.vtkRenderWindowInteractor()
+    iren = vtkRenderWindowInteractor()
     iren.SetRenderWindow(renWin)
 
     # The cow pipeline.
-    cow = vtk.vtkBYUReader()
+    cow = vtkBYUReader()
     cow.SetGeometryFileName(file_name)
     cow.Update()
 
-    cowMapper = vtk.vtkPolyDataMapper()
+    cowMapper = vtkPolyDataMapper()
     cowMapper.SetInputConnection(cow.GetOutputPort())
     cowMapper.ScalarVisibilityOff()
 
-    cowActor = vtk.vtkActor()
+    cowActor = vtkActor()
     cowActor.SetMapper(cowMapper)
     cowActor.GetProperty().SetColor(colors.GetColor3d('Wheat'))
 
     ren.AddActor(cowActor)
 
     # Axes pipeline.
-    cowAxesSource = vtk.vtkAxes()
+    cowAxesSource = vtkAxes()
     cowAxesSource.SetScaleFactor(10.0)
     cowAxesSource.SetOrigin(0, 0, 0)
 
-    cowAxesMapper = vtk.vtkPolyDataMapper()
+    cowAxesMapper = vtkPolyDataMapper()
     cowAxesMapper.SetInputConnection(cowAxesSource.GetOutputPort())
 
-    cowAxes = vtk.vtkActor()
+    cowAxes = vtkActor()
     cowAxes.SetMapper(cowAxesMapper)
     cowAxes.VisibilityOff()
 
@@ -61,30 +103,40 @@ def walk_cow(file_name, figure):
     # Activate this if you want to see the Position and Focal point.
     # ren.GetActiveCamera().AddObserver('ModifiedEvent', CameraModifiedCallback)
 
+    driver = AnimationDriver(renWin, frame_rate=5)
+    recorder = None
+    if frames:
+        recorder = FrameRecorder(renWin, frames, frame_rate=driver.frame_rate)
+
     # These four walks use the same camera position.
-    Rotate_X(cowActor, ren, renWin)
-    Rotate_Y(cowActor, ren, renWin)
-    Rotate_Z(cowActor, ren, renWin)
-    Rotate_XY(cowActor, ren, renWin)
+    Rotate_X(cowActor, ren, renWin, driver)
+    Rotate_Y(cowActor, ren, renWin, driver)
+    Rotate_Z(cowActor, ren, renWin, driver)
+    Rotate_XY(cowActor, ren, renWin, driver)
 
     ren.SetBackground(colors.GetColor3d('BkgColor2'))
     if figure == 1:
-        Rotate_V_0(cowActor, ren, renWin)
+        Rotate_V_0(cowActor, ren, renWin, driver)
     elif figure == 2:
-        Rotate_V_V(cowActor, ren, renWin)
+        Rotate_V_V(cowActor, ren, renWin, driver)
     else:
-        Rotate_V_0(cowActor, ren, renWin)
-        Rotate_V_V(cowActor, ren, renWin)
+        Rotate_V_0(cowActor, ren, renWin, driver)
+        Rotate_V_V(cowActor, ren, renWin, driver)
         # Walk() needs to go after Rotate_V_0() or Rotate_V_V().
-        Walk(cowActor, ren, renWin)
+        Walk(cowActor, ren, renWin, driver)
+
+    driver.report()
+    if recorder:
+        recorder.close()
 
     # Interact with data.
     renWin.EraseOff()
-    iren.Start()
+    if not offscreen:
+        iren.Start()
 
 def main():
-    file_name, figure = get_program_parameters()
-    walk_cow(file_name, figure)
+    file_name, figure, frames, offscreen = get_program_parameters()
+    walk_cow(file_name, figure, frames, offscreen)
 
 
 def get_program_parameters():
@@ -95,13 +147,19 @@ def get_program_parameters():
 
         If the parameter figure is 0, 1 or 2 then these correspond to
         the VTK Textbook figures 3-32, 3-33a, 3-33b in that order.
+
+        Use -f to record the animation, e.g. -f cow.y4m for a YUV4MPEG2 stream (needs NumPy)
+        or -f cow.png for the PNG files cow0000.png, cow0001.png, ...
+        Use -o to render offscreen as fast as possible e.g. to record the animation.
    '''
     parser = argparse.ArgumentParser(description=description, epilog=epilogue,
                                      formatter_class=argparse.RawDescriptionHelpFormatter)
     parser.add_argument('filename', help='The file cow.g.')
     parser.add_argument('figure', default=0, type=int, nargs='?', help='The particular rotation that you want to view.')
+    parser.add_argument('-f', '--frames', default=None, help='Record the animation to this file.')
+    parser.add_argument('-o', '--offscreen', action='store_true', help='Render offscreen as fast as possible.')
     args = parser.parse_args()
-    return args.filename, args.figure
+    return args.filename, args.figure, args.frames, args.offscreen
 
 
 '''
@@ -118,14 +176,14 @@ def get_program_parameters():
         EraseOff() has to be called after a Render() call
          to work in the desired way.
     5) Then rotate or Walk the object around the scene.
-    6) Optionally write out the scene using Screenshot().
+    6) Optionally write out the scene using write_image().
     6) Set EraseOff() in the render window.
     7) Reset the object position.
 
 '''
 
 
-def Rotate_X(cowActor, ren, renWin):
+def Rotate_X(cowActor, ren, renWin, driver):
     # Six rotations about the x axis.
     ren.ResetCamera()
     ren.ResetCameraClippingRange()
@@ -142,18 +200,16 @@ def Rotate_X(cowActor, ren, renWin):
     ren.GetActiveCamera().SetFocalPoint(fp)
     ren.GetActiveCamera().SetViewUp(0, 0, -1)
     ren.ResetCameraClippingRange()
-    renWin.Render()
-    renWin.Render()
+    driver.render()
     renWin.EraseOff()
     for idx in range(0, 6):
         cowActor.RotateX(60)
-        renWin.Render()
-        renWin.Render()
-    # Screenshot('Fig3-31a.png', renWin)
+        driver.render()
+    # write_image('Fig3-31a.png', renWin, rgba=False)
     renWin.EraseOn()
 
 
-def Rotate_Y(cowActor, ren, renWin):
+def Rotate_Y(cowActor, ren, renWin, driver):
     # Six rotations about the y axis.
     ren.ResetCamera()
     ren.ResetCameraClippingRange()
@@ -170,18 +226,16 @@ def Rotate_Y(cowActor, ren, renWin):
     ren.GetActiveCamera().SetFocalPoint(fp)
     ren.GetActiveCamera().SetViewUp(0, 1, 0)
     ren.ResetCameraClippingRange()
-    renWin.Render()
-    renWin.Render()
+    driver.render()
     renWin.EraseOff()
     for idx in range(0, 6):
         cowActor.RotateY(60)
-        renWin.Render()
-        renWin.Render()
-    # Screenshot('Fig3-31b.png', renWin)
+        driver.render()
+    # write_image('Fig3-31b.png', renWin, rgba=False)
     renWin.EraseOn()
 
 
-def Rotate_Z(cowActor, ren, renWin):
+def Rotate_Z(cowActor, ren, renWin, driver):
     # Six rotations about the z axis.
     ren.ResetCamera()
     ren.ResetCameraClippingRange()
@@ -199,18 +253,16 @@ def Rotate_Z(cowActor, ren, renWin):
     ren.GetActiveCamera().SetFocalPoint(fp)
     ren.GetActiveCamera().SetViewUp(0, 1, 0)
     ren.ResetCameraClippingRange()
-    renWin.Render()
-    renWin.Render()
+    driver.render()
     renWin.EraseOff()
     for idx in range(0, 6):
         cowActor.RotateZ(60)
-        renWin.Render()
-        renWin.Render()
-    # Screenshot('Fig3-31c.png', renWin)
+        driver.render()
+    # write_image('Fig3-31c.png', renWin, rgba=False)
     renWin.EraseOn()
 
 
-def Rotate_XY(cowActor, ren, renWin):
+def Rotate_XY(cowActor, ren, renWin, driver):
     # First a rotation about the x axis, then six rotations about the y axis.
     ren.ResetCamera()
     ren.ResetCameraClippingRange()
@@ -228,20 +280,18 @@ def Rotate_XY(cowActor, ren, renWin):
     ren.GetActiveCamera().SetFocalPoint(fp)
     ren.GetActiveCamera().SetViewUp(0, 1, 0)
     ren.ResetCameraClippingRange()
-    renWin.Render()
-    renWin.Render()
+    driver.render()
     renWin.EraseOff()
     cowActor.RotateX(60)
     for idx in range(0, 6):
         cowActor.RotateY(60)
-        renWin.Render()
-        renWin.Render()
+        driver.render()
     cowActor.RotateX(-60)
-    # Screenshot('Fig3-31d.png', renWin)
+    # write_image('Fig3-31d.png', renWin, rgba=False)
     renWin.EraseOn()
 
 
-def Rotate_V_0(cowActor, ren, renWin):
+def Rotate_V_0(cowActor, ren, renWin, driver):
     # The cow rotating about a vector passing through her nose.
     # With the origin at (0, 0, 0).
     ren.ResetCamera()
@@ -254,24 +304,22 @@ def Rotate_V_0(cowActor, ren, renWin):
     fp = [0.0] * 3
     for i in range(0, 3):
         fp[i] = (bounds[i * 2 + 1] + bounds[i * 2]) / 2.0
-    cowPos = vtk.vtkTransform()
+    cowPos = vtkTransform()
     cowPos.Identity()
     cowPos.SetMatrix(cowActor.GetMatrix())
-    cowTransform = vtk.vtkTransform()
+    cowTransform = vtkTransform()
     cowTransform.Identity()
     cowActor.SetUserMatrix(cowTransform.GetMatrix())
     # This closely matches the original illustration.
     ren.GetActiveCamera().SetPosition(16, 9, -12)
     ren.GetActiveCamera().SetFocalPoint(fp)
     ren.ResetCameraClippingRange()
-    renWin.Render()
-    renWin.Render()
+    driver.render()
     renWin.EraseOff()
     for idx in range(0, 6):
         cowActor.RotateWXYZ(60, 2.19574, -1.42455, -0.0331036)
-        renWin.Render()
-        renWin.Render()
-    # Screenshot('Fig3-33a.png', renWin)
+        driver.render()
+    # write_image('Fig3-33a.png', renWin, rgba=False)
     renWin.EraseOn()
     # Put the cow back on the origin.
     # for idx in range(0, 6):
@@ -282,7 +330,7 @@ def Rotate_V_0(cowActor, ren, renWin):
     # ren.ResetCamera()
 
 
-def Rotate_V_V(cowActor, ren, renWin):
+def Rotate_V_V(cowActor, ren, renWin, driver):
     # The cow rotating about a vector passing through her nose.
     # With the origin at (6.11414, 1.27386, 0.015175).
     ren.ResetCamera()
@@ -295,25 +343,23 @@ def Rotate_V_V(cowActor, ren, renWin):
     fp = [0.0] * 3
     for i in range(0, 3):
         fp[i] = (bounds[i * 2 + 1] + bounds[i * 2]) / 2.0
-    cowPos = vtk.vtkTransform()
+    cowPos = vtkTransform()
     cowPos.Identity()
     cowPos.SetMatrix(cowActor.GetMatrix())
     cowActor.SetOrigin(6.11414, 1.27386, 0.015175)  # The cow's nose
-    cowTransform = vtk.vtkTransform()
+    cowTransform = vtkTransform()
     cowTransform.Identity()
     cowActor.SetUserMatrix(cowTransform.GetMatrix())
     # This closely matches the original illustration.
     ren.GetActiveCamera().SetPosition(31, 23, -21)
     ren.GetActiveCamera().SetFocalPoint(fp)
     ren.ResetCameraClippingRange()
-    renWin.Render()
-    renWin.Render()
+    driver.render()
     renWin.EraseOff()
     for idx in range(0, 6):
         cowActor.RotateWXYZ(60, 2.19574, -1.42455, -0.0331036)
-        renWin.Render()
-        renWin.Render()
-    # Screenshot('Fig3-33b.png', renWin)
+        driver.render()
+    # write_image('Fig3-33b.png', renWin, rgba=False)
     renWin.EraseOn()
     # Put the cow back on the origin.
     # for idx in range(0, 6):
@@ -321,9 +367,9 @@ def Rotate_V_V(cowActor, ren, renWin):
     # cowActor.SetUserMatrix(cowPos.GetMatrix())
 
 
-def Walk(cowActor, ren, renWin):
+def Walk(cowActor, ren, renWin, driver):
     # The cow 'walking' around the global origin
-    cowPos = vtk.vtkTransform()
+    cowPos = vtkTransform()
     cowPos.Identity()
     cowPos.SetMatrix(cowActor.GetMatrix())
     cowActor.SetOrientation(0.0, 0.0, 0.0)
@@ -333,7 +379,7 @@ def Walk(cowActor, ren, renWin):
     fp = [0.0] * 3
     for i in range(0, 3):
         fp[i] = (bounds[i * 2 + 1] + bounds[i * 2]) / 2.0
-    cowTransform = vtk.vtkTransform()
+    cowTransform = vtkTransform()
     cowTransform.Identity()
     cowTransform.Translate(0, 0, 5)
     cowActor.SetUserMatrix(cowTransform.GetMatrix())
@@ -342,17 +388,15 @@ def Walk(cowActor, ren, renWin):
     ren.GetActiveCamera().SetFocalPoint(fp)
     ren.GetActiveCamera().SetViewUp(0, 0, -1)
     ren.ResetCameraClippingRange()
-    renWin.Render()
-    renWin.Render()
+    driver.render()
     renWin.EraseOff()
     for idx in range(1, 7):
         cowTransform.Identity()
         cowTransform.RotateY(idx * 60)
         cowTransform.Translate(0, 0, 5)
         cowActor.SetUserMatrix(cowTransform.GetMatrix())
-        renWin.Render()
-        renWin.Render()
-    # Screenshot('Fig3-32.png', renWin)
+        driver.render()
+    # write_image('Fig3-32.png', renWin, rgba=False)
     renWin.EraseOn()
     # Walkies are over, put the cow back on the origin.
     # cowActor.SetUserMatrix(cowPos.GetMatrix())
@@ -376,27 +420,255 @@ def CameraModifiedCallback(caller, ev):
           caller.GetFocalPoint()[2])
 
 
-def Screenshot(fileName, renWin):
-    '''
-    Save a screenshot.
-    :param fileName:
-    :param renWin:
+def write_image(file_name, render_window, rgba=True):
+    """
+    Write the render window view to an image file.
+
+    Image types supported are:
+     BMP, JPEG, PNM, PNG, PostScript, TIFF.
+    The default parameters are used for all writers, change as needed.
+
+    :param file_name: The file name, if no extension then PNG is assumed.
+    :param render_window: The render window.
+    :param rgba: Used to set the buffer type.
     :return:
-    '''
-    windowToImageFilter = vtk.vtkWindowToImageFilter()
-    windowToImageFilter.SetInput(renWin)
-    windowToImageFilter.SetScale(1)  # image quality
-    # We are not recording the alpha (transparency) channel.
-    # windowToImageFilter.SetInputBufferTypeToRGBA()
-    windowToImageFilter.SetInputBufferTypeToRGB()
-    # Read from the front buffer.
-    windowToImageFilter.ReadFrontBufferOff()
-    windowToImageFilter.Update()
-
-    writer = vtk.vtkPNGWriter()
-    writer.SetFileName(fileName)
-    writer.SetInputConnection(windowToImageFilter.GetOutputPort())
-    writer.Write()
+    """
+    if file_name:
+        # Select the writer to use.
+        path, ext = os.path.splitext(file_name)
+        ext = ext.lower()
+        if not ext:
+            ext = '.png'
+            file_name = file_name + ext
+        if ext == '.bmp':
+            writer = vtkBMPWriter()
+        elif ext == '.jpg':
+            writer = vtkJPEGWriter()
+        elif ext == '.pnm':
+            writer = vtkPNMWriter()
+        elif ext == '.ps':
+            if rgba:
+                rgba = False
+            writer = vtkPostScriptWriter()
+        elif ext == '.tiff':
+            writer = vtkTIFFWriter()
+        else:
+            writer = vtkPNGWriter()
+
+        windowto_image_filter = vtkWindowToImageFilter()
+        windowto_image_filter.SetInput(render_window)
+        windowto_image_filter.SetScale(1)  # image quality
+        if rgba:
+            windowto_image_filter.SetInputBufferTypeToRGBA()
+        else:
+            windowto_image_filter.SetInputBufferTypeToRGB()
+            # Read from the front buffer.
+            windowto_image_filter.ReadFrontBufferOff()
+            windowto_image_filter.Update()
+
+        writer.SetFileName(file_name)
+        writer.SetInputConnection(windowto_image_filter.GetOutputPort())
+        writer.Write()
+    else:
+        raise RuntimeError('Need a filename.')
+
+
+class FrameRecorder(object):
+    """
+    Record every frame rendered in a render window.
+
+    When a render finishes, the frame is read back by a vtkWindowToImageFilter that is reused
+     for every frame. The frame is put in a bounded queue and written by background threads,
+     so the render loop only waits for the writing when the queue is full.
+
+    If the file name ends in .y4m, the frames are written as a YUV4MPEG2 stream, this needs NumPy.
+     The stream can be converted with e.g. ffmpeg -i frames.y4m frames.mp4
+    Otherwise the frames are written as a numbered PNG sequence e.g. frames0000.png, frames0001.png, ...
+    """
+
+    def __init__(self, render_window, file_name, frame_rate=30, queue_size=8, workers=2):
+        """
+        :param render_window: The render window.
+        :param file_name: The .y4m file or the prefix of the PNG files.
+        :param frame_rate: The frame rate of the .y4m stream, it does not have to be an integer.
+        :param queue_size: The maximum number of frames waiting to be written.
+        :param workers: The number of threads writing the PNG files.
+        """
+        path = Path(file_name)
+        self.y4m = path.suffix.lower() == '.y4m'
+        if self.y4m and np is None:
+            raise RuntimeError('NumPy is needed to write a .y4m stream.')
+        self.file_name = file_name
+        self.frame_rate = frame_rate
+        self.prefix = str(path.with_suffix(''))
+        self.stream = None
+        self.size = None
+
+        self.window_to_image = vtkWindowToImageFilter()
+        self.window_to_image.SetInput(render_window)
+        # The frame has just been rendered, so read it from the back buffer without rendering again.
+        self.window_to_image.ShouldRerenderOff()
+        self.window_to_image.ReadFrontBufferOff()
+        self.window_to_image.SetInputBufferTypeToRGB()
+
+        self.number_of_frames = 0
+        self.capture_time = 0.0
+        self.paused = False
+        # The first exception raised while writing the frames.
+        self.error = None
+        self.frames = queue.Queue(queue_size)
+        if self.y4m:
+            # The stream is written in order by one thread.
+            workers = 1
+            self.stream = open(file_name, 'wb')
+        self.threads = [threading.Thread(target=self.write_frames, daemon=True) for i in range(workers)]
+        for thread in self.threads:
+            thread.start()
+        self.render_window = render_window
+        self.observer = render_window.AddObserver('EndEvent', self.capture)
+
+    def pause(self):
+        """
+        Stop recording the frames, e.g. while rendering an image that is not part of the animation.
+        """
+        self.paused = True
+
+    def resume(self):
+        self.paused = False
+
+    def capture(self, caller=None, event=None):
+        if self.paused:
+            return
+        if self.error is not None:
+            # Exceptions raised in an observer do not reach the render loop, so report it and stop recording,
+            #  close() raises it.
+            print(f'Recording to {self.file_name} stopped, a frame could not be written: {self.error}')
+            self.render_window.RemoveObserver(self.observer)
+            return
+        start = time.perf_counter()
+        self.window_to_image.Modified()
+        self.window_to_image.Update()
+        # The frame shares the pixels with the filter output, as the frame holds a reference to them,
+        #  the filter allocates new pixels for the next frame instead of overwriting them.
+        frame = vtkImageData()
+        frame.ShallowCopy(self.window_to_image.GetOutput())
+        self.frames.put((self.number_of_frames, frame))
+        self.number_of_frames += 1
+        self.capture_time += time.perf_counter() - start
+
+    def write_frames(self):
+        while True:
+            item = self.frames.get()
+            if item is None:
+                break
+            if self.error is not None:
+                # Keep emptying the queue so that capture() and close() never wait on it.
+                continue
+            index, frame = item
+            try:
+                if self.y4m:
+                    self.write_y4m_frame(frame)
+                else:
+                    file_name = f'{self.prefix}{index:04d}.png'
+                    writer = vtkPNGWriter()
+                    writer.SetFileName(file_name)
+                    writer.SetInputData(frame)
+                    writer.Write()
+                    if writer.GetErrorCode():
+                        raise OSError(f'Cannot write {file_name}.')
+            except Exception as e:
+                self.error = e
+
+    def write_y4m_frame(self, frame):
+        width, height = frame.GetDimensions()[:2]
+        if self.size is None:
+            self.size = (width, height)
+            # The frame rate is written as a ratio, e.g. 100/3 as F100:3.
+            rate = Fraction(self.frame_rate).limit_denominator(1001)
+            self.stream.write(f'YUV4MPEG2 W{width} H{height} F{rate.numerator}:{rate.denominator} Ip A1:1 C444'
+                              f' XCOLORRANGE=FULL\n'.encode('ascii'))
+        elif self.size != (width, height):
+            # The window has been resized, the frame does not fit in the stream.
+            return
+        # The image rows are stored from the bottom up.
+        rgb = numpy_support.vtk_to_numpy(frame.GetPointData().GetScalars()).reshape(height, width, 3)[::-1]
+        rgb = rgb.astype(np.float32)
+        # Full range BT.601 YCbCr.
+        y = rgb @ np.array([0.299, 0.587, 0.114], dtype=np.float32)
+        cb = rgb @ np.array([-0.168736, -0.331264, 0.5], dtype=np.float32) + 128
+        cr = rgb @ np.array([0.5, -0.418688, -0.081312], dtype=np.float32) + 128
+        self.stream.write(b'FRAME\n')
+        for plane in (y, cb, cr):
+            self.stream.write(np.clip(np.rint(plane), 0, 255).astype(np.uint8).tobytes())
+
+    def close(self):
+        """
+        Stop recording and wait for the frames to be written.
+        """
+        self.render_window.RemoveObserver(self.observer)
+        for thread in self.threads:
+            self.frames.put(None)
+        for thread in self.threads:
+            thread.join()
+        if self.stream:
+            self.stream.close()
+        if self.error is not None:
+            raise RuntimeError(f'Recording to {self.file_name} failed: {self.error}') from self.error
+        if self.number_of_frames:
+            print(f'Recorded {self.number_of_frames} frames to {self.file_name},'
+                  f' {self.capture_time / self.number_of_frames * 1000:0.1f}ms per frame in the render loop.')
+
+
+class AnimationDriver(object):
+    """
+    Render the frames of an animation and time them.
+
+    In real time mode the frames are shown at the frame rate, a frame that takes too long
+     delays the rest of the animation rather than frames being dropped, so the same frames
+     are always rendered.
+    When the render window is offscreen, nobody is watching, so the frames are rendered
+     as fast as possible.
+    """
+
+    def __init__(self, render_window, frame_rate=30.0, real_time=None):
+        """
+        :param render_window: The render window.
+        :param frame_rate: The number of frames per second in real time mode.
+        :param real_time: If None, real time mode is used unless the render window is offscreen.
+        """
+        self.render_window = render_window
+        self.frame_rate = frame_rate
+        self.frame_interval = 1.0 / frame_rate
+        if real_time is None:
+            real_time = not render_window.GetOffScreenRendering()
+        self.real_time = real_time
+        self.frame_times = list()
+        self.start = None
+        self.end = None
+        self.next_frame = None
+
+    def render(self):
+        """
+        Render a frame, in real time mode wait until the next frame is due.
+        """
+        start = time.perf_counter()
+        if self.start is None:
+            self.start = self.next_frame = start
+        self.render_window.Render()
+        self.end = time.perf_counter()
+        self.frame_times.append(self.end - start)
+        if self.real_time:
+            self.next_frame = max(self.next_frame + self.frame_interval, self.end)
+            time.sleep(self.next_frame - self.end)
+
+    def report(self):
+        if not self.frame_times:
+            return
+        n = len(self.frame_times)
+        elapsed = self.end - self.start
+        print(f'Rendered {n} frames in {elapsed:0.2f}s ({n / elapsed:0.1f} fps),'
+              f' render time per frame: mean {sum(self.frame_times) / n * 1000:0.1f}ms,'
+              f' max {max(self.frame_times) * 1000:0.1f}ms.')
 
 
 if __name__ == '__main__':
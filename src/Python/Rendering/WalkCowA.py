@@ -10,9 +10,9 @@ import WalkCow
 
 
 def main():
-    file_name, figure = WalkCow.get_program_parameters()
+    file_name, figure, frames, offscreen = WalkCow.get_program_parameters()
     figure = 1
-    WalkCow.walk_cow(file_name, figure)
+    WalkCow.walk_cow(file_name, figure, frames, offscreen)
 
 
 if __name__ == '__main__':
@@ -1,74 +1,111 @@
 #!/usr/bin/env python
 
-import vtk
+import queue
+import threading
+import time
+from fractions import Fraction
+from pathlib import Path
+
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonDataModel import vtkImageData
+from vtkmodules.vtkFiltersCore import (
+    vtkGlyph3D,
+    vtkThresholdPoints
+)
+from vtkmodules.vtkFiltersModeling import vtkOutlineFilter
+from vtkmodules.vtkFiltersSources import vtkLineSource
+from vtkmodules.vtkIOImage import vtkPNGWriter
+from vtkmodules.vtkIOLegacy import vtkStructuredPointsReader
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkCamera,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer,
+    vtkTexture,
+    vtkWindowToImageFilter
+)
+
+try:
+    import numpy as np
+    from vtkmodules.util import numpy_support
+except ModuleNotFoundError:
+    np = None
 
 
 def main():
     fileNames = [''] * 2
-    fileNames[0], fileNames[1] = get_program_parameters()
+    fileNames[0], fileNames[1], frames = get_program_parameters()
 
     # Generate the other vecAnim file names. There are 8 of them.
     tmpFn = fileNames[1][:-5]
     for i in range(2, 9):
         fileNames.append(tmpFn + str(i) + '.vtk')
 
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
     # Setup the render window, renderer, and interactor.
-    renderer = vtk.vtkRenderer()
-    renderWindow = vtk.vtkRenderWindow()
+    renderer = vtkRenderer()
+    renderWindow = vtkRenderWindow()
     renderWindow.AddRenderer(renderer)
-    interactor = vtk.vtkRenderWindowInteractor()
+    interactor = vtkRenderWindowInteractor()
     interactor.SetRenderWindow(renderWindow)
 
     # Read the data.
     #
     # Create the pipeline.
     #
-    reader = vtk.vtkStructuredPointsReader()
+    reader = vtkStructuredPointsReader()
     reader.SetFileName(fileNames[0])
 
-    threshold = vtk.vtkThresholdPoints()
+    threshold = vtkThresholdPoints()
     threshold.SetInputConnection(reader.GetOutputPort())
     threshold.ThresholdByUpper(200)
 
-    line = vtk.vtkLineSource()
+    line = vtkLineSource()
     line.SetResolution(1)
 
-    lines = vtk.vtkGlyph3D()
+    lines = vtkGlyph3D()
     lines.SetInputConnection(threshold.GetOutputPort())
     lines.SetSourceConnection(line.GetOutputPort())
     lines.SetScaleFactor(0.005)
     lines.SetScaleModeToScaleByScalar()
     lines.Update()
 
-    vectorMapper = vtk.vtkPolyDataMapper()
+    vectorMapper = vtkPolyDataMapper()
     vectorMapper.SetInputConnection(lines.GetOutputPort())
     vectorMapper.SetScalarRange(lines.GetOutput().GetScalarRange())
 
-    vectorActor = vtk.vtkActor()
+    vectorActor = vtkActor()
     vectorActor.SetMapper(vectorMapper)
     vectorActor.GetProperty().SetOpacity(0.99)
     vectorActor.GetProperty().SetLineWidth(1.5)
 
     # Outline
-    outline = vtk.vtkOutlineFilter()
+    outline = vtkOutlineFilter()
     outline.SetInputConnection(reader.GetOutputPort())
 
-    outlineMapper = vtk.vtkPolyDataMapper()
+    outlineMapper = vtkPolyDataMapper()
     outlineMapper.SetInputConnection(outline.GetOutputPort())
 
-    outlineActor = vtk.vtkActor()
+    outlineActor = vtkActor()
     outlineActor.SetMapper(outlineMapper)
     outlineActor.GetProperty().SetColor(colors.GetColor3d('Black'))
 
     #  Texture maps.
     textureMaps = list()
     for i in range(2, len(fileNames)):
-        tmap = vtk.vtkStructuredPointsReader()
+        tmap = vtkStructuredPointsReader()
         tmap.SetFileName(fileNames[i])
 
-        texture = vtk.vtkTexture()
+        texture = vtkTexture()
         texture.SetInputConnection(tmap.GetOutputPort())
         texture.InterpolateOff()
         texture.RepeatOff()
@@ -81,7 +118,7 @@ def main():
     renderer.AddActor(vectorActor)
     renderer.AddActor(outlineActor)
 
-    cam1 = vtk.vtkCamera()
+    cam1 = vtkCamera()
     cam1.SetClippingRange(17.4043, 870.216)
     cam1.SetFocalPoint(136.71, 104.025, 23)
     cam1.SetPosition(204.747, 258.939, 63.7925)
@@ -93,11 +130,17 @@ def main():
     renderWindow.SetSize(640, 480)
     renderWindow.SetWindowName('AnimateVectors')
 
+    recorder = None
+    if frames:
+        recorder = FrameRecorder(renderWindow, frames)
+
     # Go into a loop.
     for j in range(0, 100):
         for i in range(0, len(textureMaps)):
             vectorActor.SetTexture(textureMaps[i])
             renderWindow.Render()
+    if recorder:
+        recorder.close()
     interactor.Start()
 
 
@@ -106,13 +149,163 @@ def get_program_parameters():
     description = 'Texture maps can be animated as a function of time.'
     epilogue = '''
     This example uses texture map animation to simulate vector field motion.
+
+    Use -f to record the animation, e.g. -f vectors.y4m for a YUV4MPEG2 stream (needs NumPy)
+     or -f vectors.png for the PNG files vectors0000.png, vectors0001.png, ...
     '''
     parser = argparse.ArgumentParser(description=description, epilog=epilogue,
                                      formatter_class=argparse.RawDescriptionHelpFormatter)
     parser.add_argument('filename1', help='carotid.vtk.')
     parser.add_argument('filename2', help='vecAnim1.vtk.')
+    parser.add_argument('-f', '--frames', default=None, help='Record the animation to this file.')
     args = parser.parse_args()
-    return args.filename1, args.filename2
+    return args.filename1, args.filename2, args.frames
+
+
+class FrameRecorder(object):
+    """
+    Record every frame rendered in a render window.
+
+    When a render finishes, the frame is read back by a vtkWindowToImageFilter that is reused
+     for every frame. The frame is put in a bounded queue and written by background threads,
+     so the render loop only waits for the writing when the queue is full.
+
+    If the file name ends in .y4m, the frames are written as a YUV4MPEG2 stream, this needs NumPy.
+     The stream can be converted with e.g. ffmpeg -i frames.y4m frames.mp4
+    Otherwise the frames are written as a numbered PNG sequence e.g. frames0000.png, frames0001.png, ...
+    """
+
+    def __init__(self, render_window, file_name, frame_rate=30, queue_size=8, workers=2):
+        """
+        :param render_window: The render window.
+        :param file_name: The .y4m file or the prefix of the PNG files.
+        :param frame_rate: The frame rate of the .y4m stream, it does not have to be an integer.
+        :param queue_size: The maximum number of frames waiting to be written.
+        :param workers: The number of threads writing the PNG files.
+        """
+        path = Path(file_name)
+        self.y4m = path.suffix.lower() == '.y4m'
+        if self.y4m and np is None:
+            raise RuntimeError('NumPy is needed to write a .y4m stream.')
+        self.file_name = file_name
+        self.frame_rate = frame_rate
+        self.prefix = str(path.with_suffix(''))
+        self.stream = None
+        self.size = None
+
+        self.window_to_image = vtkWindowToImageFilter()
+        self.window_to_image.SetInput(render_window)
+        # The frame has just been rendered, so read it from the back buffer without rendering again.
+        self.window_to_image.ShouldRerenderOff()
+        self.window_to_image.ReadFrontBufferOff()
+        self.window_to_image.SetInputBufferTypeToRGB()
+
+        self.number_of_frames = 0
+        self.capture_time = 0.0
+        self.paused = False
+        # The first exception raised while writing the frames.
+        self.error = None
+        self.frames = queue.Queue(queue_size)
+        if self.y4m:
+            # The stream is written in order by one thread.
+            workers = 1
+            self.stream = open(file_name, 'wb')
+        self.threads = [threading.Thread(target=self.write_frames, daemon=True) for i in range(workers)]
+        for thread in self.threads:
+            thread.start()
+        self.render_window = render_window
+        self.observer = render_window.AddObserver('EndEvent', self.capture)
+
+    def pause(self):
+        """
+        Stop recording the frames, e.g. while rendering an image that is not part of the animation.
+        """
+        self.paused = True
+
+    def resume(self):
+        self.paused = False
+
+    def capture(self, caller=None, event=None):
+        if self.paused:
+            return
+        if self.error is not None:
+            # Exceptions raised in an observer do not reach the render loop, so report it and stop recording,
+            #  close() raises it.
+            print(f'Recording to {self.file_name} stopped, a frame could not be written: {self.error}')
+            self.render_window.RemoveObserver(self.observer)
+            return
+        start = time.perf_counter()
+        self.window_to_image.Modified()
+        self.window_to_image.Update()
+        # The frame shares the pixels with the filter output, as the frame holds a reference to them,
+        #  the filter allocates new pixels for the next frame instead of overwriting them.
+        frame = vtkImageData()
+        frame.ShallowCopy(self.window_to_image.GetOutput())
+        self.frames.put((self.number_of_frames, frame))
+        self.number_of_frames += 1
+        self.capture_time += time.perf_counter() - start
+
+    def write_frames(self):
+        while True:
+            item = self.frames.get()
+            if item is None:
+                break
+            if self.error is not None:
+                # Keep emptying the queue so that capture() and close() never wait on it.
+                continue
+            index, frame = item
+            try:
+                if self.y4m:
+                    self.write_y4m_frame(frame)
+                else:
+                    file_name = f'{self.prefix}{index:04d}.png'
+                    writer = vtkPNGWriter()
+                    writer.SetFileName(file_name)
+                    writer.SetInputData(frame)
+                    writer.Write()
+                    if writer.GetErrorCode():
+                        raise OSError(f'Cannot write {file_name}.')
+            except Exception as e:
+                self.error = e
+
+    def write_y4m_frame(self, frame):
+        width, height = frame.GetDimensions()[:2]
+        if self.size is None:
+            self.size = (width, height)
+            # The frame rate is written as a ratio, e.g. 100/3 as F100:3.
+            rate = Fraction(self.frame_rate).limit_denominator(1001)
+            self.stream.write(f'YUV4MPEG2 W{width} H{height} F{rate.numerator}:{rate.denominator} Ip A1:1 C444'
+                              f' XCOLORRANGE=FULL\n'.encode('ascii'))
+        elif self.size != (width, height):
+            # The window has been resized, the frame does not fit in the stream.
+            return
+        # The image rows are stored from the bottom up.
+        rgb = numpy_support.vtk_to_numpy(frame.GetPointData().GetScalars()).reshape(height, width, 3)[::-1]
+        rgb = rgb.astype(np.float32)
+        # Full range BT.601 YCbCr.
+        y = rgb @ np.array([0.299, 0.587, 0.114], dtype=np.float32)
+        cb = rgb @ np.array([-0.168736, -0.331264, 0.5], dtype=np.float32) + 128
+        cr = rgb @ np.array([0.5, -0.418688, -0.081312], dtype=np.float32) + 128
+        self.stream.write(b'FRAME\n')
+        for plane in (y, cb, cr):
+            self.stream.write(np.clip(np.rint(plane), 0, 255).astype(np.uint8).tobytes())
+
+    def close(self):
+        """
+        Stop recording and wait for the frames to be written.
+        """
+        self.render_window.RemoveObserver(self.observer)
+        for thread in self.threads:
+            self.frames.put(None)
+        for thread in self.threads:
+            thread.join()
+        if self.stream:
+            self.stream.close()
+        if self.error is not None:
+            raise RuntimeError(f'Recording to {self.file_name} failed: {self.error}') from self.error
+        if self.number_of_frames:
+            print(f'Recorded {self.number_of_frames} frames to {self.file_name},'
+                  f' {self.capture_time / self.number_of_frames * 1000:0.1f}ms per frame in the render loop.')
 
 
 if __name__ == '__main__':
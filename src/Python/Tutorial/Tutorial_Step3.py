@@ -16,11 +16,24 @@
 """
 
 # First access the VTK module (and any other needed modules) by importing them.
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkFiltersSources import vtkConeSource
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderer
+)
 
 
 def main(argv):
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
     #
     # Next we create an instance of vtkConeSource and set some of its
@@ -28,7 +41,7 @@ def main(argv):
     # visualization pipeline (it is a source process object) it produces data
     # (output type is vtkPolyData) which other filters may process.
     #
-    cone = vtk.vtkConeSource()
+    cone = vtkConeSource()
     cone.SetHeight(3.0)
     cone.SetRadius(1.0)
     cone.SetResolution(10)
@@ -40,7 +53,7 @@ def main(argv):
     # vtkPolyDataMapper to map the polygonal data into graphics primitives. We
     # connect the output of the cone source to the input of this mapper.
     #
-    coneMapper = vtk.vtkPolyDataMapper()
+    coneMapper = vtkPolyDataMapper()
     coneMapper.SetInputConnection(cone.GetOutputPort())
 
     #
@@ -50,7 +63,7 @@ def main(argv):
     # matrix. We set this actor's mapper to be coneMapper which we created
     # above.
     #
-    coneActor = vtk.vtkActor()
+    coneActor = vtkActor()
     coneActor.SetMapper(coneMapper)
     coneActor.GetProperty().SetColor(colors.GetColor3d('MistyRose'))
 
@@ -62,13 +75,13 @@ def main(argv):
     # actor to two different renderers it is okay to add different actors to
     # different renderers as well.
     #
-    ren1 = vtk.vtkRenderer()
+    ren1 = vtkRenderer()
     ren1.AddActor(coneActor)
     ren1.SetBackground(colors.GetColor3d('RoyalBlue'))
 
     ren1.SetViewport(0.0, 0.0, 0.5, 1.0)
 
-    ren2 = vtk.vtkRenderer()
+    ren2 = vtkRenderer()
     ren2.AddActor(coneActor)
     ren2.SetBackground(colors.GetColor3d('DodgerBlue'))
     ren2.SetViewport(0.5, 0.0, 1.0, 1.0)
@@ -78,7 +91,7 @@ def main(argv):
     # We put our renderer into the render window using AddRenderer. We also
     # set the size to be 300 pixels by 300.
     #
-    renWin = vtk.vtkRenderWindow()
+    renWin = vtkRenderWindow()
     renWin.AddRenderer(ren1)
     renWin.AddRenderer(ren2)
     renWin.SetSize(600, 300)
@@ -16,11 +16,28 @@
 """
 
 # First access the VTK module (and any other needed modules) by importing them.
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingContextOpenGL2
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonTransforms import vtkTransform
+from vtkmodules.vtkFiltersSources import vtkConeSource
+from vtkmodules.vtkInteractionStyle import vtkInteractorStyleTrackballCamera
+from vtkmodules.vtkInteractionWidgets import vtkBoxWidget
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
 
 
 def main(argv):
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
     #
     # Next we create an instance of vtkConeSource and set some of its
@@ -28,7 +45,7 @@ def main(argv):
     # visualization pipeline (it is a source process object) it produces data
     # (output type is vtkPolyData) which other filters may process.
     #
-    cone = vtk.vtkConeSource()
+    cone = vtkConeSource()
     cone.SetHeight(3.0)
     cone.SetRadius(1.0)
     cone.SetResolution(10)
@@ -40,7 +57,7 @@ def main(argv):
     # vtkPolyDataMapper to map the polygonal data into graphics primitives. We
     # connect the output of the cone source to the input of this mapper.
     #
-    coneMapper = vtk.vtkPolyDataMapper()
+    coneMapper = vtkPolyDataMapper()
     coneMapper.SetInputConnection(cone.GetOutputPort())
 
     #
@@ -50,7 +67,7 @@ def main(argv):
     # matrix. We set this actor's mapper to be coneMapper which we created
     # above.
     #
-    coneActor = vtk.vtkActor()
+    coneActor = vtkActor()
     coneActor.SetMapper(coneMapper)
     coneActor.GetProperty().SetColor(colors.GetColor3d('Bisque'))
 
@@ -60,7 +77,7 @@ def main(argv):
     # responsible for drawing the actors it has.  We also set the background
     # color here.
     #
-    ren1 = vtk.vtkRenderer()
+    ren1 = vtkRenderer()
     ren1.AddActor(coneActor)
     ren1.SetBackground(colors.GetColor3d('MidnightBlue'))
 
@@ -69,7 +86,7 @@ def main(argv):
     # We put our renderer into the render window using AddRenderer. We also
     # set the size to be 300 pixels by 300.
     #
-    renWin = vtk.vtkRenderWindow()
+    renWin = vtkRenderWindow()
     renWin.AddRenderer(ren1)
     renWin.SetSize(300, 300)
     renWin.SetWindowName('Tutorial_Step6')
@@ -80,7 +97,7 @@ def main(argv):
     # event invocations that VTK understands (see VTK/Common/vtkCommand.h
     # for all events that VTK processes). Then observers of these VTK
     # events can process them as appropriate.
-    iren = vtk.vtkRenderWindowInteractor()
+    iren = vtkRenderWindowInteractor()
     iren.SetRenderWindow(renWin)
 
     #
@@ -89,7 +106,7 @@ def main(argv):
     # it observes into operations on the camera, actors, and/or properties
     # in the vtkRenderWindow associated with the vtkRenderWinodwInteractor.
     # Here we specify a particular interactor style.
-    style = vtk.vtkInteractorStyleTrackballCamera()
+    style = vtkInteractorStyleTrackballCamera()
     iren.SetInteractorStyle(style)
 
     #
@@ -102,7 +119,7 @@ def main(argv):
     # using the Command/Observer mechanism (AddObserver()). The place factor
     # controls the initial size of the widget with respect to the bounding box
     # of the input to the widget.
-    boxWidget = vtk.vtkBoxWidget()
+    boxWidget = vtkBoxWidget()
     boxWidget.SetInteractor(iren)
     boxWidget.SetPlaceFactor(1.25)
     boxWidget.GetOutlineProperty().SetColor(colors.GetColor3d('Gold'))
@@ -136,7 +153,7 @@ class vtkMyCallback(object):
     """
 
     def __call__(self, caller, ev):
-        t = vtk.vtkTransform()
+        t = vtkTransform()
         widget = caller
         widget.GetTransform(t)
         widget.GetProp3D().SetUserTransform(t)
@@ -1,41 +1,126 @@
-import vtk
+import time
+
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkFiltersSources import vtkSphereSource
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
+
+
+def get_program_parameters():
+    import argparse
+    description = 'Move a sphere across a scene.'
+    epilogue = '''
+A timer is used to move the sphere one step each time it fires.
+Use -o to render the animation offscreen as fast as possible.
+'''
+    parser = argparse.ArgumentParser(description=description, epilog=epilogue,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-o', '--offscreen', action='store_true', help='Render offscreen as fast as possible.')
+    args = parser.parse_args()
+    return args.offscreen
 
 
 class vtkTimerCallback():
-    def __init__(self, steps, actor, iren):
+    def __init__(self, steps, actor, driver):
         self.timer_count = 0
         self.steps = steps
         self.actor = actor
-        self.iren = iren
+        self.driver = driver
         self.timerId = None
 
     def execute(self, obj, event):
-        step = 0
-        while step < self.steps:
-            print(self.timer_count)
-            self.actor.SetPosition(self.timer_count / 100.0, self.timer_count / 100.0, 0)
-            iren = obj
-            iren.GetRenderWindow().Render()
-            self.timer_count += 1
-            step += 1
-        if self.timerId:
-            iren.DestroyTimer(self.timerId)
+        self.step()
+        if self.timer_count >= self.steps and self.timerId:
+            obj.DestroyTimer(self.timerId)
+            self.timerId = None
+            self.driver.report()
+
+    def step(self):
+        print(self.timer_count)
+        self.actor.SetPosition(self.timer_count / 100.0, self.timer_count / 100.0, 0)
+        self.driver.render()
+        self.timer_count += 1
+
+
+class AnimationDriver(object):
+    """
+    Render the frames of an animation and time them.
+
+    In real time mode the frames are shown at the frame rate, a frame that takes too long
+     delays the rest of the animation rather than frames being dropped, so the same frames
+     are always rendered.
+    When the render window is offscreen, nobody is watching, so the frames are rendered
+     as fast as possible.
+    """
+
+    def __init__(self, render_window, frame_rate=30.0, real_time=None):
+        """
+        :param render_window: The render window.
+        :param frame_rate: The number of frames per second in real time mode.
+        :param real_time: If None, real time mode is used unless the render window is offscreen.
+        """
+        self.render_window = render_window
+        self.frame_rate = frame_rate
+        self.frame_interval = 1.0 / frame_rate
+        if real_time is None:
+            real_time = not render_window.GetOffScreenRendering()
+        self.real_time = real_time
+        self.frame_times = list()
+        self.start = None
+        self.end = None
+        self.next_frame = None
+
+    def render(self):
+        """
+        Render a frame, in real time mode wait until the next frame is due.
+        """
+        start = time.perf_counter()
+        if self.start is None:
+            self.start = self.next_frame = start
+        self.render_window.Render()
+        self.end = time.perf_counter()
+        self.frame_times.append(self.end - start)
+        if self.real_time:
+            self.next_frame = max(self.next_frame + self.frame_interval, self.end)
+            time.sleep(self.next_frame - self.end)
+
+    def report(self):
+        if not self.frame_times:
+            return
+        n = len(self.frame_times)
+        elapsed = self.end - self.start
+        print(f'Rendered {n} frames in {elapsed:0.2f}s ({n / elapsed:0.1f} fps),'
+              f' render time per frame: mean {sum(self.frame_times) / n * 1000:0.1f}ms,'
+              f' max {max(self.frame_times) * 1000:0.1f}ms.')
 
 
 def main():
-    colors = vtk.vtkNamedColors()
+    offscreen = get_program_parameters()
+
+    colors = vtkNamedColors()
 
     # Create a sphere
-    sphereSource = vtk.vtkSphereSource()
+    sphereSource = vtkSphereSource()
     sphereSource.SetCenter(0.0, 0.0, 0.0)
     sphereSource.SetRadius(2)
     sphereSource.SetPhiResolution(30)
     sphereSource.SetThetaResolution(30)
 
     # Create a mapper and actor
-    mapper = vtk.vtkPolyDataMapper()
+    mapper = vtkPolyDataMapper()
     mapper.SetInputConnection(sphereSource.GetOutputPort())
-    actor = vtk.vtkActor()
+    actor = vtkActor()
     actor.GetProperty().SetColor(colors.GetColor3d("Peacock"))
     actor.GetProperty().SetSpecular(0.6)
     actor.GetProperty().SetSpecularPower(30)
@@ -43,13 +128,15 @@ def main():
     # actor.SetPosition(-5, -5, 0)
 
     # Setup a renderer, render window, and interactor
-    renderer = vtk.vtkRenderer()
+    renderer = vtkRenderer()
     renderer.SetBackground(colors.GetColor3d("MistyRose"))
-    renderWindow = vtk.vtkRenderWindow()
+    renderWindow = vtkRenderWindow()
     renderWindow.SetWindowName("Animation")
     renderWindow.AddRenderer(renderer)
+    if offscreen:
+        renderWindow.SetOffScreenRendering(1)
 
-    renderWindowInteractor = vtk.vtkRenderWindowInteractor()
+    renderWindowInteractor = vtkRenderWindowInteractor()
     renderWindowInteractor.SetRenderWindow(renderWindow)
 
     # Add the actor to the scene
@@ -60,13 +147,22 @@ def main():
     renderer.GetActiveCamera().Zoom(0.8)
     renderWindow.Render()
 
+    frame_rate = 30
+    # The timer shows the frames at the frame rate, so the driver only times them.
+    driver = AnimationDriver(renderWindow, frame_rate=frame_rate, real_time=False)
+    cb = vtkTimerCallback(200, actor, driver)
+    if offscreen:
+        for i in range(0, cb.steps):
+            cb.step()
+        driver.report()
+        return
+
     # Initialize must be called prior to creating timer events.
     renderWindowInteractor.Initialize()
 
     # Sign up to receive TimerEvent
-    cb = vtkTimerCallback(200, actor, renderWindowInteractor)
     renderWindowInteractor.AddObserver('TimerEvent', cb.execute)
-    cb.timerId = renderWindowInteractor.CreateRepeatingTimer(500)
+    cb.timerId = renderWindowInteractor.CreateRepeatingTimer(1000 // frame_rate)
 
     # start the interaction and timer
     renderWindow.Render()
@@ -5,7 +5,12 @@ from __future__ import print_function
 
 import sys
 
-import vtk
+from vtkmodules.vtkCommonColor import vtkColorSeries
+from vtkmodules.vtkCommonCore import (
+    vtkLookupTable,
+    vtkVariant,
+    vtkVariantArray
+)
 
 
 class LUTUtilities(object):
@@ -172,7 +177,7 @@ def GetAllColorSchemes():
     :return: a map of the names keyed on their index.
     '''
     colorSchemes = dict()
-    colorSeries = vtk.vtkColorSeries()
+    colorSeries = vtkColorSeries()
     for i in range(colorSeries.GetNumberOfColorSchemes()):
         colorSeries.SetColorScheme(i)
         colorSchemes[i] = colorSeries.GetColorSchemeName()
@@ -238,9 +243,9 @@ def TestLookupTables(lutMode):
     :param: lutMode - if True the tables are ordinal, categorical otherwise.
     :return: True if all tests passed.
     '''
-    lut1 = vtk.vtkLookupTable()
-    lut2 = vtk.vtkLookupTable()
-    colorSeries = vtk.vtkColorSeries()
+    lut1 = vtkLookupTable()
+    lut2 = vtkLookupTable()
+    colorSeries = vtkColorSeries()
     colorSeriesEnum = colorSeries.SPECTRUM
     colorSeries.SetColorScheme(colorSeriesEnum)
 
@@ -253,13 +258,13 @@ def TestLookupTables(lutMode):
     lut2.SetNanColor(1, 0, 0, 1)
     if not lutMode:
         # For the annotation just use a letter of the alphabet.
-        values1 = vtk.vtkVariantArray()
-        values2 = vtk.vtkVariantArray()
+        values1 = vtkVariantArray()
+        values2 = vtkVariantArray()
         str = "abcdefghijklmnopqrstuvwxyz"
         for i in range(lut1.GetNumberOfTableValues()):
-            values1.InsertNextValue(vtk.vtkVariant(str[i]))
+            values1.InsertNextValue(vtkVariant(str[i]))
         for i in range(lut2.GetNumberOfTableValues()):
-            values2.InsertNextValue(vtk.vtkVariant(str[i]))
+            values2.InsertNextValue(vtkVariant(str[i]))
         for i in range(values1.GetNumberOfTuples()):
             lut1.SetAnnotation(i, values1.GetValue(i).ToString())
         for i in range(values2.GetNumberOfTuples()):
@@ -285,7 +290,7 @@ def TestLookupTables(lutMode):
         # Different color
         colorSeriesEnum = colorSeries.COOL
         colorSeries.SetColorScheme(colorSeriesEnum)
-        lut3 = vtk.vtkLookupTable()
+        lut3 = vtkLookupTable()
         colorSeries.BuildLookupTable(lut3)
         lut3.IndexedLookupOff()
         res &= TestTables(lut1, lut3, False)
@@ -298,12 +303,12 @@ def TestLookupTables(lutMode):
         # Different color
         colorSeriesEnum = colorSeries.COOL
         colorSeries.SetColorScheme(colorSeriesEnum)
-        lut3 = vtk.vtkLookupTable()
+        lut3 = vtkLookupTable()
         colorSeries.BuildLookupTable(lut3)
-        values = vtk.vtkVariantArray()
+        values = vtkVariantArray()
         str = "abcdefghijklmnopqrstuvwxyz"
         for i in range(lut3.GetNumberOfTableValues()):
-            values.InsertNextValue(vtk.vtkVariant(str[i]))
+            values.InsertNextValue(vtkVariant(str[i]))
         for i in range(values.GetNumberOfTuples()):
             lut3.SetAnnotation(i, values.GetValue(i).ToString())
         colorSeries.BuildLookupTable(lut3)
@@ -3,12 +3,13 @@
 import json
 import os
 import random
+import sqlite3
 import tempfile
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from urllib.error import HTTPError
-from urllib.request import urlretrieve
+from urllib.request import Request, urlopen
 
 
 def get_program_parameters():
@@ -16,18 +17,38 @@ def get_program_parameters():
     description = 'Get examples that use a particular VTK class for a given language.'
     epilogue = '''
 The JSON file is obtained from the gh-pages branch of the vtk-examples GitHub site.
-It is stored in your tempfile directory.
+It is converted into an indexed SQLite database that is stored in your tempfile directory.
+
+The database is checked for changes on the site if it is more than ten minutes old,
+   the JSON file is only downloaded if it has changed.
+   If the site cannot be reached, the existing database is used and the site is not
+   checked again for ten minutes.
+   Use -o to work offline and -r to force a refresh.
+
+Several VTK classes or languages can be selected by separating them with commas e.g.:
+   SelectExamples.py vtkActor,vtkCamera Cxx,Python
+Use -e to find the VTK classes used by one or more examples e.g.:
+   SelectExamples.py -e Cone,CylinderExample
+   SelectExamples.py -e Cone Python
 '''
     parser = argparse.ArgumentParser(description=description, epilog=epilogue,
                                      formatter_class=argparse.RawTextHelpFormatter)
-    parser.add_argument('vtk_class', help='The desired VTK class.')
-    parser.add_argument('language', help='The desired language.')
+    parser.add_argument('vtk_class', nargs='?', default=None, help='The desired VTK class(es).')
+    parser.add_argument('language', nargs='?', default=None, help='The desired language(s).')
     parser.add_argument('-a', '--all_values', action="store_true",
                         help='All examples (Warning: Can be a very long list).')
     parser.add_argument('-n', '--number', type=int, default=5, help='The maximum number of examples.')
+    parser.add_argument('-e', '--examples', default=None, help='List the VTK classes used by these example(s).')
+    parser.add_argument('-o', '--offline', action="store_true", help='Do not check the site for a newer file.')
+    parser.add_argument('-r', '--refresh', action="store_true", help='Force a refresh from the site.')
 
     args = parser.parse_args()
-    return args.vtk_class, args.language, args.all_values, args.number
+    if args.examples is None and (args.vtk_class is None or args.language is None):
+        parser.error('Specify a VTK class and a language or use -e to specify the examples.')
+    if args.examples is not None and args.language is None:
+        # Only the language(s) can be given with -e.
+        args.vtk_class, args.language = None, args.vtk_class
+    return args.vtk_class, args.language, args.all_values, args.number, args.examples, args.offline, args.refresh
 
 
 @dataclass(frozen=True)
@@ -39,46 +60,174 @@ class Links:
         'https://raw.githubusercontent.com/Kitware/vtk-examples/gh-pages/src/Coverage/vtk_vtk-examples_xref.json'
 
 
-def download_file(dl_path, dl_url, overwrite=False):
+def split_values(s):
+    """
+    Split a comma separated string, removing any duplicates.
+
+    :param s: The string.
+    :return: The values in the order they were given.
+    """
+    res = list()
+    for v in s.split(','):
+        v = v.strip()
+        if v and v not in res:
+            res.append(v)
+    return res
+
+
+def fetch_file(dl_url, etag=None, last_modified=None):
     """
-    Use the URL to get a file.
+    Use the URL to get a file if it has changed.
 
-    :param dl_path: The path to download the file to.
     :param dl_url: The URL of the file.
-    :param overwrite: If true, do a download even if the file exists.
-    :return: The path to the file as a pathlib Path.
+    :param etag: The ETag of the copy we have.
+    :param last_modified: The Last-Modified date of the copy we have.
+    :return: The contents, ETag and Last-Modified date, the contents are None if the file has not changed.
+    """
+    request = Request(dl_url)
+    if etag:
+        request.add_header('If-None-Match', etag)
+    if last_modified:
+        request.add_header('If-Modified-Since', last_modified)
+    try:
+        with urlopen(request) as response:
+            return response.read(), response.headers.get('ETag'), response.headers.get('Last-Modified')
+    except HTTPError as e:
+        if e.code == 304:
+            return None, etag, last_modified
+        raise RuntimeError(f'Failed to download {dl_url}. {e.reason}')
+
+
+def build_index(db_path, xref_dict, etag, last_modified):
+    """
+    Build the SQLite database from the cross reference dictionary.
+
+    The database is written to a temporary file that then replaces any existing database.
+
+    :param db_path: The path to the database.
+    :param xref_dict: The dictionary of [vtk class][language][example] = link.
+    :param etag: The ETag of the JSON file.
+    :param last_modified: The Last-Modified date of the JSON file.
+    :return:
+    """
+    tmp_path = Path(str(db_path) + '.tmp')
+    if tmp_path.is_file():
+        tmp_path.unlink()
+    con = sqlite3.connect(str(tmp_path))
+    con.executescript('''
+        CREATE TABLE xref (vtk_class TEXT, language TEXT, example TEXT, link TEXT);
+        CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+    ''')
+    rows = list()
+    for vtk_class, languages in xref_dict.items():
+        for lang, examples in languages.items():
+            # VTKLink is the link to the VTK class documentation.
+            if lang == 'VTKLink':
+                continue
+            rows.extend((vtk_class, lang, example, link) for example, link in examples.items())
+    con.executemany('INSERT INTO xref VALUES (?, ?, ?, ?)', rows)
+    con.executescript('''
+        CREATE INDEX xref_class ON xref (vtk_class, language);
+        CREATE INDEX xref_example ON xref (example, language);
+    ''')
+    set_meta(con, etag=etag, last_modified=last_modified, checked=datetime.today().timestamp())
+    con.commit()
+    con.close()
+    os.replace(tmp_path, db_path)
+
+
+def get_meta(con, key):
+    row = con.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+    return row[0] if row else None
+
+
+def set_meta(con, **kwargs):
+    con.executemany('INSERT OR REPLACE INTO meta VALUES (?, ?)',
+                    [(k, None if v is None else str(v)) for k, v in kwargs.items()])
+
+
+def set_checked(db_path):
+    """
+    Record the time that the site was checked.
+
+    :param db_path: The path to the database.
+    """
+    con = sqlite3.connect(str(db_path))
+    try:
+        set_meta(con, checked=datetime.today().timestamp())
+        con.commit()
+    except sqlite3.DatabaseError:
+        pass
+    finally:
+        con.close()
+
+
+def open_index(db_path, xref_url, offline=False, refresh=False, max_age=600):
+    """
+    Open the database, refreshing it if needed.
+
+    If the database is older than max_age seconds, the site is checked and the JSON file
+     is only downloaded and indexed if it has changed.
+    If the site cannot be reached, the existing database is used.
+
+    :param db_path: The path to the database.
+    :param xref_url: The URL of the JSON cross reference file.
+    :param offline: If true, do not check the site.
+    :param refresh: If true, download and index the JSON file.
+    :param max_age: The time in seconds before the site is checked for changes.
+    :return: The connection to the database or None if there is no database.
     """
-    file_name = dl_url.split('/')[-1]
+    etag = last_modified = None
+    checked = 0.0
+    if Path(db_path).is_file():
+        con = sqlite3.connect(str(db_path))
+        try:
+            etag = get_meta(con, 'etag')
+            last_modified = get_meta(con, 'last_modified')
+            checked = float(get_meta(con, 'checked') or 0)
+        except sqlite3.DatabaseError:
+            refresh = True
+        con.close()
+    else:
+        refresh = True
 
-    # Create necessary sub-directories in the dl_path
-    # (if they don't exist).
-    Path(dl_path).mkdir(parents=True, exist_ok=True)
-    # Download if it doesn't exist in the directory overriding if overwrite is True.
-    path = Path(dl_path, file_name)
-    if not path.is_file() or overwrite:
+    if not offline and (refresh or datetime.today().timestamp() - checked > max_age):
         try:
-            urlretrieve(dl_url, path)
-        except HTTPError as e:
-            raise RuntimeError(f'Failed to download {dl_url}. {e.reason}')
-    return path
+            if refresh:
+                data, etag, last_modified = fetch_file(xref_url)
+            else:
+                data, etag, last_modified = fetch_file(xref_url, etag, last_modified)
+            if data is None:
+                set_checked(db_path)
+            else:
+                build_index(db_path, json.loads(data), etag, last_modified)
+        except (RuntimeError, OSError, ValueError) as e:
+            # URLError and socket timeouts are OSErrors, a truncated JSON file raises a ValueError.
+            print(f'Unable to refresh the examples, using the existing ones. {e}')
+            # Wait max_age seconds before trying again.
+            if Path(db_path).is_file():
+                set_checked(db_path)
+
+    if not Path(db_path).is_file():
+        return None
+    return sqlite3.connect(str(db_path))
 
 
-def get_examples(d, vtk_class, lang, all_values=False, number=5, ):
+def get_examples(con, vtk_class, lang, all_values=False, number=5, ):
     """
     For the VTK Class and language return the
      total number of examples and a list of examples.
 
-    :param d: The dictionary.
+    :param con: The connection to the database.
     :param vtk_class: The VTK Class e.g. vtkActor.
     :param lang: The language, e.g. Cxx.
     :param all_values: True if all examples are needed.
     :param number: The number of values.
     :return: Total number of examples and a list of examples.
     """
-    try:
-        kv = d[vtk_class][lang].items()
-    except KeyError as e:
-        # print(f'For the combination {vtk_class} and {lang}, this key does not exist: {e}')
+    kv = con.execute('SELECT example, link FROM xref WHERE vtk_class = ? AND language = ?',
+                     (vtk_class, lang)).fetchall()
+    if not kv:
         return None, None
     total = len(kv)
     if len(kv) > number:
@@ -92,40 +241,76 @@ def get_examples(d, vtk_class, lang, all_values=False, number=5, ):
     return total, [f'{s[1]}' for s in samples]
 
 
+def get_classes(con, example, lang=None):
+    """
+    For the example return the VTK classes that it uses.
+
+    :param con: The connection to the database.
+    :param example: The example name e.g. Cone.
+    :param lang: The language, e.g. Cxx, if None all languages are searched.
+    :return: A dictionary of [link to the example][vtk classes ...].
+    """
+    if lang is None:
+        rows = con.execute('SELECT link, vtk_class FROM xref WHERE example = ? ORDER BY link, vtk_class',
+                           (example,))
+    else:
+        rows = con.execute(
+            'SELECT link, vtk_class FROM xref WHERE example = ? AND language = ? ORDER BY link, vtk_class',
+            (example, lang))
+    res = dict()
+    for link, vtk_class in rows:
+        res.setdefault(link, list()).append(vtk_class)
+    return res
+
+
 def main():
-    vtk_class, language, all_values, number = get_program_parameters()
-    language = language.lower()
+    vtk_class, language, all_values, number, examples, offline, refresh = get_program_parameters()
     available_languages = {k.lower(): k for k in ['CSharp', 'Cxx', 'Java', 'Python']}
-    if language not in available_languages:
-        print(f'The language: {language} is not available.')
-        tmp = ', '.join([lang for lang in available_languages.values()])
-        print(f'Choose one of these: {tmp}.')
-        return
-    else:
-        language = available_languages[language]
-    tmp_dir = tempfile.gettempdir()
-    path = download_file(tmp_dir, Links.xref_url, overwrite=False)
-    if not path.is_file():
+    languages = list()
+    if language is not None:
+        for lang in split_values(language.lower()):
+            if lang not in available_languages:
+                print(f'The language: {lang} is not available.')
+                tmp = ', '.join([lang for lang in available_languages.values()])
+                print(f'Choose one of these: {tmp}.')
+                return
+            languages.append(available_languages[lang])
+
+    path = Path(tempfile.gettempdir(), 'vtk_vtk-examples_xref.db')
+    con = open_index(path, Links.xref_url, offline=offline, refresh=refresh)
+    if con is None:
         print(f'The path: {str(path)} does not exist.')
         return
-    dt = datetime.today().timestamp() - os.path.getmtime(path)
-    # Force a new download if the time difference is > 10 minutes.
-    if dt > 600:
-        path = download_file(tmp_dir, Links.xref_url, overwrite=True)
-    with open(path) as json_file:
-        xref_dict = json.load(json_file)
-
-    total_number, examples = get_examples(xref_dict, vtk_class, language, all_values=all_values, number=number)
-    if examples:
-        if total_number <= number or all_values:
-            print(f'VTK Class: {vtk_class}, language: {language}\n'
-                  f'Number of example(s): {total_number}.')
-        else:
-            print(f'VTK Class: {vtk_class}, language: {language}\n'
-                  f'Number of example(s): {total_number} with {number} random sample(s) shown.')
-        print('\n'.join(examples))
-    else:
-        print(f'No examples for the VTK Class: {vtk_class} and language: {language}')
+
+    if examples is not None:
+        for example in split_values(examples):
+            found = dict()
+            for lang in (languages if languages else [None]):
+                found.update(get_classes(con, example, lang))
+            if found:
+                for link, vtk_classes in found.items():
+                    print(f'Example: {link}\n'
+                          f'Number of VTK class(es): {len(vtk_classes)}.')
+                    print('\n'.join(vtk_classes))
+            else:
+                print(f'No VTK classes for the example: {example}')
+        con.close()
+        return
+
+    for vtk_cls in split_values(vtk_class):
+        for language in languages:
+            total_number, examples = get_examples(con, vtk_cls, language, all_values=all_values, number=number)
+            if examples:
+                if total_number <= number or all_values:
+                    print(f'VTK Class: {vtk_cls}, language: {language}\n'
+                          f'Number of example(s): {total_number}.')
+                else:
+                    print(f'VTK Class: {vtk_cls}, language: {language}\n'
+                          f'Number of example(s): {total_number} with {number} random sample(s) shown.')
+                print('\n'.join(examples))
+            else:
+                print(f'No examples for the VTK Class: {vtk_cls} and language: {language}')
+    con.close()
 
 
 if __name__ == '__main__':
@@ -1,5 +1,5 @@
 from __future__ import print_function
 
-import vtk
+from vtkmodules.vtkCommonCore import vtkVersion
 
-print(vtk.vtkVersion.GetVTKSourceVersion())
+print(vtkVersion.GetVTKSourceVersion())
@@ -2,7 +2,22 @@ from __future__ import print_function
 
 import sys
 
-import vtk
+from vtkmodules.util.vtkVariant import (
+    vtkVariantCast,
+    vtkVariantCreate,
+    vtkVariantEqual,
+    vtkVariantExtract,
+    vtkVariantLessThan,
+    vtkVariantStrictEquality,
+    vtkVariantStrictWeakOrder,
+    vtkVariantStrictWeakOrderKey
+)
+from vtkmodules.vtkCommonCore import (
+    VTK_UNSIGNED_SHORT,
+    vtkStringArray,
+    vtkVariant,
+    vtkVariantArray
+)
 
 # Unicode string for demonstration (etre with circumflex)
 if sys.hexversion >= 0x03000000:
@@ -15,28 +30,28 @@ else:
 #
 
 # Default constructor
-v = vtk.vtkVariant()
+v = vtkVariant()
 print("Invalid variant: %r, '%s'" % (v, v.GetTypeAsString()))
 
 # Copy constructor
-v = vtk.vtkVariant(vtk.vtkVariant("variant"))
+v = vtkVariant(vtkVariant("variant"))
 print("Copied variant: %r, '%s'" % (v, v.GetTypeAsString()))
 
 # Conversion constructors
-v = vtk.vtkVariant(1)
+v = vtkVariant(1)
 print("Integer variant: %r, '%s'" % (v, v.GetTypeAsString()))
-v = vtk.vtkVariant(1.0)
+v = vtkVariant(1.0)
 print("Float variant: %r, '%s'" % (v, v.GetTypeAsString()))
-v = vtk.vtkVariant("hello")
+v = vtkVariant("hello")
 print("String variant: %r, '%s'" % (v, v.GetTypeAsString()))
-v = vtk.vtkVariant(unicodeEtre)
+v = vtkVariant(unicodeEtre)
 print("Unicode variant: %r, '%s'" % (v, v.GetTypeAsString()))
-v = vtk.vtkVariant(vtk.vtkStringArray())
+v = vtkVariant(vtkStringArray())
 print("Object variant: %r, '%s'" % (v, v.GetTypeAsString()))
 
 # Explicit type constructor
-v1 = vtk.vtkVariant(1, vtk.VTK_UNSIGNED_SHORT)
-v2 = vtk.vtkVariant(2, v1.GetType())
+v1 = vtkVariant(1, VTK_UNSIGNED_SHORT)
+v2 = vtkVariant(2, v1.GetType())
 print("UShort variant: %r, '%s'" % (v2, v2.GetTypeAsString()))
 
 # Type checking
@@ -52,34 +67,34 @@ i = v2.ToInt()
 print("Int value: %i, %s" % (i, type(i)))
 
 # Automatic argument conversion
-a = vtk.vtkVariantArray()
-a.InsertNextValue(vtk.vtkVariant())
+a = vtkVariantArray()
+a.InsertNextValue(vtkVariant())
 a.InsertNextValue(1)
 a.InsertNextValue(2.0)
 a.InsertNextValue("hello")
 a.InsertNextValue(unicodeEtre)
-a.InsertNextValue(vtk.vtkVariantArray())
+a.InsertNextValue(vtkVariantArray())
 print("Variant array:")
 for i in range(a.GetNumberOfValues()):
     v = a.GetValue(i)
     print("%i: %r, '%s'" % (i, v, v.GetTypeAsString()))
 
 # Comparison
-if v2 == vtk.vtkVariant(2):
+if v2 == vtkVariant(2):
     print("v2 is equal to 2")
-if v2 > vtk.vtkVariant(1):
+if v2 > vtkVariant(1):
     print("v2 is greater than 1")
-if v2 < vtk.vtkVariant(3):
+if v2 < vtkVariant(3):
     print("v2 is less than 3")
-if v2 == vtk.vtkVariant("2"):
+if v2 == vtkVariant("2"):
     print("v2 is equal to '2'")
 
 # Use as a dict key (hashed as a string)
 d = {}
-d[vtk.vtkVariant(1)] = 0
-d[vtk.vtkVariant('1')] = 1
-d[vtk.vtkVariant()] = 3
-print("Index is %i" % d[vtk.vtkVariant(1.0)])
+d[vtkVariant(1)] = 0
+d[vtkVariant('1')] = 1
+d[vtkVariant()] = 3
+print("Index is %i" % d[vtkVariant(1.0)])
 
 #
 # Extra functionality from vtk.util.vtkVariant
@@ -90,23 +105,23 @@ print("Index is %i" % d[vtk.vtkVariant(1.0)])
 #      vtkVariantCreate(1, 'unsigned int')
 
 # Creation
-v = vtk.vtkVariantCreate(1, 'unsigned int')
+v = vtkVariantCreate(1, 'unsigned int')
 
 # Value extraction
-v = vtk.vtkVariant(6.0)
-f = vtk.vtkVariantExtract(v)
+v = vtkVariant(6.0)
+f = vtkVariantExtract(v)
 
 # Value extraction with type specified
-f = vtk.vtkVariantExtract(v, 'double')
+f = vtkVariantExtract(v, 'double')
 
 # Casting a variant
-v = vtk.vtkVariant("10")
-i = vtk.vtkVariantCast(v, 'int')
+v = vtkVariant("10")
+i = vtkVariantCast(v, 'int')
 print("Valid cast result: %r" % i)
 
 # A failed cast returns None
-v = vtk.vtkVariant("hello")
-i = vtk.vtkVariantCast(v, 'int')
+v = vtkVariant("hello")
+i = vtkVariantCast(v, 'int')
 print("Invalid cast result: %r" % i)
 
 #
@@ -118,23 +133,23 @@ print("Invalid cast result: %r" % i)
 # return values are -1, 0, 1 like the Python 2 "cmp()" method.  This is
 # in contrast with the Python 3 and C++ versions of this function, which
 # check if (v1 < v2) and return True or False.
-v1 = vtk.vtkVariant(10)
-v2 = vtk.vtkVariant("10")
-r = vtk.vtkVariantStrictWeakOrder(v1, v2)
+v1 = vtkVariant(10)
+v2 = vtkVariant("10")
+r = vtkVariantStrictWeakOrder(v1, v2)
 print("Strict weak order (10, '10') ->", r)
 
 # Sorting by strict weak order, using a key function:
-unsorted = [1, 2.5, vtk.vtkVariant(), "0", unicodeEtre]
-l = [vtk.vtkVariant(x) for x in unsorted]
-l.sort(key=vtk.vtkVariantStrictWeakOrderKey)
+unsorted = [1, 2.5, vtkVariant(), "0", unicodeEtre]
+l = [vtkVariant(x) for x in unsorted]
+l.sort(key=vtkVariantStrictWeakOrderKey)
 print("Sort by weak order ->", l)
 
 # Check two variants for strict equality of type and value.
-b = vtk.vtkVariantStrictEquality(v1, v2)
+b = vtkVariantStrictEquality(v1, v2)
 print("Strict equality (10, '10') -> %s" % b)
 
 # Two special-purpose methods.
 # First is identical to (v1 < v2)
-b = vtk.vtkVariantLessThan(v1, v2)
+b = vtkVariantLessThan(v1, v2)
 # Second is identical to (v1 == v2)
-b = vtk.vtkVariantEqual(v1, v2)
+b = vtkVariantEqual(v1, v2)
@@ -3,98 +3,121 @@
 '''
 '''
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonTransforms import vtkTransform
+from vtkmodules.vtkFiltersCore import (
+    vtkAppendPolyData,
+    vtkContourFilter,
+    vtkPolyDataNormals
+)
+from vtkmodules.vtkFiltersGeneral import vtkTransformPolyDataFilter
+from vtkmodules.vtkFiltersHybrid import vtkImplicitModeller
+from vtkmodules.vtkIOLegacy import vtkPolyDataReader
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkPolyDataMapper,
+    vtkProperty,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
 
 
 def main():
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
     fileName1, fileName2, fileName3 = get_program_parameters()
-    aRenderer = vtk.vtkRenderer()
-    aRenderWindow = vtk.vtkRenderWindow()
+    aRenderer = vtkRenderer()
+    aRenderWindow = vtkRenderWindow()
     aRenderWindow.AddRenderer(aRenderer)
-    anInteractor = vtk.vtkRenderWindowInteractor()
+    anInteractor = vtkRenderWindowInteractor()
     anInteractor.SetRenderWindow(aRenderWindow)
     aRenderWindow.SetSize(300, 300)
     aRenderWindow.SetWindowName('BlobbyLogo')
 
     # Read the geometry file containing the letter v.
-    letterV = vtk.vtkPolyDataReader()
+    letterV = vtkPolyDataReader()
     letterV.SetFileName(fileName1)
 
     # Read the geometry file containing the letter t.
-    letterT = vtk.vtkPolyDataReader()
+    letterT = vtkPolyDataReader()
     letterT.SetFileName(fileName2)
 
     # Read the geometry file containing the letter k.
-    letterK = vtk.vtkPolyDataReader()
+    letterK = vtkPolyDataReader()
     letterK.SetFileName(fileName3)
 
     # Create a transform and transform filter for each letter.
-    VTransform = vtk.vtkTransform()
-    VTransformFilter = vtk.vtkTransformPolyDataFilter()
+    VTransform = vtkTransform()
+    VTransformFilter = vtkTransformPolyDataFilter()
     VTransformFilter.SetInputConnection(letterV.GetOutputPort())
     VTransformFilter.SetTransform(VTransform)
 
-    TTransform = vtk.vtkTransform()
-    TTransformFilter = vtk.vtkTransformPolyDataFilter()
+    TTransform = vtkTransform()
+    TTransformFilter = vtkTransformPolyDataFilter()
     TTransformFilter.SetInputConnection(letterT.GetOutputPort())
     TTransformFilter.SetTransform(TTransform)
 
-    KTransform = vtk.vtkTransform()
-    KTransformFilter = vtk.vtkTransformPolyDataFilter()
+    KTransform = vtkTransform()
+    KTransformFilter = vtkTransformPolyDataFilter()
     KTransformFilter.SetInputConnection(letterK.GetOutputPort())
     KTransformFilter.SetTransform(KTransform)
 
     # Now append them all.
-    appendAll = vtk.vtkAppendPolyData()
+    appendAll = vtkAppendPolyData()
     appendAll.AddInputConnection(VTransformFilter.GetOutputPort())
     appendAll.AddInputConnection(TTransformFilter.GetOutputPort())
     appendAll.AddInputConnection(KTransformFilter.GetOutputPort())
 
     # Create normals.
-    logoNormals = vtk.vtkPolyDataNormals()
+    logoNormals = vtkPolyDataNormals()
     logoNormals.SetInputConnection(appendAll.GetOutputPort())
     logoNormals.SetFeatureAngle(60)
 
     # Map to rendering primitives.
-    logoMapper = vtk.vtkPolyDataMapper()
+    logoMapper = vtkPolyDataMapper()
     logoMapper.SetInputConnection(logoNormals.GetOutputPort())
 
     # Now an actor.
-    logo = vtk.vtkActor()
+    logo = vtkActor()
     logo.SetMapper(logoMapper)
 
     # Now create an implicit model of the same letter.
-    blobbyLogoImp = vtk.vtkImplicitModeller()
+    blobbyLogoImp = vtkImplicitModeller()
     blobbyLogoImp.SetInputConnection(appendAll.GetOutputPort())
     blobbyLogoImp.SetMaximumDistance(.075)
     blobbyLogoImp.SetSampleDimensions(64, 64, 64)
     blobbyLogoImp.SetAdjustDistance(0.05)
 
     # Extract an iso surface.
-    blobbyLogoIso = vtk.vtkContourFilter()
+    blobbyLogoIso = vtkContourFilter()
     blobbyLogoIso.SetInputConnection(blobbyLogoImp.GetOutputPort())
     blobbyLogoIso.SetValue(1, 1.5)
 
     # Map to rendering primitives.
-    blobbyLogoMapper = vtk.vtkPolyDataMapper()
+    blobbyLogoMapper = vtkPolyDataMapper()
     blobbyLogoMapper.SetInputConnection(blobbyLogoIso.GetOutputPort())
     blobbyLogoMapper.ScalarVisibilityOff()
 
-    tomato = vtk.vtkProperty()
+    tomato = vtkProperty()
     tomato.SetDiffuseColor(colors.GetColor3d('tomato'))
     tomato.SetSpecular(.3)
     tomato.SetSpecularPower(20)
 
-    banana = vtk.vtkProperty()
+    banana = vtkProperty()
     banana.SetDiffuseColor(colors.GetColor3d('banana'))
     banana.SetDiffuse(.7)
     banana.SetSpecular(.4)
     banana.SetSpecularPower(20)
 
     # Now an actor.
-    blobbyLogo = vtk.vtkActor()
+    blobbyLogo = vtkActor()
     blobbyLogo.SetMapper(blobbyLogoMapper)
     blobbyLogo.SetProperty(banana)
 
@@ -1,8 +1,39 @@
 #!/usr/bin/env python
 
+import queue
+import threading
 import time
+from fractions import Fraction
+from pathlib import Path
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonDataModel import vtkImageData
+from vtkmodules.vtkCommonMath import vtkMatrix4x4
+from vtkmodules.vtkCommonTransforms import vtkTransform
+from vtkmodules.vtkFiltersModeling import vtkCollisionDetectionFilter
+from vtkmodules.vtkFiltersSources import vtkSphereSource
+from vtkmodules.vtkIOImage import vtkPNGWriter
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer,
+    vtkTextActor,
+    vtkWindowToImageFilter
+)
+
+try:
+    import numpy as np
+    from vtkmodules.util import numpy_support
+except ModuleNotFoundError:
+    np = None
 
 
 def get_program_parameters():
@@ -20,35 +51,41 @@ Three collision modes are available and can be set as the first argument on the
 2. First contact (1) quickly find the first contact point.
 3. Half contacts (2) finds all the contacting cell pairs with one points per collision.
 
+Use -f to record the animation, e.g. -f collision.y4m for a YUV4MPEG2 stream (needs NumPy)
+ or -f collision.png for the PNG files collision0000.png, collision0001.png, ...
+Use -o to render offscreen as fast as possible e.g. to record the animation.
+
     '''
     parser = argparse.ArgumentParser(description=description, epilog=epilogue,
                                      formatter_class=argparse.RawDescriptionHelpFormatter)
     parser.add_argument('contactMode', nargs='?', default=0, type=int, help='Contact mode 0 (default), 1, or 2.')
+    parser.add_argument('-f', '--frames', default=None, help='Record the animation to this file.')
+    parser.add_argument('-o', '--offscreen', action='store_true', help='Render offscreen as fast as possible.')
     args = parser.parse_args()
-    return args.contactMode
+    return args.contactMode, args.frames, args.offscreen
 
 
 def main():
-    contactMode = get_program_parameters()
+    contactMode, frames, offscreen = get_program_parameters()
 
     # Define colors
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
-    sphere0 = vtk.vtkSphereSource()
+    sphere0 = vtkSphereSource()
     sphere0.SetRadius(0.29)
     sphere0.SetPhiResolution(31)
     sphere0.SetThetaResolution(31)
     sphere0.SetCenter(0.0, 0, 0)
 
-    sphere1 = vtk.vtkSphereSource()
+    sphere1 = vtkSphereSource()
     sphere1.SetPhiResolution(30)
     sphere1.SetThetaResolution(30)
     sphere1.SetRadius(0.3)
 
-    matrix1 = vtk.vtkMatrix4x4()
-    transform0 = vtk.vtkTransform()
+    matrix1 = vtkMatrix4x4()
+    transform0 = vtkTransform()
 
-    collide = vtk.vtkCollisionDetectionFilter()
+    collide = vtkCollisionDetectionFilter()
     collide.SetInputConnection(0, sphere0.GetOutputPort())
     collide.SetTransform(0, transform0)
     collide.SetInputConnection(1, sphere1.GetOutputPort())
@@ -65,37 +102,37 @@ def main():
     collide.GenerateScalarsOn()
 
     # Visualize
-    mapper1 = vtk.vtkPolyDataMapper()
+    mapper1 = vtkPolyDataMapper()
     mapper1.SetInputConnection(collide.GetOutputPort(0))
     mapper1.ScalarVisibilityOff()
-    actor1 = vtk.vtkActor()
+    actor1 = vtkActor()
     actor1.SetMapper(mapper1)
     actor1.GetProperty().BackfaceCullingOn()
     actor1.SetUserTransform(transform0)
     actor1.GetProperty().SetDiffuseColor(colors.GetColor3d("Tomato"))
     actor1.GetProperty().SetRepresentationToWireframe()
 
-    mapper2 = vtk.vtkPolyDataMapper()
+    mapper2 = vtkPolyDataMapper()
     mapper2.SetInputConnection(collide.GetOutputPort(1))
 
-    actor2 = vtk.vtkActor()
+    actor2 = vtkActor()
     actor2.SetMapper(mapper2)
     actor2.GetProperty().BackfaceCullingOn()
     actor2.SetUserMatrix(matrix1)
 
-    mapper3 = vtk.vtkPolyDataMapper()
+    mapper3 = vtkPolyDataMapper()
     mapper3.SetInputConnection(collide.GetContactsOutputPort())
     mapper3.SetResolveCoincidentTopologyToPolygonOffset()
 
-    actor3 = vtk.vtkActor()
+    actor3 = vtkActor()
     actor3.SetMapper(mapper3)
     actor3.GetProperty().SetColor(colors.GetColor3d("Black"))
     actor3.GetProperty().SetLineWidth(3.0)
 
-    txt = vtk.vtkTextActor()
+    txt = vtkTextActor()
     txt.GetTextProperty().SetFontSize(18)
 
-    renderer = vtk.vtkRenderer()
+    renderer = vtkRenderer()
     renderer.UseHiddenLineRemovalOn()
     renderer.AddActor(actor1)
     renderer.AddActor(actor2)
@@ -104,11 +141,13 @@ def main():
     renderer.SetBackground(colors.GetColor3d("Gray"))
     renderer.UseHiddenLineRemovalOn()
 
-    renderWindow = vtk.vtkRenderWindow()
+    renderWindow = vtkRenderWindow()
     renderWindow.SetSize(640, 480)
     renderWindow.AddRenderer(renderer)
+    if offscreen:
+        renderWindow.SetOffScreenRendering(1)
 
-    interactor = vtk.vtkRenderWindowInteractor()
+    interactor = vtkRenderWindowInteractor()
     interactor.SetRenderWindow(renderWindow)
 
     # Move the first object
@@ -121,6 +160,11 @@ def main():
     renderer.GetActiveCamera().Dolly(1.2)
 
     renderWindow.SetWindowName('CollisionDetection')
+    # The total animation time is 3 seconds.
+    driver = AnimationDriver(renderWindow, frame_rate=numSteps / 3.0)
+    recorder = None
+    if frames:
+        recorder = FrameRecorder(renderWindow, frames, frame_rate=driver.frame_rate)
     renderWindow.Render()
 
     for i in range(0, numSteps):
@@ -129,16 +173,17 @@ def main():
         s = '{:s}: Number of contact cells is {:d}'.format(collide.GetCollisionModeAsString(),
                                                            collide.GetNumberOfContacts())
         txt.SetInput(s)
-        renderWindow.Render()
+        driver.render()
         if collide.GetNumberOfContacts() > 0:
             break
-        # The total animation time is 3 seconds
-        time.sleep(3.0 / numSteps)
+    driver.report()
 
     renderer.ResetCamera()
     renderWindow.Render()
-    renderWindow.Render()
-    interactor.Start()
+    if recorder:
+        recorder.close()
+    if not offscreen:
+        interactor.Start()
     # In Field Data there will be an array named "ContactCells".
     # This array indexes contacting cells (e.g.) index 10 of array 0
     #  points to a cell (triangle) which contacts/intersects a cell
@@ -149,5 +194,203 @@ def main():
     # print(collide.GetOutput(1))
 
 
+class FrameRecorder(object):
+    """
+    Record every frame rendered in a render window.
+
+    When a render finishes, the frame is read back by a vtkWindowToImageFilter that is reused
+     for every frame. The frame is put in a bounded queue and written by background threads,
+     so the render loop only waits for the writing when the queue is full.
+
+    If the file name ends in .y4m, the frames are written as a YUV4MPEG2 stream, this needs NumPy.
+     The stream can be converted with e.g. ffmpeg -i frames.y4m frames.mp4
+    Otherwise the frames are written as a numbered PNG sequence e.g. frames0000.png, frames0001.png, ...
+    """
+
+    def __init__(self, render_window, file_name, frame_rate=30, queue_size=8, workers=2):
+        """
+        :param render_window: The render window.
+        :param file_name: The .y4m file or the prefix of the PNG files.
+        :param frame_rate: The frame rate of the .y4m stream, it does not have to be an integer.
+        :param queue_size: The maximum number of frames waiting to be written.
+        :param workers: The number of threads writing the PNG files.
+        """
+        path = Path(file_name)
+        self.y4m = path.suffix.lower() == '.y4m'
+        if self.y4m and np is None:
+            raise RuntimeError('NumPy is needed to write a .y4m stream.')
+        self.file_name = file_name
+        self.frame_rate = frame_rate
+        self.prefix = str(path.with_suffix(''))
+        self.stream = None
+        self.size = None
+
+        self.window_to_image = vtkWindowToImageFilter()
+        self.window_to_image.SetInput(render_window)
+        # The frame has just been rendered, so read it from the back buffer without rendering again.
+        self.window_to_image.ShouldRerenderOff()
+        self.window_to_image.ReadFrontBufferOff()
+        self.window_to_image.SetInputBufferTypeToRGB()
+
+        self.number_of_frames = 0
+        self.capture_time = 0.0
+        self.paused = False
+        # The first exception raised while writing the frames.
+        self.error = None
+        self.frames = queue.Queue(queue_size)
+        if self.y4m:
+            # The stream is written in order by one thread.
+            workers = 1
+            self.stream = open(file_name, 'wb')
+        self.threads = [threading.Thread(target=self.write_frames, daemon=True) for i in range(workers)]
+        for thread in self.threads:
+            thread.start()
+        self.render_window = render_window
+        self.observer = render_window.AddObserver('EndEvent', self.capture)
+
+    def pause(self):
+        """
+        Stop recording the frames, e.g. while rendering an image that is not part of the animation.
+        """
+        self.paused = True
+
+    def resume(self):
+        self.paused = False
+
+    def capture(self, caller=None, event=None):
+        if self.paused:
+            return
+        if self.error is not None:
+            # Exceptions raised in an observer do not reach the render loop, so report it and stop recording,
+            #  close() raises it.
+            print(f'Recording to {self.file_name} stopped, a frame could not be written: {self.error}')
+            self.render_window.RemoveObserver(self.observer)
+            return
+        start = time.perf_counter()
+        self.window_to_image.Modified()
+        self.window_to_image.Update()
+        # The frame shares the pixels with the filter output, as the frame holds a reference to them,
+        #  the filter allocates new pixels for the next frame instead of overwriting them.
+        frame = vtkImageData()
+        frame.ShallowCopy(self.window_to_image.GetOutput())
+        self.frames.put((self.number_of_frames, frame))
+        self.number_of_frames += 1
+        self.capture_time += time.perf_counter() - start
+
+    def write_frames(self):
+        while True:
+            item = self.frames.get()
+            if item is None:
+                break
+            if self.error is not None:
+                # Keep emptying the queue so that capture() and close() never wait on it.
+                continue
+            index, frame = item
+            try:
+                if self.y4m:
+                    self.write_y4m_frame(frame)
+                else:
+                    file_name = f'{self.prefix}{index:04d}.png'
+                    writer = vtkPNGWriter()
+                    writer.SetFileName(file_name)
+                    writer.SetInputData(frame)
+                    writer.Write()
+                    if writer.GetErrorCode():
+                        raise OSError(f'Cannot write {file_name}.')
+            except Exception as e:
+                self.error = e
+
+    def write_y4m_frame(self, frame):
+        width, height = frame.GetDimensions()[:2]
+        if self.size is None:
+            self.size = (width, height)
+            # The frame rate is written as a ratio, e.g. 100/3 as F100:3.
+            rate = Fraction(self.frame_rate).limit_denominator(1001)
+            self.stream.write(f'YUV4MPEG2 W{width} H{height} F{rate.numerator}:{rate.denominator} Ip A1:1 C444'
+                              f' XCOLORRANGE=FULL\n'.encode('ascii'))
+        elif self.size != (width, height):
+            # The window has been resized, the frame does not fit in the stream.
+            return
+        # The image rows are stored from the bottom up.
+        rgb = numpy_support.vtk_to_numpy(frame.GetPointData().GetScalars()).reshape(height, width, 3)[::-1]
+        rgb = rgb.astype(np.float32)
+        # Full range BT.601 YCbCr.
+        y = rgb @ np.array([0.299, 0.587, 0.114], dtype=np.float32)
+        cb = rgb @ np.array([-0.168736, -0.331264, 0.5], dtype=np.float32) + 128
+        cr = rgb @ np.array([0.5, -0.418688, -0.081312], dtype=np.float32) + 128
+        self.stream.write(b'FRAME\n')
+        for plane in (y, cb, cr):
+            self.stream.write(np.clip(np.rint(plane), 0, 255).astype(np.uint8).tobytes())
+
+    def close(self):
+        """
+        Stop recording and wait for the frames to be written.
+        """
+        self.render_window.RemoveObserver(self.observer)
+        for thread in self.threads:
+            self.frames.put(None)
+        for thread in self.threads:
+            thread.join()
+        if self.stream:
+            self.stream.close()
+        if self.error is not None:
+            raise RuntimeError(f'Recording to {self.file_name} failed: {self.error}') from self.error
+        if self.number_of_frames:
+            print(f'Recorded {self.number_of_frames} frames to {self.file_name},'
+                  f' {self.capture_time / self.number_of_frames * 1000:0.1f}ms per frame in the render loop.')
+
+
+class AnimationDriver(object):
+    """
+    Render the frames of an animation and time them.
+
+    In real time mode the frames are shown at the frame rate, a frame that takes too long
+     delays the rest of the animation rather than frames being dropped, so the same frames
+     are always rendered.
+    When the render window is offscreen, nobody is watching, so the frames are rendered
+     as fast as possible.
+    """
+
+    def __init__(self, render_window, frame_rate=30.0, real_time=None):
+        """
+        :param render_window: The render window.
+        :param frame_rate: The number of frames per second in real time mode.
+        :param real_time: If None, real time mode is used unless the render window is offscreen.
+        """
+        self.render_window = render_window
+        self.frame_rate = frame_rate
+        self.frame_interval = 1.0 / frame_rate
+        if real_time is None:
+            real_time = not render_window.GetOffScreenRendering()
+        self.real_time = real_time
+        self.frame_times = list()
+        self.start = None
+        self.end = None
+        self.next_frame = None
+
+    def render(self):
+        """
+        Render a frame, in real time mode wait until the next frame is due.
+        """
+        start = time.perf_counter()
+        if self.start is None:
+            self.start = self.next_frame = start
+        self.render_window.Render()
+        self.end = time.perf_counter()
+        self.frame_times.append(self.end - start)
+        if self.real_time:
+            self.next_frame = max(self.next_frame + self.frame_interval, self.end)
+            time.sleep(self.next_frame - self.end)
+
+    def report(self):
+        if not self.frame_times:
+            return
+        n = len(self.frame_times)
+        elapsed = self.end - self.start
+        print(f'Rendered {n} frames in {elapsed:0.2f}s ({n / elapsed:0.1f} fps),'
+              f' render time per frame: mean {sum(self.frame_times) / n * 1000:0.1f}ms,'
+              f' max {max(self.frame_times) * 1000:0.1f}ms.')
+
+
 if __name__ == '__main__':
     main()
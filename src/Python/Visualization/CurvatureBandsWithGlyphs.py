@@ -2,7 +2,60 @@
 
 import math
 
-import vtk
+import numpy as np
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import (
+    vtkColorSeries,
+    vtkNamedColors
+)
+from vtkmodules.vtkCommonComputationalGeometry import (
+    vtkParametricBoy,
+    vtkParametricEnneper,
+    vtkParametricRandomHills,
+    vtkParametricTorus
+)
+from vtkmodules.vtkCommonCore import (
+    vtkLookupTable,
+    vtkVariant,
+    vtkVariantArray
+)
+from vtkmodules.vtkCommonDataModel import (
+    vtkImplicitBoolean,
+    vtkPlane,
+    vtkPolyData
+)
+from vtkmodules.vtkFiltersCore import (
+    vtkCleanPolyData,
+    vtkClipPolyData,
+    vtkElevationFilter,
+    vtkGlyph3D,
+    vtkMaskPoints,
+    vtkReverseSense,
+    vtkTriangleFilter
+)
+from vtkmodules.vtkFiltersGeneral import vtkCurvatures
+from vtkmodules.vtkFiltersHybrid import vtkRenderLargeImage
+from vtkmodules.vtkFiltersModeling import vtkBandedPolyDataContourFilter
+from vtkmodules.vtkFiltersSources import (
+    vtkArrowSource,
+    vtkParametricFunctionSource,
+    vtkSuperquadricSource
+)
+from vtkmodules.vtkIOImage import vtkPNGWriter
+from vtkmodules.vtkRenderingAnnotation import vtkScalarBarActor
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
+from vtkmodules.util import numpy_support
 
 # Available surfaces are:
 SURFACE_TYPE = {'TORUS', 'PARAMETRIC_HILLS', 'PARAMETRIC_TORUS'}
@@ -15,8 +68,8 @@ def WritePNG(ren, fn, magnification=1):
     :param: fn - the file name.
     :param: magnification - the magnification, usually 1.
     """
-    renLgeIm = vtk.vtkRenderLargeImage()
-    imgWriter = vtk.vtkPNGWriter()
+    renLgeIm = vtkRenderLargeImage()
+    imgWriter = vtkPNGWriter()
     renLgeIm.SetInput(ren)
     renLgeIm.SetMagnification(magnification)
     imgWriter.SetInputConnection(renLgeIm.GetOutputPort())
@@ -39,14 +92,8 @@ def MakeBands(dR, numberOfBands, nearestInteger):
     if nearestInteger:
         x[0] = math.floor(x[0])
         x[1] = math.ceil(x[1])
-    dx = (x[1] - x[0]) / float(numberOfBands)
-    b = [x[0], x[0] + dx / 2.0, x[0] + dx]
-    i = 0
-    while i < numberOfBands:
-        bands.append(b)
-        b = [b[0] + dx, b[1] + dx, b[2] + dx]
-        i += 1
-    return bands
+    edges = np.linspace(x[0], x[1], numberOfBands + 1)
+    return np.column_stack((edges[:-1], (edges[:-1] + edges[1:]) / 2.0, edges[1:])).tolist()
 
 
 def MakeCustomBands(dR, numberOfBands):
@@ -65,46 +112,40 @@ def MakeCustomBands(dR, numberOfBands):
     bands = list()
     if (dR[1] < dR[0]) or (numberOfBands <= 0):
         return bands
-    x = list()
-    x.append([-0.7, -0.05])
-    x.append([-0.05, 0])
-    x.append([0, 0.13])
-    x.append([0.13, 1.07])
-    x.append([1.07, 35.4])
-    x.append([35.4, 37.1])
+    x = np.array([[-0.7, -0.05],
+                  [-0.05, 0],
+                  [0, 0.13],
+                  [0.13, 1.07],
+                  [1.07, 35.4],
+                  [35.4, 37.1]])
     # Set the minimum to match the range minimum.
-    x[0][0] = dR[0]
-    if len(x) >= numberOfBands:
-        x = x[:numberOfBands]
+    x[0, 0] = dR[0]
+    x = x[:numberOfBands]
     # Adjust the last band.
-    t = (x[len(x) - 1])
-    if t[0] > dR[1]:
-        t[0] = dR[1]
-    t[1] = dR[1]
-    x[len(x) - 1] = t
-    for e in x:
-        bands.append([e[0], e[0] + (e[1] - e[0]) / 2, e[1]])
-    return bands
+    x[-1, 0] = min(x[-1, 0], dR[1])
+    x[-1, 1] = dR[1]
+    return np.column_stack((x[:, 0], x[:, 0] + (x[:, 1] - x[:, 0]) / 2, x[:, 1])).tolist()
 
 
 def Frequencies(bands, src):
     """
     Count the number of scalars in each band.
+
+    The scalars are viewed as a NumPy array without copying them and the band
+     for each scalar is found by a binary search of the band maxima.
     :param: bands - the bands.
     :param: src - the vtkPolyData source.
     :return: The frequencies of the scalars in each band.
     """
-    freq = dict()
-    for i in range(len(bands)):
-        freq[i] = 0
-    tuples = src.GetPointData().GetScalars().GetNumberOfTuples()
-    for i in range(tuples):
-        x = src.GetPointData().GetScalars().GetTuple1(i)
-        for j in range(len(bands)):
-            if x <= bands[j][2]:
-                freq[j] = freq[j] + 1
-                break
-    return freq
+    scalars = numpy_support.vtk_to_numpy(src.GetPointData().GetScalars())
+    if scalars.ndim > 1:
+        scalars = scalars[:, 0]
+    maxima = np.array([b[2] for b in bands])
+    # The index of the first band whose maximum is >= the scalar,
+    # scalars above the last band are counted in an extra bin that is discarded.
+    idx = np.searchsorted(maxima, scalars, side='left')
+    freq = np.bincount(idx, minlength=len(bands) + 1)[:len(bands)]
+    return dict(enumerate(freq.tolist()))
 
 
 def MakeElevations(src):
@@ -115,7 +156,7 @@ def MakeElevations(src):
     """
     bounds = [0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
     src.GetBounds(bounds)
-    elevFilter = vtk.vtkElevationFilter()
+    elevFilter = vtkElevationFilter()
     elevFilter.SetInputData(src)
     elevFilter.SetLowPoint(0, bounds[2], 0)
     elevFilter.SetHighPoint(0, bounds[3], 0)
@@ -129,7 +170,7 @@ def MakeTorus():
     Make a torus as the source.
     :return: vtkPolyData with normal and scalar data.
     """
-    source = vtk.vtkSuperquadricSource()
+    source = vtkSuperquadricSource()
     source.SetCenter(0.0, 0.0, 0.0)
     source.SetScale(1.0, 1.0, 1.0)
     source.SetPhiResolution(64)
@@ -141,13 +182,13 @@ def MakeTorus():
 
     # The quadric is made of strips, so pass it through a triangle filter as
     # the curvature filter only operates on polys
-    tri = vtk.vtkTriangleFilter()
+    tri = vtkTriangleFilter()
     tri.SetInputConnection(source.GetOutputPort())
 
     # The quadric has nasty discontinuities from the way the edges are generated
     # so let's pass it though a CleanPolyDataFilter and merge any points which
     # are coincident, or very close
-    cleaner = vtk.vtkCleanPolyData()
+    cleaner = vtkCleanPolyData()
     cleaner.SetInputConnection(tri.GetOutputPort())
     cleaner.SetTolerance(0.005)
     cleaner.Update()
@@ -159,11 +200,11 @@ def MakeParametricTorus():
     Make a parametric torus as the source.
     :return: vtkPolyData with normal and scalar data.
     """
-    fn = vtk.vtkParametricTorus()
+    fn = vtkParametricTorus()
     fn.SetRingRadius(5)
     fn.SetCrossSectionRadius(2)
 
-    source = vtk.vtkParametricFunctionSource()
+    source = vtkParametricFunctionSource()
     source.SetParametricFunction(fn)
     source.SetUResolution(50)
     source.SetVResolution(50)
@@ -181,7 +222,7 @@ def MakeParametricHills():
     Make a parametric hills surface as the source.
     :return: vtkPolyData with normal and scalar data.
     """
-    fn = vtk.vtkParametricRandomHills()
+    fn = vtkParametricRandomHills()
     fn.AllowRandomGenerationOn()
     fn.SetRandomSeed(1)
     fn.SetNumberOfHills(30)
@@ -190,7 +231,7 @@ def MakeParametricHills():
     # if fn.GetClassName() == 'vtkParametricRandomHills':
     #    fn.ClockwiseOrderingOff()
 
-    source = vtk.vtkParametricFunctionSource()
+    source = vtkParametricFunctionSource()
     source.SetParametricFunction(fn)
     source.SetUResolution(50)
     source.SetVResolution(50)
@@ -218,31 +259,31 @@ def Clipper(src, dx, dy, dz):
     bounds = [0, 0, 0, 0, 0, 0]
     src.GetBounds(bounds)
 
-    plane1 = vtk.vtkPlane()
+    plane1 = vtkPlane()
     plane1.SetOrigin(bounds[0] + dx, 0, 0)
     plane1.SetNormal(1, 0, 0)
 
-    plane2 = vtk.vtkPlane()
+    plane2 = vtkPlane()
     plane2.SetOrigin(bounds[1] - dx, 0, 0)
     plane2.SetNormal(-1, 0, 0)
 
-    plane3 = vtk.vtkPlane()
+    plane3 = vtkPlane()
     plane3.SetOrigin(0, bounds[2] + dy, 0)
     plane3.SetNormal(0, 1, 0)
 
-    plane4 = vtk.vtkPlane()
+    plane4 = vtkPlane()
     plane4.SetOrigin(0, bounds[3] - dy, 0)
     plane4.SetNormal(0, -1, 0)
 
-    plane5 = vtk.vtkPlane()
+    plane5 = vtkPlane()
     plane5.SetOrigin(0, 0, bounds[4] + dz)
     plane5.SetNormal(0, 0, 1)
 
-    plane6 = vtk.vtkPlane()
+    plane6 = vtkPlane()
     plane6.SetOrigin(0, 0, bounds[5] - dz)
     plane6.SetNormal(0, 0, -1)
 
-    clipFunction = vtk.vtkImplicitBoolean()
+    clipFunction = vtkImplicitBoolean()
     clipFunction.SetOperationTypeToUnion()
     clipFunction.AddFunction(plane1)
     clipFunction.AddFunction(plane2)
@@ -252,7 +293,7 @@ def Clipper(src, dx, dy, dz):
     clipFunction.AddFunction(plane6)
 
     # Clip it.
-    clipper = vtk.vtkClipPolyData()
+    clipper = vtkClipPolyData()
     clipper.SetClipFunction(clipFunction)
     clipper.SetInputData(src)
     clipper.GenerateClipScalarsOff()
@@ -268,7 +309,7 @@ def CalculateCurvatures(src):
     :param: src - the source.
     :return: vtkPolyData with normal and scalar data representing curvatures.
     """
-    curvature = vtk.vtkCurvatures()
+    curvature = vtkCurvatures()
     curvature.SetCurvatureTypeToGaussian()
     curvature.SetInputData(src)
     curvature.Update()
@@ -280,9 +321,9 @@ def MakeEnneper():
     Make a parametric surface as the source.
     :return: vtkPolyData with normal and scalar data.
     """
-    fn = vtk.vtkParametricEnneper()
+    fn = vtkParametricEnneper()
 
-    source = vtk.vtkParametricFunctionSource()
+    source = vtkParametricFunctionSource()
     source.SetParametricFunction(fn)
     source.SetUResolution(50)
     source.SetVResolution(50)
@@ -300,9 +341,9 @@ def MakeBoys():
     Make a parametric surface as the source.
     :return: vtkPolyData with normal and scalar data.
     """
-    fn = vtk.vtkParametricBoy()
+    fn = vtkParametricBoy()
 
-    source = vtk.vtkParametricFunctionSource()
+    source = vtkParametricFunctionSource()
     source.SetParametricFunction(fn)
     source.SetUResolution(50)
     source.SetVResolution(50)
@@ -321,7 +362,7 @@ def MakeLUT():
     :return: An indexed lookup table.
     """
     # Make the lookup table.
-    colorSeries = vtk.vtkColorSeries()
+    colorSeries = vtkColorSeries()
     # Select a color scheme.
     # colorSeriesEnum = colorSeries.BREWER_DIVERGING_BROWN_BLUE_GREEN_9
     # colorSeriesEnum = colorSeries.BREWER_DIVERGING_SPECTRAL_10
@@ -332,7 +373,7 @@ def MakeLUT():
     colorSeriesEnum = colorSeries.BREWER_QUALITATIVE_SET3
     # colorSeriesEnum = colorSeries.CITRUS
     colorSeries.SetColorScheme(colorSeriesEnum)
-    lut = vtk.vtkLookupTable()
+    lut = vtkLookupTable()
     colorSeries.BuildLookupTable(lut)
     lut.SetNanColor(0, 0, 0, 1)
     return lut
@@ -344,7 +385,7 @@ def ReverseLUT(lut):
     :param: lut - An indexed lookup table.
     :return: The reversed indexed lookup table.
     """
-    lutr = vtk.vtkLookupTable()
+    lutr = vtkLookupTable()
     lutr.DeepCopy(lut)
     t = lut.GetNumberOfTableValues() - 1
     revRange = reversed(list(range(t + 1)))
@@ -376,10 +417,10 @@ def MakeGlyphs(src, reverseNormals):
     # Sometimes the contouring algorithm can create a volume whose gradient
     # vector and ordering of polygon (using the right hand rule) are
     # inconsistent. vtkReverseSense cures this problem.
-    reverse = vtk.vtkReverseSense()
+    reverse = vtkReverseSense()
 
     # Choose a random subset of points.
-    maskPts = vtk.vtkMaskPoints()
+    maskPts = vtkMaskPoints()
     maskPts.SetOnRatio(5)
     maskPts.RandomModeOn()
     if reverseNormals:
@@ -391,12 +432,12 @@ def MakeGlyphs(src, reverseNormals):
         maskPts.SetInputData(src)
 
     # Source for the glyph filter
-    arrow = vtk.vtkArrowSource()
+    arrow = vtkArrowSource()
     arrow.SetTipResolution(16)
     arrow.SetTipLength(0.3)
     arrow.SetTipRadius(0.1)
 
-    glyph = vtk.vtkGlyph3D()
+    glyph = vtkGlyph3D()
     glyph.SetSourceConnection(arrow.GetOutputPort())
     glyph.SetInputConnection(maskPts.GetOutputPort())
     glyph.SetVectorModeToUseNormal()
@@ -417,10 +458,10 @@ def DisplaySurface(st):
     surface = st.upper()
     if not (surface in SURFACE_TYPE):
         print(st, 'is not a surface.')
-        iren = vtk.vtkRenderWindowInteractor()
+        iren = vtkRenderWindowInteractor()
         return iren
 
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
     # Set the background color.
     colors.SetColor('BkgColor', [179, 204, 255, 255])
@@ -428,7 +469,7 @@ def DisplaySurface(st):
     # ------------------------------------------------------------
     # Create the surface, lookup tables, contour filter etc.
     # ------------------------------------------------------------
-    src = vtk.vtkPolyData()
+    src = vtkPolyData()
     if surface == 'TORUS':
         src = MakeTorus()
     elif surface == 'PARAMETRIC_TORUS':
@@ -463,9 +504,9 @@ def DisplaySurface(st):
         labels.append('{:4.2f}'.format(bands[i][1]))
 
     # Annotate
-    values = vtk.vtkVariantArray()
+    values = vtkVariantArray()
     for i in range(len(labels)):
-        values.InsertNextValue(vtk.vtkVariant(labels[i]))
+        values.InsertNextValue(vtkVariant(labels[i]))
     for i in range(values.GetNumberOfTuples()):
         lut.SetAnnotation(i, values.GetValue(i).ToString())
 
@@ -473,7 +514,7 @@ def DisplaySurface(st):
     lutr = ReverseLUT(lut)
 
     # Create the contour bands.
-    bcf = vtk.vtkBandedPolyDataContourFilter()
+    bcf = vtkBandedPolyDataContourFilter()
     bcf.SetInputData(src)
     # Use either the minimum or maximum value for each band.
     for i in range(0, numberOfBands):
@@ -488,29 +529,29 @@ def DisplaySurface(st):
     # ------------------------------------------------------------
     # Create the mappers and actors
     # ------------------------------------------------------------
-    srcMapper = vtk.vtkPolyDataMapper()
+    srcMapper = vtkPolyDataMapper()
     srcMapper.SetInputConnection(bcf.GetOutputPort())
     srcMapper.SetScalarRange(scalarRange)
     srcMapper.SetLookupTable(lut)
     srcMapper.SetScalarModeToUseCellData()
 
-    srcActor = vtk.vtkActor()
+    srcActor = vtkActor()
     srcActor.SetMapper(srcMapper)
     srcActor.RotateX(-45)
     srcActor.RotateZ(45)
 
     # Create contour edges
-    edgeMapper = vtk.vtkPolyDataMapper()
+    edgeMapper = vtkPolyDataMapper()
     edgeMapper.SetInputData(bcf.GetContourEdgesOutput())
     edgeMapper.SetResolveCoincidentTopologyToPolygonOffset()
 
-    edgeActor = vtk.vtkActor()
+    edgeActor = vtkActor()
     edgeActor.SetMapper(edgeMapper)
     edgeActor.GetProperty().SetColor(colors.GetColor3d('Black'))
     edgeActor.RotateX(-45)
     edgeActor.RotateZ(45)
 
-    glyphMapper = vtk.vtkPolyDataMapper()
+    glyphMapper = vtkPolyDataMapper()
     glyphMapper.SetInputConnection(glyph.GetOutputPort())
     glyphMapper.SetScalarModeToUsePointFieldData()
     glyphMapper.SetColorModeToMapScalars()
@@ -519,13 +560,13 @@ def DisplaySurface(st):
     # Colour by scalars.
     glyphMapper.SetScalarRange(scalarRangeElevation)
 
-    glyphActor = vtk.vtkActor()
+    glyphActor = vtkActor()
     glyphActor.SetMapper(glyphMapper)
     glyphActor.RotateX(-45)
     glyphActor.RotateZ(45)
 
     # Add a scalar bar.
-    scalarBar = vtk.vtkScalarBarActor()
+    scalarBar = vtkScalarBarActor()
     # This LUT puts the lowest value at the top of the scalar bar.
     # scalarBar->SetLookupTable(lut);
     # Use this LUT if you want the highest value at the top.
@@ -535,9 +576,9 @@ def DisplaySurface(st):
     # ------------------------------------------------------------
     # Create the RenderWindow, Renderer and Interactor
     # ------------------------------------------------------------
-    ren = vtk.vtkRenderer()
-    renWin = vtk.vtkRenderWindow()
-    iren = vtk.vtkRenderWindowInteractor()
+    ren = vtkRenderer()
+    renWin = vtkRenderWindow()
+    iren = vtkRenderWindowInteractor()
 
     renWin.AddRenderer(ren)
     iren.SetRenderWindow(renWin)
@@ -2,7 +2,48 @@
 
 import math
 
-import vtk
+import numpy as np
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import (
+    vtkColorSeries,
+    vtkNamedColors
+)
+from vtkmodules.vtkCommonComputationalGeometry import vtkParametricRandomHills
+from vtkmodules.vtkCommonCore import (
+    vtkLookupTable,
+    vtkVariant,
+    vtkVariantArray
+)
+from vtkmodules.vtkCommonDataModel import vtkPolyData
+from vtkmodules.vtkFiltersCore import (
+    vtkElevationFilter,
+    vtkGlyph3D,
+    vtkMaskPoints,
+    vtkReverseSense
+)
+from vtkmodules.vtkFiltersHybrid import vtkRenderLargeImage
+from vtkmodules.vtkFiltersModeling import vtkBandedPolyDataContourFilter
+from vtkmodules.vtkFiltersSources import (
+    vtkArrowSource,
+    vtkParametricFunctionSource,
+    vtkPlaneSource,
+    vtkSphereSource
+)
+from vtkmodules.vtkIOImage import vtkPNGWriter
+from vtkmodules.vtkRenderingAnnotation import vtkScalarBarActor
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
+from vtkmodules.util import numpy_support
 
 # Available surfaces are:
 SURFACE_TYPE = {'PLANE', 'SPHERE', 'PARAMETRIC_SURFACE'}
@@ -15,8 +56,8 @@ def WritePNG(ren, fn, magnification=1):
     :param: fn - the file name.
     :param: magnification - the magnification, usually 1.
     """
-    renLgeIm = vtk.vtkRenderLargeImage()
-    imgWriter = vtk.vtkPNGWriter()
+    renLgeIm = vtkRenderLargeImage()
+    imgWriter = vtkPNGWriter()
     renLgeIm.SetInput(ren)
     renLgeIm.SetMagnification(magnification)
     imgWriter.SetInputConnection(renLgeIm.GetOutputPort())
@@ -39,14 +80,8 @@ def MakeBands(dR, numberOfBands, nearestInteger):
     if nearestInteger:
         x[0] = math.floor(x[0])
         x[1] = math.ceil(x[1])
-    dx = (x[1] - x[0]) / float(numberOfBands)
-    b = [x[0], x[0] + dx / 2.0, x[0] + dx]
-    i = 0
-    while i < numberOfBands:
-        bands.append(b)
-        b = [b[0] + dx, b[1] + dx, b[2] + dx]
-        i += 1
-    return bands
+    edges = np.linspace(x[0], x[1], numberOfBands + 1)
+    return np.column_stack((edges[:-1], (edges[:-1] + edges[1:]) / 2.0, edges[1:])).tolist()
 
 
 def MakeIntegralBands(dR):
@@ -73,7 +108,7 @@ def MakeElevations(src):
     """
     bounds = [0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
     src.GetBounds(bounds)
-    elevFilter = vtk.vtkElevationFilter()
+    elevFilter = vtkElevationFilter()
     elevFilter.SetInputData(src)
     elevFilter.SetLowPoint(0, bounds[2], 0)
     elevFilter.SetHighPoint(0, bounds[3], 0)
@@ -87,7 +122,7 @@ def MakePlane():
     Make a plane as the source.
     :return: vtkPolyData with normal and scalar data.
     """
-    source = vtk.vtkPlaneSource()
+    source = vtkPlaneSource()
     source.SetOrigin(-10.0, -10.0, 0.0)
     source.SetPoint2(-10.0, 10.0, 0.0)
     source.SetPoint1(10.0, -10.0, 0.0)
@@ -102,7 +137,7 @@ def MakeSphere():
     Make a sphere as the source.
     :return: vtkPolyData with normal and scalar data.
     """
-    source = vtk.vtkSphereSource()
+    source = vtkSphereSource()
     source.SetCenter(0.0, 0.0, 0.0)
     source.SetRadius(10.0)
     source.SetThetaResolution(32)
@@ -116,7 +151,7 @@ def MakeParametricSource():
     Make a parametric surface as the source.
     :return: vtkPolyData with normal and scalar data.
     """
-    fn = vtk.vtkParametricRandomHills()
+    fn = vtkParametricRandomHills()
     fn.AllowRandomGenerationOn()
     fn.SetRandomSeed(1)
     fn.SetNumberOfHills(30)
@@ -124,7 +159,7 @@ def MakeParametricSource():
     # Not needed with VTK 8.0 or later.
     # if fn.GetClassName() == 'vtkParametricRandomHills':
     #    fn.ClockwiseOrderingOff()
-    source = vtk.vtkParametricFunctionSource()
+    source = vtkParametricFunctionSource()
     source.SetParametricFunction(fn)
     source.SetUResolution(50)
     source.SetVResolution(50)
@@ -142,7 +177,7 @@ def MakeLUT():
     :return: An indexed lookup table.
     """
     # Make the lookup table.
-    colorSeries = vtk.vtkColorSeries()
+    colorSeries = vtkColorSeries()
     # Select a color scheme.
     # colorSeriesEnum = colorSeries.BREWER_DIVERGING_BROWN_BLUE_GREEN_9
     # colorSeriesEnum = colorSeries.BREWER_DIVERGING_SPECTRAL_10
@@ -153,7 +188,7 @@ def MakeLUT():
     colorSeriesEnum = colorSeries.BREWER_QUALITATIVE_SET3
     # colorSeriesEnum = colorSeries.CITRUS
     colorSeries.SetColorScheme(colorSeriesEnum)
-    lut = vtk.vtkLookupTable()
+    lut = vtkLookupTable()
     colorSeries.BuildLookupTable(lut)
     lut.SetNanColor(1, 0, 0, 1)
     return lut
@@ -165,7 +200,7 @@ def ReverseLUT(lut):
     :param: lut - An indexed lookup table.
     :return: The reversed indexed lookup table.
     """
-    lutr = vtk.vtkLookupTable()
+    lutr = vtkLookupTable()
     lutr.DeepCopy(lut)
     t = lut.GetNumberOfTableValues() - 1
     revList = reversed(list(range(t + 1)))
@@ -185,21 +220,22 @@ def ReverseLUT(lut):
 def Frequencies(bands, src):
     """
     Count the number of scalars in each band.
+
+    The scalars are viewed as a NumPy array without copying them and the band
+     for each scalar is found by a binary search of the band maxima.
     :param: bands - the bands.
     :param: src - the vtkPolyData source.
     :return: The frequencies of the scalars in each band.
     """
-    freq = dict()
-    for i in range(len(bands)):
-        freq[i] = 0
-    tuples = src.GetPointData().GetScalars().GetNumberOfTuples()
-    for i in range(tuples):
-        x = src.GetPointData().GetScalars().GetTuple1(i)
-        for j in range(len(bands)):
-            if x <= bands[j][2]:
-                freq[j] = freq[j] + 1
-                break
-    return freq
+    scalars = numpy_support.vtk_to_numpy(src.GetPointData().GetScalars())
+    if scalars.ndim > 1:
+        scalars = scalars[:, 0]
+    maxima = np.array([b[2] for b in bands])
+    # The index of the first band whose maximum is >= the scalar,
+    # scalars above the last band are counted in an extra bin that is discarded.
+    idx = np.searchsorted(maxima, scalars, side='left')
+    freq = np.bincount(idx, minlength=len(bands) + 1)[:len(bands)]
+    return dict(enumerate(freq.tolist()))
 
 
 def MakeGlyphs(src, reverseNormals):
@@ -217,10 +253,10 @@ def MakeGlyphs(src, reverseNormals):
     # Sometimes the contouring algorithm can create a volume whose gradient
     # vector and ordering of polygon (using the right hand rule) are
     # inconsistent. vtkReverseSense cures this problem.
-    reverse = vtk.vtkReverseSense()
+    reverse = vtkReverseSense()
 
     # Choose a random subset of points.
-    maskPts = vtk.vtkMaskPoints()
+    maskPts = vtkMaskPoints()
     maskPts.SetOnRatio(5)
     maskPts.RandomModeOn()
     if reverseNormals:
@@ -232,12 +268,12 @@ def MakeGlyphs(src, reverseNormals):
         maskPts.SetInputData(src)
 
     # Source for the glyph filter
-    arrow = vtk.vtkArrowSource()
+    arrow = vtkArrowSource()
     arrow.SetTipResolution(16)
     arrow.SetTipLength(0.3)
     arrow.SetTipRadius(0.1)
 
-    glyph = vtk.vtkGlyph3D()
+    glyph = vtkGlyph3D()
     glyph.SetSourceConnection(arrow.GetOutputPort())
     glyph.SetInputConnection(maskPts.GetOutputPort())
     glyph.SetVectorModeToUseNormal()
@@ -258,10 +294,10 @@ def DisplaySurface(st):
     surface = st.upper()
     if not (surface in SURFACE_TYPE):
         print(st, 'is not a surface.')
-        iren = vtk.vtkRenderWindowInteractor()
+        iren = vtkRenderWindowInteractor()
         return iren
 
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
     # Set the background color.
     colors.SetColor('BkgColor', [179, 204, 255, 255])
@@ -269,7 +305,7 @@ def DisplaySurface(st):
     # ------------------------------------------------------------
     # Create the surface, lookup tables, contour filter etc.
     # ------------------------------------------------------------
-    src = vtk.vtkPolyData()
+    src = vtkPolyData()
     if surface == 'PLANE':
         src = MakePlane()
     elif surface == 'SPHERE':
@@ -289,7 +325,7 @@ def DisplaySurface(st):
 
     # Let's do a frequency table.
     # The number of scalars in each band.
-    # print Frequencies(bands, src)
+    # print(Frequencies(bands, src))
 
     # We will use the midpoint of the band as the label.
     labels = []
@@ -297,9 +333,9 @@ def DisplaySurface(st):
         labels.append('{:4.2f}'.format(bands[i][1]))
 
     # Annotate
-    values = vtk.vtkVariantArray()
+    values = vtkVariantArray()
     for i in range(len(labels)):
-        values.InsertNextValue(vtk.vtkVariant(labels[i]))
+        values.InsertNextValue(vtkVariant(labels[i]))
     for i in range(values.GetNumberOfTuples()):
         lut.SetAnnotation(i, values.GetValue(i).ToString())
 
@@ -307,7 +343,7 @@ def DisplaySurface(st):
     lutr = ReverseLUT(lut)
 
     # Create the contour bands.
-    bcf = vtk.vtkBandedPolyDataContourFilter()
+    bcf = vtkBandedPolyDataContourFilter()
     bcf.SetInputData(src)
     # Use either the minimum or maximum value for each band.
     for i in range(0, numberOfBands):
@@ -322,29 +358,29 @@ def DisplaySurface(st):
     # ------------------------------------------------------------
     # Create the mappers and actors
     # ------------------------------------------------------------
-    srcMapper = vtk.vtkPolyDataMapper()
+    srcMapper = vtkPolyDataMapper()
     srcMapper.SetInputConnection(bcf.GetOutputPort())
     srcMapper.SetScalarRange(scalarRange)
     srcMapper.SetLookupTable(lut)
     srcMapper.SetScalarModeToUseCellData()
 
-    srcActor = vtk.vtkActor()
+    srcActor = vtkActor()
     srcActor.SetMapper(srcMapper)
     srcActor.RotateX(-45)
     srcActor.RotateZ(45)
 
     # Create contour edges
-    edgeMapper = vtk.vtkPolyDataMapper()
+    edgeMapper = vtkPolyDataMapper()
     edgeMapper.SetInputData(bcf.GetContourEdgesOutput())
     edgeMapper.SetResolveCoincidentTopologyToPolygonOffset()
 
-    edgeActor = vtk.vtkActor()
+    edgeActor = vtkActor()
     edgeActor.SetMapper(edgeMapper)
     edgeActor.GetProperty().SetColor(colors.GetColor3d('Black'))
     edgeActor.RotateX(-45)
     edgeActor.RotateZ(45)
 
-    glyphMapper = vtk.vtkPolyDataMapper()
+    glyphMapper = vtkPolyDataMapper()
     glyphMapper.SetInputConnection(glyph.GetOutputPort())
     glyphMapper.SetScalarModeToUsePointFieldData()
     glyphMapper.SetColorModeToMapScalars()
@@ -353,13 +389,13 @@ def DisplaySurface(st):
     # Colour by scalars.
     glyphMapper.SetScalarRange(scalarRange)
 
-    glyphActor = vtk.vtkActor()
+    glyphActor = vtkActor()
     glyphActor.SetMapper(glyphMapper)
     glyphActor.RotateX(-45)
     glyphActor.RotateZ(45)
 
     # Add a scalar bar.
-    scalarBar = vtk.vtkScalarBarActor()
+    scalarBar = vtkScalarBarActor()
     # scalarBar.SetLookupTable(lut)
     # Use this LUT if you want the highest value at the top.
     scalarBar.SetLookupTable(lutr)
@@ -368,9 +404,9 @@ def DisplaySurface(st):
     # ------------------------------------------------------------
     # Create the RenderWindow, Renderer and Interactor
     # ------------------------------------------------------------
-    ren = vtk.vtkRenderer()
-    renWin = vtk.vtkRenderWindow()
-    iren = vtk.vtkRenderWindowInteractor()
+    ren = vtkRenderer()
+    renWin = vtkRenderWindow()
+    iren = vtkRenderWindowInteractor()
 
     renWin.AddRenderer(ren)
     iren.SetRenderWindow(renWin)
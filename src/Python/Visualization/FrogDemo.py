@@ -1,8 +1,48 @@
 #!/usr/bin/env python
 
+import contextlib
+import hashlib
+import os
+import tempfile
+import threading
+import time
 from pathlib import Path
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingContextOpenGL2
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonCore import (
+    vtkCommand,
+    vtkLookupTable
+)
+from vtkmodules.vtkCommonMath import vtkMatrix4x4
+from vtkmodules.vtkCommonTransforms import vtkTransform
+from vtkmodules.vtkFiltersCore import vtkPolyDataNormals
+from vtkmodules.vtkFiltersGeneral import vtkTransformPolyDataFilter
+from vtkmodules.vtkIOLegacy import vtkPolyDataReader
+from vtkmodules.vtkIOXML import (
+    vtkXMLPolyDataReader,
+    vtkXMLPolyDataWriter
+)
+from vtkmodules.vtkInteractionWidgets import (
+    vtkOrientationMarkerWidget,
+    vtkSliderRepresentation2D,
+    vtkSliderWidget
+)
+from vtkmodules.vtkRenderingAnnotation import vtkAxesActor
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
 
 
 def get_program_parameters(argv):
@@ -36,25 +76,38 @@ Fig12-9c:
                        help='The view corresponds to Figs 12-9d in the VTK Textbook')
     parser.set_defaults(type=None)
 
+    parser.add_argument('-n', action='store_false', dest='use_cache',
+                        help='Do not use the mesh cache.')
+    parser.add_argument('-i', action='store_true', dest='invalidate',
+                        help='Invalidate the mesh cache, the tissues are rebuilt and cached again.')
+    parser.add_argument('--cache_dir', default=Path(tempfile.gettempdir(), 'vtk-examples', 'FrogMeshCache'),
+                        help='The folder holding the cached tissue surfaces.')
+    parser.add_argument('--cache_size', type=int, default=512,
+                        help='The maximum size of the mesh cache in MB.')
     parser.add_argument('data_folder', help='The path to the files: frog.mhd and frogtissue.mhd.')
     parser.add_argument('tissues', nargs='+', help='List of one or more tissues.')
     args = parser.parse_args()
-    return args.data_folder, args.tissues, args.view
+    cache = None
+    if args.use_cache:
+        cache = MeshCache(args.cache_dir, args.cache_size * 1024 * 1024)
+        if args.invalidate:
+            cache.clear()
+    return args.data_folder, args.tissues, args.view, cache
 
 
-def main(data_folder, tissues, view):
-    colors = vtk.vtkNamedColors()
+def main(data_folder, tissues, view, cache):
+    colors = vtkNamedColors()
 
     # Setup render window, renderers, and interactor.
     # ren_1 is for the frog rendering, ren_2 is for the slider rendering.
-    ren_1 = vtk.vtkRenderer()
-    ren_2 = vtk.vtkRenderer()
-    render_window = vtk.vtkRenderWindow()
+    ren_1 = vtkRenderer()
+    ren_2 = vtkRenderer()
+    render_window = vtkRenderWindow()
     render_window.AddRenderer(ren_1)
     render_window.AddRenderer(ren_2)
     ren_1.SetViewport(0.0, 0.0, 0.7, 1.0)
     ren_2.SetViewport(0.7, 0.0, 1, 1)
-    render_window_interactor = vtk.vtkRenderWindowInteractor()
+    render_window_interactor = vtkRenderWindowInteractor()
     render_window_interactor.SetRenderWindow(render_window)
 
     tm = create_tissue_map()
@@ -73,7 +126,7 @@ def main(data_folder, tissues, view):
                 s = 'The file: {:s} does not exist.'.format(str(source))
                 print(s)
                 continue
-        actor = create_frog_actor(str(source), tissue, tm[tissue][1])
+        actor = create_frog_actor(str(source), tissue, tm[tissue][1], cache)
         actor.GetProperty().SetOpacity(tm[tissue][2])
         actor.GetProperty().SetDiffuseColor(lut.GetTableValue(tm[tissue][0])[:3])
         actor.GetProperty().SetSpecular(0.2)
@@ -95,11 +148,13 @@ def main(data_folder, tissues, view):
         slider_widget.SetAnimationModeToAnimate()
         slider_widget.EnabledOn()
         slider_widget.SetCurrentRenderer(ren_2)
-        slider_widget.AddObserver(vtk.vtkCommand.InteractionEvent, cb)
+        slider_widget.AddObserver(vtkCommand.InteractionEvent, cb)
         sliders[tissue] = slider_widget
 
     if len(res) > 1:
         print('\n'.join(res))
+    if cache:
+        cache.evict()
 
     render_window.SetSize(800, 600)
     render_window.SetWindowName('FrogDemo')
@@ -140,9 +195,9 @@ def main(data_folder, tissues, view):
 
     render_window.Render()
 
-    axes = vtk.vtkAxesActor()
+    axes = vtkAxesActor()
 
-    widget = vtk.vtkOrientationMarkerWidget()
+    widget = vtkOrientationMarkerWidget()
     rgba = [0.0, 0.0, 0.0, 0.0]
     colors.GetColor("Carrot", rgba)
     widget.SetOutlineColor(rgba[0], rgba[1], rgba[2])
@@ -155,10 +210,25 @@ def main(data_folder, tissues, view):
     render_window_interactor.Start()
 
 
-def create_frog_actor(file_name, tissue, transform):
+def create_frog_actor(file_name, tissue, transform, cache):
+    feature_angle = 60.0
+
+    key = None
+    if cache:
+        key = MeshCache.make_key(tissue, transform, feature_angle, MeshCache.file_signature(file_name))
+        surface = cache.get(key)
+        if surface is not None:
+            mapper = vtkPolyDataMapper()
+            mapper.SetInputData(surface)
+
+            actor = vtkActor()
+            actor.SetMapper(mapper)
+
+            return actor
+
     so = SliceOrder()
 
-    reader = vtk.vtkPolyDataReader()
+    reader = vtkPolyDataReader()
     reader.SetFileName(file_name)
     reader.Update()
 
@@ -166,24 +236,157 @@ def create_frog_actor(file_name, tissue, transform):
     if tissue == 'brainbin':
         trans.Scale(1, -1, 1)
         trans.RotateZ(180)
-    tf = vtk.vtkTransformPolyDataFilter()
+    tf = vtkTransformPolyDataFilter()
     tf.SetInputConnection(reader.GetOutputPort())
     tf.SetTransform(trans)
     tf.SetInputConnection(reader.GetOutputPort())
 
-    normals = vtk.vtkPolyDataNormals()
+    normals = vtkPolyDataNormals()
     normals.SetInputConnection(tf.GetOutputPort())
-    normals.SetFeatureAngle(60.0)
+    normals.SetFeatureAngle(feature_angle)
 
-    mapper = vtk.vtkPolyDataMapper()
+    mapper = vtkPolyDataMapper()
     mapper.SetInputConnection(normals.GetOutputPort())
 
-    actor = vtk.vtkActor()
+    if cache:
+        normals.Update()
+        cache.put(key, normals.GetOutput())
+
+    actor = vtkActor()
     actor.SetMapper(mapper)
 
     return actor
 
 
+class MeshCache:
+    """
+    A content addressed, size bounded, on-disk cache of vtkPolyData.
+
+    Each surface is stored as a .vtp file named by a hash of everything used to make it,
+     so a change in any parameter or input file results in a new entry.
+    When the cache grows beyond max_size bytes the least recently used files are removed.
+    """
+
+    def __init__(self, cache_dir, max_size):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+
+    @staticmethod
+    def make_key(*args):
+        """
+        Make a key from the arguments, dictionaries are sorted so that the key is repeatable.
+
+        :param args: The parameters and file signatures used to make the surface.
+        :return: The key.
+        """
+        h = hashlib.sha256()
+        for arg in args:
+            if isinstance(arg, dict):
+                arg = sorted(arg.items())
+            h.update(repr(arg).encode('utf-8'))
+        return h.hexdigest()
+
+    @staticmethod
+    def file_signature(file_name):
+        """
+        The path, size and modification time of a file.
+
+        For a .mhd file the signature of the data file it refers to is also included.
+
+        :param file_name: The file.
+        :return: A tuple of signatures.
+        """
+        path = Path(file_name).resolve()
+        st = path.stat()
+        res = [(str(path), st.st_size, st.st_mtime_ns)]
+        if path.suffix == '.mhd':
+            with open(path, 'r') as ifh:
+                for line in ifh:
+                    words = line.split('=')
+                    if words[0].strip() == 'ElementDataFile' and words[1].strip() != 'LOCAL':
+                        data_path = path.parent.joinpath(words[1].strip())
+                        if data_path.is_file():
+                            st = data_path.stat()
+                            res.append((str(data_path), st.st_size, st.st_mtime_ns))
+        return tuple(res)
+
+    def path(self, key):
+        return self.cache_dir.joinpath(key).with_suffix('.vtp')
+
+    def get(self, key):
+        """
+        Get the polydata corresponding to the key.
+
+        :param key: The key.
+        :return: The polydata or None if it is not in the cache or cannot be read.
+        """
+        path = self.path(key)
+        reader = vtkXMLPolyDataReader()
+        # False if the file is missing, e.g. evicted by another run.
+        if not reader.CanReadFile(str(path)):
+            return None
+        reader.SetFileName(str(path))
+        reader.Update()
+        if reader.GetOutput().GetNumberOfPoints() == 0:
+            # A damaged file, remove it so that the surface is made and cached again.
+            with contextlib.suppress(OSError):
+                path.unlink()
+            return None
+        # Mark it as recently used.
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return reader.GetOutput()
+
+    def put(self, key, poly_data):
+        """
+        Save the polydata, the file is written under a temporary name and then renamed
+         so that a partially written file is never seen.
+
+        :param key: The key.
+        :param poly_data: The polydata.
+        """
+        path = self.path(key)
+        tmp_path = path.with_suffix('.{:d}.tmp'.format(threading.get_ident()))
+        writer = vtkXMLPolyDataWriter()
+        writer.SetFileName(str(tmp_path))
+        writer.SetInputData(poly_data)
+        writer.SetDataModeToAppended()
+        writer.EncodeAppendedDataOff()
+        writer.SetCompressorTypeToLZ4()
+        writer.Write()
+        os.replace(tmp_path, path)
+
+    def evict(self, tmp_age=3600):
+        """
+        Remove the least recently used files until the cache is no larger than max_size.
+
+        Temporary files left behind by an interrupted run are also removed, those younger
+         than tmp_age seconds are kept as they may still be being written by another run.
+
+        :param tmp_age: The age in seconds after which a temporary file is removed.
+        """
+        now = time.time()
+        for p in self.cache_dir.glob('*.tmp'):
+            with contextlib.suppress(OSError):
+                if now - p.stat().st_mtime > tmp_age:
+                    p.unlink()
+        files = sorted(self.cache_dir.glob('*.vtp'), key=lambda p: p.stat().st_mtime)
+        total = sum(p.stat().st_size for p in files)
+        for p in files:
+            if total <= self.max_size:
+                break
+            total -= p.stat().st_size
+            p.unlink()
+
+    def clear(self):
+        """
+        Invalidate the cache by removing all the files.
+        """
+        for p in self.cache_dir.glob('*.vtp'):
+            p.unlink()
+
+
 class SliceOrder:
     """
     These transformations permute image and other geometric data to maintain proper
@@ -204,28 +407,28 @@ class SliceOrder:
     """
 
     def __init__(self):
-        self.si_mat = vtk.vtkMatrix4x4()
+        self.si_mat = vtkMatrix4x4()
         self.si_mat.Zero()
         self.si_mat.SetElement(0, 0, 1)
         self.si_mat.SetElement(1, 2, 1)
         self.si_mat.SetElement(2, 1, -1)
         self.si_mat.SetElement(3, 3, 1)
 
-        self.is_mat = vtk.vtkMatrix4x4()
+        self.is_mat = vtkMatrix4x4()
         self.is_mat.Zero()
         self.is_mat.SetElement(0, 0, 1)
         self.is_mat.SetElement(1, 2, -1)
         self.is_mat.SetElement(2, 1, -1)
         self.is_mat.SetElement(3, 3, 1)
 
-        self.lr_mat = vtk.vtkMatrix4x4()
+        self.lr_mat = vtkMatrix4x4()
         self.lr_mat.Zero()
         self.lr_mat.SetElement(0, 2, -1)
         self.lr_mat.SetElement(1, 1, -1)
         self.lr_mat.SetElement(2, 0, 1)
         self.lr_mat.SetElement(3, 3, 1)
 
-        self.rl_mat = vtk.vtkMatrix4x4()
+        self.rl_mat = vtkMatrix4x4()
         self.rl_mat.Zero()
         self.rl_mat.SetElement(0, 2, 1)
         self.rl_mat.SetElement(1, 1, -1)
@@ -238,7 +441,7 @@ class SliceOrder:
         with a 180° rotation about y
         """
 
-        self.hf_mat = vtk.vtkMatrix4x4()
+        self.hf_mat = vtkMatrix4x4()
         self.hf_mat.Zero()
         self.hf_mat.SetElement(0, 0, -1)
         self.hf_mat.SetElement(1, 1, 1)
@@ -246,73 +449,73 @@ class SliceOrder:
         self.hf_mat.SetElement(3, 3, 1)
 
     def s_i(self):
-        t = vtk.vtkTransform()
+        t = vtkTransform()
         t.SetMatrix(self.si_mat)
         return t
 
     def i_s(self):
-        t = vtk.vtkTransform()
+        t = vtkTransform()
         t.SetMatrix(self.is_mat)
         return t
 
     @staticmethod
     def a_p():
-        t = vtk.vtkTransform()
+        t = vtkTransform()
         return t.Scale(1, -1, 1)
 
     @staticmethod
     def p_a():
-        t = vtk.vtkTransform()
+        t = vtkTransform()
         return t.Scale(1, -1, -1)
 
     def l_r(self):
-        t = vtk.vtkTransform()
+        t = vtkTransform()
         t.SetMatrix(self.lr_mat)
         t.Update()
         return t
 
     def r_l(self):
-        t = vtk.vtkTransform()
+        t = vtkTransform()
         t.SetMatrix(self.lr_mat)
         return t
 
     def h_f(self):
-        t = vtk.vtkTransform()
+        t = vtkTransform()
         t.SetMatrix(self.hf_mat)
         return t
 
     def hf_si(self):
-        t = vtk.vtkTransform()
+        t = vtkTransform()
         t.Concatenate(self.hf_mat)
         t.Concatenate(self.si_mat)
         return t
 
     def hf_is(self):
-        t = vtk.vtkTransform()
+        t = vtkTransform()
         t.Concatenate(self.hf_mat)
         t.Concatenate(self.is_mat)
         return t
 
     def hf_ap(self):
-        t = vtk.vtkTransform()
+        t = vtkTransform()
         t.Concatenate(self.hf_mat)
         t.Scale(1, -1, 1)
         return t
 
     def hf_pa(self):
-        t = vtk.vtkTransform()
+        t = vtkTransform()
         t.Concatenate(self.hf_mat)
         t.Scale(1, -1, -1)
         return t
 
     def hf_lr(self):
-        t = vtk.vtkTransform()
+        t = vtkTransform()
         t.Concatenate(self.hf_mat)
         t.Concatenate(self.lr_mat)
         return t
 
     def hf_rl(self):
-        t = vtk.vtkTransform()
+        t = vtkTransform()
         t.Concatenate(self.hf_mat)
         t.Concatenate(self.rl_mat)
         return t
@@ -356,7 +559,7 @@ class SliceOrder:
 
 
 def create_frog_lut(colors):
-    lut = vtk.vtkLookupTable()
+    lut = vtkLookupTable()
     lut.SetNumberOfColors(16)
     lut.SetTableRange(0, 15)
     lut.Build()
@@ -429,7 +632,7 @@ class SliderProperties:
 
 
 def make_slider_widget(properties, colors, lut, idx):
-    slider = vtk.vtkSliderRepresentation2D()
+    slider = vtkSliderRepresentation2D()
 
     slider.SetMinimumValue(properties.value_minimum)
     slider.SetMaximumValue(properties.value_maximum)
@@ -464,7 +667,7 @@ def make_slider_widget(properties, colors, lut, idx):
     else:
         slider.GetTitleProperty().SetColor(colors.GetColor3d(properties.title_color))
 
-    slider_widget = vtk.vtkSliderWidget()
+    slider_widget = vtkSliderWidget()
     slider_widget.SetRepresentation(slider)
 
     return slider_widget
@@ -483,5 +686,5 @@ class SliderCB:
 if __name__ == '__main__':
     import sys
 
-    data_folder, tissues, view = get_program_parameters(sys.argv)
-    main(data_folder, tissues, view)
+    data_folder, tissues, view, cache = get_program_parameters(sys.argv)
+    main(data_folder, tissues, view, cache)
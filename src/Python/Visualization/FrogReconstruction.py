@@ -1,9 +1,59 @@
 #!/usr/bin/env python
 
 import collections
+import concurrent.futures
+import contextlib
+import hashlib
+import os
+import tempfile
+import threading
+import time
 from pathlib import Path
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingContextOpenGL2
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonCore import vtkLookupTable
+from vtkmodules.vtkCommonDataModel import vtkImageData
+from vtkmodules.vtkCommonExecutionModel import vtkTrivialProducer
+from vtkmodules.vtkCommonMath import vtkMatrix4x4
+from vtkmodules.vtkCommonTransforms import vtkTransform
+from vtkmodules.vtkFiltersCore import (
+    vtkDecimatePro,
+    vtkExecutionTimer,
+    vtkFlyingEdges3D,
+    vtkMarchingCubes,
+    vtkPolyDataNormals,
+    vtkStripper,
+    vtkWindowedSincPolyDataFilter
+)
+from vtkmodules.vtkFiltersGeneral import vtkTransformPolyDataFilter
+from vtkmodules.vtkIOImage import vtkMetaImageReader
+from vtkmodules.vtkIOXML import (
+    vtkXMLPolyDataReader,
+    vtkXMLPolyDataWriter
+)
+from vtkmodules.vtkImagingCore import (
+    vtkImageShrink3D,
+    vtkImageThreshold
+)
+from vtkmodules.vtkImagingGeneral import vtkImageGaussianSmooth
+from vtkmodules.vtkImagingMorphological import vtkImageIslandRemoval2D
+from vtkmodules.vtkInteractionWidgets import vtkOrientationMarkerWidget
+from vtkmodules.vtkRenderingAnnotation import vtkAxesActor
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
 
 
 def get_program_parameters(argv):
@@ -41,14 +91,29 @@ Fig12-9c:
                         help='Use flying edges by default, marching cubes if set.')
     parser.add_argument('-t', action='store_true', dest='decimation',
                         help='Decimate if set.')
+    parser.add_argument('-j', type=int, default=None, dest='workers',
+                        help='The number of worker threads used to build the tissues, 1 builds them serially.')
+    parser.add_argument('-n', action='store_false', dest='use_cache',
+                        help='Do not use the mesh cache.')
+    parser.add_argument('-i', action='store_true', dest='invalidate',
+                        help='Invalidate the mesh cache, the tissues are rebuilt and cached again.')
+    parser.add_argument('--cache_dir', default=Path(tempfile.gettempdir(), 'vtk-examples', 'FrogMeshCache'),
+                        help='The folder holding the cached tissue surfaces.')
+    parser.add_argument('--cache_size', type=int, default=512,
+                        help='The maximum size of the mesh cache in MB.')
     parser.add_argument('data_folder', help='The path to the files: frog.mhd and frogtissue.mhd.')
     parser.add_argument('tissues', nargs='+', help='List of one or more tissues.')
     args = parser.parse_args()
-    return args.data_folder, args.tissues, args.view, args.flying_edges, args.decimation
+    cache = None
+    if args.use_cache:
+        cache = MeshCache(args.cache_dir, args.cache_size * 1024 * 1024)
+        if args.invalidate:
+            cache.clear()
+    return args.data_folder, args.tissues, args.view, args.flying_edges, args.decimation, args.workers, cache
 
 
-def main(data_folder, tissues, view, flying_edges, decimate):
-    colors = vtk.vtkNamedColors()
+def main(data_folder, tissues, view, flying_edges, decimate, workers, cache):
+    colors = vtkNamedColors()
 
     path = Path(data_folder)
     if path.is_dir():
@@ -85,10 +150,10 @@ def main(data_folder, tissues, view, flying_edges, decimate):
         return
 
     # Setup render window, renderer, and interactor.
-    renderer = vtk.vtkRenderer()
-    render_window = vtk.vtkRenderWindow()
+    renderer = vtkRenderer()
+    render_window = vtkRenderWindow()
     render_window.AddRenderer(renderer)
-    render_window_interactor = vtk.vtkRenderWindowInteractor()
+    render_window_interactor = vtkRenderWindowInteractor()
     render_window_interactor.SetRenderWindow(render_window)
 
     lut = create_frog_lut(colors)
@@ -96,11 +161,54 @@ def main(data_folder, tissues, view, flying_edges, decimate):
     #  Time some filters
     ict = collections.defaultdict(dict)
 
+    # The key for each tissue surface in the mesh cache.
+    studies = {'frog': frog_fn, 'frogtissue': frog_tissue_fn}
+    keys = dict()
+    if cache:
+        signatures = {study: MeshCache.file_signature(fn) for study, fn in studies.items()}
+        for name, tissue in selected_tissues.items():
+            keys[name] = MeshCache.make_key(tissue, flying_edges, decimate, signatures[tissue['STUDY']])
+
+    # Load the cached surfaces first, a surface is then either in hand or made from its volume,
+    #  even if its cache file is removed by another run in the meantime.
+    cached = dict()
+    if cache:
+        for name in selected_tissues:
+            start = time.perf_counter()
+            surface = cache.get(keys[name])
+            if surface is not None:
+                cached[name] = (time.perf_counter() - start, surface)
+
+    # Read each volume only once, all the tissue pipelines share the same image data.
+    # Volumes only needed by cached tissues are not read.
+    volumes = collections.defaultdict(lambda: None)
+    needed = {tissue['STUDY'] for name, tissue in selected_tissues.items() if name not in cached}
+    for study in sorted(needed):
+        t, volumes[study] = read_volume(studies[study])
+        print('Read {:s} in {:5.2f}s'.format(studies[study].name, t))
+
     for name, tissue in selected_tissues.items():
         print('Tissue: {:>9s}, label: {:2d}'.format(name, tissue['TISSUE']))
-        t, actor = create_frog_actor(frog_fn, frog_tissue_fn, tissue, flying_edges, decimate, lut)
-        ict[name] = t
-        renderer.AddActor(actor)
+
+    # Build the tissues concurrently.
+    wall_times = dict()
+    actors = dict()
+    start = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        future_results = {
+            executor.submit(create_frog_actor, volumes[tissue['STUDY']], tissue, flying_edges, decimate, lut,
+                            cached.get(name), cache, keys.get(name)): name
+            for name, tissue in selected_tissues.items()}
+        for future in concurrent.futures.as_completed(future_results):
+            name = future_results[future]
+            ict[name], wall_times[name], actors[name] = future.result()
+    elapsed = time.perf_counter() - start
+    if cache:
+        cache.evict()
+
+    # Add the actors in the order the tissues were specified.
+    for name in selected_tissues:
+        renderer.AddActor(actors[name])
 
     # Initial view (looking down on the dorsal surface).
     renderer.GetActiveCamera().Roll(-90)
@@ -134,7 +242,7 @@ def main(data_folder, tissues, view, flying_edges, decimate):
             camera.SetClippingRange(452.459105, 905.003135)
 
     print('Timings:')
-    print('\n'.join(format_timings(ict)))
+    print('\n'.join(format_timings(ict, wall_times, elapsed)))
 
     renderer.SetBackground(colors.GetColor3d('LightSteelBlue'))
 
@@ -142,9 +250,9 @@ def main(data_folder, tissues, view, flying_edges, decimate):
     render_window.SetWindowName('FrogReconstruction')
     render_window.Render()
 
-    axes = vtk.vtkAxesActor()
+    axes = vtkAxesActor()
 
-    widget = vtk.vtkOrientationMarkerWidget()
+    widget = vtkOrientationMarkerWidget()
     rgba = [0.0, 0.0, 0.0, 0.0]
     colors.GetColor("Carrot", rgba)
     widget.SetOutlineColor(rgba[0], rgba[1], rgba[2])
@@ -159,64 +267,105 @@ def main(data_folder, tissues, view, flying_edges, decimate):
     render_window_interactor.Start()
 
 
-def create_frog_actor(frog_fn, frog_tissue_fn, tissue, flying_edges, decimate, lut):
-    # Get the tissue parameters
-    pixel_size = tissue['PIXEL_SIZE']
-    columns = tissue['COLUMNS']
-    rows = tissue['ROWS']
+def read_volume(file_name):
+    """
+    Read a volume into memory.
+
+    vtkMetaImageReader takes the spacing, origin and extent from the .mhd header,
+     so the volume is the same for every tissue and only needs to be read once.
 
-    voi = tissue['VOI']
-    spacing = float(tissue['SPACING'])
-    start_slice = float(tissue['START_SLICE'])
-    data_spacing = [pixel_size, pixel_size, spacing]
-    data_origin = [-(columns / 2.0) * pixel_size, -(rows / 2.0) * pixel_size, start_slice * spacing]
+    :param file_name: The .mhd file.
+    :return: The time taken to read the volume and the volume.
+    """
+    start = time.perf_counter()
+    reader = vtkMetaImageReader()
+    reader.SetFileName(str(file_name))
+    reader.Update()
+    return time.perf_counter() - start, reader.GetOutput()
 
-    #
-    # adjust y bounds for PNM coordinate system
-    #
-    tmp = voi[2]
-    voi[2] = rows - voi[3] - 1
-    voi[3] = rows - tmp - 1
 
-    if tissue['NAME'] == 'skin':
-        fn = frog_fn
+def create_frog_actor(volume, tissue, flying_edges, decimate, lut, cached, cache, key):
+    """
+    Make the actor for a tissue, using the cached surface if there is one.
+
+    :param volume: The vtkImageData shared by the tissues, only used if the surface is not cached.
+    :param tissue: The tissue parameters.
+    :param flying_edges: If True use vtkFlyingEdges3D, otherwise vtkMarchingCubes.
+    :param decimate: If True decimate the surface.
+    :param lut: The lookup table used to color the tissue.
+    :param cached: The time taken to load the cached surface and the surface, or None.
+    :param cache: The mesh cache or None, a surface that is made is saved in it.
+    :param key: The key of the tissue surface in the cache.
+    :return: The timings, the wall time and the actor.
+    """
+    start = time.perf_counter()
+
+    if cached is not None:
+        load_time, surface = cached
+        ict = {'Mesh Cache': load_time}
     else:
-        fn = frog_tissue_fn
+        ict, surface = create_tissue_surface(volume, tissue, flying_edges, decimate)
+        if cache:
+            cache.put(key, surface)
 
-    reader = vtk.vtkMetaImageReader()
-    reader.SetFileName(str(fn))
-    reader.SetDataSpacing(data_spacing)
-    reader.SetDataOrigin(data_origin)
-    reader.SetDataExtent(voi)
-    reader.Update()
+    mapper = vtkPolyDataMapper()
+    mapper.SetInputData(surface)
 
-    last_connection = reader
+    actor = vtkActor()
+    actor.SetMapper(mapper)
+    actor.GetProperty().SetOpacity(tissue['OPACITY'])
+    actor.GetProperty().SetDiffuseColor(lut.GetTableValue(tissue['TISSUE'])[:3])
+    actor.GetProperty().SetSpecular(0.5)
+    actor.GetProperty().SetSpecularPower(10)
+
+    return ict, time.perf_counter() - start, actor
+
+
+def create_tissue_surface(volume, tissue, flying_edges, decimate):
+    """
+    Build the smoothed surface, with normals, for a tissue from the shared volume.
+
+    The volume is only read, so this can be run concurrently for several tissues.
+
+    :param volume: The vtkImageData shared by the tissues.
+    :param tissue: The tissue parameters.
+    :param flying_edges: If True use vtkFlyingEdges3D, otherwise vtkMarchingCubes.
+    :param decimate: If True decimate the surface.
+    :return: The isocontouring time and the surface.
+    """
+    # A shallow copy shares the scalars of the volume but gives each pipeline its own producer.
+    image = vtkImageData()
+    image.ShallowCopy(volume)
+    producer = vtkTrivialProducer()
+    producer.SetOutput(image)
+
+    last_connection = producer
 
     if not tissue['NAME'] == 'skin':
         if tissue['ISLAND_REPLACE'] >= 0:
-            island_remover = vtk.vtkImageIslandRemoval2D()
+            island_remover = vtkImageIslandRemoval2D()
             island_remover.SetAreaThreshold(tissue['ISLAND_AREA'])
             island_remover.SetIslandValue(tissue['ISLAND_REPLACE'])
             island_remover.SetReplaceValue(tissue['TISSUE'])
-            island_remover.SetInput(last_connection.GetOutput())
+            island_remover.SetInputConnection(last_connection.GetOutputPort())
             island_remover.Update()
             last_connection = island_remover
 
-        select_tissue = vtk.vtkImageThreshold()
+        select_tissue = vtkImageThreshold()
         select_tissue.ThresholdBetween(tissue['TISSUE'], tissue['TISSUE'])
         select_tissue.SetInValue(255)
         select_tissue.SetOutValue(0)
         select_tissue.SetInputConnection(last_connection.GetOutputPort())
         last_connection = select_tissue
 
-    shrinker = vtk.vtkImageShrink3D()
+    shrinker = vtkImageShrink3D()
     shrinker.SetInputConnection(last_connection.GetOutputPort())
     shrinker.SetShrinkFactors(tissue['SAMPLE_RATE'])
     shrinker.AveragingOn()
     last_connection = shrinker
 
     if not all(v == 0 for v in tissue['GAUSSIAN_STANDARD_DEVIATION']):
-        gaussian = vtk.vtkImageGaussianSmooth()
+        gaussian = vtkImageGaussianSmooth()
         gaussian.SetStandardDeviation(*tissue['GAUSSIAN_STANDARD_DEVIATION'])
         gaussian.SetRadiusFactors(*tissue['GAUSSIAN_RADIUS_FACTORS'])
         gaussian.SetInputConnection(shrinker.GetOutputPort())
@@ -225,24 +374,24 @@ def create_frog_actor(frog_fn, frog_tissue_fn, tissue, flying_edges, decimate, l
     ict = collections.defaultdict()
     iso_value = tissue['VALUE']
     if flying_edges:
-        iso_surface = vtk.vtkFlyingEdges3D()
+        iso_surface = vtkFlyingEdges3D()
         iso_surface.SetInputConnection(last_connection.GetOutputPort())
         iso_surface.ComputeScalarsOff()
         iso_surface.ComputeGradientsOff()
         iso_surface.ComputeNormalsOff()
         iso_surface.SetValue(0, iso_value)
-        timer = vtk.vtkExecutionTimer()
+        timer = vtkExecutionTimer()
         timer.SetFilter(iso_surface)
         iso_surface.Update()
         ict['Flying Edges'] = timer.GetElapsedWallClockTime()
     else:
-        iso_surface = vtk.vtkMarchingCubes()
+        iso_surface = vtkMarchingCubes()
         iso_surface.SetInputConnection(last_connection.GetOutputPort())
         iso_surface.ComputeScalarsOff()
         iso_surface.ComputeGradientsOff()
         iso_surface.ComputeNormalsOff()
         iso_surface.SetValue(0, iso_value)
-        timer = vtk.vtkExecutionTimer()
+        timer = vtkExecutionTimer()
         timer.SetFilter(iso_surface)
         iso_surface.Update()
         ict['Marching Cubes'] = timer.GetElapsedWallClockTime()
@@ -252,13 +401,13 @@ def create_frog_actor(frog_fn, frog_tissue_fn, tissue, flying_edges, decimate, l
     # Match Frog.py
     transform = so.get('hfap')
     transform.Scale(1, -1, 1)
-    tf = vtk.vtkTransformPolyDataFilter()
+    tf = vtkTransformPolyDataFilter()
     tf.SetTransform(transform)
     tf.SetInputConnection(iso_surface.GetOutputPort())
     last_connection = tf
 
     if decimate:
-        decimator = vtk.vtkDecimatePro()
+        decimator = vtkDecimatePro()
         decimator.SetInputConnection(last_connection.GetOutputPort())
         decimator.SetFeatureAngle(tissue['DECIMATE_ANGLE'])
         decimator.MaximumIterations = tissue['DECIMATE_ITERATIONS']
@@ -268,7 +417,7 @@ def create_frog_actor(frog_fn, frog_tissue_fn, tissue, flying_edges, decimate, l
         decimator.SetTargetReduction(tissue['DECIMATE_REDUCTION'])
         last_connection = decimator
 
-    smoother = vtk.vtkWindowedSincPolyDataFilter()
+    smoother = vtkWindowedSincPolyDataFilter()
     smoother.SetInputConnection(last_connection.GetOutputPort())
     smoother.SetNumberOfIterations(tissue['SMOOTH_ITERATIONS'])
     smoother.BoundarySmoothingOff()
@@ -279,29 +428,144 @@ def create_frog_actor(frog_fn, frog_tissue_fn, tissue, flying_edges, decimate, l
     smoother.NormalizeCoordinatesOff()
     smoother.Update()
 
-    normals = vtk.vtkPolyDataNormals()
+    normals = vtkPolyDataNormals()
     normals.SetInputConnection(smoother.GetOutputPort())
     normals.SetFeatureAngle(tissue['FEATURE_ANGLE'])
 
-    stripper = vtk.vtkStripper()
+    stripper = vtkStripper()
     stripper.SetInputConnection(normals.GetOutputPort())
+    stripper.Update()
 
-    mapper = vtk.vtkPolyDataMapper()
-    mapper.SetInputConnection(stripper.GetOutputPort())
+    return ict, stripper.GetOutput()
 
-    # Create iso-surface
-    contour = vtk.vtkContourFilter()
-    contour.SetInputConnection(reader.GetOutputPort())
-    contour.SetValue(0, iso_value)
 
-    actor = vtk.vtkActor()
-    actor.SetMapper(mapper)
-    actor.GetProperty().SetOpacity(tissue['OPACITY'])
-    actor.GetProperty().SetDiffuseColor(lut.GetTableValue(tissue['TISSUE'])[:3])
-    actor.GetProperty().SetSpecular(0.5)
-    actor.GetProperty().SetSpecularPower(10)
+class MeshCache:
+    """
+    A content addressed, size bounded, on-disk cache of vtkPolyData.
 
-    return ict, actor
+    Each surface is stored as a .vtp file named by a hash of everything used to make it,
+     so a change in any parameter or input file results in a new entry.
+    When the cache grows beyond max_size bytes the least recently used files are removed.
+    """
+
+    def __init__(self, cache_dir, max_size):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+
+    @staticmethod
+    def make_key(*args):
+        """
+        Make a key from the arguments, dictionaries are sorted so that the key is repeatable.
+
+        :param args: The parameters and file signatures used to make the surface.
+        :return: The key.
+        """
+        h = hashlib.sha256()
+        for arg in args:
+            if isinstance(arg, dict):
+                arg = sorted(arg.items())
+            h.update(repr(arg).encode('utf-8'))
+        return h.hexdigest()
+
+    @staticmethod
+    def file_signature(file_name):
+        """
+        The path, size and modification time of a file.
+
+        For a .mhd file the signature of the data file it refers to is also included.
+
+        :param file_name: The file.
+        :return: A tuple of signatures.
+        """
+        path = Path(file_name).resolve()
+        st = path.stat()
+        res = [(str(path), st.st_size, st.st_mtime_ns)]
+        if path.suffix == '.mhd':
+            with open(path, 'r') as ifh:
+                for line in ifh:
+                    words = line.split('=')
+                    if words[0].strip() == 'ElementDataFile' and words[1].strip() != 'LOCAL':
+                        data_path = path.parent.joinpath(words[1].strip())
+                        if data_path.is_file():
+                            st = data_path.stat()
+                            res.append((str(data_path), st.st_size, st.st_mtime_ns))
+        return tuple(res)
+
+    def path(self, key):
+        return self.cache_dir.joinpath(key).with_suffix('.vtp')
+
+    def get(self, key):
+        """
+        Get the polydata corresponding to the key.
+
+        :param key: The key.
+        :return: The polydata or None if it is not in the cache or cannot be read.
+        """
+        path = self.path(key)
+        reader = vtkXMLPolyDataReader()
+        # False if the file is missing, e.g. evicted by another run.
+        if not reader.CanReadFile(str(path)):
+            return None
+        reader.SetFileName(str(path))
+        reader.Update()
+        if reader.GetOutput().GetNumberOfPoints() == 0:
+            # A damaged file, remove it so that the surface is made and cached again.
+            with contextlib.suppress(OSError):
+                path.unlink()
+            return None
+        # Mark it as recently used.
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return reader.GetOutput()
+
+    def put(self, key, poly_data):
+        """
+        Save the polydata, the file is written under a temporary name and then renamed
+         so that a partially written file is never seen.
+
+        :param key: The key.
+        :param poly_data: The polydata.
+        """
+        path = self.path(key)
+        tmp_path = path.with_suffix('.{:d}.tmp'.format(threading.get_ident()))
+        writer = vtkXMLPolyDataWriter()
+        writer.SetFileName(str(tmp_path))
+        writer.SetInputData(poly_data)
+        writer.SetDataModeToAppended()
+        writer.EncodeAppendedDataOff()
+        writer.SetCompressorTypeToLZ4()
+        writer.Write()
+        os.replace(tmp_path, path)
+
+    def evict(self, tmp_age=3600):
+        """
+        Remove the least recently used files until the cache is no larger than max_size.
+
+        Temporary files left behind by an interrupted run are also removed, those younger
+         than tmp_age seconds are kept as they may still be being written by another run.
+
+        :param tmp_age: The age in seconds after which a temporary file is removed.
+        """
+        now = time.time()
+        for p in self.cache_dir.glob('*.tmp'):
+            with contextlib.suppress(OSError):
+                if now - p.stat().st_mtime > tmp_age:
+                    p.unlink()
+        files = sorted(self.cache_dir.glob('*.vtp'), key=lambda p: p.stat().st_mtime)
+        total = sum(p.stat().st_size for p in files)
+        for p in files:
+            if total <= self.max_size:
+                break
+            total -= p.stat().st_size
+            p.unlink()
+
+    def clear(self):
+        """
+        Invalidate the cache by removing all the files.
+        """
+        for p in self.cache_dir.glob('*.vtp'):
+            p.unlink()
 
 
 class SliceOrder:
@@ -324,28 +588,28 @@ class SliceOrder:
     """
 
     def __init__(self):
-        self.si_mat = vtk.vtkMatrix4x4()
+        self.si_mat = vtkMatrix4x4()
         self.si_mat.Zero()
         self.si_mat.SetElement(0, 0, 1)
         self.si_mat.SetElement(1, 2, 1)
         self.si_mat.SetElement(2, 1, -1)
         self.si_mat.SetElement(3, 3, 1)
 
-        self.is_mat = vtk.vtkMatrix4x4()
+        self.is_mat = vtkMatrix4x4()
         self.is_mat.Zero()
         self.is_mat.SetElement(0, 0, 1)
         self.is_mat.SetElement(1, 2, -1)
         self.is_mat.SetElement(2, 1, -1)
         self.is_mat.SetElement(3, 3, 1)
 
-        self.lr_mat = vtk.vtkMatrix4x4()
+        self.lr_mat = vtkMatrix4x4()
         self.lr_mat.Zero()
         self.lr_mat.SetElement(0, 2, -1)
         self.lr_mat.SetElement(1, 1, -1)
         self.lr_mat.SetElement(2, 0, 1)
         self.lr_mat.SetElement(3, 3, 1)
 
-        self.rl_mat = vtk.vtkMatrix4x4()
+        self.rl_mat = vtkMatrix4x4()
         self.rl_mat.Zero()
         self.rl_mat.SetElement(0, 2, 1)
         self.rl_mat.SetElement(1, 1, -1)
@@ -358,7 +622,7 @@ class SliceOrder:
         with a 180° rotation about y
         """
 
-        self.hf_mat = vtk.vtkMatrix4x4()
+        self.hf_mat = vtkMatrix4x4()
         self.hf_mat.Zero()
         self.hf_mat.SetElement(0, 0, -1)
         self.hf_mat.SetElement(1, 1, 1)
@@ -366,73 +630,73 @@ class SliceOrder:
         self.hf_mat.SetElement(3, 3, 1)
 
     def s_i(self):
-        t = vtk.vtkTransform()
+        t = vtkTransform()
         t.SetMatrix(self.si_mat)
         return t
 
     def i_s(self):
-        t = vtk.vtkTransform()
+        t = vtkTransform()
         t.SetMatrix(self.is_mat)
         return t
 
     @staticmethod
     def a_p():
-        t = vtk.vtkTransform()
+        t = vtkTransform()
         return t.Scale(1, -1, 1)
 
     @staticmethod
     def p_a():
-        t = vtk.vtkTransform()
+        t = vtkTransform()
         return t.Scale(1, -1, -1)
 
     def l_r(self):
-        t = vtk.vtkTransform()
+        t = vtkTransform()
         t.SetMatrix(self.lr_mat)
         t.Update()
         return t
 
     def r_l(self):
-        t = vtk.vtkTransform()
+        t = vtkTransform()
         t.SetMatrix(self.lr_mat)
         return t
 
     def h_f(self):
-        t = vtk.vtkTransform()
+        t = vtkTransform()
         t.SetMatrix(self.hf_mat)
         return t
 
     def hf_si(self):
-        t = vtk.vtkTransform()
+        t = vtkTransform()
         t.Concatenate(self.hf_mat)
         t.Concatenate(self.si_mat)
         return t
 
     def hf_is(self):
-        t = vtk.vtkTransform()
+        t = vtkTransform()
         t.Concatenate(self.hf_mat)
         t.Concatenate(self.is_mat)
         return t
 
     def hf_ap(self):
-        t = vtk.vtkTransform()
+        t = vtkTransform()
         t.Concatenate(self.hf_mat)
         t.Scale(1, -1, 1)
         return t
 
     def hf_pa(self):
-        t = vtk.vtkTransform()
+        t = vtkTransform()
         t.Concatenate(self.hf_mat)
         t.Scale(1, -1, -1)
         return t
 
     def hf_lr(self):
-        t = vtk.vtkTransform()
+        t = vtkTransform()
         t.Concatenate(self.hf_mat)
         t.Concatenate(self.lr_mat)
         return t
 
     def hf_rl(self):
-        t = vtk.vtkTransform()
+        t = vtkTransform()
         t.Concatenate(self.hf_mat)
         t.Concatenate(self.rl_mat)
         return t
@@ -744,7 +1008,7 @@ def tissue_parameters():
 
 
 def create_frog_lut(colors):
-    lut = vtk.vtkLookupTable()
+    lut = vtkLookupTable()
     lut.SetNumberOfColors(16)
     lut.SetTableRange(0, 15)
     lut.Build()
@@ -785,9 +1049,18 @@ def check_for_required_parameters(tissue, parameters):
     return s
 
 
-def format_timings(ict):
+def format_timings(ict, wall_times, elapsed):
+    """
+    Format the timings.
+
+    :param ict: The isocontouring times for each tissue.
+    :param wall_times: The wall time taken to build each tissue.
+    :param elapsed: The wall time taken to build all the tissues.
+    :return: A list of strings.
+    """
     res = list()
     total = 0
+    total_wall = 0
     sk = sorted(ict.keys())
     for k in sk:
         sigma = 0
@@ -797,13 +1070,19 @@ def format_timings(ict):
             sigma += ict[k][kk]
             res.append('{:11s}{:13s} {:5.2f}s'.format(' ', kk, ict[k][kk]))
         total += sigma
+        total_wall += wall_times[k]
         res.append('Subtotal: {:5.2f}s'.format(sigma))
+        res.append('    Wall: {:5.2f}s'.format(wall_times[k]))
     res.append('   Total: {:5.2f}s'.format(total))
+    res.append('    Wall: {:5.2f}s (sum over the tissues)'.format(total_wall))
+    res.append(' Elapsed: {:5.2f}s'.format(elapsed))
+    if elapsed > 0:
+        res.append(' Speedup: {:5.2f}x'.format(total_wall / elapsed))
     return res
 
 
 if __name__ == '__main__':
     import sys
 
-    data_folder, tissue, view, flying_edges, decimate = get_program_parameters(sys.argv)
-    main(data_folder, tissue, view, flying_edges, decimate)
+    data_folder, tissue, view, flying_edges, decimate, workers, cache = get_program_parameters(sys.argv)
+    main(data_folder, tissue, view, flying_edges, decimate, workers, cache)
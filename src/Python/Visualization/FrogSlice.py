@@ -2,7 +2,31 @@
 
 from pathlib import Path
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonCore import vtkLookupTable
+from vtkmodules.vtkCommonMath import vtkMatrix4x4
+from vtkmodules.vtkCommonTransforms import vtkTransform
+from vtkmodules.vtkFiltersCore import vtkPolyDataNormals
+from vtkmodules.vtkFiltersGeneral import vtkTransformPolyDataFilter
+from vtkmodules.vtkFiltersSources import vtkPlaneSource
+from vtkmodules.vtkIOImage import vtkMetaImageReader
+from vtkmodules.vtkImagingCore import vtkImageConstantPad
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkCamera,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer,
+    vtkTexture,
+    vtkWindowLevelLookupTable
+)
 
 
 def get_program_parameters(argv):
@@ -23,7 +47,7 @@ If slice = 39 it matches Figure 12-6 in the VTK Book.
 
 
 def main(data_folder, slice_number):
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
     path = Path(data_folder)
     if path.is_dir():
@@ -46,91 +70,91 @@ def main(data_folder, slice_number):
 
     # Now create the RenderWindow, Renderer and Interactor
     #
-    ren1 = vtk.vtkRenderer()
-    ren2 = vtk.vtkRenderer()
-    ren3 = vtk.vtkRenderer()
-    ren_win = vtk.vtkRenderWindow()
+    ren1 = vtkRenderer()
+    ren2 = vtkRenderer()
+    ren3 = vtkRenderer()
+    ren_win = vtkRenderWindow()
     ren_win.AddRenderer(ren1)
     ren_win.AddRenderer(ren2)
     ren_win.AddRenderer(ren3)
     ren_win.SetWindowName('FrogSlice')
 
-    iren = vtk.vtkRenderWindowInteractor()
+    iren = vtkRenderWindowInteractor()
     iren.SetRenderWindow(ren_win)
 
-    grey_reader = vtk.vtkMetaImageReader()
+    grey_reader = vtkMetaImageReader()
     grey_reader.SetFileName(str(fn_1))
     grey_reader.Update()
 
-    grey_padder = vtk.vtkImageConstantPad()
+    grey_padder = vtkImageConstantPad()
     grey_padder.SetInputConnection(grey_reader.GetOutputPort())
     grey_padder.SetOutputWholeExtent(0, 511, 0, 511, slice_number, slice_number)
     grey_padder.SetConstant(0)
 
-    grey_plane = vtk.vtkPlaneSource()
+    grey_plane = vtkPlaneSource()
 
-    grey_transform = vtk.vtkTransformPolyDataFilter()
+    grey_transform = vtkTransformPolyDataFilter()
     grey_transform.SetTransform(so.get('hfsi'))
     grey_transform.SetInputConnection(grey_plane.GetOutputPort())
 
-    grey_normals = vtk.vtkPolyDataNormals()
+    grey_normals = vtkPolyDataNormals()
     grey_normals.SetInputConnection(grey_transform.GetOutputPort())
     grey_normals.FlipNormalsOff()
 
-    wllut = vtk.vtkWindowLevelLookupTable()
+    wllut = vtkWindowLevelLookupTable()
     wllut.SetWindow(255)
     wllut.SetLevel(128)
     wllut.SetTableRange(0, 255)
     wllut.Build()
 
-    grey_mapper = vtk.vtkPolyDataMapper()
+    grey_mapper = vtkPolyDataMapper()
     grey_mapper.SetInputConnection(grey_plane.GetOutputPort())
 
-    grey_texture = vtk.vtkTexture()
+    grey_texture = vtkTexture()
     grey_texture.SetInputConnection(grey_padder.GetOutputPort())
     grey_texture.SetLookupTable(wllut)
     grey_texture.SetColorModeToMapScalars()
     grey_texture.InterpolateOn()
 
-    grey_actor = vtk.vtkActor()
+    grey_actor = vtkActor()
     grey_actor.SetMapper(grey_mapper)
     grey_actor.SetTexture(grey_texture)
 
-    segment_reader = vtk.vtkMetaImageReader()
+    segment_reader = vtkMetaImageReader()
     segment_reader.SetFileName(str(fn_2))
     segment_reader.Update()
 
-    segment_padder = vtk.vtkImageConstantPad()
+    segment_padder = vtkImageConstantPad()
     segment_padder.SetInputConnection(segment_reader.GetOutputPort())
     segment_padder.SetOutputWholeExtent(0, 511, 0, 511, slice_number, slice_number)
     segment_padder.SetConstant(0)
 
-    segment_plane = vtk.vtkPlaneSource()
+    segment_plane = vtkPlaneSource()
 
-    segment_transform = vtk.vtkTransformPolyDataFilter()
+    segment_transform = vtkTransformPolyDataFilter()
     segment_transform.SetTransform(so.get('hfsi'))
     segment_transform.SetInputConnection(segment_plane.GetOutputPort())
 
-    segment_normals = vtk.vtkPolyDataNormals()
+    segment_normals = vtkPolyDataNormals()
     segment_normals.SetInputConnection(segment_transform.GetOutputPort())
     segment_normals.FlipNormalsOn()
 
     lut = create_frog_lut(colors)
 
-    segment_mapper = vtk.vtkPolyDataMapper()
+    segment_mapper = vtkPolyDataMapper()
     segment_mapper.SetInputConnection(segment_plane.GetOutputPort())
 
-    segment_texture = vtk.vtkTexture()
+    segment_texture = vtkTexture()
     segment_texture.SetInputConnection(segment_padder.GetOutputPort())
     segment_texture.SetLookupTable(lut)
     segment_texture.SetColorModeToMapScalars()
     segment_texture.InterpolateOff()
 
-    segment_actor = vtk.vtkActor()
+    segment_actor = vtkActor()
     segment_actor.SetMapper(segment_mapper)
     segment_actor.SetTexture(segment_texture)
 
-    segment_overlay_actor = vtk.vtkActor()
+    segment_overlay_actor = vtkActor()
     segment_overlay_actor.SetMapper(segment_mapper)
     segment_overlay_actor.SetTexture(segment_texture)
 
@@ -144,7 +168,7 @@ def main(data_folder, slice_number):
     ren2.SetViewport(0.5, 0.5, 1, 1)
     ren2.AddActor(segment_actor)
 
-    cam1 = vtk.vtkCamera()
+    cam1 = vtkCamera()
     cam1.SetViewUp(0, -1, 0)
     cam1.SetPosition(0, 0, -1)
     ren1.SetActiveCamera(cam1)
@@ -172,7 +196,7 @@ def main(data_folder, slice_number):
 
 
 def create_frog_lut(colors):
-    lut = vtk.vtkLookupTable()
+    lut = vtkLookupTable()
     lut.SetNumberOfColors(16)
     lut.SetTableRange(0, 15)
     lut.Build()
@@ -217,28 +241,28 @@ class SliceOrder:
     """
 
     def __init__(self):
-        self.si_mat = vtk.vtkMatrix4x4()
+        self.si_mat = vtkMatrix4x4()
         self.si_mat.Zero()
         self.si_mat.SetElement(0, 0, 1)
         self.si_mat.SetElement(1, 2, 1)
         self.si_mat.SetElement(2, 1, -1)
         self.si_mat.SetElement(3, 3, 1)
 
-        self.is_mat = vtk.vtkMatrix4x4()
+        self.is_mat = vtkMatrix4x4()
         self.is_mat.Zero()
         self.is_mat.SetElement(0, 0, 1)
         self.is_mat.SetElement(1, 2, -1)
         self.is_mat.SetElement(2, 1, -1)
         self.is_mat.SetElement(3, 3, 1)
 
-        self.lr_mat = vtk.vtkMatrix4x4()
+        self.lr_mat = vtkMatrix4x4()
         self.lr_mat.Zero()
         self.lr_mat.SetElement(0, 2, -1)
         self.lr_mat.SetElement(1, 1, -1)
         self.lr_mat.SetElement(2, 0, 1)
         self.lr_mat.SetElement(3, 3, 1)
 
-        self.rl_mat = vtk.vtkMatrix4x4()
+        self.rl_mat = vtkMatrix4x4()
         self.rl_mat.Zero()
         self.rl_mat.SetElement(0, 2, 1)
         self.rl_mat.SetElement(1, 1, -1)
@@ -251,7 +275,7 @@ class SliceOrder:
         with a 180° rotation about y
         """
 
-        self.hf_mat = vtk.vtkMatrix4x4()
+        self.hf_mat = vtkMatrix4x4()
         self.hf_mat.Zero()
         self.hf_mat.SetElement(0, 0, -1)
         self.hf_mat.SetElement(1, 1, 1)
@@ -259,73 +283,73 @@ class SliceOrder:
         self.hf_mat.SetElement(3, 3, 1)
 
     def s_i(self):
-        t = vtk.vtkTransform()
+        t = vtkTransform()
         t.SetMatrix(self.si_mat)
         return t
 
     def i_s(self):
-        t = vtk.vtkTransform()
+        t = vtkTransform()
         t.SetMatrix(self.is_mat)
         return t
 
     @staticmethod
     def a_p():
-        t = vtk.vtkTransform()
+        t = vtkTransform()
         return t.Scale(1, -1, 1)
 
     @staticmethod
     def p_a():
-        t = vtk.vtkTransform()
+        t = vtkTransform()
         return t.Scale(1, -1, -1)
 
     def l_r(self):
-        t = vtk.vtkTransform()
+        t = vtkTransform()
         t.SetMatrix(self.lr_mat)
         t.Update()
         return t
 
     def r_l(self):
-        t = vtk.vtkTransform()
+        t = vtkTransform()
         t.SetMatrix(self.lr_mat)
         return t
 
     def h_f(self):
-        t = vtk.vtkTransform()
+        t = vtkTransform()
         t.SetMatrix(self.hf_mat)
         return t
 
     def hf_si(self):
-        t = vtk.vtkTransform()
+        t = vtkTransform()
         t.Concatenate(self.hf_mat)
         t.Concatenate(self.si_mat)
         return t
 
     def hf_is(self):
-        t = vtk.vtkTransform()
+        t = vtkTransform()
         t.Concatenate(self.hf_mat)
         t.Concatenate(self.is_mat)
         return t
 
     def hf_ap(self):
-        t = vtk.vtkTransform()
+        t = vtkTransform()
         t.Concatenate(self.hf_mat)
         t.Scale(1, -1, 1)
         return t
 
     def hf_pa(self):
-        t = vtk.vtkTransform()
+        t = vtkTransform()
         t.Concatenate(self.hf_mat)
         t.Scale(1, -1, -1)
         return t
 
     def hf_lr(self):
-        t = vtk.vtkTransform()
+        t = vtkTransform()
         t.Concatenate(self.hf_mat)
         t.Concatenate(self.lr_mat)
         return t
 
     def hf_rl(self):
-        t = vtk.vtkTransform()
+        t = vtkTransform()
         t.Concatenate(self.hf_mat)
         t.Concatenate(self.rl_mat)
         return t
@@ -1,4 +1,27 @@
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkFiltersCore import (
+    vtkElevationFilter,
+    vtkGlyph3D
+)
+from vtkmodules.vtkFiltersSources import (
+    vtkConeSource,
+    vtkCubeSource,
+    vtkSphereSource
+)
+from vtkmodules.vtkImagingCore import vtkRTAnalyticSource
+from vtkmodules.vtkImagingGeneral import vtkImageGradient
+from vtkmodules.vtkInteractionStyle import vtkInteractorStyleTrackballCamera
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
 
 
 # This example uses a "glyph table" to change the shape of the 3d glyphs
@@ -8,37 +31,37 @@ import vtk
 # generated by a table like this for some reason...
 
 def main():
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
     # The Wavelet Source is nice for generating a test vtkImageData set
-    rt = vtk.vtkRTAnalyticSource()
+    rt = vtkRTAnalyticSource()
     rt.SetWholeExtent(-2, 2, -2, 2, 0, 0)
 
     # Take the gradient of the only scalar 'RTData' to get a vector attribute
-    grad = vtk.vtkImageGradient()
+    grad = vtkImageGradient()
     grad.SetDimensionality(3)
     grad.SetInputConnection(rt.GetOutputPort())
 
     # Elevation just to generate another scalar attribute that varies nicely over the data range
-    elev = vtk.vtkElevationFilter()
+    elev = vtkElevationFilter()
     # Elevation values will range from 0 to 1 between the Low and High Points
     elev.SetLowPoint(-2, -2, 0)
     elev.SetHighPoint(2, 2, 0)
     elev.SetInputConnection(grad.GetOutputPort())
 
     # Create simple PolyData for glyph table
-    cs = vtk.vtkCubeSource()
+    cs = vtkCubeSource()
     cs.SetXLength(0.5)
     cs.SetYLength(1)
     cs.SetZLength(2)
-    ss = vtk.vtkSphereSource()
+    ss = vtkSphereSource()
     ss.SetRadius(0.25)
-    cs2 = vtk.vtkConeSource()
+    cs2 = vtkConeSource()
     cs2.SetRadius(0.25)
     cs2.SetHeight(0.5)
 
     # Set up the glyph filter
-    glyph = vtk.vtkGlyph3D()
+    glyph = vtkGlyph3D()
     glyph.SetInputConnection(elev.GetOutputPort())
 
     # Here is where we build the glyph table
@@ -62,7 +85,7 @@ def main():
     glyph.SetInputArrayToProcess(1, 0, 0, 0, 'RTDataGradient')  # vectors
 
     coloring_by = 'Elevation'
-    mapper = vtk.vtkPolyDataMapper()
+    mapper = vtkPolyDataMapper()
     mapper.SetInputConnection(glyph.GetOutputPort())
     mapper.SetScalarModeToUsePointFieldData()
     mapper.SetColorModeToMapScalars()
@@ -73,19 +96,19 @@ def main():
     # mapper.SetScalarRange(glyph.GetOutputDataObject(0).GetPointData().GetArray(coloring_by).GetRange())
 
     mapper.SelectColorArray(coloring_by)
-    actor = vtk.vtkActor()
+    actor = vtkActor()
     actor.SetMapper(mapper)
 
-    ren = vtk.vtkRenderer()
+    ren = vtkRenderer()
     ren.AddActor(actor)
     ren.SetBackground(colors.GetColor3d("DarkGray"))
 
-    renWin = vtk.vtkRenderWindow()
+    renWin = vtkRenderWindow()
     renWin.AddRenderer(ren)
     renWin.SetWindowName('GlyphTable')
 
-    iren = vtk.vtkRenderWindowInteractor()
-    istyle = vtk.vtkInteractorStyleTrackballCamera()
+    iren = vtkRenderWindowInteractor()
+    istyle = vtkInteractorStyleTrackballCamera()
     iren.SetInteractorStyle(istyle)
     iren.SetRenderWindow(renWin)
     ren.ResetCamera()
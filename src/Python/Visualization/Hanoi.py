@@ -2,7 +2,49 @@
 
 #  Translated from Hanoi.cxx.
 
-import vtk
+import os
+import queue
+import threading
+import time
+from fractions import Fraction
+from pathlib import Path
+
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonCore import vtkMinimalStandardRandomSequence
+from vtkmodules.vtkCommonDataModel import vtkImageData
+from vtkmodules.vtkFiltersSources import (
+    vtkCylinderSource,
+    vtkPlaneSource
+)
+from vtkmodules.vtkIOImage import (
+    vtkBMPWriter,
+    vtkJPEGWriter,
+    vtkPNGWriter,
+    vtkPNMWriter,
+    vtkPostScriptWriter,
+    vtkTIFFWriter
+)
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkCamera,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer,
+    vtkWindowToImageFilter
+)
+
+try:
+    import numpy as np
+    from vtkmodules.util import numpy_support
+except ModuleNotFoundError:
+    np = None
 
 
 class GV(object):
@@ -23,18 +65,24 @@ class GV(object):
         self.rMax = 12.0 * self.R  # The maximum allowable radius of disks
         self.D = 1.1 * 1.25 * self.rMax  # The distance between the pegs.
         self.numberOfMoves = 0
+        self.frames = None  # The file used to record the animation.
+        self.offscreen = False  # Render offscreen as fast as possible.
+        self.driver = None  # Renders the frames of the animation.
+        self.recorder = None  # Records the frames of the animation.
 
-    def update(self, numberOfPucks, numberOfSteps, puckResolution, configuration):
+    def update(self, numberOfPucks, numberOfSteps, puckResolution, configuration, frames=None, offscreen=False):
         self.numberOfPucks = numberOfPucks
         self.numberOfSteps = numberOfSteps
         self.puckResolution = puckResolution
         self.configuration = configuration
+        self.frames = frames
+        self.offscreen = offscreen
         self.H = 1.1 * self.numberOfPucks * self.L  # Peg height.
 
 
 # Globals
 gv = GV()
-renWin = vtk.vtkRenderWindow()
+renWin = vtkRenderWindow()
 """
    For pegStack we use a list of lists where the sublists correspond to the
       source, target and helper pegs.
@@ -45,18 +93,20 @@ pegStack = [[], [], []]
 
 
 def hanoi():
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
     # Create the renderer and render window interactor.
-    ren = vtk.vtkRenderer()
+    ren = vtkRenderer()
     renWin.AddRenderer(ren)
     renWin.SetSize(1200, 750)
-    iren = vtk.vtkRenderWindowInteractor()
+    if gv.offscreen:
+        renWin.SetOffScreenRendering(1)
+    iren = vtkRenderWindowInteractor()
     iren.SetRenderWindow(renWin)
 
     ren.SetBackground(colors.GetColor3d('PapayaWhip'))
 
-    camera = vtk.vtkCamera()
+    camera = vtkCamera()
     camera.SetPosition(41.0433, 27.9637, 30.442)
     camera.SetFocalPoint(11.5603, -1.51931, 0.95899)
     camera.SetClippingRange(18.9599, 91.6042)
@@ -65,24 +115,24 @@ def hanoi():
     ren.SetActiveCamera(camera)
 
     # Create geometry: table, pegs, and pucks.
-    pegGeometry = vtk.vtkCylinderSource()
+    pegGeometry = vtkCylinderSource()
     pegGeometry.SetResolution(8)
-    pegMapper = vtk.vtkPolyDataMapper()
+    pegMapper = vtkPolyDataMapper()
     pegMapper.SetInputConnection(pegGeometry.GetOutputPort())
 
-    puckGeometry = vtk.vtkCylinderSource()
+    puckGeometry = vtkCylinderSource()
     puckGeometry.SetResolution(gv.puckResolution)
-    puckMapper = vtk.vtkPolyDataMapper()
+    puckMapper = vtkPolyDataMapper()
     puckMapper.SetInputConnection(puckGeometry.GetOutputPort())
 
-    tableGeometry = vtk.vtkPlaneSource()
+    tableGeometry = vtkPlaneSource()
     tableGeometry.SetResolution(10, 10)
-    tableMapper = vtk.vtkPolyDataMapper()
+    tableMapper = vtkPolyDataMapper()
     tableMapper.SetInputConnection(tableGeometry.GetOutputPort())
 
     # Create the actors: table top, pegs, and pucks
     # The table
-    table = vtk.vtkActor()
+    table = vtkActor()
     ren.AddActor(table)
     table.SetMapper(tableMapper)
     # table.GetProperty().SetColor(0.9569, 0.6431, 0.3765)
@@ -96,7 +146,7 @@ def hanoi():
     gv.H = 1.1 * gv.numberOfPucks * gv.L
     peg = list()
     for i in range(0, 3):
-        peg.append(vtk.vtkActor())
+        peg.append(vtkActor())
         ren.AddActor(peg[i])
         peg[i].SetMapper(pegMapper)
         # peg[i].GetProperty().SetColor(1, 1, 1)
@@ -106,10 +156,10 @@ def hanoi():
 
     # The pucks (using cylinder geometry). Always loaded on peg# 0.
     puck = list()
-    randomSequence = vtk.vtkMinimalStandardRandomSequence()
+    randomSequence = vtkMinimalStandardRandomSequence()
     randomSequence.SetSeed(1)
     for i in range(0, gv.numberOfPucks):
-        puck.append(vtk.vtkActor())
+        puck.append(vtkActor())
         puck[i].SetMapper(puckMapper)
         color = [0, 0, 0]
         for j in range(0, 3):
@@ -127,7 +177,11 @@ def hanoi():
     renWin.SetWindowName('Hanoi')
 
     if gv.configuration == 3:
-        WriteImage('hanoi0.png', renWin, rgba=False)
+        write_image('hanoi0.png', renWin, rgba=False)
+
+    gv.driver = AnimationDriver(renWin, frame_rate=60)
+    if gv.frames:
+        gv.recorder = FrameRecorder(renWin, gv.frames, frame_rate=gv.driver.frame_rate)
 
     if gv.configuration != 1:
         # Begin recursion.
@@ -136,13 +190,22 @@ def hanoi():
         if not gv.gotFigure2:
             Hanoi(gv.numberOfPucks - 1, 2, 1, 0)
 
+            # The final frame has already been recorded.
+            if gv.recorder:
+                gv.recorder.pause()
             renWin.Render()
             if gv.configuration == 3:
-                WriteImage('hanoi2.png', renWin, rgba=False)
+                write_image('hanoi2.png', renWin, rgba=False)
         # Report output.
         s = 'Number of moves: {:d}\nPolygons rendered each frame: {:d}\nTotal number of frames: {:d}'
         print(s.format(gv.numberOfMoves, 3 * 8 + 1 + gv.numberOfPucks * (2 + gv.puckResolution),
                        gv.numberOfMoves * 3 * gv.numberOfSteps))
+        gv.driver.report()
+    if gv.recorder:
+        gv.recorder.close()
+
+    if gv.offscreen:
+        return
 
     iren.AddObserver('EndInteractionEvent', OrientationObserver(ren.GetActiveCamera()))
 
@@ -170,6 +233,9 @@ Where:  -p specifies the number of pucks.
             1 initial configuration.
             2 intermediate configuration.
             3 final configuration and save images
+        -f records the animation, e.g. -f hanoi.y4m for a YUV4MPEG2 stream (needs NumPy)
+            or -f hanoi.png for the PNG files hanoi0000.png, hanoi0001.png, ...
+        -o renders offscreen as fast as possible e.g. to record the animation.
 Defaults:  -p 5 -s 5 -r 48 -c 0
     '''
     parser = argparse.ArgumentParser(description=description, epilog=epilogue,
@@ -178,12 +244,15 @@ Defaults:  -p 5 -s 5 -r 48 -c 0
     parser.add_argument('--numberOfSteps', '-s', default=5, type=int, nargs='?', help='The number of steps.')
     parser.add_argument('--puckResolution', '-r', default=48, type=int, nargs='?', help='The puck resolution.')
     parser.add_argument('--configuration', '-c', default=0, type=int, nargs='?', help='The configuration.')
+    parser.add_argument('--frames', '-f', default=None, help='Record the animation to this file.')
+    parser.add_argument('--offscreen', '-o', action='store_true', help='Render offscreen as fast as possible.')
     args = parser.parse_args()
-    return args.numberOfPucks, args.numberOfSteps, args.puckResolution, args.configuration
+    return (args.numberOfPucks, args.numberOfSteps, args.puckResolution, args.configuration, args.frames,
+            args.offscreen)
 
 
 def verify_parameters(maxPucks):
-    numberOfPucks, numberOfSteps, puckResolution, configuration = get_program_parameters()
+    numberOfPucks, numberOfSteps, puckResolution, configuration, frames, offscreen = get_program_parameters()
     numberOfPucks = abs(numberOfPucks)
     numberOfSteps = abs(numberOfSteps)
     puckResolution = abs(puckResolution)
@@ -202,7 +271,7 @@ def verify_parameters(maxPucks):
         print('0 >= configuration <= 3')
         check = False
     if check:
-        gv.update(numberOfPucks, numberOfSteps, puckResolution, configuration)
+        gv.update(numberOfPucks, numberOfSteps, puckResolution, configuration, frames, offscreen)
     return check
 
 
@@ -223,7 +292,7 @@ def MovePuck(peg1, peg2):
 
     for i in range(0, gv.numberOfSteps):
         movingActor.AddPosition(0, distance, 0)
-        renWin.Render()
+        gv.driver.render()
 
     # Get the distance to move across
     distance = (peg2 - peg1) * gv.D / gv.numberOfSteps
@@ -231,11 +300,14 @@ def MovePuck(peg1, peg2):
     for i in range(0, gv.numberOfSteps):
         movingActor.AddPosition(distance, 0, 0)
         movingActor.RotateX(flipAngle)
-        renWin.Render()
+        gv.driver.render()
         if gv.numberOfMoves == 13 and i == 3:  # for making book image
             if gv.configuration == 3 or gv.configuration == 2:
+                # The book image is not part of the animation.
+                if gv.recorder:
+                    gv.recorder.pause()
                 cam = renWin.GetRenderers().GetFirstRenderer().GetActiveCamera()
-                camera1 = vtk.vtkCamera()
+                camera1 = vtkCamera()
                 camera1.SetPosition(54.7263, 41.6467, 44.125)
                 camera1.SetFocalPoint(11.5603, -1.51931, 0.95899)
                 camera1.SetClippingRange(42.4226, 115.659)
@@ -243,12 +315,14 @@ def MovePuck(peg1, peg2):
                 renWin.GetRenderers().GetFirstRenderer().SetActiveCamera(camera1)
                 renWin.Render()
                 if gv.configuration == 3:
-                    WriteImage('hanoi1.png', renWin, rgba=False)
+                    write_image('hanoi1.png', renWin, rgba=False)
                 if gv.configuration == 2:
                     gv.gotFigure2 = True
                     break
                 renWin.GetRenderers().GetFirstRenderer().SetActiveCamera(cam)
                 renWin.Render()
+                if gv.recorder:
+                    gv.recorder.resume()
     if gv.gotFigure2:
         pegStack[peg2].append(movingActor)
         return
@@ -258,7 +332,7 @@ def MovePuck(peg1, peg2):
 
     for i in range(0, gv.numberOfSteps):
         movingActor.AddPosition(0, distance, 0)
-        renWin.Render()
+        gv.driver.render()
     pegStack[peg2].append(movingActor)
 
 
@@ -305,7 +379,7 @@ def CameraOrientation(cam):
     print(fmt1.format('Distance:'), fmt2.format(cam.GetDistance()))
 
 
-def WriteImage(fileName, renWin1, rgba=True):
+def write_image(file_name, render_window, rgba=True):
     """
     Write the render window view to an image file.
 
@@ -313,38 +387,35 @@ def WriteImage(fileName, renWin1, rgba=True):
      BMP, JPEG, PNM, PNG, PostScript, TIFF.
     The default parameters are used for all writers, change as needed.
 
-    :param fileName: The file name, if no extension then PNG is assumed.
-    :param renWin1: The render window.
+    :param file_name: The file name, if no extension then PNG is assumed.
+    :param render_window: The render window.
     :param rgba: Used to set the buffer type.
     :return:
     """
-
-    import os
-
-    if fileName:
+    if file_name:
         # Select the writer to use.
-        path, ext = os.path.splitext(fileName)
+        path, ext = os.path.splitext(file_name)
         ext = ext.lower()
         if not ext:
             ext = '.png'
-            fileName = fileName + ext
+            file_name = file_name + ext
         if ext == '.bmp':
-            writer = vtk.vtkBMPWriter()
+            writer = vtkBMPWriter()
         elif ext == '.jpg':
-            writer = vtk.vtkJPEGWriter()
+            writer = vtkJPEGWriter()
         elif ext == '.pnm':
-            writer = vtk.vtkPNMWriter()
+            writer = vtkPNMWriter()
         elif ext == '.ps':
             if rgba:
                 rgba = False
-            writer = vtk.vtkPostScriptWriter()
+            writer = vtkPostScriptWriter()
         elif ext == '.tiff':
-            writer = vtk.vtkTIFFWriter()
+            writer = vtkTIFFWriter()
         else:
-            writer = vtk.vtkPNGWriter()
+            writer = vtkPNGWriter()
 
-        windowto_image_filter = vtk.vtkWindowToImageFilter()
-        windowto_image_filter.SetInput(renWin1)
+        windowto_image_filter = vtkWindowToImageFilter()
+        windowto_image_filter.SetInput(render_window)
         windowto_image_filter.SetScale(1)  # image quality
         if rgba:
             windowto_image_filter.SetInputBufferTypeToRGBA()
@@ -354,12 +425,210 @@ def WriteImage(fileName, renWin1, rgba=True):
             windowto_image_filter.ReadFrontBufferOff()
             windowto_image_filter.Update()
 
-        writer.SetFileName(fileName)
+        writer.SetFileName(file_name)
         writer.SetInputConnection(windowto_image_filter.GetOutputPort())
         writer.Write()
     else:
         raise RuntimeError('Need a filename.')
 
 
+class FrameRecorder(object):
+    """
+    Record every frame rendered in a render window.
+
+    When a render finishes, the frame is read back by a vtkWindowToImageFilter that is reused
+     for every frame. The frame is put in a bounded queue and written by background threads,
+     so the render loop only waits for the writing when the queue is full.
+
+    If the file name ends in .y4m, the frames are written as a YUV4MPEG2 stream, this needs NumPy.
+     The stream can be converted with e.g. ffmpeg -i frames.y4m frames.mp4
+    Otherwise the frames are written as a numbered PNG sequence e.g. frames0000.png, frames0001.png, ...
+    """
+
+    def __init__(self, render_window, file_name, frame_rate=30, queue_size=8, workers=2):
+        """
+        :param render_window: The render window.
+        :param file_name: The .y4m file or the prefix of the PNG files.
+        :param frame_rate: The frame rate of the .y4m stream, it does not have to be an integer.
+        :param queue_size: The maximum number of frames waiting to be written.
+        :param workers: The number of threads writing the PNG files.
+        """
+        path = Path(file_name)
+        self.y4m = path.suffix.lower() == '.y4m'
+        if self.y4m and np is None:
+            raise RuntimeError('NumPy is needed to write a .y4m stream.')
+        self.file_name = file_name
+        self.frame_rate = frame_rate
+        self.prefix = str(path.with_suffix(''))
+        self.stream = None
+        self.size = None
+
+        self.window_to_image = vtkWindowToImageFilter()
+        self.window_to_image.SetInput(render_window)
+        # The frame has just been rendered, so read it from the back buffer without rendering again.
+        self.window_to_image.ShouldRerenderOff()
+        self.window_to_image.ReadFrontBufferOff()
+        self.window_to_image.SetInputBufferTypeToRGB()
+
+        self.number_of_frames = 0
+        self.capture_time = 0.0
+        self.paused = False
+        # The first exception raised while writing the frames.
+        self.error = None
+        self.frames = queue.Queue(queue_size)
+        if self.y4m:
+            # The stream is written in order by one thread.
+            workers = 1
+            self.stream = open(file_name, 'wb')
+        self.threads = [threading.Thread(target=self.write_frames, daemon=True) for i in range(workers)]
+        for thread in self.threads:
+            thread.start()
+        self.render_window = render_window
+        self.observer = render_window.AddObserver('EndEvent', self.capture)
+
+    def pause(self):
+        """
+        Stop recording the frames, e.g. while rendering an image that is not part of the animation.
+        """
+        self.paused = True
+
+    def resume(self):
+        self.paused = False
+
+    def capture(self, caller=None, event=None):
+        if self.paused:
+            return
+        if self.error is not None:
+            # Exceptions raised in an observer do not reach the render loop, so report it and stop recording,
+            #  close() raises it.
+            print(f'Recording to {self.file_name} stopped, a frame could not be written: {self.error}')
+            self.render_window.RemoveObserver(self.observer)
+            return
+        start = time.perf_counter()
+        self.window_to_image.Modified()
+        self.window_to_image.Update()
+        # The frame shares the pixels with the filter output, as the frame holds a reference to them,
+        #  the filter allocates new pixels for the next frame instead of overwriting them.
+        frame = vtkImageData()
+        frame.ShallowCopy(self.window_to_image.GetOutput())
+        self.frames.put((self.number_of_frames, frame))
+        self.number_of_frames += 1
+        self.capture_time += time.perf_counter() - start
+
+    def write_frames(self):
+        while True:
+            item = self.frames.get()
+            if item is None:
+                break
+            if self.error is not None:
+                # Keep emptying the queue so that capture() and close() never wait on it.
+                continue
+            index, frame = item
+            try:
+                if self.y4m:
+                    self.write_y4m_frame(frame)
+                else:
+                    file_name = f'{self.prefix}{index:04d}.png'
+                    writer = vtkPNGWriter()
+                    writer.SetFileName(file_name)
+                    writer.SetInputData(frame)
+                    writer.Write()
+                    if writer.GetErrorCode():
+                        raise OSError(f'Cannot write {file_name}.')
+            except Exception as e:
+                self.error = e
+
+    def write_y4m_frame(self, frame):
+        width, height = frame.GetDimensions()[:2]
+        if self.size is None:
+            self.size = (width, height)
+            # The frame rate is written as a ratio, e.g. 100/3 as F100:3.
+            rate = Fraction(self.frame_rate).limit_denominator(1001)
+            self.stream.write(f'YUV4MPEG2 W{width} H{height} F{rate.numerator}:{rate.denominator} Ip A1:1 C444'
+                              f' XCOLORRANGE=FULL\n'.encode('ascii'))
+        elif self.size != (width, height):
+            # The window has been resized, the frame does not fit in the stream.
+            return
+        # The image rows are stored from the bottom up.
+        rgb = numpy_support.vtk_to_numpy(frame.GetPointData().GetScalars()).reshape(height, width, 3)[::-1]
+        rgb = rgb.astype(np.float32)
+        # Full range BT.601 YCbCr.
+        y = rgb @ np.array([0.299, 0.587, 0.114], dtype=np.float32)
+        cb = rgb @ np.array([-0.168736, -0.331264, 0.5], dtype=np.float32) + 128
+        cr = rgb @ np.array([0.5, -0.418688, -0.081312], dtype=np.float32) + 128
+        self.stream.write(b'FRAME\n')
+        for plane in (y, cb, cr):
+            self.stream.write(np.clip(np.rint(plane), 0, 255).astype(np.uint8).tobytes())
+
+    def close(self):
+        """
+        Stop recording and wait for the frames to be written.
+        """
+        self.render_window.RemoveObserver(self.observer)
+        for thread in self.threads:
+            self.frames.put(None)
+        for thread in self.threads:
+            thread.join()
+        if self.stream:
+            self.stream.close()
+        if self.error is not None:
+            raise RuntimeError(f'Recording to {self.file_name} failed: {self.error}') from self.error
+        if self.number_of_frames:
+            print(f'Recorded {self.number_of_frames} frames to {self.file_name},'
+                  f' {self.capture_time / self.number_of_frames * 1000:0.1f}ms per frame in the render loop.')
+
+
+class AnimationDriver(object):
+    """
+    Render the frames of an animation and time them.
+
+    In real time mode the frames are shown at the frame rate, a frame that takes too long
+     delays the rest of the animation rather than frames being dropped, so the same frames
+     are always rendered.
+    When the render window is offscreen, nobody is watching, so the frames are rendered
+     as fast as possible.
+    """
+
+    def __init__(self, render_window, frame_rate=30.0, real_time=None):
+        """
+        :param render_window: The render window.
+        :param frame_rate: The number of frames per second in real time mode.
+        :param real_time: If None, real time mode is used unless the render window is offscreen.
+        """
+        self.render_window = render_window
+        self.frame_rate = frame_rate
+        self.frame_interval = 1.0 / frame_rate
+        if real_time is None:
+            real_time = not render_window.GetOffScreenRendering()
+        self.real_time = real_time
+        self.frame_times = list()
+        self.start = None
+        self.end = None
+        self.next_frame = None
+
+    def render(self):
+        """
+        Render a frame, in real time mode wait until the next frame is due.
+        """
+        start = time.perf_counter()
+        if self.start is None:
+            self.start = self.next_frame = start
+        self.render_window.Render()
+        self.end = time.perf_counter()
+        self.frame_times.append(self.end - start)
+        if self.real_time:
+            self.next_frame = max(self.next_frame + self.frame_interval, self.end)
+            time.sleep(self.next_frame - self.end)
+
+    def report(self):
+        if not self.frame_times:
+            return
+        n = len(self.frame_times)
+        elapsed = self.end - self.start
+        print(f'Rendered {n} frames in {elapsed:0.2f}s ({n / elapsed:0.1f} fps),'
+              f' render time per frame: mean {sum(self.frame_times) / n * 1000:0.1f}ms,'
+              f' max {max(self.frame_times) * 1000:0.1f}ms.')
+
+
 if __name__ == '__main__':
     main()
@@ -9,12 +9,58 @@ The surface is extracted via marching cubes using a visit value of 50.
 The number of integration steps is 10 million, in a volume of dimensions 200 x 200 x 200.
 The surface roughness is caused by the discrete nature of the evaluation function.
 
-'''
-import vtk
-
+If NumPy is available the trajectory is integrated in chunks and the voxel visits are
+ counted in a single pass, otherwise the VTK array is updated one step at a time.
 
-def main():
-    colors = vtk.vtkNamedColors()
+'''
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonCore import (
+    VTK_SHORT,
+    vtkMinimalStandardRandomSequence,
+    vtkShortArray
+)
+from vtkmodules.vtkCommonDataModel import vtkStructuredPoints
+from vtkmodules.vtkFiltersCore import vtkContourFilter
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
+
+try:
+    import numpy as np
+    from vtkmodules.util import numpy_support
+except ModuleNotFoundError:
+    np = None
+
+
+def get_program_parameters():
+    import argparse
+    description = 'Create an iso-surface of the Lorenz attractor.'
+    epilogue = '''
+    The number of visits in each voxel is recorded as a scalar function.
+    Lowering the number of iterations or the resolution gives a quicker, but rougher, surface.
+   '''
+    parser = argparse.ArgumentParser(description=description, epilog=epilogue,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-i', '--iterations', default=10000000, type=int, help='The number of iterations.')
+    parser.add_argument('-r', '--resolution', default=200, type=int, help='The slice resolution.')
+    parser.add_argument('-v', action='store_true', dest='vtk_only',
+                        help='Count the visits with the VTK array one step at a time, this is slow.')
+    args = parser.parse_args()
+    return args.iterations, args.resolution, args.vtk_only
+
+
+def main(iterations, resolution, vtk_only):
+    colors = vtkNamedColors()
 
     Pr = 10.0  # The Lorenz parameters
     b = 2.667
@@ -23,8 +69,6 @@ def main():
     # y = 0.0
     # z = 0.0  # starting (and current) x, y, z
     h = 0.01  # integration step size
-    resolution = 200  # slice resolution
-    iterations = 10000000  # number of iterations
     xmin = -30.0  # x, y, z range for voxels
     xmax = 30.0
     ymin = -30.0
@@ -43,13 +87,13 @@ def main():
     print(' r =', r)
     print(' integration step size =', h)
     print(' slice resolution =', resolution)
-    print(' # of iterations =', iter)
+    print(' # of iterations =', iterations)
     print(' specified range:')
     print('     x: {:f}, {:f}'.format(xmin, xmax))
     print('     y: {:f}, {:f}'.format(ymin, ymax))
     print('     z: {:f}, {:f}'.format(zmin, zmax))
 
-    randomSequence = vtk.vtkMinimalStandardRandomSequence()
+    randomSequence = vtkMinimalStandardRandomSequence()
     randomSequence.SetSeed(8775070)
     x = randomSequence.GetRangeValue(xmin, xmax)
     randomSequence.Next()
@@ -61,28 +105,32 @@ def main():
     # allocate memory for the slices
     sliceSize = resolution * resolution
     numPts = sliceSize * resolution
-    scalars = vtk.vtkShortArray()
-    for i in range(0, numPts):
-        scalars.InsertTuple1(i, 0)
-    for j in range(0, iterations):
-        # Integrate to the next time step.
-        xx = x + h * Pr * (y - x)
-        yy = y + h * (x * (r - z) - y)
-        zz = z + h * (x * y - (b * z))
-
-        x = xx
-        y = yy
-        z = zz
-
-        # Calculate the voxel index.
-        if xmax > x > xmin and ymax > y > ymin and zmax > z > zmin:
-            xxx = int(float(xx - xmin) * xIncr)
-            yyy = int(float(yy - ymin) * yIncr)
-            zzz = int(float(zz - zmin) * zIncr)
-            index = xxx + yyy * resolution + zzz * sliceSize
-            scalars.SetTuple1(index, scalars.GetTuple1(index) + 1)
-
-    volume = vtk.vtkStructuredPoints()
+    if np is not None and not vtk_only:
+        scalars = count_visits(x, y, z, Pr, b, r, h, iterations, resolution,
+                               (xmin, xmax, ymin, ymax, zmin, zmax))
+    else:
+        scalars = vtkShortArray()
+        for i in range(0, numPts):
+            scalars.InsertTuple1(i, 0)
+        for j in range(0, iterations):
+            # Integrate to the next time step.
+            xx = x + h * Pr * (y - x)
+            yy = y + h * (x * (r - z) - y)
+            zz = z + h * (x * y - (b * z))
+
+            x = xx
+            y = yy
+            z = zz
+
+            # Calculate the voxel index.
+            if xmax > x > xmin and ymax > y > ymin and zmax > z > zmin:
+                xxx = int(float(xx - xmin) * xIncr)
+                yyy = int(float(yy - ymin) * yIncr)
+                zzz = int(float(zz - zmin) * zIncr)
+                index = xxx + yyy * resolution + zzz * sliceSize
+                scalars.SetTuple1(index, scalars.GetTuple1(index) + 1)
+
+    volume = vtkStructuredPoints()
     volume.GetPointData().SetScalars(scalars)
     volume.SetDimensions(resolution, resolution, resolution)
     volume.SetOrigin(xmin, ymin, zmin)
@@ -90,25 +138,25 @@ def main():
 
     print(' contouring...')
     # Do the graphics dance.
-    renderer = vtk.vtkRenderer()
-    renWin = vtk.vtkRenderWindow()
+    renderer = vtkRenderer()
+    renWin = vtkRenderWindow()
     renWin.AddRenderer(renderer)
 
-    iren = vtk.vtkRenderWindowInteractor()
+    iren = vtkRenderWindowInteractor()
     iren.SetRenderWindow(renWin)
 
     # Create iso-surface
-    contour = vtk.vtkContourFilter()
+    contour = vtkContourFilter()
     contour.SetInputData(volume)
     contour.SetValue(0, 50)
 
     # Create mapper.
-    mapper = vtk.vtkPolyDataMapper()
+    mapper = vtkPolyDataMapper()
     mapper.SetInputConnection(contour.GetOutputPort())
     mapper.ScalarVisibilityOff()
 
     # Create actor.
-    actor = vtk.vtkActor()
+    actor = vtkActor()
     actor.SetMapper(mapper)
     actor.GetProperty().SetColor(colors.GetColor3d('DodgerBlue'))
 
@@ -131,5 +179,56 @@ def main():
     iren.Start()
 
 
+def count_visits(x, y, z, Pr, b, r, h, iterations, resolution, bounds, chunk_size=1000000):
+    """
+    Integrate the Lorenz equations and count the number of visits to each voxel.
+
+    Each integration step depends on the previous one so the trajectory is integrated
+     in chunks of plain floats, the voxel indices of each chunk are then computed with NumPy
+     and all the visits are counted with a single bincount.
+
+    :param x, y, z: The starting point.
+    :param Pr, b, r: The Lorenz parameters.
+    :param h: The integration step size.
+    :param iterations: The number of iterations.
+    :param resolution: The slice resolution.
+    :param bounds: The x, y, z range for the voxels.
+    :param chunk_size: The number of steps integrated before the indices are computed.
+    :return: A vtkShortArray of visits that shares its memory with a NumPy array.
+    """
+    xmin, xmax, ymin, ymax, zmin, zmax = bounds
+    lo = np.array([xmin, ymin, zmin])
+    hi = np.array([xmax, ymax, zmax])
+    incr = resolution / (hi - lo)
+    strides = np.array([1, resolution, resolution * resolution], dtype=np.int64)
+
+    # Start with an empty chunk so that there is something to concatenate when iterations is 0.
+    indices = [np.empty(0, dtype=np.int64)]
+    remaining = iterations
+    while remaining > 0:
+        n = min(chunk_size, remaining)
+        remaining -= n
+        xs = [0.0] * n
+        ys = [0.0] * n
+        zs = [0.0] * n
+        for j in range(0, n):
+            # Integrate to the next time step.
+            x, y, z = x + h * Pr * (y - x), y + h * (x * (r - z) - y), z + h * (x * y - (b * z))
+            xs[j] = x
+            ys[j] = y
+            zs[j] = z
+        pts = np.column_stack((xs, ys, zs))
+        inside = np.all((pts > lo) & (pts < hi), axis=1)
+        ijk = ((pts[inside] - lo) * incr).astype(np.int64)
+        indices.append(ijk @ strides)
+
+    num_pts = resolution ** 3
+    visits = np.bincount(np.concatenate(indices), minlength=num_pts)
+    visits = np.minimum(visits, np.iinfo(np.int16).max).astype(np.int16)
+    # The VTK array refers to the NumPy array rather than copying it.
+    return numpy_support.numpy_to_vtk(visits, deep=False, array_type=VTK_SHORT)
+
+
 if __name__ == '__main__':
-    main()
+    iterations, resolution, vtk_only = get_program_parameters()
+    main(iterations, resolution, vtk_only)
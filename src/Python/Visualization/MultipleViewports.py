@@ -1,12 +1,26 @@
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkFiltersSources import vtkSphereSource
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
 
 
 def main():
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
     '''One render window, multiple viewports'''
-    rw = vtk.vtkRenderWindow()
-    iren = vtk.vtkRenderWindowInteractor()
+    rw = vtkRenderWindow()
+    iren = vtkRenderWindowInteractor()
     iren.SetRenderWindow(rw)
 
     # Define viewport ranges
@@ -20,19 +34,19 @@ def main():
     actor_color = ['Bisque', 'RosyBrown', 'Goldenrod', 'Chocolate']
 
     for i in range(4):
-        ren = vtk.vtkRenderer()
+        ren = vtkRenderer()
         rw.AddRenderer(ren)
         ren.SetViewport(xmins[i], ymins[i], xmaxs[i], ymaxs[i])
 
         # Create a sphere
-        sphereSource = vtk.vtkSphereSource()
+        sphereSource = vtkSphereSource()
         sphereSource.SetCenter(0.0, 0.0, 0.0)
         sphereSource.SetRadius(5)
 
         # Create a mapper and actor
-        mapper = vtk.vtkPolyDataMapper()
+        mapper = vtkPolyDataMapper()
         mapper.SetInputConnection(sphereSource.GetOutputPort())
-        actor = vtk.vtkActor()
+        actor = vtkActor()
         actor.GetProperty().SetColor(colors.GetColor3d(actor_color[i]))
         actor.SetMapper(mapper)
         ren.AddActor(actor)
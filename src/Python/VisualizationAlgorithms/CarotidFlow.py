@@ -1,89 +1,132 @@
 #!/usr/bin/env python
 
-import vtk
+import time
+
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonCore import (
+    VTK_VERSION_NUMBER,
+    vtkCommand,
+    vtkLookupTable,
+    vtkSMPTools,
+    vtkVersion
+)
+from vtkmodules.vtkFiltersCore import (
+    vtkContourFilter,
+    vtkMaskPoints,
+    vtkThresholdPoints,
+    vtkTubeFilter
+)
+from vtkmodules.vtkFiltersFlowPaths import vtkStreamTracer
+from vtkmodules.vtkFiltersModeling import vtkOutlineFilter
+from vtkmodules.vtkFiltersSources import vtkPointSource
+from vtkmodules.vtkIOLegacy import vtkStructuredPointsReader
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkCamera,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
 
 
 def main():
-    fileName = get_program_parameters()
+    fileName, numberOfSeeds, workers, max_seeds, max_steps = get_program_parameters()
 
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
-    ren1 = vtk.vtkRenderer()
+    ren1 = vtkRenderer()
 
-    renWin = vtk.vtkRenderWindow()
+    renWin = vtkRenderWindow()
     renWin.AddRenderer(ren1)
 
-    iren = vtk.vtkRenderWindowInteractor()
+    iren = vtkRenderWindowInteractor()
     iren.SetRenderWindow(renWin)
 
     # Create the pipeline.
     #
-    reader = vtk.vtkStructuredPointsReader()
+    reader = vtkStructuredPointsReader()
     reader.SetFileName(fileName)
 
-    psource = vtk.vtkPointSource()
-    psource.SetNumberOfPoints(25)
+    psource = vtkPointSource()
+    psource.SetNumberOfPoints(numberOfSeeds)
     psource.SetCenter(133.1, 116.3, 5.0)
     psource.SetRadius(2.0)
 
-    threshold = vtk.vtkThresholdPoints()
+    threshold = vtkThresholdPoints()
     threshold.SetInputConnection(reader.GetOutputPort())
     threshold.ThresholdByUpper(275)
 
-    streamers = vtk.vtkStreamTracer()
+    streamers = vtkStreamTracer()
     streamers.SetInputConnection(reader.GetOutputPort())
-    streamers.SetSourceConnection(psource.GetOutputPort())
+    seeds = psource if max_seeds is None else mask_seeds(psource, max_seeds)
+    streamers.SetSourceConnection(seeds.GetOutputPort())
     # streamers.SetMaximumPropagationUnitToTimeUnit()
     streamers.SetMaximumPropagation(100.0)
     # streamers.SetInitialIntegrationStepUnitToCellLengthUnit()
     streamers.SetInitialIntegrationStep(0.2)
     streamers.SetTerminalSpeed(.01)
+    if max_steps is not None:
+        streamers.SetMaximumNumberOfSteps(max_steps)
+
+    # vtkStreamTracer traces the seeds in parallel using vtkSMPTools.
+    threads = use_threads(workers) if workers else None
+    streamers.AddObserver(vtkCommand.ProgressEvent, print_progress)
+    start = time.perf_counter()
     streamers.Update()
+    print(f'Traced {streamers.GetOutput().GetNumberOfLines()} streamlines in {time.perf_counter() - start:0.3f}s'
+          + (f' on {threads} threads.' if threads else '.'))
     scalarRange = [0] * 2
     scalarRange[0] = streamers.GetOutput().GetPointData().GetScalars().GetRange()[0]
     scalarRange[1] = streamers.GetOutput().GetPointData().GetScalars().GetRange()[1]
     print("range: ", scalarRange[0], ", ", scalarRange[1])
 
-    tubes = vtk.vtkTubeFilter()
+    tubes = vtkTubeFilter()
     tubes.SetInputConnection(streamers.GetOutputPort())
     tubes.SetRadius(0.3)
     tubes.SetNumberOfSides(6)
     tubes.SetVaryRadius(0)
 
-    lut = vtk.vtkLookupTable()
+    lut = vtkLookupTable()
     lut.SetHueRange(.667, 0.0)
     lut.Build()
 
-    streamerMapper = vtk.vtkPolyDataMapper()
+    streamerMapper = vtkPolyDataMapper()
     streamerMapper.SetInputConnection(tubes.GetOutputPort())
     streamerMapper.SetScalarRange(scalarRange[0], scalarRange[1])
     streamerMapper.SetLookupTable(lut)
 
-    streamerActor = vtk.vtkActor()
+    streamerActor = vtkActor()
     streamerActor.SetMapper(streamerMapper)
 
     # Speed contours.
-    iso = vtk.vtkContourFilter()
+    iso = vtkContourFilter()
     iso.SetInputConnection(reader.GetOutputPort())
     iso.SetValue(0, 175)
 
-    isoMapper = vtk.vtkPolyDataMapper()
+    isoMapper = vtkPolyDataMapper()
     isoMapper.SetInputConnection(iso.GetOutputPort())
     isoMapper.ScalarVisibilityOff()
 
-    isoActor = vtk.vtkActor()
+    isoActor = vtkActor()
     isoActor.SetMapper(isoMapper)
     isoActor.GetProperty().SetRepresentationToWireframe()
     isoActor.GetProperty().SetOpacity(0.25)
 
     # Outline
-    outline = vtk.vtkOutlineFilter()
+    outline = vtkOutlineFilter()
     outline.SetInputConnection(reader.GetOutputPort())
 
-    outlineMapper = vtk.vtkPolyDataMapper()
+    outlineMapper = vtkPolyDataMapper()
     outlineMapper.SetInputConnection(outline.GetOutputPort())
 
-    outlineActor = vtk.vtkActor()
+    outlineActor = vtkActor()
     outlineActor.SetMapper(outlineMapper)
     outlineActor.GetProperty().SetColor(colors.GetColor3d("Black"))
 
@@ -96,7 +139,7 @@ def main():
     renWin.SetSize(640, 480)
     renWin.SetWindowName('CarotidFlow')
 
-    cam1 = vtk.vtkCamera()
+    cam1 = vtkCamera()
     cam1.SetClippingRange(17.4043, 870.216)
     cam1.SetFocalPoint(136.71, 104.025, 23)
     cam1.SetPosition(204.747, 258.939, 63.7925)
@@ -119,8 +162,78 @@ def get_program_parameters():
     parser = argparse.ArgumentParser(description=description, epilog=epilogue,
                                      formatter_class=argparse.RawDescriptionHelpFormatter)
     parser.add_argument('filename', help='carotid.vtk.')
+    parser.add_argument('-s', '--seeds', type=int, default=25, help='The number of seeds.')
+    parser.add_argument('-j', type=int, default=None, dest='workers',
+                        help='The number of threads tracing the streamlines, needs VTK 9.1 or later.')
+    parser.add_argument('--max_seeds', type=int, default=None,
+                        help='The maximum number of seeds, if there are more an evenly spaced subset is used.')
+    parser.add_argument('--max_steps', type=int, default=None,
+                        help='The maximum number of integration steps for each streamline.')
     args = parser.parse_args()
-    return args.filename
+    return args.filename, args.seeds, args.workers, args.max_seeds, args.max_steps
+
+
+def use_threads(workers):
+    """
+    Set the number of threads used by vtkSMPTools, the STDThread backend is used
+     unless VTK has been set to use another parallel backend.
+
+    Selecting the backend at run time needs VTK 9.1 or later.
+
+    :param workers: The number of threads.
+    :return: The estimated number of threads, or None if the VTK version is too old.
+    """
+    if not vtk_version_ok(9, 1, 0):
+        print('Setting the number of threads needs VTK 9.1 or later, -j is ignored.')
+        return None
+    if vtkSMPTools.GetBackend() == 'Sequential':
+        vtkSMPTools.SetBackend('STDThread')
+    vtkSMPTools.Initialize(workers)
+    return vtkSMPTools.GetEstimatedNumberOfThreads()
+
+
+def mask_seeds(seeds, max_seeds):
+    """
+    Keep an evenly spaced subset of the seeds.
+
+    :param seeds: The source of the seeds.
+    :param max_seeds: The maximum number of seeds.
+    :return: The vtkMaskPoints.
+    """
+    seeds.Update()
+    number_of_seeds = seeds.GetOutput().GetNumberOfPoints()
+    mask = vtkMaskPoints()
+    mask.SetInputConnection(seeds.GetOutputPort())
+    mask.SetOnRatio(max(1, -(-number_of_seeds // max_seeds)))
+    mask.SetMaximumNumberOfPoints(max_seeds)
+    return mask
+
+
+def print_progress(caller, event):
+    progress = caller.GetProgress()
+    print(f'\rTracing the streamlines: {progress:4.0%}', end='\n' if progress == 1 else '', flush=True)
+
+
+def vtk_version_ok(major, minor, build):
+    """
+    Check the VTK version.
+
+    :param major: Major version.
+    :param minor: Minor version.
+    :param build: Build version.
+    :return: True if the requested VTK version is greater or equal to the actual VTK version.
+    """
+    needed_version = 10000000000 * int(major) + 100000000 * int(minor) + int(build)
+    try:
+        vtk_version_number = VTK_VERSION_NUMBER
+    except AttributeError:  # as error:
+        ver = vtkVersion()
+        vtk_version_number = 10000000000 * ver.GetVTKMajorVersion() + 100000000 * ver.GetVTKMinorVersion() \
+                             + ver.GetVTKBuildVersion()
+    if vtk_version_number >= needed_version:
+        return True
+    else:
+        return False
 
 
 if __name__ == '__main__':
@@ -1,46 +1,70 @@
 #!/usr/bin/env python
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonCore import vtkLookupTable
+from vtkmodules.vtkFiltersCore import (
+    vtkContourFilter,
+    vtkGlyph3D,
+    vtkMaskPoints,
+    vtkThresholdPoints
+)
+from vtkmodules.vtkFiltersModeling import vtkOutlineFilter
+from vtkmodules.vtkFiltersSources import vtkConeSource
+from vtkmodules.vtkIOLegacy import vtkStructuredPointsReader
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkCamera,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
 
 
 def main():
     fileName = get_program_parameters()
 
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
-    ren1 = vtk.vtkRenderer()
+    ren1 = vtkRenderer()
 
-    renWin = vtk.vtkRenderWindow()
+    renWin = vtkRenderWindow()
     renWin.AddRenderer(ren1)
 
-    iren = vtk.vtkRenderWindowInteractor()
+    iren = vtkRenderWindowInteractor()
     iren.SetRenderWindow(renWin)
 
     # Create the pipeline.
     #
-    reader = vtk.vtkStructuredPointsReader()
+    reader = vtkStructuredPointsReader()
     reader.SetFileName(fileName)
 
-    threshold = vtk.vtkThresholdPoints()
+    threshold = vtkThresholdPoints()
     threshold.SetInputConnection(reader.GetOutputPort())
     threshold.ThresholdByUpper(200)
 
-    mask = vtk.vtkMaskPoints()
+    mask = vtkMaskPoints()
     mask.SetInputConnection(threshold.GetOutputPort())
     mask.SetOnRatio(5)
 
-    cone = vtk.vtkConeSource()
+    cone = vtkConeSource()
     cone.SetResolution(11)
     cone.SetHeight(1)
     cone.SetRadius(0.25)
 
-    cones = vtk.vtkGlyph3D()
+    cones = vtkGlyph3D()
     cones.SetInputConnection(mask.GetOutputPort())
     cones.SetSourceConnection(cone.GetOutputPort())
     cones.SetScaleFactor(0.4)
     cones.SetScaleModeToScaleByVector()
 
-    lut = vtk.vtkLookupTable()
+    lut = vtkLookupTable()
     lut.SetHueRange(.667, 0.0)
     lut.Build()
 
@@ -50,36 +74,36 @@ def main():
     scalarRange[1] = cones.GetOutput().GetPointData().GetScalars().GetRange()[1]
     print("range: ", scalarRange[0], ", ", scalarRange[1])
 
-    vectorMapper = vtk.vtkPolyDataMapper()
+    vectorMapper = vtkPolyDataMapper()
     vectorMapper.SetInputConnection(cones.GetOutputPort())
     vectorMapper.SetScalarRange(scalarRange[0], scalarRange[1])
     vectorMapper.SetLookupTable(lut)
 
-    vectorActor = vtk.vtkActor()
+    vectorActor = vtkActor()
     vectorActor.SetMapper(vectorMapper)
 
     # Speed contours.
-    iso = vtk.vtkContourFilter()
+    iso = vtkContourFilter()
     iso.SetInputConnection(reader.GetOutputPort())
     iso.SetValue(0, 175)
 
-    isoMapper = vtk.vtkPolyDataMapper()
+    isoMapper = vtkPolyDataMapper()
     isoMapper.SetInputConnection(iso.GetOutputPort())
     isoMapper.ScalarVisibilityOff()
 
-    isoActor = vtk.vtkActor()
+    isoActor = vtkActor()
     isoActor.SetMapper(isoMapper)
     isoActor.GetProperty().SetRepresentationToWireframe()
     isoActor.GetProperty().SetOpacity(0.25)
 
     # Outline
-    outline = vtk.vtkOutlineFilter()
+    outline = vtkOutlineFilter()
     outline.SetInputConnection(reader.GetOutputPort())
 
-    outlineMapper = vtk.vtkPolyDataMapper()
+    outlineMapper = vtkPolyDataMapper()
     outlineMapper.SetInputConnection(outline.GetOutputPort())
 
-    outlineActor = vtk.vtkActor()
+    outlineActor = vtkActor()
     outlineActor.SetMapper(outlineMapper)
     outlineActor.GetProperty().SetColor(colors.GetColor3d("Black"))
 
@@ -92,7 +116,7 @@ def main():
     renWin.SetSize(640, 480)
     renWin.SetWindowName('CarotidFlowGlyphs')
 
-    cam1 = vtk.vtkCamera()
+    cam1 = vtkCamera()
     cam1.SetClippingRange(17.4043, 870.216)
     cam1.SetFocalPoint(136.71, 104.025, 23)
     cam1.SetPosition(204.747, 258.939, 63.7925)
@@ -1,28 +1,45 @@
 #!/usr/bin/env python
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonCore import vtkDoubleArray
+from vtkmodules.vtkCommonDataModel import vtkPlane
+from vtkmodules.vtkFiltersCore import vtkContourFilter
+from vtkmodules.vtkIOXML import vtkXMLPolyDataReader
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
 
 
 def main():
     inputFilename, numberOfCuts = get_program_parameters()
 
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
-    reader = vtk.vtkXMLPolyDataReader()
+    reader = vtkXMLPolyDataReader()
     reader.SetFileName(inputFilename)
     reader.Update()
 
     bounds = reader.GetOutput().GetBounds()
     print(bounds)
 
-    plane = vtk.vtkPlane()
+    plane = vtkPlane()
     plane.SetOrigin((bounds[1] + bounds[0]) / 2.0,
                     (bounds[3] + bounds[2]) / 2.0,
                     (bounds[5] + bounds[4]) / 2.0)
     plane.SetNormal(0, 0, 1)
 
     # Create Scalars.
-    scalars = vtk.vtkDoubleArray()
+    scalars = vtkDoubleArray()
     numberOfPoints = reader.GetOutput().GetNumberOfPoints()
     scalars.SetNumberOfTuples(numberOfPoints)
     pts = reader.GetOutput().GetPoints()
@@ -33,7 +50,7 @@ def main():
     reader.GetOutput().GetPointData().GetScalars().GetRange()
 
     # Create the cutter.
-    cutter = vtk.vtkContourFilter()
+    cutter = vtkContourFilter()
     cutter.SetInputConnection(reader.GetOutputPort())
     cutter.ComputeScalarsOff()
     cutter.ComputeNormalsOff()
@@ -42,37 +59,37 @@ def main():
         0.99 * reader.GetOutput().GetPointData().GetScalars().GetRange()[0],
         0.99 * reader.GetOutput().GetPointData().GetScalars().GetRange()[1])
 
-    cutterMapper = vtk.vtkPolyDataMapper()
+    cutterMapper = vtkPolyDataMapper()
     cutterMapper.SetInputConnection(cutter.GetOutputPort())
     cutterMapper.ScalarVisibilityOff()
 
     # Create the cut actor.
-    cutterActor = vtk.vtkActor()
+    cutterActor = vtkActor()
     cutterActor.GetProperty().SetColor(colors.GetColor3d('Banana'))
     cutterActor.GetProperty().SetLineWidth(2)
     cutterActor.SetMapper(cutterMapper)
 
     # Create the model actor
-    modelMapper = vtk.vtkPolyDataMapper()
+    modelMapper = vtkPolyDataMapper()
     modelMapper.SetInputConnection(reader.GetOutputPort())
     modelMapper.ScalarVisibilityOff()
 
-    modelActor = vtk.vtkActor()
+    modelActor = vtkActor()
     modelActor.GetProperty().SetColor(colors.GetColor3d('Flesh'))
     modelActor.SetMapper(modelMapper)
 
     # Create renderers and add the plane and model actors.
-    renderer = vtk.vtkRenderer()
+    renderer = vtkRenderer()
     renderer.AddActor(cutterActor)
     renderer.AddActor(modelActor)
 
     # Add renderer to renderwindow and render
-    renderWindow = vtk.vtkRenderWindow()
+    renderWindow = vtkRenderWindow()
     renderWindow.AddRenderer(renderer)
     renderWindow.SetSize(600, 600)
     renderWindow.SetWindowName('CutWithCutScalars')
 
-    interactor = vtk.vtkRenderWindowInteractor()
+    interactor = vtkRenderWindowInteractor()
     interactor.SetRenderWindow(renderWindow)
 
     renderer.SetBackground(colors.GetColor3d('Burlywood'))
@@ -2,35 +2,51 @@
 
 # A simple script to demonstrate the vtkCutter function
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonDataModel import vtkPlane
+from vtkmodules.vtkFiltersCore import vtkCutter
+from vtkmodules.vtkFiltersSources import vtkCubeSource
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
 
 
 def main():
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
     # Create a cube
-    cube = vtk.vtkCubeSource()
+    cube = vtkCubeSource()
     cube.SetXLength(40)
     cube.SetYLength(30)
     cube.SetZLength(20)
-    cubeMapper = vtk.vtkPolyDataMapper()
+    cubeMapper = vtkPolyDataMapper()
     cubeMapper.SetInputConnection(cube.GetOutputPort())
 
     # create a plane to cut,here it cuts in the XZ direction (xz normal=(1,0,0);XY =(0,0,1),YZ =(0,1,0)
-    plane = vtk.vtkPlane()
+    plane = vtkPlane()
     plane.SetOrigin(10, 0, 0)
     plane.SetNormal(1, 0, 0)
 
     # create cutter
-    cutter = vtk.vtkCutter()
+    cutter = vtkCutter()
     cutter.SetCutFunction(plane)
     cutter.SetInputConnection(cube.GetOutputPort())
     cutter.Update()
-    cutterMapper = vtk.vtkPolyDataMapper()
+    cutterMapper = vtkPolyDataMapper()
     cutterMapper.SetInputConnection(cutter.GetOutputPort())
 
     # create plane actor
-    planeActor = vtk.vtkActor()
+    planeActor = vtkActor()
     planeActor.GetProperty().SetColor(colors.GetColor3d('Yellow'))
     planeActor.GetProperty().SetLineWidth(2)
     planeActor.GetProperty().SetAmbient(1.0)
@@ -38,25 +54,25 @@ def main():
     planeActor.SetMapper(cutterMapper)
 
     # create cube actor
-    cubeActor = vtk.vtkActor()
+    cubeActor = vtkActor()
     cubeActor.GetProperty().SetColor(colors.GetColor3d('Aquamarine'))
     cubeActor.GetProperty().SetOpacity(0.5)
     cubeActor.SetMapper(cubeMapper)
 
     # create renderers and add actors of plane and cube
-    ren = vtk.vtkRenderer()
+    ren = vtkRenderer()
     ren.AddActor(planeActor)
     ren.AddActor(cubeActor)
     ren.SetBackground(colors.GetColor3d('Silver'))
 
     # Add renderer to renderwindow and render
-    renWin = vtk.vtkRenderWindow()
+    renWin = vtkRenderWindow()
     renWin.AddRenderer(ren)
     renWin.SetSize(600, 600)
     renWin.SetWindowName('Cutter')
     renWin.Render()
 
-    iren = vtk.vtkRenderWindowInteractor()
+    iren = vtkRenderWindowInteractor()
     iren.SetRenderWindow(renWin)
 
     camera = ren.GetActiveCamera()
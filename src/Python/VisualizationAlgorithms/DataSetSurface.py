@@ -1,11 +1,34 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonCore import vtkPoints
+from vtkmodules.vtkCommonDataModel import (
+    vtkCellArray,
+    vtkHexahedron,
+    vtkPlane,
+    vtkUnstructuredGrid
+)
+from vtkmodules.vtkFiltersCore import vtkCutter
+from vtkmodules.vtkFiltersGeometry import vtkDataSetSurfaceFilter
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkDataSetMapper,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
 
 
 def main():
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
     # Setup the coordinates of eight points
     # (the two faces must be in counter clockwise order as viewed from the
@@ -22,29 +45,29 @@ def main():
     ]
 
     # Create the points and a hexahedron from the points.
-    points = vtk.vtkPoints()
-    hexa = vtk.vtkHexahedron()
+    points = vtkPoints()
+    hexa = vtkHexahedron()
     for i, pointCoord in enumerate(pointCoords):
         points.InsertNextPoint(pointCoord)
         hexa.GetPointIds().SetId(i, i)
 
     # Add the hexahedron to a cell array.
-    hexs = vtk.vtkCellArray()
+    hexs = vtkCellArray()
     hexs.InsertNextCell(hexa)
 
     # Add the points and hexahedron to an unstructured grid.
-    uGrid = vtk.vtkUnstructuredGrid()
+    uGrid = vtkUnstructuredGrid()
     uGrid.SetPoints(points)
     uGrid.InsertNextCell(hexa.GetCellType(), hexa.GetPointIds())
 
     # Extract the outer (polygonal) surface.
-    surface = vtk.vtkDataSetSurfaceFilter()
+    surface = vtkDataSetSurfaceFilter()
     surface.SetInputData(uGrid)
     surface.Update()
 
-    aBeamMapper = vtk.vtkDataSetMapper()
+    aBeamMapper = vtkDataSetMapper()
     aBeamMapper.SetInputConnection(surface.GetOutputPort())
-    aBeamActor = vtk.vtkActor()
+    aBeamActor = vtkActor()
     aBeamActor.SetMapper(aBeamMapper)
     aBeamActor.AddPosition(0, 0, 0)
     aBeamActor.GetProperty().SetColor(
@@ -57,32 +80,32 @@ def main():
 
     # Create a plane to cut, here it cuts in the XZ direction
     # (xz normal=(1,0,0) XY =(0,0,1), YZ =(0,1,0)
-    plane = vtk.vtkPlane()
+    plane = vtkPlane()
     plane.SetOrigin(0.5, 0, 0)
     plane.SetNormal(1, 0, 0)
 
     # Create cutter
-    cutter = vtk.vtkCutter()
+    cutter = vtkCutter()
     cutter.SetCutFunction(plane)
     cutter.SetInputData(aBeamActor.GetMapper().GetInput())
     cutter.Update()
-    cutterMapper = vtk.vtkPolyDataMapper()
+    cutterMapper = vtkPolyDataMapper()
     cutterMapper.SetInputConnection(cutter.GetOutputPort())
 
     # Create plane actor
-    planeActor = vtk.vtkActor()
+    planeActor = vtkActor()
     planeActor.GetProperty().SetColor(
         colors.GetColor3d('Red'))
     planeActor.GetProperty().SetLineWidth(2)
     planeActor.SetMapper(cutterMapper)
 
     # Create a renderer, render window, and interactor
-    renderer = vtk.vtkRenderer()
-    renderWindow = vtk.vtkRenderWindow()
+    renderer = vtkRenderer()
+    renderWindow = vtkRenderWindow()
     renderWindow.SetWindowName('DatasetSurface')
     renderWindow.AddRenderer(renderer)
 
-    renderWindowInteractor = vtk.vtkRenderWindowInteractor()
+    renderWindowInteractor = vtkRenderWindowInteractor()
     renderWindowInteractor.SetRenderWindow(renderWindow)
 
     # Add the actors to the scene
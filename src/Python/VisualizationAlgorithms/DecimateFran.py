@@ -3,11 +3,32 @@
 """
 """
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkFiltersCore import (
+    vtkDecimatePro,
+    vtkPolyDataNormals
+)
+from vtkmodules.vtkIOImage import vtkPNGReader
+from vtkmodules.vtkIOLegacy import vtkPolyDataReader
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkCamera,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer,
+    vtkTexture
+)
 
 
 def main():
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
     fileName1, fileName2 = get_program_parameters()
 
@@ -18,48 +39,48 @@ def main():
     # We start by reading some data that was originally captured from
     # a Cyberware laser digitizing system.
     #
-    fran = vtk.vtkPolyDataReader()
+    fran = vtkPolyDataReader()
     fran.SetFileName(fileName1)
 
     # Read the corresponding texture.
-    textureReader = vtk.vtkPNGReader()
+    textureReader = vtkPNGReader()
     textureReader.SetFileName(fileName2)
 
-    texture = vtk.vtkTexture()
+    texture = vtkTexture()
     texture.InterpolateOn()
     texture.SetInputConnection(textureReader.GetOutputPort())
 
     # We want to preserve topology (not let any cracks form). This may limit
     # the total reduction possible, which we have specified at 90%.
     #
-    deci = vtk.vtkDecimatePro()
+    deci = vtkDecimatePro()
     deci.SetInputConnection(fran.GetOutputPort())
     deci.SetTargetReduction(0.9)
     deci.PreserveTopologyOn()
 
-    decimatedNormals = vtk.vtkPolyDataNormals()
+    decimatedNormals = vtkPolyDataNormals()
     decimatedNormals.SetInputConnection(deci.GetOutputPort())
     decimatedNormals.FlipNormalsOn()
     decimatedNormals.SetFeatureAngle(60)
 
-    originalNormals = vtk.vtkPolyDataNormals()
+    originalNormals = vtkPolyDataNormals()
     originalNormals.SetInputConnection(fran.GetOutputPort())
     originalNormals.FlipNormalsOn()
     originalNormals.SetFeatureAngle(60)
 
-    decimatedMapper = vtk.vtkPolyDataMapper()
+    decimatedMapper = vtkPolyDataMapper()
     decimatedMapper.SetInputConnection(decimatedNormals.GetOutputPort())
 
-    decimatedActor = vtk.vtkActor()
+    decimatedActor = vtkActor()
     decimatedActor.SetMapper(decimatedMapper)
     decimatedActor.GetProperty().SetAmbient(.5)
     decimatedActor.GetProperty().SetDiffuse(.5)
     decimatedActor.SetTexture(texture)
 
-    originalMapper = vtk.vtkPolyDataMapper()
+    originalMapper = vtkPolyDataMapper()
     originalMapper.SetInputConnection(originalNormals.GetOutputPort())
 
-    originalActor = vtk.vtkActor()
+    originalActor = vtkActor()
     originalActor.SetMapper(originalMapper)
     originalActor.GetProperty().SetAmbient(.5)
     originalActor.GetProperty().SetDiffuse(.5)
@@ -67,18 +88,18 @@ def main():
 
     # Create the RenderWindow, Renderer and Interactor.
     #
-    renderer1 = vtk.vtkRenderer()
+    renderer1 = vtkRenderer()
     renderer1.SetViewport(0.0, 0.0, 0.5, 1.0)
 
-    renderer2 = vtk.vtkRenderer()
+    renderer2 = vtkRenderer()
     renderer2.SetViewport(0.5, 0.0, 1.0, 1.0)
 
-    renderWindow = vtk.vtkRenderWindow()
+    renderWindow = vtkRenderWindow()
     renderWindow.AddRenderer(renderer1)
     renderWindow.AddRenderer(renderer2)
     renderWindow.SetWindowName('DecimateFran')
 
-    interactor = vtk.vtkRenderWindowInteractor()
+    interactor = vtkRenderWindowInteractor()
     interactor.SetRenderWindow(renderWindow)
 
     # Add the actors to the renderer, set the background and size.
@@ -91,7 +112,7 @@ def main():
 
     # Render the image.
     #
-    cam1 = vtk.vtkCamera()
+    cam1 = vtkCamera()
     cam1.SetClippingRange(0.0475572, 2.37786)
     cam1.SetFocalPoint(0.052665, -0.129454, -0.0573973)
     cam1.SetPosition(0.327637, -0.116299, -0.256418)
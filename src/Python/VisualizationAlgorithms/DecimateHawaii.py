@@ -1,10 +1,29 @@
 #!/usr/bin/env python
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkFiltersCore import (
+    vtkDecimatePro,
+    vtkPolyDataNormals
+)
+from vtkmodules.vtkIOLegacy import vtkPolyDataReader
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkCamera,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
 
 
 def main():
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
     fileName = get_program_parameters()
 
@@ -12,50 +31,50 @@ def main():
     # use mesh smoothing and generate surface normals to give a pleasing result.
     #
 
-    hawaii = vtk.vtkPolyDataReader()
+    hawaii = vtkPolyDataReader()
     hawaii.SetFileName(fileName)
 
     # We want to preserve topology (not let any cracks form). This may limit
     # the total reduction possible, which we have specified at 90%.
     #
-    deci = vtk.vtkDecimatePro()
+    deci = vtkDecimatePro()
     deci.SetInputConnection(hawaii.GetOutputPort())
     deci.SetTargetReduction(0.9)
     deci.PreserveTopologyOn()
 
-    decimatedNormals = vtk.vtkPolyDataNormals()
+    decimatedNormals = vtkPolyDataNormals()
     decimatedNormals.SetInputConnection(deci.GetOutputPort())
     decimatedNormals.FlipNormalsOn()
     decimatedNormals.SetFeatureAngle(60)
 
-    decimatedMapper = vtk.vtkPolyDataMapper()
+    decimatedMapper = vtkPolyDataMapper()
     decimatedMapper.SetInputConnection(decimatedNormals.GetOutputPort())
 
-    decimatedActor = vtk.vtkActor()
+    decimatedActor = vtkActor()
     decimatedActor.SetMapper(decimatedMapper)
     decimatedActor.GetProperty().SetColor(colors.GetColor3d('Sienna'))
     decimatedActor.GetProperty().SetRepresentationToWireframe()
 
-    originalMapper = vtk.vtkPolyDataMapper()
+    originalMapper = vtkPolyDataMapper()
     originalMapper.SetInputConnection(decimatedNormals.GetOutputPort())
 
-    originalActor = vtk.vtkActor()
+    originalActor = vtkActor()
     originalActor.SetMapper(originalMapper)
     originalActor.GetProperty().SetColor(colors.GetColor3d('Sienna'))
 
     # Create the RenderWindow, Renderer and Interactor.
     #
-    renderer1 = vtk.vtkRenderer()
+    renderer1 = vtkRenderer()
     renderer1.SetViewport(0.0, 0.0, 0.5, 1.0)
 
-    renderer2 = vtk.vtkRenderer()
+    renderer2 = vtkRenderer()
     renderer2.SetViewport(0.5, 0.0, 1.0, 1.0)
 
-    renderWindow = vtk.vtkRenderWindow()
+    renderWindow = vtkRenderWindow()
     renderWindow.AddRenderer(renderer1)
     renderWindow.AddRenderer(renderer2)
 
-    interactor = vtk.vtkRenderWindowInteractor()
+    interactor = vtkRenderWindowInteractor()
     interactor.SetRenderWindow(renderWindow)
 
     # Add the actors to the renderer, set the background and size.
@@ -69,7 +88,7 @@ def main():
 
     # Render the image.
     #
-    cam1 = vtk.vtkCamera()
+    cam1 = vtkCamera()
     renderer1.SetActiveCamera(cam1)
     renderer2.SetActiveCamera(cam1)
     renderer1.ResetCamera()
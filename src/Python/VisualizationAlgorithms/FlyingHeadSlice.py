@@ -1,6 +1,26 @@
 #!/usr/bin/env python
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkFiltersCore import (
+    vtkContourFilter,
+    vtkFlyingEdges2D
+)
+from vtkmodules.vtkFiltersModeling import vtkOutlineFilter
+from vtkmodules.vtkIOImage import vtkMetaImageReader
+from vtkmodules.vtkImagingCore import vtkExtractVOI
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
 
 
 def main():
@@ -10,30 +30,30 @@ def main():
     else:
         print('Using vtkFlyingEdges2D.')
 
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
     # Create the RenderWindow, Renderer and Interactor.
-    ren1 = vtk.vtkRenderer()
-    renWin = vtk.vtkRenderWindow()
+    ren1 = vtkRenderer()
+    renWin = vtkRenderWindow()
     renWin.AddRenderer(ren1)
-    iren = vtk.vtkRenderWindowInteractor()
+    iren = vtkRenderWindowInteractor()
     iren.SetRenderWindow(renWin)
 
     # Create the pipeline.
-    reader = vtk.vtkMetaImageReader()
+    reader = vtkMetaImageReader()
     reader.SetFileName(fileName)
     reader.Update()
 
-    extractVOI = vtk.vtkExtractVOI()
+    extractVOI = vtkExtractVOI()
     extractVOI.SetInputConnection(reader.GetOutputPort())
     extractVOI.SetVOI(0, 255, 0, 255, 45, 45)
     # scalarRange = extractVOI.GetOutput().GetScalarRange()
     scalarRange = [500, 1150]
     # print(scalarRange)
 
-    contour = vtk.vtkContourFilter()
-    flyingEdges = vtk.vtkFlyingEdges2D()
-    isoMapper = vtk.vtkPolyDataMapper()
+    contour = vtkContourFilter()
+    flyingEdges = vtkFlyingEdges2D()
+    isoMapper = vtkPolyDataMapper()
     if useContouring:
         contour.SetInputConnection(extractVOI.GetOutputPort())
         contour.GenerateValues(12, scalarRange)
@@ -46,17 +66,17 @@ def main():
     isoMapper.ScalarVisibilityOn()
     isoMapper.SetScalarRange(scalarRange)
 
-    isoActor = vtk.vtkActor()
+    isoActor = vtkActor()
     isoActor.SetMapper(isoMapper)
     isoActor.GetProperty().SetColor(colors.GetColor3d('Wheat'))
 
-    outline = vtk.vtkOutlineFilter()
+    outline = vtkOutlineFilter()
     outline.SetInputConnection(extractVOI.GetOutputPort())
 
-    outlineMapper = vtk.vtkPolyDataMapper()
+    outlineMapper = vtkPolyDataMapper()
     outlineMapper.SetInputConnection(outline.GetOutputPort())
 
-    outlineActor = vtk.vtkActor()
+    outlineActor = vtkActor()
     outlineActor.SetMapper(outlineMapper)
 
     # Add the actors to the renderer, set the background and size.
@@ -1,98 +1,135 @@
 #!/usr/bin/env python
 
-import vtk
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonCore import (
+    vtkLookupTable,
+    vtkPoints,
+    vtkVersion
+)
+from vtkmodules.vtkCommonDataModel import (
+    vtkMultiBlockDataSet,
+    vtkStructuredGrid
+)
+from vtkmodules.vtkFiltersCore import (
+    vtkStructuredGridOutlineFilter,
+    vtkTubeFilter
+)
+from vtkmodules.vtkFiltersFlowPaths import vtkStreamTracer
+from vtkmodules.vtkFiltersGeometry import vtkStructuredGridGeometryFilter
+from vtkmodules.vtkFiltersSources import vtkPointSource
+from vtkmodules.vtkIOParallel import vtkMultiBlockPLOT3DReader
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkCamera,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
+
+try:
+    import numpy as np
+    from vtkmodules.util import numpy_support
+except ModuleNotFoundError:
+    np = None
 
 
 def main():
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
-    xyxFile, qFile = get_program_parameters()
+    xyxFile, qFile, cache_dir = get_program_parameters()
 
     # Read the data.
     #
-    pl3d = vtk.vtkMultiBlockPLOT3DReader()
-    pl3d.AutoDetectFormatOn()
-    pl3d.SetXYZFileName(xyxFile)
-    pl3d.SetQFileName(qFile)
-    pl3d.SetScalarFunctionNumber(153)
-    pl3d.SetVectorFunctionNumber(200)
-    pl3d.Update()
+    pl3d = read_plot3d(xyxFile, qFile, 153, 200, auto_detect=True, cache_dir=cache_dir)
 
-    sg = pl3d.GetOutput().GetBlock(0)
+    sg = pl3d.GetBlock(0)
 
     # blue to red lut
     #
-    lut = vtk.vtkLookupTable()
+    lut = vtkLookupTable()
     lut.SetHueRange(0.667, 0.0)
 
     # Computational planes.
-    floorComp = vtk.vtkStructuredGridGeometryFilter()
+    floorComp = vtkStructuredGridGeometryFilter()
     floorComp.SetExtent(0, 37, 0, 75, 0, 0)
     floorComp.SetInputData(sg)
     floorComp.Update()
 
-    floorMapper = vtk.vtkPolyDataMapper()
+    floorMapper = vtkPolyDataMapper()
     floorMapper.SetInputConnection(floorComp.GetOutputPort())
     floorMapper.ScalarVisibilityOff()
     floorMapper.SetLookupTable(lut)
 
-    floorActor = vtk.vtkActor()
+    floorActor = vtkActor()
     floorActor.SetMapper(floorMapper)
     floorActor.GetProperty().SetRepresentationToWireframe()
     floorActor.GetProperty().SetColor(colors.GetColor3d('Beige'))
     floorActor.GetProperty().SetLineWidth(2)
 
-    subFloorComp = vtk.vtkStructuredGridGeometryFilter()
+    subFloorComp = vtkStructuredGridGeometryFilter()
 
     subFloorComp.SetExtent(0, 37, 0, 15, 22, 22)
     subFloorComp.SetInputData(sg)
 
-    subFloorMapper = vtk.vtkPolyDataMapper()
+    subFloorMapper = vtkPolyDataMapper()
     subFloorMapper.SetInputConnection(subFloorComp.GetOutputPort())
     subFloorMapper.SetLookupTable(lut)
     subFloorMapper.SetScalarRange(sg.GetScalarRange())
 
-    subFloorActor = vtk.vtkActor()
+    subFloorActor = vtkActor()
 
     subFloorActor.SetMapper(subFloorMapper)
 
-    subFloor2Comp = vtk.vtkStructuredGridGeometryFilter()
+    subFloor2Comp = vtkStructuredGridGeometryFilter()
     subFloor2Comp.SetExtent(0, 37, 60, 75, 22, 22)
     subFloor2Comp.SetInputData(sg)
 
-    subFloor2Mapper = vtk.vtkPolyDataMapper()
+    subFloor2Mapper = vtkPolyDataMapper()
     subFloor2Mapper.SetInputConnection(subFloor2Comp.GetOutputPort())
     subFloor2Mapper.SetLookupTable(lut)
     subFloor2Mapper.SetScalarRange(sg.GetScalarRange())
 
-    subFloor2Actor = vtk.vtkActor()
+    subFloor2Actor = vtkActor()
 
     subFloor2Actor.SetMapper(subFloor2Mapper)
 
-    postComp = vtk.vtkStructuredGridGeometryFilter()
+    postComp = vtkStructuredGridGeometryFilter()
 
     postComp.SetExtent(10, 10, 0, 75, 0, 37)
     postComp.SetInputData(sg)
 
-    postMapper = vtk.vtkPolyDataMapper()
+    postMapper = vtkPolyDataMapper()
     postMapper.SetInputConnection(postComp.GetOutputPort())
     postMapper.SetLookupTable(lut)
     postMapper.SetScalarRange(sg.GetScalarRange())
 
-    postActor = vtk.vtkActor()
+    postActor = vtkActor()
     postActor.SetMapper(postMapper)
     postActor.GetProperty().SetColor(colors.GetColor3d('Beige'))
 
-    fanComp = vtk.vtkStructuredGridGeometryFilter()
+    fanComp = vtkStructuredGridGeometryFilter()
     fanComp.SetExtent(0, 37, 38, 38, 0, 37)
     fanComp.SetInputData(sg)
 
-    fanMapper = vtk.vtkPolyDataMapper()
+    fanMapper = vtkPolyDataMapper()
     fanMapper.SetInputConnection(fanComp.GetOutputPort())
     fanMapper.SetLookupTable(lut)
     fanMapper.SetScalarRange(sg.GetScalarRange())
 
-    fanActor = vtk.vtkActor()
+    fanActor = vtkActor()
 
     fanActor.SetMapper(fanMapper)
     fanActor.GetProperty().SetColor(colors.GetColor3d('Beige'))
@@ -100,17 +137,17 @@ def main():
     # streamers
     #
     # spherical seed points
-    rake = vtk.vtkPointSource()
+    rake = vtkPointSource()
     rake.SetCenter(-0.74, 0, 0.3)
     rake.SetNumberOfPoints(10)
 
     # a line of seed points
-    seedsComp = vtk.vtkStructuredGridGeometryFilter()
+    seedsComp = vtkStructuredGridGeometryFilter()
     seedsComp.SetExtent(10, 10, 37, 39, 1, 35)
     seedsComp.SetInputData(sg)
 
-    streamers = vtk.vtkStreamTracer()
-    streamers.SetInputConnection(pl3d.GetOutputPort())
+    streamers = vtkStreamTracer()
+    streamers.SetInputData(pl3d)
 
     # streamers SetSource [rake GetOutput]
     streamers.SetSourceConnection(seedsComp.GetOutputPort())
@@ -120,37 +157,37 @@ def main():
     streamers.SetIntegratorType(2)
     streamers.Update()
 
-    tubes = vtk.vtkTubeFilter()
+    tubes = vtkTubeFilter()
     tubes.SetInputConnection(streamers.GetOutputPort())
     tubes.SetNumberOfSides(8)
     tubes.SetRadius(0.08)
     tubes.SetVaryRadius(0)
 
-    mapTubes = vtk.vtkPolyDataMapper()
+    mapTubes = vtkPolyDataMapper()
 
     mapTubes.SetInputConnection(tubes.GetOutputPort())
     mapTubes.SetScalarRange(sg.GetScalarRange())
 
-    tubesActor = vtk.vtkActor()
+    tubesActor = vtkActor()
     tubesActor.SetMapper(mapTubes)
 
     # outline
-    outline = vtk.vtkStructuredGridOutlineFilter()
+    outline = vtkStructuredGridOutlineFilter()
     outline.SetInputData(sg)
 
-    outlineMapper = vtk.vtkPolyDataMapper()
+    outlineMapper = vtkPolyDataMapper()
     outlineMapper.SetInputConnection(outline.GetOutputPort())
 
-    outlineActor = vtk.vtkActor()
+    outlineActor = vtkActor()
     outlineActor.SetMapper(outlineMapper)
     outlineActor.GetProperty().SetColor(colors.GetColor3d('Beige'))
 
     # Create graphics stuff.
-    ren1 = vtk.vtkRenderer()
-    renWin = vtk.vtkRenderWindow()
+    ren1 = vtkRenderer()
+    renWin = vtkRenderWindow()
     renWin.AddRenderer(ren1)
 
-    iren = vtk.vtkRenderWindowInteractor()
+    iren = vtkRenderWindowInteractor()
     iren.SetRenderWindow(renWin)
 
     # Add the actors to the renderer, set the background and size.
@@ -163,7 +200,7 @@ def main():
     ren1.AddActor(fanActor)
     ren1.AddActor(tubesActor)
 
-    aCam = vtk.vtkCamera()
+    aCam = vtkCamera()
     aCam.SetFocalPoint(0.00657892, 0, 2.41026)
     aCam.SetPosition(-1.94838, -47.1275, 39.4607)
     aCam.SetViewUp(0.00653193, 0.617865, 0.786257)
@@ -188,8 +225,235 @@ def get_program_parameters():
     parser = argparse.ArgumentParser(description=description, epilog=epilogue)
     parser.add_argument('xyz_file', help='postxyz.bin.')
     parser.add_argument('q_file', help='postq.bin.')
+    parser.add_argument('--cache_dir', default=None,
+                        help='Cache the dataset as NumPy arrays in this folder, later runs memory-map them.')
     args = parser.parse_args()
-    return args.xyz_file, args.q_file
+    return args.xyz_file, args.q_file, args.cache_dir
+
+
+def read_plot3d(xyz_file, q_file, scalar_function, vector_function, auto_detect=False, cache_dir=None,
+                cache_size=512):
+    """
+    Read a PLOT3D dataset.
+
+    If cache_dir is given, the dataset is read from the cache if it is there,
+     otherwise it is read from the PLOT3D files and saved in the cache.
+
+    :param xyz_file: The geometry file.
+    :param q_file: The solution file.
+    :param scalar_function: The scalar function number.
+    :param vector_function: The vector function number.
+    :param auto_detect: True if the format of the files is to be detected.
+    :param cache_dir: The folder holding the cache or None, NumPy is needed to use the cache.
+    :param cache_size: The maximum size of the cache in MB.
+    :return: The vtkMultiBlockDataSet.
+    """
+    cache = key = None
+    if cache_dir is not None:
+        if np is None:
+            print('NumPy is needed to use the PLOT3D cache, the PLOT3D files are read instead.')
+        else:
+            cache = PLOT3DCache(cache_dir, cache_size * 1024 * 1024)
+            key = PLOT3DCache.make_key(PLOT3DCache.file_signature(xyz_file), PLOT3DCache.file_signature(q_file),
+                                       scalar_function, vector_function, auto_detect, vtkVersion.GetVTKVersion())
+            dataset = cache.get(key)
+            if dataset is not None:
+                return dataset
+
+    pl3d = vtkMultiBlockPLOT3DReader()
+    if auto_detect:
+        pl3d.AutoDetectFormatOn()
+    pl3d.SetXYZFileName(xyz_file)
+    pl3d.SetQFileName(q_file)
+    pl3d.SetScalarFunctionNumber(scalar_function)
+    pl3d.SetVectorFunctionNumber(vector_function)
+    pl3d.Update()
+    if cache is not None:
+        cache.put(key, pl3d.GetOutput())
+        cache.evict()
+    return pl3d.GetOutput()
+
+
+class PLOT3DCache:
+    """
+    A size bounded, on-disk cache of PLOT3D datasets in a memory-mappable layout.
+
+    The structured grids read from a pair of PLOT3D files are stored as one .npy file per array,
+     in a folder named by a hash of the files and the reader settings.
+    Later runs memory-map the arrays instead of parsing the PLOT3D files, so the pages are read
+     from disk when they are used and are shared between the processes using the same dataset.
+    When the cache grows beyond max_size bytes the least recently used datasets are removed.
+    """
+
+    def __init__(self, cache_dir, max_size):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+
+    @staticmethod
+    def make_key(*args):
+        """
+        Make a key from the arguments.
+
+        :param args: The file signatures and reader settings.
+        :return: The key.
+        """
+        h = hashlib.sha256()
+        for arg in args:
+            h.update(repr(arg).encode('utf-8'))
+        return h.hexdigest()
+
+    @staticmethod
+    def file_signature(file_name):
+        """
+        The path, size and modification time of a file.
+
+        :param file_name: The file.
+        :return: A tuple of the path, size and modification time.
+        """
+        path = Path(file_name).resolve()
+        st = path.stat()
+        return str(path), st.st_size, st.st_mtime_ns
+
+    def path(self, key):
+        return self.cache_dir.joinpath(key)
+
+    def get(self, key):
+        """
+        Get the dataset corresponding to the key, the arrays are memory-mapped copy on write,
+         so the dataset can be modified without changing the cache.
+
+        If the dataset cannot be loaded, e.g. a file is missing or truncated, it is removed.
+
+        :param key: The key.
+        :return: The vtkMultiBlockDataSet or None if it is not in the cache.
+        """
+        path = self.path(key)
+        layout_file = path.joinpath('layout.json')
+        if not layout_file.is_file():
+            return None
+        try:
+            dataset = self.load(path)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f'Removing the cached PLOT3D dataset {path}, it cannot be loaded. {e}')
+            shutil.rmtree(path, ignore_errors=True)
+            return None
+        # Mark it as recently used.
+        os.utime(layout_file)
+        return dataset
+
+    @staticmethod
+    def load(path):
+        """
+        Load a dataset from the cache.
+
+        :param path: The folder holding the dataset.
+        :return: The vtkMultiBlockDataSet.
+        """
+        with open(path.joinpath('layout.json'), 'r') as ifh:
+            layout = json.load(ifh)
+
+        def load_array(name, file_name, number_of_tuples):
+            a = np.load(path.joinpath(file_name), mmap_mode='c')
+            if a.shape[0] != number_of_tuples:
+                raise ValueError(f'{file_name} has {a.shape[0]} tuples, expected {number_of_tuples}.')
+            array = numpy_support.numpy_to_vtk(a)
+            array.SetName(name)
+            return array
+
+        dataset = vtkMultiBlockDataSet()
+        dataset.SetNumberOfBlocks(len(layout))
+        for i, block in enumerate(layout):
+            if block is None:
+                continue
+            e = block['extent']
+            grid = vtkStructuredGrid()
+            grid.SetExtent(e)
+            number_of_points = (e[1] - e[0] + 1) * (e[3] - e[2] + 1) * (e[5] - e[4] + 1)
+            points = vtkPoints()
+            points.SetData(load_array(None, block['points'], number_of_points))
+            grid.SetPoints(points)
+            for name, file_name in block['point_data']:
+                grid.GetPointData().AddArray(load_array(name, file_name, number_of_points))
+            for name, file_name in block['field_data']:
+                array = numpy_support.numpy_to_vtk(np.load(path.joinpath(file_name), mmap_mode='c'))
+                array.SetName(name)
+                grid.GetFieldData().AddArray(array)
+            if block['scalars']:
+                grid.GetPointData().SetActiveScalars(block['scalars'])
+            if block['vectors']:
+                grid.GetPointData().SetActiveVectors(block['vectors'])
+            dataset.SetBlock(i, grid)
+        return dataset
+
+    def put(self, key, dataset):
+        """
+        Save the dataset, the files are written to a temporary folder and then it is renamed
+         so that a partially written dataset is never seen.
+
+        :param key: The key.
+        :param dataset: The vtkMultiBlockDataSet of structured grids.
+        """
+        path = self.path(key)
+        tmp_path = path.with_suffix('.{:d}.tmp'.format(os.getpid()))
+        tmp_path.mkdir(parents=True, exist_ok=True)
+
+        def save_array(array, file_name):
+            np.save(tmp_path.joinpath(file_name), numpy_support.vtk_to_numpy(array))
+            return file_name
+
+        layout = list()
+        for i in range(dataset.GetNumberOfBlocks()):
+            grid = dataset.GetBlock(i)
+            if grid is None:
+                layout.append(None)
+                continue
+            point_data = grid.GetPointData()
+            field_data = grid.GetFieldData()
+            layout.append({
+                'extent': grid.GetExtent(),
+                'points': save_array(grid.GetPoints().GetData(), f'{i}_points.npy'),
+                'point_data': [[point_data.GetArrayName(j),
+                                save_array(point_data.GetArray(j), f'{i}_point_data_{j}.npy')]
+                               for j in range(point_data.GetNumberOfArrays())],
+                # Only the numeric arrays are kept.
+                'field_data': [[field_data.GetArrayName(j),
+                                save_array(field_data.GetArray(j), f'{i}_field_data_{j}.npy')]
+                               for j in range(field_data.GetNumberOfArrays()) if field_data.GetArray(j)],
+                'scalars': point_data.GetScalars().GetName() if point_data.GetScalars() else None,
+                'vectors': point_data.GetVectors().GetName() if point_data.GetVectors() else None,
+            })
+        with open(tmp_path.joinpath('layout.json'), 'w') as ofh:
+            json.dump(layout, ofh)
+        try:
+            os.replace(tmp_path, path)
+        except OSError:
+            # Another process has cached the same dataset.
+            shutil.rmtree(tmp_path)
+
+    def evict(self):
+        """
+        Remove the least recently used datasets until the cache is no larger than max_size.
+        """
+        datasets = list()
+        for path in self.cache_dir.iterdir():
+            layout_file = path.joinpath('layout.json')
+            if path.suffix or not layout_file.is_file():
+                # A dataset being written.
+                continue
+            try:
+                size = sum(p.stat().st_size for p in path.iterdir())
+                datasets.append((layout_file.stat().st_mtime, size, path))
+            except OSError:
+                # Removed by another process.
+                continue
+        datasets.sort()
+        total = sum(size for mtime, size, path in datasets)
+        for mtime, size, path in datasets:
+            if total <= self.max_size:
+                break
+            total -= size
+            shutil.rmtree(path, ignore_errors=True)
 
 
 if __name__ == '__main__':
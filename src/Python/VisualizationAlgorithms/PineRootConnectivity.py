@@ -1,67 +1,119 @@
 #!/usr/bin/env python
 
-import vtk
-
-
-def pine_root_connectivity(fileName, noConnectivity):
-    def NumberOfTriangles(pd):
-        '''
-        Count the number of triangles.
-        :param pd: vtkPolyData.
-        :return: The number of triangles.
-        '''
-        cells = pd.GetPolys()
-        numOfTriangles = 0
-        idList = vtk.vtkIdList()
+import time
+
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonCore import vtkIdList
+from vtkmodules.vtkFiltersCore import vtkPolyDataConnectivityFilter
+from vtkmodules.vtkFiltersModeling import vtkOutlineFilter
+from vtkmodules.vtkIOGeometry import vtkMCubesReader
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
+
+try:
+    import numpy as np
+    from vtkmodules.util import numpy_support
+except ModuleNotFoundError:
+    np = None
+
+
+def CellSizeHistogram(cells):
+    '''
+    Count the cells of each size.
+    The sizes are found from the offsets of the cell array, without visiting each cell.
+    :param cells: vtkCellArray.
+    :return: A dictionary of {number of points in a cell: number of cells}.
+    '''
+    if np is None:
+        res = dict()
+        idList = vtkIdList()
+        cells.InitTraversal()
         for i in range(0, cells.GetNumberOfCells()):
             cells.GetNextCell(idList)
-            # If a cell has three points it is a triangle.
-            if idList.GetNumberOfIds() == 3:
-                numOfTriangles += 1
-        return numOfTriangles
+            res[idList.GetNumberOfIds()] = res.get(idList.GetNumberOfIds(), 0) + 1
+        return dict(sorted(res.items()))
+    offsets = numpy_support.vtk_to_numpy(cells.GetOffsetsArray())
+    counts = np.bincount(np.diff(offsets))
+    return {size: int(count) for size, count in enumerate(counts) if count}
+
+
+def NumberOfTriangles(pd):
+    '''
+    Count the number of triangles.
+    :param pd: vtkPolyData.
+    :return: The number of triangles.
+    '''
+    # If a cell has three points it is a triangle.
+    return CellSizeHistogram(pd.GetPolys()).get(3, 0)
+
+
+def PrintCellStatistics(pd):
+    '''
+    Print the number of triangles and the number of polygons of each size.
+    :param pd: vtkPolyData.
+    '''
+    start = time.perf_counter()
+    histogram = CellSizeHistogram(pd.GetPolys())
+    elapsed = time.perf_counter() - start
+    print('There are: ', histogram.get(3, 0), 'triangles')
+    print('Polygons by number of points:', ', '.join(f'{k}: {v}' for k, v in histogram.items()),
+          '({:0.3f}ms)'.format(elapsed * 1000))
 
-    colors = vtk.vtkNamedColors()
+
+def pine_root_connectivity(fileName, noConnectivity):
+    colors = vtkNamedColors()
 
     # Create the pipeline.
-    reader = vtk.vtkMCubesReader()
+    reader = vtkMCubesReader()
     reader.SetFileName(fileName)
     if not noConnectivity:
         reader.Update()
         print('Before Connectivity.')
-        print('There are: ', NumberOfTriangles(reader.GetOutput()), 'triangles')
+        PrintCellStatistics(reader.GetOutput())
 
-    connect = vtk.vtkPolyDataConnectivityFilter()
+    connect = vtkPolyDataConnectivityFilter()
     connect.SetInputConnection(reader.GetOutputPort())
     connect.SetExtractionModeToLargestRegion()
     if not noConnectivity:
         connect.Update()
         print('After Connectivity.')
-        print('There are: ', NumberOfTriangles(connect.GetOutput()), 'triangles')
+        PrintCellStatistics(connect.GetOutput())
 
-    isoMapper = vtk.vtkPolyDataMapper()
+    isoMapper = vtkPolyDataMapper()
     if noConnectivity:
         isoMapper.SetInputConnection(reader.GetOutputPort())
     else:
         isoMapper.SetInputConnection(connect.GetOutputPort())
     isoMapper.ScalarVisibilityOff()
-    isoActor = vtk.vtkActor()
+    isoActor = vtkActor()
     isoActor.SetMapper(isoMapper)
     isoActor.GetProperty().SetColor(colors.GetColor3d('raw_sienna'))
 
     #  Get an outline of the data set for context.
-    outline = vtk.vtkOutlineFilter()
+    outline = vtkOutlineFilter()
     outline.SetInputConnection(reader.GetOutputPort())
-    outlineMapper = vtk.vtkPolyDataMapper()
+    outlineMapper = vtkPolyDataMapper()
     outlineMapper.SetInputConnection(outline.GetOutputPort())
-    outlineActor = vtk.vtkActor()
+    outlineActor = vtkActor()
     outlineActor.SetMapper(outlineMapper)
     outlineActor.GetProperty().SetColor(colors.GetColor3d('Black'))
 
     # Create the Renderer, RenderWindow and RenderWindowInteractor.
-    ren = vtk.vtkRenderer()
-    renWin = vtk.vtkRenderWindow()
+    ren = vtkRenderer()
+    renWin = vtkRenderWindow()
     renWin.AddRenderer(ren)
-    iren = vtk.vtkRenderWindowInteractor()
+    iren = vtkRenderWindowInteractor()
     iren.SetRenderWindow(renWin)
 
     # Add the actors to the renderer, set the background and size.
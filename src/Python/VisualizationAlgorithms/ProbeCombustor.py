@@ -1,91 +1,130 @@
 #!/usr/bin/env python
 
-import vtk
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonCore import (
+    vtkPoints,
+    vtkVersion
+)
+from vtkmodules.vtkCommonDataModel import (
+    vtkMultiBlockDataSet,
+    vtkStructuredGrid
+)
+from vtkmodules.vtkCommonTransforms import vtkTransform
+from vtkmodules.vtkFiltersCore import (
+    vtkAppendPolyData,
+    vtkContourFilter,
+    vtkProbeFilter,
+    vtkStructuredGridOutlineFilter
+)
+from vtkmodules.vtkFiltersGeneral import vtkTransformPolyDataFilter
+from vtkmodules.vtkFiltersModeling import vtkOutlineFilter
+from vtkmodules.vtkFiltersSources import vtkPlaneSource
+from vtkmodules.vtkIOParallel import vtkMultiBlockPLOT3DReader
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
+
+try:
+    import numpy as np
+    from vtkmodules.util import numpy_support
+except ModuleNotFoundError:
+    np = None
 
 
 def main():
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
-    fileName1, fileName2 = get_program_parameters()
+    fileName1, fileName2, cache_dir = get_program_parameters()
 
     # Create the pipeline.
     #
-    pl3d = vtk.vtkMultiBlockPLOT3DReader()
-    pl3d.SetXYZFileName(fileName1)
-    pl3d.SetQFileName(fileName2)
-    pl3d.SetScalarFunctionNumber(100)
-    pl3d.SetVectorFunctionNumber(202)
-    pl3d.Update()
+    pl3d = read_plot3d(fileName1, fileName2, 100, 202, cache_dir=cache_dir)
 
-    sg = pl3d.GetOutput().GetBlock(0)
+    sg = pl3d.GetBlock(0)
 
     # We create three planes and position them in the correct position
     # using transform filters. They are then appended together and used as
     # a probe.
-    plane = vtk.vtkPlaneSource()
+    plane = vtkPlaneSource()
     plane.SetResolution(50, 50)
 
-    transP1 = vtk.vtkTransform()
+    transP1 = vtkTransform()
     transP1.Translate(3.7, 0.0, 28.37)
     transP1.Scale(5, 5, 5)
     transP1.RotateY(90)
 
-    tpd1 = vtk.vtkTransformPolyDataFilter()
+    tpd1 = vtkTransformPolyDataFilter()
     tpd1.SetInputConnection(plane.GetOutputPort())
     tpd1.SetTransform(transP1)
 
-    outTpd1 = vtk.vtkOutlineFilter()
+    outTpd1 = vtkOutlineFilter()
     outTpd1.SetInputConnection(tpd1.GetOutputPort())
 
-    mapTpd1 = vtk.vtkPolyDataMapper()
+    mapTpd1 = vtkPolyDataMapper()
     mapTpd1.SetInputConnection(outTpd1.GetOutputPort())
 
-    tpd1Actor = vtk.vtkActor()
+    tpd1Actor = vtkActor()
     tpd1Actor.SetMapper(mapTpd1)
     tpd1Actor.GetProperty().SetColor(0, 0, 0)
     tpd1Actor.GetProperty().SetLineWidth(2.0)
 
-    transP2 = vtk.vtkTransform()
+    transP2 = vtkTransform()
     transP2.Translate(9.2, 0.0, 31.20)
     transP2.Scale(5, 5, 5)
     transP2.RotateY(90)
 
-    tpd2 = vtk.vtkTransformPolyDataFilter()
+    tpd2 = vtkTransformPolyDataFilter()
     tpd2.SetInputConnection(plane.GetOutputPort())
     tpd2.SetTransform(transP2)
 
-    outTpd2 = vtk.vtkOutlineFilter()
+    outTpd2 = vtkOutlineFilter()
     outTpd2.SetInputConnection(tpd2.GetOutputPort())
 
-    mapTpd2 = vtk.vtkPolyDataMapper()
+    mapTpd2 = vtkPolyDataMapper()
     mapTpd2.SetInputConnection(outTpd2.GetOutputPort())
 
-    tpd2Actor = vtk.vtkActor()
+    tpd2Actor = vtkActor()
     tpd2Actor.SetMapper(mapTpd2)
     tpd2Actor.GetProperty().SetColor(0, 0, 0)
     tpd2Actor.GetProperty().SetLineWidth(2.0)
 
-    transP3 = vtk.vtkTransform()
+    transP3 = vtkTransform()
     transP3.Translate(13.27, 0.0, 33.30)
     transP3.Scale(5, 5, 5)
     transP3.RotateY(90)
 
-    tpd3 = vtk.vtkTransformPolyDataFilter()
+    tpd3 = vtkTransformPolyDataFilter()
     tpd3.SetInputConnection(plane.GetOutputPort())
     tpd3.SetTransform(transP3)
 
-    outTpd3 = vtk.vtkOutlineFilter()
+    outTpd3 = vtkOutlineFilter()
     outTpd3.SetInputConnection(tpd3.GetOutputPort())
 
-    mapTpd3 = vtk.vtkPolyDataMapper()
+    mapTpd3 = vtkPolyDataMapper()
     mapTpd3.SetInputConnection(outTpd3.GetOutputPort())
 
-    tpd3Actor = vtk.vtkActor()
+    tpd3Actor = vtkActor()
     tpd3Actor.SetMapper(mapTpd3)
     tpd3Actor.GetProperty().SetColor(0, 0, 0)
     tpd3Actor.GetProperty().SetLineWidth(2.0)
 
-    appendF = vtk.vtkAppendPolyData()
+    appendF = vtkAppendPolyData()
     appendF.AddInputConnection(tpd1.GetOutputPort())
     appendF.AddInputConnection(tpd2.GetOutputPort())
     appendF.AddInputConnection(tpd3.GetOutputPort())
@@ -95,38 +134,38 @@ def main():
     # (SetSourceConnection). The output dataset structure (geometry and
     # topology) of the probe is the same as the structure of the input. The
     # probing process generates new data values resampled from the source.
-    probe = vtk.vtkProbeFilter()
+    probe = vtkProbeFilter()
     probe.SetInputConnection(appendF.GetOutputPort())
     probe.SetSourceData(sg)
 
-    contour = vtk.vtkContourFilter()
+    contour = vtkContourFilter()
     contour.SetInputConnection(probe.GetOutputPort())
     contour.GenerateValues(50, sg.GetScalarRange())
 
-    contourMapper = vtk.vtkPolyDataMapper()
+    contourMapper = vtkPolyDataMapper()
     contourMapper.SetInputConnection(contour.GetOutputPort())
     contourMapper.SetScalarRange(sg.GetScalarRange())
 
-    planeActor = vtk.vtkActor()
+    planeActor = vtkActor()
     planeActor.SetMapper(contourMapper)
 
-    outline = vtk.vtkStructuredGridOutlineFilter()
+    outline = vtkStructuredGridOutlineFilter()
     outline.SetInputData(sg)
 
-    outlineMapper = vtk.vtkPolyDataMapper()
+    outlineMapper = vtkPolyDataMapper()
     outlineMapper.SetInputConnection(outline.GetOutputPort())
 
-    outlineActor = vtk.vtkActor()
+    outlineActor = vtkActor()
     outlineActor.SetMapper(outlineMapper)
     outlineActor.GetProperty().SetColor(0, 0, 0)
     outlineActor.GetProperty().SetLineWidth(2.0)
 
     # Create the RenderWindow, Renderer and both Actors
     #
-    ren1 = vtk.vtkRenderer()
-    renWin = vtk.vtkRenderWindow()
+    ren1 = vtkRenderer()
+    renWin = vtkRenderWindow()
     renWin.AddRenderer(ren1)
-    iren = vtk.vtkRenderWindowInteractor()
+    iren = vtkRenderWindowInteractor()
     iren.SetRenderWindow(renWin)
 
     ren1.AddActor(outlineActor)
@@ -158,8 +197,235 @@ def get_program_parameters():
                                      formatter_class=argparse.RawDescriptionHelpFormatter)
     parser.add_argument('filename1', help='combxyz.bin.')
     parser.add_argument('filename2', help='combq.bin.')
+    parser.add_argument('--cache_dir', default=None,
+                        help='Cache the dataset as NumPy arrays in this folder, later runs memory-map them.')
     args = parser.parse_args()
-    return args.filename1, args.filename2
+    return args.filename1, args.filename2, args.cache_dir
+
+
+def read_plot3d(xyz_file, q_file, scalar_function, vector_function, auto_detect=False, cache_dir=None,
+                cache_size=512):
+    """
+    Read a PLOT3D dataset.
+
+    If cache_dir is given, the dataset is read from the cache if it is there,
+     otherwise it is read from the PLOT3D files and saved in the cache.
+
+    :param xyz_file: The geometry file.
+    :param q_file: The solution file.
+    :param scalar_function: The scalar function number.
+    :param vector_function: The vector function number.
+    :param auto_detect: True if the format of the files is to be detected.
+    :param cache_dir: The folder holding the cache or None, NumPy is needed to use the cache.
+    :param cache_size: The maximum size of the cache in MB.
+    :return: The vtkMultiBlockDataSet.
+    """
+    cache = key = None
+    if cache_dir is not None:
+        if np is None:
+            print('NumPy is needed to use the PLOT3D cache, the PLOT3D files are read instead.')
+        else:
+            cache = PLOT3DCache(cache_dir, cache_size * 1024 * 1024)
+            key = PLOT3DCache.make_key(PLOT3DCache.file_signature(xyz_file), PLOT3DCache.file_signature(q_file),
+                                       scalar_function, vector_function, auto_detect, vtkVersion.GetVTKVersion())
+            dataset = cache.get(key)
+            if dataset is not None:
+                return dataset
+
+    pl3d = vtkMultiBlockPLOT3DReader()
+    if auto_detect:
+        pl3d.AutoDetectFormatOn()
+    pl3d.SetXYZFileName(xyz_file)
+    pl3d.SetQFileName(q_file)
+    pl3d.SetScalarFunctionNumber(scalar_function)
+    pl3d.SetVectorFunctionNumber(vector_function)
+    pl3d.Update()
+    if cache is not None:
+        cache.put(key, pl3d.GetOutput())
+        cache.evict()
+    return pl3d.GetOutput()
+
+
+class PLOT3DCache:
+    """
+    A size bounded, on-disk cache of PLOT3D datasets in a memory-mappable layout.
+
+    The structured grids read from a pair of PLOT3D files are stored as one .npy file per array,
+     in a folder named by a hash of the files and the reader settings.
+    Later runs memory-map the arrays instead of parsing the PLOT3D files, so the pages are read
+     from disk when they are used and are shared between the processes using the same dataset.
+    When the cache grows beyond max_size bytes the least recently used datasets are removed.
+    """
+
+    def __init__(self, cache_dir, max_size):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+
+    @staticmethod
+    def make_key(*args):
+        """
+        Make a key from the arguments.
+
+        :param args: The file signatures and reader settings.
+        :return: The key.
+        """
+        h = hashlib.sha256()
+        for arg in args:
+            h.update(repr(arg).encode('utf-8'))
+        return h.hexdigest()
+
+    @staticmethod
+    def file_signature(file_name):
+        """
+        The path, size and modification time of a file.
+
+        :param file_name: The file.
+        :return: A tuple of the path, size and modification time.
+        """
+        path = Path(file_name).resolve()
+        st = path.stat()
+        return str(path), st.st_size, st.st_mtime_ns
+
+    def path(self, key):
+        return self.cache_dir.joinpath(key)
+
+    def get(self, key):
+        """
+        Get the dataset corresponding to the key, the arrays are memory-mapped copy on write,
+         so the dataset can be modified without changing the cache.
+
+        If the dataset cannot be loaded, e.g. a file is missing or truncated, it is removed.
+
+        :param key: The key.
+        :return: The vtkMultiBlockDataSet or None if it is not in the cache.
+        """
+        path = self.path(key)
+        layout_file = path.joinpath('layout.json')
+        if not layout_file.is_file():
+            return None
+        try:
+            dataset = self.load(path)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f'Removing the cached PLOT3D dataset {path}, it cannot be loaded. {e}')
+            shutil.rmtree(path, ignore_errors=True)
+            return None
+        # Mark it as recently used.
+        os.utime(layout_file)
+        return dataset
+
+    @staticmethod
+    def load(path):
+        """
+        Load a dataset from the cache.
+
+        :param path: The folder holding the dataset.
+        :return: The vtkMultiBlockDataSet.
+        """
+        with open(path.joinpath('layout.json'), 'r') as ifh:
+            layout = json.load(ifh)
+
+        def load_array(name, file_name, number_of_tuples):
+            a = np.load(path.joinpath(file_name), mmap_mode='c')
+            if a.shape[0] != number_of_tuples:
+                raise ValueError(f'{file_name} has {a.shape[0]} tuples, expected {number_of_tuples}.')
+            array = numpy_support.numpy_to_vtk(a)
+            array.SetName(name)
+            return array
+
+        dataset = vtkMultiBlockDataSet()
+        dataset.SetNumberOfBlocks(len(layout))
+        for i, block in enumerate(layout):
+            if block is None:
+                continue
+            e = block['extent']
+            grid = vtkStructuredGrid()
+            grid.SetExtent(e)
+            number_of_points = (e[1] - e[0] + 1) * (e[3] - e[2] + 1) * (e[5] - e[4] + 1)
+            points = vtkPoints()
+            points.SetData(load_array(None, block['points'], number_of_points))
+            grid.SetPoints(points)
+            for name, file_name in block['point_data']:
+                grid.GetPointData().AddArray(load_array(name, file_name, number_of_points))
+            for name, file_name in block['field_data']:
+                array = numpy_support.numpy_to_vtk(np.load(path.joinpath(file_name), mmap_mode='c'))
+                array.SetName(name)
+                grid.GetFieldData().AddArray(array)
+            if block['scalars']:
+                grid.GetPointData().SetActiveScalars(block['scalars'])
+            if block['vectors']:
+                grid.GetPointData().SetActiveVectors(block['vectors'])
+            dataset.SetBlock(i, grid)
+        return dataset
+
+    def put(self, key, dataset):
+        """
+        Save the dataset, the files are written to a temporary folder and then it is renamed
+         so that a partially written dataset is never seen.
+
+        :param key: The key.
+        :param dataset: The vtkMultiBlockDataSet of structured grids.
+        """
+        path = self.path(key)
+        tmp_path = path.with_suffix('.{:d}.tmp'.format(os.getpid()))
+        tmp_path.mkdir(parents=True, exist_ok=True)
+
+        def save_array(array, file_name):
+            np.save(tmp_path.joinpath(file_name), numpy_support.vtk_to_numpy(array))
+            return file_name
+
+        layout = list()
+        for i in range(dataset.GetNumberOfBlocks()):
+            grid = dataset.GetBlock(i)
+            if grid is None:
+                layout.append(None)
+                continue
+            point_data = grid.GetPointData()
+            field_data = grid.GetFieldData()
+            layout.append({
+                'extent': grid.GetExtent(),
+                'points': save_array(grid.GetPoints().GetData(), f'{i}_points.npy'),
+                'point_data': [[point_data.GetArrayName(j),
+                                save_array(point_data.GetArray(j), f'{i}_point_data_{j}.npy')]
+                               for j in range(point_data.GetNumberOfArrays())],
+                # Only the numeric arrays are kept.
+                'field_data': [[field_data.GetArrayName(j),
+                                save_array(field_data.GetArray(j), f'{i}_field_data_{j}.npy')]
+                               for j in range(field_data.GetNumberOfArrays()) if field_data.GetArray(j)],
+                'scalars': point_data.GetScalars().GetName() if point_data.GetScalars() else None,
+                'vectors': point_data.GetVectors().GetName() if point_data.GetVectors() else None,
+            })
+        with open(tmp_path.joinpath('layout.json'), 'w') as ofh:
+            json.dump(layout, ofh)
+        try:
+            os.replace(tmp_path, path)
+        except OSError:
+            # Another process has cached the same dataset.
+            shutil.rmtree(tmp_path)
+
+    def evict(self):
+        """
+        Remove the least recently used datasets until the cache is no larger than max_size.
+        """
+        datasets = list()
+        for path in self.cache_dir.iterdir():
+            layout_file = path.joinpath('layout.json')
+            if path.suffix or not layout_file.is_file():
+                # A dataset being written.
+                continue
+            try:
+                size = sum(p.stat().st_size for p in path.iterdir())
+                datasets.append((layout_file.stat().st_mtime, size, path))
+            except OSError:
+                # Removed by another process.
+                continue
+        datasets.sort()
+        total = sum(size for mtime, size, path in datasets)
+        for mtime, size, path in datasets:
+            if total <= self.max_size:
+                break
+            total -= size
+            shutil.rmtree(path, ignore_errors=True)
 
 
 if __name__ == '__main__':
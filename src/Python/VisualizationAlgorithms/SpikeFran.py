@@ -1,24 +1,46 @@
 #!/usr/bin/env python
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonTransforms import vtkTransform
+from vtkmodules.vtkFiltersCore import (
+    vtkGlyph3D,
+    vtkMaskPoints,
+    vtkPolyDataNormals
+)
+from vtkmodules.vtkFiltersGeneral import vtkTransformPolyDataFilter
+from vtkmodules.vtkFiltersSources import vtkConeSource
+from vtkmodules.vtkIOLegacy import vtkPolyDataReader
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
 
 
 def main():
     fileName = get_program_parameters()
 
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
-    fran = vtk.vtkPolyDataReader()
+    fran = vtkPolyDataReader()
     fran.SetFileName(fileName)
 
-    normals = vtk.vtkPolyDataNormals()
+    normals = vtkPolyDataNormals()
     normals.SetInputConnection(fran.GetOutputPort())
     normals.FlipNormalsOn()
 
-    franMapper = vtk.vtkPolyDataMapper()
+    franMapper = vtkPolyDataMapper()
     franMapper.SetInputConnection(normals.GetOutputPort())
 
-    franActor = vtk.vtkActor()
+    franActor = vtkActor()
     franActor.SetMapper(franMapper)
     franActor.GetProperty().SetColor(colors.GetColor3d('Flesh'))
 
@@ -27,20 +49,20 @@ def main():
     # read. The RandomModeOn and SetOnRatio combine to random select one out
     # of every 10 points in the dataset.
     #
-    ptMask = vtk.vtkMaskPoints()
+    ptMask = vtkMaskPoints()
     ptMask.SetInputConnection(normals.GetOutputPort())
     ptMask.SetOnRatio(10)
     ptMask.RandomModeOn()
 
     # In this case we are using a cone as a glyph. We transform the cone so
     # its base is at 0,0,0. This is the point where glyph rotation occurs.
-    cone = vtk.vtkConeSource()
+    cone = vtkConeSource()
     cone.SetResolution(6)
 
-    transform = vtk.vtkTransform()
+    transform = vtkTransform()
     transform.Translate(0.5, 0.0, 0.0)
 
-    transformF = vtk.vtkTransformPolyDataFilter()
+    transformF = vtkTransformPolyDataFilter()
     transformF.SetInputConnection(cone.GetOutputPort())
     transformF.SetTransform(transform)
 
@@ -48,27 +70,27 @@ def main():
     # which can be any vtkDataSet and the glyph (SetSourceConnection) which
     # must be a vtkPolyData.  We are interested in orienting the glyphs by the
     # surface normals that we previously generated.
-    glyph = vtk.vtkGlyph3D()
+    glyph = vtkGlyph3D()
     glyph.SetInputConnection(ptMask.GetOutputPort())
     glyph.SetSourceConnection(transformF.GetOutputPort())
     glyph.SetVectorModeToUseNormal()
     glyph.SetScaleModeToScaleByVector()
     glyph.SetScaleFactor(0.004)
 
-    spikeMapper = vtk.vtkPolyDataMapper()
+    spikeMapper = vtkPolyDataMapper()
     spikeMapper.SetInputConnection(glyph.GetOutputPort())
 
-    spikeActor = vtk.vtkActor()
+    spikeActor = vtkActor()
     spikeActor.SetMapper(spikeMapper)
     spikeActor.GetProperty().SetColor(colors.GetColor3d('Emerald_Green'))
 
     # Create the RenderWindow, Renderer and Interactor.
     #
-    ren1 = vtk.vtkRenderer()
-    renWin = vtk.vtkRenderWindow()
+    ren1 = vtkRenderer()
+    renWin = vtkRenderWindow()
     renWin.AddRenderer(ren1)
 
-    iren = vtk.vtkRenderWindowInteractor()
+    iren = vtkRenderWindowInteractor()
     iren.SetRenderWindow(renWin)
 
     # Add the actors to the renderer, set the background and size.
@@ -6,41 +6,83 @@ This program encompasses the functionality of
   StreamlinesWithLineWidget.tcl and LineWidget.tcl.
 """
 
-import vtk
+import hashlib
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingContextOpenGL2
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonCore import (
+    VTK_VERSION_NUMBER,
+    vtkCommand,
+    vtkPoints,
+    vtkSMPTools,
+    vtkVersion
+)
+from vtkmodules.vtkCommonDataModel import (
+    vtkMultiBlockDataSet,
+    vtkPolyData,
+    vtkStructuredGrid
+)
+from vtkmodules.vtkCommonMath import vtkRungeKutta4
+from vtkmodules.vtkFiltersCore import vtkStructuredGridOutlineFilter
+from vtkmodules.vtkFiltersFlowPaths import vtkStreamTracer
+from vtkmodules.vtkFiltersModeling import vtkRibbonFilter
+from vtkmodules.vtkIOParallel import vtkMultiBlockPLOT3DReader
+from vtkmodules.vtkInteractionWidgets import vtkLineWidget
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
+
+try:
+    import numpy as np
+    from vtkmodules.util import numpy_support
+except ModuleNotFoundError:
+    np = None
 
 
 def main():
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
-    fileName1, fileName2, numOfStreamLines, illustration = get_program_parameters()
+    fileName1, fileName2, numOfStreamLines, illustration, cache_dir, workers, max_steps = get_program_parameters()
     if illustration:
         numOfStreamLines = 25
 
     # Start by loading some data.
-    pl3d = vtk.vtkMultiBlockPLOT3DReader()
-    pl3d.SetXYZFileName(fileName1)
-    pl3d.SetQFileName(fileName2)
-    pl3d.SetScalarFunctionNumber(100)  # Density
-    pl3d.SetVectorFunctionNumber(202)  # Momentum
-    pl3d.Update()
+    # The scalar function is the density and the vector function is the momentum.
+    pl3d = read_plot3d(fileName1, fileName2, 100, 202, cache_dir=cache_dir)
 
-    pl3d_output = pl3d.GetOutput().GetBlock(0)
+    pl3d_output = pl3d.GetBlock(0)
 
     # Create the Renderer, RenderWindow and RenderWindowInteractor.
-    ren = vtk.vtkRenderer()
-    renWin = vtk.vtkRenderWindow()
+    ren = vtkRenderer()
+    renWin = vtkRenderWindow()
     renWin.AddRenderer(ren)
-    iren = vtk.vtkRenderWindowInteractor()
+    iren = vtkRenderWindowInteractor()
     iren.SetRenderWindow(renWin)
 
     # Needed by: vtkStreamTracer and vtkLineWidget.
-    seeds = vtk.vtkPolyData()
-    streamline = vtk.vtkActor()
-    seeds2 = vtk.vtkPolyData()
-    streamline2 = vtk.vtkActor()
+    seeds = vtkPolyData()
+    streamline = vtkActor()
+    seeds2 = vtkPolyData()
+    streamline2 = vtkActor()
 
     # The line widget is used seed the streamlines.
-    lineWidget = vtk.vtkLineWidget()
+    lineWidget = vtkLineWidget()
     lineWidget.SetResolution(numOfStreamLines)
     lineWidget.SetInputData(pl3d_output)
     lineWidget.GetPolyData(seeds)
@@ -58,7 +100,7 @@ def main():
     lineWidget.AddObserver("InteractionEvent", GenerateStreamlinesCallback(seeds, renWin))
 
     # The second line widget is used seed more streamlines.
-    lineWidget2 = vtk.vtkLineWidget()
+    lineWidget2 = vtkLineWidget()
     lineWidget2.SetResolution(numOfStreamLines)
     lineWidget2.SetInputData(pl3d_output)
     lineWidget2.GetPolyData(seeds2)
@@ -72,8 +114,10 @@ def main():
     lineWidget2.AddObserver("InteractionEvent", GenerateStreamlinesCallback(seeds2, renWin))
 
     # Here we set up two streamlines.
-    rk4 = vtk.vtkRungeKutta4()
-    streamer = vtk.vtkStreamTracer()
+    # vtkStreamTracer traces the seeds in parallel using vtkSMPTools.
+    threads = use_threads(workers) if workers else None
+    rk4 = vtkRungeKutta4()
+    streamer = vtkStreamTracer()
     streamer.SetInputData(pl3d_output)
     streamer.SetSourceData(seeds)
     streamer.SetMaximumPropagation(100)
@@ -81,17 +125,19 @@ def main():
     streamer.SetIntegrationDirectionToForward()
     streamer.SetComputeVorticity(1)
     streamer.SetIntegrator(rk4)
-    rf = vtk.vtkRibbonFilter()
+    if max_steps is not None:
+        streamer.SetMaximumNumberOfSteps(max_steps)
+    rf = vtkRibbonFilter()
     rf.SetInputConnection(streamer.GetOutputPort())
     rf.SetWidth(0.1)
     rf.SetWidthFactor(5)
-    streamMapper = vtk.vtkPolyDataMapper()
+    streamMapper = vtkPolyDataMapper()
     streamMapper.SetInputConnection(rf.GetOutputPort())
     streamMapper.SetScalarRange(pl3d_output.GetScalarRange())
     streamline.SetMapper(streamMapper)
     streamline.VisibilityOff()
 
-    streamer2 = vtk.vtkStreamTracer()
+    streamer2 = vtkStreamTracer()
     streamer2.SetInputData(pl3d_output)
     streamer2.SetSourceData(seeds2)
     streamer2.SetMaximumPropagation(100)
@@ -99,22 +145,24 @@ def main():
     streamer2.SetIntegrationDirectionToForward()
     streamer2.SetComputeVorticity(1)
     streamer2.SetIntegrator(rk4)
-    rf2 = vtk.vtkRibbonFilter()
+    if max_steps is not None:
+        streamer2.SetMaximumNumberOfSteps(max_steps)
+    rf2 = vtkRibbonFilter()
     rf2.SetInputConnection(streamer2.GetOutputPort())
     rf2.SetWidth(0.1)
     rf2.SetWidthFactor(5)
-    streamMapper2 = vtk.vtkPolyDataMapper()
+    streamMapper2 = vtkPolyDataMapper()
     streamMapper2.SetInputConnection(rf2.GetOutputPort())
     streamMapper2.SetScalarRange(pl3d_output.GetScalarRange())
     streamline2.SetMapper(streamMapper2)
     streamline2.VisibilityOff()
 
     # Get an outline of the data set for context.
-    outline = vtk.vtkStructuredGridOutlineFilter()
+    outline = vtkStructuredGridOutlineFilter()
     outline.SetInputData(pl3d_output)
-    outlineMapper = vtk.vtkPolyDataMapper()
+    outlineMapper = vtkPolyDataMapper()
     outlineMapper.SetInputConnection(outline.GetOutputPort())
-    outlineActor = vtk.vtkActor()
+    outlineActor = vtkActor()
     outlineActor.GetProperty().SetColor(colors.GetColor3d("Black"))
     outlineActor.SetMapper(outlineMapper)
 
@@ -131,6 +179,12 @@ def main():
         lineWidget.EnabledOn()
         streamline.VisibilityOn()
         lineWidget.GetPolyData(seeds)
+        observer = streamer.AddObserver(vtkCommand.ProgressEvent, print_progress)
+        start = time.perf_counter()
+        streamer.Update()
+        print(f'Traced {streamer.GetOutput().GetNumberOfLines()} streamlines in {time.perf_counter() - start:0.3f}s'
+              + (f' on {threads} threads.' if threads else '.'))
+        streamer.RemoveObserver(observer)
         renWin.Render()
 
         cam.SetClippingRange(14.216207, 68.382915)
@@ -176,8 +230,15 @@ If the fourth parameter is non-zero, it is used to generate
     parser.add_argument('numOfStreamLines', default=25, type=int, nargs='?', help='The number of stream lines.')
     parser.add_argument('illustration', default=0, type=int, nargs='?',
                         help='If non-zero, reproduce Fig 7-39 of the VTK Textbook.')
+    parser.add_argument('--cache_dir', default=None,
+                        help='Cache the dataset as NumPy arrays in this folder, later runs memory-map them.')
+    parser.add_argument('-j', type=int, default=None, dest='workers',
+                        help='The number of threads tracing the streamlines, needs VTK 9.1 or later.')
+    parser.add_argument('--max_steps', type=int, default=None,
+                        help='The maximum number of integration steps for each streamline.')
     args = parser.parse_args()
-    return args.filename1, args.filename2, args.numOfStreamLines, args.illustration
+    return args.filename1, args.filename2, args.numOfStreamLines, args.illustration, args.cache_dir, args.workers, \
+        args.max_steps
 
 
 class EnableActorCallback(object):
@@ -198,5 +259,276 @@ class GenerateStreamlinesCallback(object):
         self.renWin.Render()
 
 
+def use_threads(workers):
+    """
+    Set the number of threads used by vtkSMPTools, the STDThread backend is used
+     unless VTK has been set to use another parallel backend.
+
+    Selecting the backend at run time needs VTK 9.1 or later.
+
+    :param workers: The number of threads.
+    :return: The estimated number of threads, or None if the VTK version is too old.
+    """
+    if not vtk_version_ok(9, 1, 0):
+        print('Setting the number of threads needs VTK 9.1 or later, -j is ignored.')
+        return None
+    if vtkSMPTools.GetBackend() == 'Sequential':
+        vtkSMPTools.SetBackend('STDThread')
+    vtkSMPTools.Initialize(workers)
+    return vtkSMPTools.GetEstimatedNumberOfThreads()
+
+
+def print_progress(caller, event):
+    progress = caller.GetProgress()
+    print(f'\rTracing the streamlines: {progress:4.0%}', end='\n' if progress == 1 else '', flush=True)
+
+
+def read_plot3d(xyz_file, q_file, scalar_function, vector_function, auto_detect=False, cache_dir=None,
+                cache_size=512):
+    """
+    Read a PLOT3D dataset.
+
+    If cache_dir is given, the dataset is read from the cache if it is there,
+     otherwise it is read from the PLOT3D files and saved in the cache.
+
+    :param xyz_file: The geometry file.
+    :param q_file: The solution file.
+    :param scalar_function: The scalar function number.
+    :param vector_function: The vector function number.
+    :param auto_detect: True if the format of the files is to be detected.
+    :param cache_dir: The folder holding the cache or None, NumPy is needed to use the cache.
+    :param cache_size: The maximum size of the cache in MB.
+    :return: The vtkMultiBlockDataSet.
+    """
+    cache = key = None
+    if cache_dir is not None:
+        if np is None:
+            print('NumPy is needed to use the PLOT3D cache, the PLOT3D files are read instead.')
+        else:
+            cache = PLOT3DCache(cache_dir, cache_size * 1024 * 1024)
+            key = PLOT3DCache.make_key(PLOT3DCache.file_signature(xyz_file), PLOT3DCache.file_signature(q_file),
+                                       scalar_function, vector_function, auto_detect, vtkVersion.GetVTKVersion())
+            dataset = cache.get(key)
+            if dataset is not None:
+                return dataset
+
+    pl3d = vtkMultiBlockPLOT3DReader()
+    if auto_detect:
+        pl3d.AutoDetectFormatOn()
+    pl3d.SetXYZFileName(xyz_file)
+    pl3d.SetQFileName(q_file)
+    pl3d.SetScalarFunctionNumber(scalar_function)
+    pl3d.SetVectorFunctionNumber(vector_function)
+    pl3d.Update()
+    if cache is not None:
+        cache.put(key, pl3d.GetOutput())
+        cache.evict()
+    return pl3d.GetOutput()
+
+
+class PLOT3DCache:
+    """
+    A size bounded, on-disk cache of PLOT3D datasets in a memory-mappable layout.
+
+    The structured grids read from a pair of PLOT3D files are stored as one .npy file per array,
+     in a folder named by a hash of the files and the reader settings.
+    Later runs memory-map the arrays instead of parsing the PLOT3D files, so the pages are read
+     from disk when they are used and are shared between the processes using the same dataset.
+    When the cache grows beyond max_size bytes the least recently used datasets are removed.
+    """
+
+    def __init__(self, cache_dir, max_size):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+
+    @staticmethod
+    def make_key(*args):
+        """
+        Make a key from the arguments.
+
+        :param args: The file signatures and reader settings.
+        :return: The key.
+        """
+        h = hashlib.sha256()
+        for arg in args:
+            h.update(repr(arg).encode('utf-8'))
+        return h.hexdigest()
+
+    @staticmethod
+    def file_signature(file_name):
+        """
+        The path, size and modification time of a file.
+
+        :param file_name: The file.
+        :return: A tuple of the path, size and modification time.
+        """
+        path = Path(file_name).resolve()
+        st = path.stat()
+        return str(path), st.st_size, st.st_mtime_ns
+
+    def path(self, key):
+        return self.cache_dir.joinpath(key)
+
+    def get(self, key):
+        """
+        Get the dataset corresponding to the key, the arrays are memory-mapped copy on write,
+         so the dataset can be modified without changing the cache.
+
+        If the dataset cannot be loaded, e.g. a file is missing or truncated, it is removed.
+
+        :param key: The key.
+        :return: The vtkMultiBlockDataSet or None if it is not in the cache.
+        """
+        path = self.path(key)
+        layout_file = path.joinpath('layout.json')
+        if not layout_file.is_file():
+            return None
+        try:
+            dataset = self.load(path)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f'Removing the cached PLOT3D dataset {path}, it cannot be loaded. {e}')
+            shutil.rmtree(path, ignore_errors=True)
+            return None
+        # Mark it as recently used.
+        os.utime(layout_file)
+        return dataset
+
+    @staticmethod
+    def load(path):
+        """
+        Load a dataset from the cache.
+
+        :param path: The folder holding the dataset.
+        :return: The vtkMultiBlockDataSet.
+        """
+        with open(path.joinpath('layout.json'), 'r') as ifh:
+            layout = json.load(ifh)
+
+        def load_array(name, file_name, number_of_tuples):
+            a = np.load(path.joinpath(file_name), mmap_mode='c')
+            if a.shape[0] != number_of_tuples:
+                raise ValueError(f'{file_name} has {a.shape[0]} tuples, expected {number_of_tuples}.')
+            array = numpy_support.numpy_to_vtk(a)
+            array.SetName(name)
+            return array
+
+        dataset = vtkMultiBlockDataSet()
+        dataset.SetNumberOfBlocks(len(layout))
+        for i, block in enumerate(layout):
+            if block is None:
+                continue
+            e = block['extent']
+            grid = vtkStructuredGrid()
+            grid.SetExtent(e)
+            number_of_points = (e[1] - e[0] + 1) * (e[3] - e[2] + 1) * (e[5] - e[4] + 1)
+            points = vtkPoints()
+            points.SetData(load_array(None, block['points'], number_of_points))
+            grid.SetPoints(points)
+            for name, file_name in block['point_data']:
+                grid.GetPointData().AddArray(load_array(name, file_name, number_of_points))
+            for name, file_name in block['field_data']:
+                array = numpy_support.numpy_to_vtk(np.load(path.joinpath(file_name), mmap_mode='c'))
+                array.SetName(name)
+                grid.GetFieldData().AddArray(array)
+            if block['scalars']:
+                grid.GetPointData().SetActiveScalars(block['scalars'])
+            if block['vectors']:
+                grid.GetPointData().SetActiveVectors(block['vectors'])
+            dataset.SetBlock(i, grid)
+        return dataset
+
+    def put(self, key, dataset):
+        """
+        Save the dataset, the files are written to a temporary folder and then it is renamed
+         so that a partially written dataset is never seen.
+
+        :param key: The key.
+        :param dataset: The vtkMultiBlockDataSet of structured grids.
+        """
+        path = self.path(key)
+        tmp_path = path.with_suffix('.{:d}.tmp'.format(os.getpid()))
+        tmp_path.mkdir(parents=True, exist_ok=True)
+
+        def save_array(array, file_name):
+            np.save(tmp_path.joinpath(file_name), numpy_support.vtk_to_numpy(array))
+            return file_name
+
+        layout = list()
+        for i in range(dataset.GetNumberOfBlocks()):
+            grid = dataset.GetBlock(i)
+            if grid is None:
+                layout.append(None)
+                continue
+            point_data = grid.GetPointData()
+            field_data = grid.GetFieldData()
+            layout.append({
+                'extent': grid.GetExtent(),
+                'points': save_array(grid.GetPoints().GetData(), f'{i}_points.npy'),
+                'point_data': [[point_data.GetArrayName(j),
+                                save_array(point_data.GetArray(j), f'{i}_point_data_{j}.npy')]
+                               for j in range(point_data.GetNumberOfArrays())],
+                # Only the numeric arrays are kept.
+                'field_data': [[field_data.GetArrayName(j),
+                                save_array(field_data.GetArray(j), f'{i}_field_data_{j}.npy')]
+                               for j in range(field_data.GetNumberOfArrays()) if field_data.GetArray(j)],
+                'scalars': point_data.GetScalars().GetName() if point_data.GetScalars() else None,
+                'vectors': point_data.GetVectors().GetName() if point_data.GetVectors() else None,
+            })
+        with open(tmp_path.joinpath('layout.json'), 'w') as ofh:
+            json.dump(layout, ofh)
+        try:
+            os.replace(tmp_path, path)
+        except OSError:
+            # Another process has cached the same dataset.
+            shutil.rmtree(tmp_path)
+
+    def evict(self):
+        """
+        Remove the least recently used datasets until the cache is no larger than max_size.
+        """
+        datasets = list()
+        for path in self.cache_dir.iterdir():
+            layout_file = path.joinpath('layout.json')
+            if path.suffix or not layout_file.is_file():
+                # A dataset being written.
+                continue
+            try:
+                size = sum(p.stat().st_size for p in path.iterdir())
+                datasets.append((layout_file.stat().st_mtime, size, path))
+            except OSError:
+                # Removed by another process.
+                continue
+        datasets.sort()
+        total = sum(size for mtime, size, path in datasets)
+        for mtime, size, path in datasets:
+            if total <= self.max_size:
+                break
+            total -= size
+            shutil.rmtree(path, ignore_errors=True)
+
+
+def vtk_version_ok(major, minor, build):
+    """
+    Check the VTK version.
+
+    :param major: Major version.
+    :param minor: Minor version.
+    :param build: Build version.
+    :return: True if the requested VTK version is greater or equal to the actual VTK version.
+    """
+    needed_version = 10000000000 * int(major) + 100000000 * int(minor) + int(build)
+    try:
+        vtk_version_number = VTK_VERSION_NUMBER
+    except AttributeError:  # as error:
+        ver = vtkVersion()
+        vtk_version_number = 10000000000 * ver.GetVTKMajorVersion() + 100000000 * ver.GetVTKMinorVersion() \
+                             + ver.GetVTKBuildVersion()
+    if vtk_version_number >= needed_version:
+        return True
+    else:
+        return False
+
+
 if __name__ == '__main__':
     main()
@@ -2,52 +2,76 @@
 
 # Translated from TenAxes.tcl
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonCore import vtkLookupTable
+from vtkmodules.vtkFiltersCore import (
+    vtkTensorGlyph,
+    vtkTubeFilter
+)
+from vtkmodules.vtkFiltersGeneral import vtkAxes
+from vtkmodules.vtkFiltersGeometry import vtkImageDataGeometryFilter
+from vtkmodules.vtkFiltersModeling import vtkOutlineFilter
+from vtkmodules.vtkFiltersSources import vtkConeSource
+from vtkmodules.vtkImagingHybrid import vtkPointLoad
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkCamera,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
 
 
 def main():
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
     # Create the RenderWindow, Renderer and interactive renderer.
     #
-    ren = vtk.vtkRenderer()
-    renWin = vtk.vtkRenderWindow()
+    ren = vtkRenderer()
+    renWin = vtkRenderWindow()
     renWin.AddRenderer(ren)
-    iren = vtk.vtkRenderWindowInteractor()
+    iren = vtkRenderWindowInteractor()
     iren.SetRenderWindow(renWin)
 
     # Generate the tensors.
-    ptLoad = vtk.vtkPointLoad()
+    ptLoad = vtkPointLoad()
     ptLoad.SetLoadValue(100.0)
     ptLoad.SetSampleDimensions(6, 6, 6)
     ptLoad.ComputeEffectiveStressOn()
     ptLoad.SetModelBounds(-10, 10, -10, 10, -10, 10)
 
     # Extract a plane of data.
-    plane = vtk.vtkImageDataGeometryFilter()
+    plane = vtkImageDataGeometryFilter()
     plane.SetInputConnection(ptLoad.GetOutputPort())
     plane.SetExtent(2, 2, 0, 99, 0, 99)
 
     # Generate the tensor axes.
-    axes = vtk.vtkAxes()
+    axes = vtkAxes()
     axes.SetScaleFactor(0.5)
 
-    tubeAxes = vtk.vtkTubeFilter()
+    tubeAxes = vtkTubeFilter()
     tubeAxes.SetInputConnection(axes.GetOutputPort())
     tubeAxes.SetRadius(0.1)
     tubeAxes.SetNumberOfSides(6)
 
-    tensorAxes = vtk.vtkTensorGlyph()
+    tensorAxes = vtkTensorGlyph()
     tensorAxes.SetInputConnection(ptLoad.GetOutputPort())
     tensorAxes.SetSourceConnection(axes.GetOutputPort())
     tensorAxes.SetScaleFactor(10)
     tensorAxes.ClampScalingOn()
 
     # Map contour
-    lut = vtk.vtkLookupTable()
+    lut = vtkLookupTable()
     MakeLogLUT(lut)
     # lut.SetHueRange(.6667, 0.0)
-    tensorAxesMapper = vtk.vtkPolyDataMapper()
+    tensorAxesMapper = vtkPolyDataMapper()
     tensorAxesMapper.SetInputConnection(tensorAxes.GetOutputPort())
     tensorAxesMapper.SetLookupTable(lut)
     plane.Update()  # force update for scalar range
@@ -55,36 +79,36 @@ def main():
     # tensorAxesMapper.ImmediateModeRenderingOn()
     tensorAxesMapper.SetScalarRange(plane.GetOutput().GetScalarRange())
 
-    tensorActor = vtk.vtkActor()
+    tensorActor = vtkActor()
     tensorActor.SetMapper(tensorAxesMapper)
 
     # Create an outline around the data.
     #
-    outline = vtk.vtkOutlineFilter()
+    outline = vtkOutlineFilter()
     outline.SetInputConnection(ptLoad.GetOutputPort())
 
-    outlineMapper = vtk.vtkPolyDataMapper()
+    outlineMapper = vtkPolyDataMapper()
     outlineMapper.SetInputConnection(outline.GetOutputPort())
 
-    outlineActor = vtk.vtkActor()
+    outlineActor = vtkActor()
     outlineActor.SetMapper(outlineMapper)
     outlineActor.GetProperty().SetColor(colors.GetColor3d('Black'))
 
     #
     # Create a cone whose apex indicates the application of load.
     #
-    coneSrc = vtk.vtkConeSource()
+    coneSrc = vtkConeSource()
     coneSrc.SetRadius(.5)
     coneSrc.SetHeight(2)
-    coneMap = vtk.vtkPolyDataMapper()
+    coneMap = vtkPolyDataMapper()
     coneMap.SetInputConnection(coneSrc.GetOutputPort())
-    coneActor = vtk.vtkActor()
+    coneActor = vtkActor()
     coneActor.SetMapper(coneMap)
     coneActor.SetPosition(0, 0, 11)
     coneActor.RotateY(90)
     coneActor.GetProperty().SetColor(colors.GetColor3d('BurlyWood'))
 
-    camera = vtk.vtkCamera()
+    camera = vtkCamera()
     camera.SetFocalPoint(0.113766, -1.13665, -1.01919)
     camera.SetPosition(-29.4886, -63.1488, 26.5807)
     camera.SetViewAngle(24.4617)
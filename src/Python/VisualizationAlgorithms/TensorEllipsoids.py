@@ -2,84 +2,113 @@
 
 # Translated from TenEllip.tcl
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import (
+    vtkColorSeries,
+    vtkNamedColors
+)
+from vtkmodules.vtkCommonCore import vtkLookupTable
+from vtkmodules.vtkFiltersCore import (
+    vtkPolyDataNormals,
+    vtkTensorGlyph
+)
+from vtkmodules.vtkFiltersGeometry import vtkImageDataGeometryFilter
+from vtkmodules.vtkFiltersModeling import vtkOutlineFilter
+from vtkmodules.vtkFiltersSources import (
+    vtkConeSource,
+    vtkSphereSource
+)
+from vtkmodules.vtkImagingHybrid import vtkPointLoad
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkCamera,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
 
 
 def main():
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
     # Create the RenderWindow, Renderer and interactive renderer.
     #
-    ren = vtk.vtkRenderer()
-    renWin = vtk.vtkRenderWindow()
+    ren = vtkRenderer()
+    renWin = vtkRenderWindow()
     renWin.AddRenderer(ren)
-    iren = vtk.vtkRenderWindowInteractor()
+    iren = vtkRenderWindowInteractor()
     iren.SetRenderWindow(renWin)
 
     # Generate the tensors.
-    ptLoad = vtk.vtkPointLoad()
+    ptLoad = vtkPointLoad()
     ptLoad.SetLoadValue(100.0)
     ptLoad.SetSampleDimensions(6, 6, 6)
     ptLoad.ComputeEffectiveStressOn()
     ptLoad.SetModelBounds(-10, 10, -10, 10, -10, 10)
 
     # Extract a plane of data.
-    plane = vtk.vtkImageDataGeometryFilter()
+    plane = vtkImageDataGeometryFilter()
     plane.SetInputConnection(ptLoad.GetOutputPort())
     plane.SetExtent(2, 2, 0, 99, 0, 99)
 
     # Generate the ellipsoids.
-    sphere = vtk.vtkSphereSource()
+    sphere = vtkSphereSource()
     sphere.SetThetaResolution(8)
     sphere.SetPhiResolution(8)
-    tensorEllipsoids = vtk.vtkTensorGlyph()
+    tensorEllipsoids = vtkTensorGlyph()
     tensorEllipsoids.SetInputConnection(ptLoad.GetOutputPort())
     tensorEllipsoids.SetSourceConnection(sphere.GetOutputPort())
     tensorEllipsoids.SetScaleFactor(10)
     tensorEllipsoids.ClampScalingOn()
 
-    ellipNormals = vtk.vtkPolyDataNormals()
+    ellipNormals = vtkPolyDataNormals()
     ellipNormals.SetInputConnection(tensorEllipsoids.GetOutputPort())
 
     # Map contour
-    lut = vtk.vtkLookupTable()
+    lut = vtkLookupTable()
     MakeLogLUT(lut)
     # lut.SetHueRange(.6667, 0.0)
-    tensorEllipsoidsMapper = vtk.vtkPolyDataMapper()
+    tensorEllipsoidsMapper = vtkPolyDataMapper()
     tensorEllipsoidsMapper.SetInputConnection(ellipNormals.GetOutputPort())
     tensorEllipsoidsMapper.SetLookupTable(lut)
     plane.Update()  # force update for scalar range
     tensorEllipsoidsMapper.SetScalarRange(plane.GetOutput().GetScalarRange())
 
-    tensorActor = vtk.vtkActor()
+    tensorActor = vtkActor()
     tensorActor.SetMapper(tensorEllipsoidsMapper)
 
     # Create an outline around the data.
     #
-    outline = vtk.vtkOutlineFilter()
+    outline = vtkOutlineFilter()
     outline.SetInputConnection(ptLoad.GetOutputPort())
 
-    outlineMapper = vtk.vtkPolyDataMapper()
+    outlineMapper = vtkPolyDataMapper()
     outlineMapper.SetInputConnection(outline.GetOutputPort())
 
-    outlineActor = vtk.vtkActor()
+    outlineActor = vtkActor()
     outlineActor.SetMapper(outlineMapper)
     outlineActor.GetProperty().SetColor(colors.GetColor3d('Black'))
 
     # Create a cone whose apex indicates the application of load.
     #
-    coneSrc = vtk.vtkConeSource()
+    coneSrc = vtkConeSource()
     coneSrc.SetRadius(.5)
     coneSrc.SetHeight(2)
-    coneMap = vtk.vtkPolyDataMapper()
+    coneMap = vtkPolyDataMapper()
     coneMap.SetInputConnection(coneSrc.GetOutputPort())
-    coneActor = vtk.vtkActor()
+    coneActor = vtkActor()
     coneActor.SetMapper(coneMap)
     coneActor.SetPosition(0, 0, 11)
     coneActor.RotateY(90)
     coneActor.GetProperty().SetColor(colors.GetColor3d('Red'))
 
-    camera = vtk.vtkCamera()
+    camera = vtkCamera()
     camera.SetFocalPoint(0.113766, -1.13665, -1.01919)
     camera.SetPosition(-29.4886, -63.1488, 26.5807)
     camera.SetViewAngle(24.4617)
@@ -102,7 +131,7 @@ def main():
 
 def MakeLogLUT(lut):
     # Make the lookup using a Brewer palette.
-    colorSeries = vtk.vtkColorSeries()
+    colorSeries = vtkColorSeries()
     colorSeries.SetNumberOfColors(8)
     colorSeriesEnum = colorSeries.BREWER_DIVERGING_SPECTRAL_8
     colorSeries.SetColorScheme(colorSeriesEnum)
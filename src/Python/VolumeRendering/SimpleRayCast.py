@@ -1,37 +1,56 @@
 #!/usr/bin/env python
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingVolumeOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonDataModel import vtkPiecewiseFunction
+from vtkmodules.vtkIOLegacy import vtkStructuredPointsReader
+from vtkmodules.vtkRenderingCore import (
+    vtkColorTransferFunction,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer,
+    vtkVolume,
+    vtkVolumeProperty
+)
+from vtkmodules.vtkRenderingVolume import vtkFixedPointVolumeRayCastMapper
 
 
 def main():
     fileName = get_program_parameters()
 
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
     # This is a simple volume rendering example that
     # uses a vtkFixedPointVolumeRayCastMapper
 
     # Create the standard renderer, render window
     # and interactor.
-    ren1 = vtk.vtkRenderer()
+    ren1 = vtkRenderer()
 
-    renWin = vtk.vtkRenderWindow()
+    renWin = vtkRenderWindow()
     renWin.AddRenderer(ren1)
 
-    iren = vtk.vtkRenderWindowInteractor()
+    iren = vtkRenderWindowInteractor()
     iren.SetRenderWindow(renWin)
 
     # Create the reader for the data.
-    reader = vtk.vtkStructuredPointsReader()
+    reader = vtkStructuredPointsReader()
     reader.SetFileName(fileName)
 
     # Create transfer mapping scalar value to opacity.
-    opacityTransferFunction = vtk.vtkPiecewiseFunction()
+    opacityTransferFunction = vtkPiecewiseFunction()
     opacityTransferFunction.AddPoint(20, 0.0)
     opacityTransferFunction.AddPoint(255, 0.2)
 
     # Create transfer mapping scalar value to color.
-    colorTransferFunction = vtk.vtkColorTransferFunction()
+    colorTransferFunction = vtkColorTransferFunction()
     colorTransferFunction.AddRGBPoint(0.0, 0.0, 0.0, 0.0)
     colorTransferFunction.AddRGBPoint(64.0, 1.0, 0.0, 0.0)
     colorTransferFunction.AddRGBPoint(128.0, 0.0, 0.0, 1.0)
@@ -39,19 +58,19 @@ def main():
     colorTransferFunction.AddRGBPoint(255.0, 0.0, 0.2, 0.0)
 
     # The property describes how the data will look.
-    volumeProperty = vtk.vtkVolumeProperty()
+    volumeProperty = vtkVolumeProperty()
     volumeProperty.SetColor(colorTransferFunction)
     volumeProperty.SetScalarOpacity(opacityTransferFunction)
     volumeProperty.ShadeOn()
     volumeProperty.SetInterpolationTypeToLinear()
 
     # The mapper / ray cast function know how to render the data.
-    volumeMapper = vtk.vtkFixedPointVolumeRayCastMapper()
+    volumeMapper = vtkFixedPointVolumeRayCastMapper()
     volumeMapper.SetInputConnection(reader.GetOutputPort())
 
     # The volume holds the mapper and the property and
     # can be used to position/orient the volume.
-    volume = vtk.vtkVolume()
+    volume = vtkVolume()
     volume.SetMapper(volumeMapper)
     volume.SetProperty(volumeProperty)
 
@@ -1,31 +1,49 @@
 # Contributed by Eric E Monson
 
-import vtk
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkInteractionStyle
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingContextOpenGL2
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingFreeType
+# noinspection PyUnresolvedReferences
+import vtkmodules.vtkRenderingOpenGL2
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkFiltersSources import vtkCubeSource
+from vtkmodules.vtkInteractionWidgets import vtkOrientationMarkerWidget
+from vtkmodules.vtkRenderingAnnotation import vtkAnnotatedCubeActor
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkPolyDataMapper,
+    vtkRenderWindow,
+    vtkRenderWindowInteractor,
+    vtkRenderer
+)
 
 
 def main():
-    colors = vtk.vtkNamedColors()
+    colors = vtkNamedColors()
 
     # colors.SetColor('bkg', [0.2, 0.3, 0.7, 1.0])
 
     # create a rendering window and renderer
-    ren = vtk.vtkRenderer()
-    ren_win = vtk.vtkRenderWindow()
+    ren = vtkRenderer()
+    ren_win = vtkRenderWindow()
     ren_win.AddRenderer(ren)
     ren_win.SetWindowName('OrientationMarkerWidget')
 
     # create a renderwindowinteractor
-    iren = vtk.vtkRenderWindowInteractor()
+    iren = vtkRenderWindowInteractor()
     iren.SetRenderWindow(ren_win)
 
-    cube = vtk.vtkCubeSource()
+    cube = vtkCubeSource()
     cube.SetXLength(200)
     cube.SetYLength(200)
     cube.SetZLength(200)
     cube.Update()
-    cm = vtk.vtkPolyDataMapper()
+    cm = vtkPolyDataMapper()
     cm.SetInputConnection(cube.GetOutputPort())
-    ca = vtk.vtkActor()
+    ca = vtkActor()
     ca.SetMapper(cm)
     ca.GetProperty().SetColor(colors.GetColor3d("BurlyWood"))
     ca.GetProperty().EdgeVisibilityOn()
@@ -35,7 +53,7 @@ def main():
     ren.AddActor(ca)
     ren.SetBackground(colors.GetColor3d('CornflowerBlue'))
 
-    axes_actor = vtk.vtkAnnotatedCubeActor()
+    axes_actor = vtkAnnotatedCubeActor()
     axes_actor.SetXPlusFaceText('L')
     axes_actor.SetXMinusFaceText('R')
     axes_actor.SetYMinusFaceText('I')
@@ -45,7 +63,7 @@ def main():
     axes_actor.GetTextEdgesProperty().SetColor(colors.GetColor3d("Yellow"))
     axes_actor.GetTextEdgesProperty().SetLineWidth(2)
     axes_actor.GetCubeProperty().SetColor(colors.GetColor3d("Blue"))
-    axes = vtk.vtkOrientationMarkerWidget()
+    axes = vtkOrientationMarkerWidget()
     axes.SetOrientationMarker(axes_actor)
     axes.SetInteractor(iren)
     axes.EnabledOn()
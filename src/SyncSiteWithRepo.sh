@@ -66,19 +66,14 @@ rsync -zavh src/VTKBook/Figures/ ${WEB_REPO_DIR}/src/VTKBook/Figures/
 cp web_gitignore ${WEB_REPO_DIR}/.gitignore
 
 echo "3) Create coverage files"
-(cd src/Admin; python ./VTKClassesUsedInExamples.py -a .. ${WEB_REPO_DIR}/src/Coverage)
+(cd src/Admin; python ./VTKClassesUsedInExamples.py -a .. ${WEB_REPO_DIR}/src/Coverage -i ${WEB_REPO_DIR}/src/Cache/ExampleIndex.json)
 
-echo "4.1) Scrape the repo"
-rm -rf ${WEB_REPO_DIR}/docs/*
+echo "4) Scrape the repo"
+# The docs directory is updated incrementally by ScrapeRepo.py using its build manifest.
 rm -rf ${WEB_REPO_DIR}/site/*
 
 src/Admin/ScrapeRepo.py src ${SITE_URL} ${WEB_SITE_URL} ${WEB_REPO_URL} ${WEB_REPO_DIR} ${VTK_SOURCE_DIR}
 
-echo "4.2) Scrape the repo again (fixes a bug where the CMakeLists file is bad on the first run)"
-#rm -rf ${WEB_REPO_DIR}/docs/*
-#rm -rf ${WEB_REPO_DIR}/site/*
-src/Admin/ScrapeRepo.py src ${SITE_URL} ${WEB_SITE_URL} ${WEB_REPO_URL} ${WEB_REPO_DIR} ${VTK_SOURCE_DIR}
-
 echo "5) Check for a successful scrape"
 pushd ${WEB_REPO_DIR}/docs
 count=$((`find . -name \*.md | wc -l`))